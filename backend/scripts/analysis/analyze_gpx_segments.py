@@ -58,7 +58,7 @@ async def analyze_segments(gpx_file_id: str = None, file_path: str = None):
             gpx_service = GPXService(db)
             parsed_data = await gpx_service.parse_gpx_file(gpx_content)
             trackpoints = gpx_service.convert_points_for_stats(
-                parsed_data["original_points"]
+                parsed_data["track"]
             )
 
             print(f"Analyzing {len(trackpoints)} GPS points")
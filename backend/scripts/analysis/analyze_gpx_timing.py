@@ -2,12 +2,11 @@
 
 import asyncio
 from pathlib import Path
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 
 from src.config import settings
-from src.models.gpx import GPXFile, TrackPoint
+from src.models.gpx import GPXFile
 from src.services.gpx_service import GPXService
 
 
@@ -41,7 +40,7 @@ async def analyze_gpx_timing(gpx_file_id: str = None, file_path: str = None):
                 gpx_service = GPXService(db)
                 parsed_data = await gpx_service.parse_gpx_file(gpx_content)
                 trackpoints_data = gpx_service.convert_points_for_stats(
-                    parsed_data["original_points"]
+                    parsed_data["track"]
                 )
 
                 if not trackpoints_data or len(trackpoints_data) < 2:
@@ -96,13 +95,8 @@ async def analyze_gpx_timing(gpx_file_id: str = None, file_path: str = None):
                 print("=" * 70)
 
             else:
-                # Get trackpoints from database
-                result = await db.execute(
-                    select(TrackPoint)
-                    .where(TrackPoint.gpx_file_id == gpx_file_id)
-                    .order_by(TrackPoint.sequence)
-                )
-                trackpoints = result.scalars().all()
+                # Get trackpoints from database (track blob or track_points rows)
+                trackpoints = await GPXService(db).load_trackpoints(gpx_file_id)
 
                 if not trackpoints or len(trackpoints) < 2:
                     print("[ERROR] Not enough trackpoints to analyze")
@@ -124,11 +118,11 @@ async def analyze_gpx_timing(gpx_file_id: str = None, file_path: str = None):
                     p1 = trackpoints[i]
                     p2 = trackpoints[i + 1]
 
-                    dist_gap = p2.distance_km - p1.distance_km
+                    dist_gap = p2["distance_km"] - p1["distance_km"]
                     distance_gaps.append(dist_gap)
 
                     if i < 10 or i > len(trackpoints) - 10:
-                        gradient_str = f"{p2.gradient:.1f}%" if p2.gradient is not None else 'N/A'
+                        gradient_str = f"{p2['gradient']:.1f}%" if p2["gradient"] is not None else 'N/A'
                         print(
                             f"  Point {i:4d} → {i+1:4d}: "
                             f"distance_gap={dist_gap:.4f}km, "
@@ -139,7 +133,7 @@ async def analyze_gpx_timing(gpx_file_id: str = None, file_path: str = None):
                 print("SUMMARY STATISTICS")
                 print("-" * 70)
                 print(f"  Total points:        {len(trackpoints)}")
-                print(f"  Total distance:      {trackpoints[-1].distance_km:.2f} km")
+                print(f"  Total distance:      {trackpoints[-1]['distance_km']:.2f} km")
                 print()
                 print(f"  Avg distance/point:  {sum(distance_gaps)/len(distance_gaps):.4f} km")
                 print(f"  Min distance gap:    {min(distance_gaps):.4f} km")
@@ -71,8 +71,8 @@ async def calcular_estadisticas_app(archivo_gpx: str):
             return
 
         trackpoints = analysis_result["trackpoints"]
-        original_points = analysis_result["original_points"]
-        print(f"Procesados {len(trackpoints)} trackpoints (simplificados de {len(original_points)} originales)")
+        track = analysis_result["track"]
+        print(f"Procesados {len(trackpoints)} trackpoints (simplificados de {len(track)} originales)")
 
         # Extract basic metrics from analysis
         total_distance_km = analysis_result["distance_km"]
@@ -82,7 +82,7 @@ async def calcular_estadisticas_app(archivo_gpx: str):
         alt_max = analysis_result["max_elevation"]
 
         # Convert original points to stats format (includes timestamps)
-        stats_trackpoints = gpx_service.convert_points_for_stats(original_points)
+        stats_trackpoints = gpx_service.convert_points_for_stats(track)
         print(f"Convertidos {len(stats_trackpoints)} trackpoints para cálculo de estadísticas")
 
         # Calculate speed and time metrics using RouteStatsService
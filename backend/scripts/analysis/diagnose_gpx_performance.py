@@ -62,6 +62,7 @@ sys.path.insert(0, 'src')
 
 from src.database import AsyncSessionLocal
 from src.services.gpx_service import GPXService
+from src.utils.track_engine import TrackArrays
 import gpxpy
 
 
@@ -183,8 +184,10 @@ async def diagnose():
     async with AsyncSessionLocal() as db:
         gpx_service = GPXService(db)
 
+        track = TrackArrays.from_gpx_points(points)
+
         start = time.perf_counter()
-        simplified = gpx_service._simplify_track_optimized(points, epsilon=0.0001)
+        simplified = gpx_service._simplify_track_optimized(track, epsilon=0.0001)
         service_time = time.perf_counter() - start
 
         print(f"✓ Service simplification time: {service_time:.3f}s")
@@ -90,7 +90,7 @@ async def recalculate_stats(gpx_file_id: str):
 
             # Convert to stats format
             trackpoints_for_stats = gpx_service.convert_points_for_stats(
-                parsed_data["original_points"]
+                parsed_data["track"]
             )
 
             # Calculate route statistics
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""Rebuild every home timeline from follows and published trips.
+
+Home timelines (fan-out on write) are only written while HOME_TIMELINE_ENABLED
+is set. Run this before enabling it, or after changing
+HOME_TIMELINE_FANOUT_MAX_FOLLOWERS.
+
+Usage:
+    poetry run python scripts/dev-tools/rebuild_home_timelines.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database import AsyncSessionLocal
+from src.services.timeline_service import TimelineService
+
+
+async def rebuild() -> None:
+    """Rebuild all home timelines."""
+    async with AsyncSessionLocal() as db:
+        delivered = await TimelineService.rebuild_timelines(db)
+
+    print(f"[SUCCESS] Timelines reconstruidos: {delivered} entradas")
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild())
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Recompute denormalized trip interaction counters (likes, comments, shares).
+
+Trip.likes_count, Trip.comments_count and Trip.shares_count are maintained on
+write. This command recomputes them in bulk from the likes, comments and shares
+tables, repairing drift from writes that bypass the ORM (bulk deletes, database
+cascades, manual SQL), then rebuilds the community ranking rows derived from
+them. Safe to run periodically (e.g. from cron).
+
+Usage:
+    poetry run python scripts/dev-tools/reconcile_trip_counters.py [trip_id ...]
+
+Args:
+    trip_id: Trips to reconcile (default: all trips)
+
+Examples:
+    poetry run python scripts/dev-tools/reconcile_trip_counters.py
+    poetry run python scripts/dev-tools/reconcile_trip_counters.py 550e8400-e29b-41d4-a716-446655440000
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database import AsyncSessionLocal
+from src.services.trip_service import TripService
+
+
+async def reconcile(trip_ids: list[str] | None = None) -> None:
+    """Reconcile counters of the given trips (all trips if None)."""
+    async with AsyncSessionLocal() as db:
+        fixed = await TripService(db).reconcile_interaction_counters(trip_ids)
+
+    scope = f"{len(trip_ids)} trips" if trip_ids else "todos los trips"
+    print(f"[SUCCESS] Revisados {scope}: {fixed} trips tenían contadores incorrectos")
+
+
+if __name__ == "__main__":
+    asyncio.run(reconcile(sys.argv[1:] or None))
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Regenerate the stored versions of every trip photo with the current settings.
+
+Run after changing PHOTO_MAX_WIDTH, PHOTO_QUALITY_*, PHOTO_VARIANT_WIDTHS or
+PHOTO_VARIANT_FORMATS. Photos are read from the database in batches (ordered
+by photo_id) and processed in a pool of worker processes, one per core by
+default; TripPhoto.file_size, width, height and variants are then updated with
+one bulk UPDATE per batch. See reprocess_stored_photo for what is rewritten.
+
+After each batch the last photo_id is saved to a checkpoint file, so an
+interrupted run continues where it stopped with --resume. The file is removed
+when the run completes.
+
+Usage:
+    poetry run python scripts/dev-tools/reprocess_trip_photos.py [options]
+
+Options:
+    --workers N       Worker processes (default: number of CPUs)
+    --batch-size N    Photos per batch (default: 500)
+    --checkpoint PATH Checkpoint file (default: {storage_path}/reprocess_trip_photos.json)
+    --resume          Continue from the checkpoint file
+    --reencode        Re-encode optimized photos even if they fit PHOTO_MAX_WIDTH
+
+Examples:
+    poetry run python scripts/dev-tools/reprocess_trip_photos.py
+    poetry run python scripts/dev-tools/reprocess_trip_photos.py --workers 8 --resume
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import func, select, update
+
+from src.config import settings
+from src.database import AsyncSessionLocal
+from src.models.trip import TripPhoto
+from src.utils.photo_variant_cache import get_photo_variant_cache
+from src.utils.trip_photo_service import reprocess_stored_photo
+
+
+def reprocess_photo(photo_id: str, photo_url: str, variants: list[dict], reencode: bool) -> dict:
+    """Reprocess one photo (runs in a worker process) and return its updated columns."""
+    file_size, width, height, new_variants = reprocess_stored_photo(photo_url, variants, reencode)
+    # Variants rendered on demand from the previous file are stale now
+    get_photo_variant_cache().discard(photo_id)
+    return {
+        "photo_id": photo_id,
+        "file_size": file_size,
+        "width": width,
+        "height": height,
+        "variants": new_variants,
+    }
+
+
+def load_checkpoint(path: Path) -> dict:
+    """Read the checkpoint file."""
+    return json.loads(path.read_text())
+
+
+def save_checkpoint(path: Path, state: dict) -> None:
+    """Write the checkpoint file atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(state))
+    os.replace(tmp_path, path)
+
+
+def format_duration(seconds: float) -> str:
+    """Format seconds as e.g. 1h05m or 4m12s."""
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m" if hours else f"{minutes}m{seconds:02d}s"
+
+
+async def reprocess(
+    workers: int, batch_size: int, checkpoint: Path, resume: bool, reencode: bool
+) -> None:
+    """Reprocess all trip photos after the checkpoint (all photos without resume)."""
+    state = {"last_photo_id": None, "updated": 0, "failed": 0}
+    if resume and checkpoint.exists():
+        state = load_checkpoint(checkpoint)
+        print(f"[INFO] Reanudando después de la foto {state['last_photo_id']}")
+
+    loop = asyncio.get_running_loop()
+    # spawn: workers do not inherit the event loop or the database connections
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+    async with AsyncSessionLocal() as db:
+        remaining = select(func.count()).select_from(TripPhoto)
+        if state["last_photo_id"] is not None:
+            remaining = remaining.where(TripPhoto.photo_id > state["last_photo_id"])
+        total = (await db.execute(remaining)).scalar_one()
+        print(f"[INFO] {total} fotos por procesar con {workers} procesos")
+
+        done = 0
+        started = time.monotonic()
+        with pool:
+            while True:
+                # Keyset pagination: each batch starts after the last photo_id
+                query = (
+                    select(TripPhoto.photo_id, TripPhoto.photo_url, TripPhoto.variants)
+                    .order_by(TripPhoto.photo_id)
+                    .limit(batch_size)
+                )
+                if state["last_photo_id"] is not None:
+                    query = query.where(TripPhoto.photo_id > state["last_photo_id"])
+                rows = (await db.execute(query)).all()
+                if not rows:
+                    break
+
+                results = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            pool,
+                            reprocess_photo,
+                            row.photo_id,
+                            row.photo_url,
+                            row.variants or [],
+                            reencode,
+                        )
+                        for row in rows
+                    ),
+                    return_exceptions=True,
+                )
+
+                updates = []
+                for row, result in zip(rows, results, strict=True):
+                    if isinstance(result, BrokenProcessPool):
+                        # Checkpoint still points at the last completed batch
+                        raise result
+                    if isinstance(result, Exception):
+                        print(f"[ERROR] Foto {row.photo_id} ({row.photo_url}): {result}")
+                        state["failed"] += 1
+                    else:
+                        updates.append(result)
+
+                if updates:
+                    # Bulk UPDATE by primary key (one executemany per batch)
+                    await db.execute(update(TripPhoto), updates)
+                    await db.commit()
+
+                state["last_photo_id"] = rows[-1].photo_id
+                state["updated"] += len(updates)
+                save_checkpoint(checkpoint, state)
+
+                done += len(rows)
+                elapsed = time.monotonic() - started
+                rate = done / elapsed if elapsed else 0.0
+                eta = format_duration((total - done) / rate) if rate else "?"
+                print(
+                    f"[INFO] {done}/{total} fotos ({rate:.1f} fotos/s, "
+                    f"transcurrido {format_duration(elapsed)}, restante {eta})"
+                )
+
+    checkpoint.unlink(missing_ok=True)
+    print(f"[SUCCESS] Fotos actualizadas: {state['updated']}, con errores: {state['failed']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Regenerate stored trip photo versions with the current settings"
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--batch-size", type=int, default=500, help="Photos per batch")
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=Path(settings.storage_path) / "reprocess_trip_photos.json",
+        help="Checkpoint file",
+    )
+    parser.add_argument("--resume", action="store_true", help="Continue from the checkpoint")
+    parser.add_argument(
+        "--reencode",
+        action="store_true",
+        help="Re-encode optimized photos even if they fit PHOTO_MAX_WIDTH",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(
+        reprocess(args.workers, args.batch_size, args.checkpoint, args.resume, args.reencode)
+    )
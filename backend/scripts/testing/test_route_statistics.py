@@ -140,7 +140,7 @@ async def test_route_statistics():
 
                 # Convert points for stats service
                 trackpoints_for_stats = gpx_service.convert_points_for_stats(
-                    parsed_data["original_points"]
+                    parsed_data["track"]
                 )
 
                 stats_service = RouteStatsService(db)
@@ -17,7 +17,7 @@ Admin endpoints:
 import logging
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import get_current_admin, get_db
@@ -29,6 +29,7 @@ from src.schemas.cycling_type import (
     CyclingTypeUpdateRequest,
 )
 from src.services.cycling_type_service import CyclingTypeService
+from src.utils.response_cache import cache_lookup
 
 logger = logging.getLogger(__name__)
 
@@ -65,25 +66,31 @@ def create_response(
 
 @router.get("/cycling-types", response_model=list[CyclingTypePublicResponse])
 async def get_cycling_types_public(
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ) -> list[CyclingTypePublicResponse]:
     """
     Get all active cycling types (public endpoint).
 
     Returns only active cycling types available for user selection.
-    No authentication required.
+    No authentication required. Served from the response cache (ETag/304).
 
     Args:
+        request: Current request
         db: Database session
 
     Returns:
         List of active cycling types
     """
+    cached = cache_lookup(request, "cycling_types")
+    if cached.response is not None:
+        return cached.response
+
     try:
         service = CyclingTypeService(db)
         cycling_types = await service.get_all_public()
 
-        return cycling_types
+        return cached.store(cycling_types)
 
     except Exception as e:
         logger.error(f"Error retrieving public cycling types: {str(e)}")
@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database import AsyncSessionLocal
 from src.utils.security import decode_token
+from src.utils.user_cache import attach_cached_user, get_user_cache
 
 # HTTP Bearer token scheme - auto_error=False to return 401 instead of 403
 security = HTTPBearer(auto_error=False)
@@ -50,7 +51,9 @@ async def get_current_user(
     """
     Dependency to get current authenticated user from JWT token.
 
-    Validates JWT token and returns User model instance.
+    Validates JWT token and returns User model instance. Recently seen
+    active users come from the user cache (src/utils/user_cache.py) instead
+    of the users table.
 
     Args:
         credentials: HTTP bearer credentials from request header
@@ -112,7 +115,12 @@ async def get_current_user(
                 },
             )
 
-        # Load user from database
+        # Load user from the cache (only active users are cached) or database
+        user_cache = get_user_cache()
+        cached = user_cache.get(user_id) if user_cache else None
+        if cached is not None:
+            return await attach_cached_user(db, cached)
+
         from sqlalchemy import select
 
         from src.models.user import User
@@ -123,6 +131,9 @@ async def get_current_user(
         if user is None or not user.is_active:
             raise credentials_exception
 
+        if user_cache:
+            user_cache.set(user)
+
         # Return User model instance
         return user
 
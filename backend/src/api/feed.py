@@ -1,16 +1,17 @@
 """
 Feed API endpoints (Feature 004 - T028).
 
-Provides personalized trip feed for authenticated users.
+Provides personalized trip feed and community trending trips for authenticated users.
 """
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import get_current_user, get_db
 from src.models.user import User
+from src.schemas.api_response import ErrorDetail, ErrorResponse
 from src.schemas.feed import FeedResponse
-from src.services.feed_service import FeedService
+from src.services.feed_service import RANKING_ORDERS, FeedService
 
 router = APIRouter(prefix="", tags=["Feed"])
 
@@ -19,6 +20,11 @@ router = APIRouter(prefix="", tags=["Feed"])
 async def get_feed(
     page: int = Query(default=1, ge=1, description="Page number (min 1)"),
     limit: int = Query(default=10, ge=1, le=50, description="Items per page (min 1, max 50)"),
+    cursor: str
+    | None = Query(
+        default=None,
+        description="Cursor mode: next_cursor of the previous page (empty for the first page)",
+    ),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> FeedResponse:
@@ -39,16 +45,38 @@ async def get_feed(
     **Pagination**:
     - page: min 1, default 1
     - limit: min 1, max 50, default 10
+    - cursor: switches to keyset pagination (`cursor=` for the first page, then
+      each response's next_cursor). Skips the total count and stays fast at any
+      scroll depth; page is ignored
 
     **Returns**:
     - trips: Array of FeedItem objects
-    - total_count: Total trips available
-    - page: Current page number
+    - total_count: Total trips available (null in cursor mode)
+    - page: Current page number (null in cursor mode)
     - limit: Items per page
     - has_more: True if more pages exist
+    - next_cursor: Cursor of the next page (cursor mode only)
 
     **Authentication**: Required (JWT Bearer token)
     """
+    if cursor is not None:
+        try:
+            result = await FeedService.get_personalized_feed_cursor(
+                db=db,
+                user_id=current_user.id,
+                cursor=cursor,
+                limit=limit,
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=ErrorResponse(
+                    success=False,
+                    error=ErrorDetail(code="INVALID_CURSOR", message=str(e)),
+                ).model_dump(),
+            )
+        return FeedResponse(**result)
+
     result = await FeedService.get_personalized_feed(
         db=db,
         user_id=current_user.id,
@@ -57,3 +85,48 @@ async def get_feed(
     )
 
     return FeedResponse(**result)
+
+
+@router.get("/feed/trending", response_model=FeedResponse)
+async def get_trending_feed(
+    ranking: str = Query(
+        default="hot",
+        pattern=f"^({'|'.join(RANKING_ORDERS)})$",
+        description="hot: popularity decayed by age; popular: likes + comments + shares",
+    ),
+    cursor: str = Query(
+        default="", description="next_cursor of the previous page (empty for the first page)"
+    ),
+    limit: int = Query(default=10, ge=1, le=50, description="Items per page (min 1, max 50)"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> FeedResponse:
+    """
+    Get community trips by rank.
+
+    Reads the precomputed community ranking (published, public trips), kept up
+    to date as trips are published and liked, commented or shared.
+
+    **Pagination**: keyset only. Pass each response's next_cursor to get the
+    next page; total_count and page are null
+
+    **Authentication**: Required (JWT Bearer token)
+    """
+    try:
+        result = await FeedService.get_trending_trips(
+            db=db,
+            user_id=current_user.id,
+            ranking=ranking,
+            cursor=cursor,
+            limit=limit,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ErrorResponse(
+                success=False,
+                error=ErrorDetail(code="INVALID_CURSOR", message=str(e)),
+            ).model_dump(),
+        )
+
+    return FeedResponse(**result)
@@ -13,20 +13,24 @@ from pathlib import Path
 
 from fastapi import (
     APIRouter,
-    BackgroundTasks,
     Depends,
     File,
+    Header,
     HTTPException,
+    Query,
+    Request,
+    Response,
     UploadFile,
     status,
 )
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import FileResponse, JSONResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.api.deps import get_current_user, get_db
-from src.models.gpx import GPXFile, TrackPoint
+from src.models.gpx import GPXFile
 from src.models.trip import Trip
 from src.models.user import User
 from src.schemas.gpx import (
@@ -35,7 +39,17 @@ from src.schemas.gpx import (
     GPXUploadSuccessResponse,
     TrackDataSuccessResponse,
 )
+from src.services.gpx_job_service import GPXJobService
 from src.services.gpx_service import GPXService
+from src.utils.gpx_executor import GPXExecutorBusyError
+from src.utils.response_cache import cache_lookup
+from src.utils.track_formats import (
+    BINARY_MEDIA_TYPE,
+    TRACK_FORMATS,
+    columnar_track,
+    encode_binary_track,
+    polyline_track,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -46,286 +60,6 @@ trip_gpx_router = APIRouter(prefix="/trips", tags=["gpx"])
 gpx_router = APIRouter(prefix="/gpx", tags=["gpx"])
 
 
-# ============================================================================
-# Background Processing Helper
-# ============================================================================
-
-
-async def process_gpx_background(
-    gpx_file_id: str,
-    trip_id: str,
-    file_content: bytes,
-    filename: str,
-) -> None:
-    """
-    Background task to process large GPX files (>1MB).
-
-    This function runs asynchronously after returning 202 Accepted to the client.
-    It performs the same processing as sync mode but without blocking the HTTP response.
-
-    Args:
-        gpx_file_id: GPX file record ID to update
-        trip_id: Trip identifier
-        file_content: Raw GPX file bytes
-        filename: Original filename
-
-    Updates GPX record status to "completed" or "failed"
-    """
-    from src.database import get_db
-
-    # LOG METRIC: Background Processing Start
-    processing_start_time = datetime.now(UTC)
-    file_size_mb = len(file_content) / (1024 * 1024)
-    logger.info(
-        "GPX_BACKGROUND_START",
-        extra={
-            "metric_type": "gpx_background_start",
-            "gpx_file_id": gpx_file_id,
-            "trip_id": trip_id,
-            "file_size_mb": round(file_size_mb, 2),
-        },
-    )
-
-    # Get database session using the application's session factory
-    async for db in get_db():
-        try:
-            # Fetch GPX file record
-            result = await db.execute(select(GPXFile).where(GPXFile.gpx_file_id == gpx_file_id))
-            gpx_file = result.scalar_one_or_none()
-
-            if not gpx_file:
-                logger.error(f"GPX file {gpx_file_id} not found in background task")
-                return
-
-            # Initialize GPX service
-            gpx_service = GPXService(db)
-
-            # Parse GPX file
-            parsed_data = await gpx_service.parse_gpx_file(file_content)
-
-            # Save original file to storage
-            file_url = await gpx_service.save_gpx_to_storage(
-                trip_id=trip_id, file_content=file_content, filename=filename
-            )
-
-            # Update GPX file record with parsed data
-            gpx_file.file_url = file_url
-            gpx_file.distance_km = parsed_data["distance_km"]
-            gpx_file.elevation_gain = parsed_data["elevation_gain"]
-            gpx_file.elevation_loss = parsed_data["elevation_loss"]
-            gpx_file.max_elevation = parsed_data["max_elevation"]
-            gpx_file.min_elevation = parsed_data["min_elevation"]
-            gpx_file.start_lat = parsed_data["start_lat"]
-            gpx_file.start_lon = parsed_data["start_lon"]
-            gpx_file.end_lat = parsed_data["end_lat"]
-            gpx_file.end_lon = parsed_data["end_lon"]
-            gpx_file.total_points = parsed_data["total_points"]
-            gpx_file.simplified_points = parsed_data["simplified_points_count"]
-            gpx_file.has_elevation = parsed_data["has_elevation"]
-            gpx_file.has_timestamps = parsed_data["has_timestamps"]
-            gpx_file.processing_status = "completed"
-            gpx_file.processed_at = datetime.now(UTC)
-
-            await db.commit()
-
-            # Save trackpoints
-            trackpoints = []
-            for point_data in parsed_data["trackpoints"]:
-                track_point = TrackPoint(
-                    gpx_file_id=gpx_file.gpx_file_id,
-                    latitude=point_data["latitude"],
-                    longitude=point_data["longitude"],
-                    elevation=point_data["elevation"],
-                    distance_km=point_data["distance_km"],
-                    sequence=point_data["sequence"],
-                    gradient=point_data["gradient"],
-                )
-                trackpoints.append(track_point)
-
-            db.add_all(trackpoints)
-            await db.commit()
-
-            logger.info(
-                f"Background GPX processing completed for file {gpx_file_id} "
-                f"({len(trackpoints)} points, {parsed_data['distance_km']:.2f} km)"
-            )
-
-            # Calculate route statistics if GPX has timestamps (T134 - User Story 5)
-            if parsed_data["has_timestamps"]:
-                try:
-                    from src.models.route_statistics import RouteStatistics
-                    from src.services.route_stats_service import RouteStatsService
-
-                    logger.info(f"Calculating route statistics for GPX file {gpx_file_id}...")
-
-                    # Convert original points to format expected by RouteStatsService
-                    trackpoints_for_stats = gpx_service.convert_points_for_stats(
-                        parsed_data["original_points"]
-                    )
-
-                    # Calculate statistics
-                    stats_service = RouteStatsService(db)
-                    speed_metrics = await stats_service.calculate_speed_metrics(
-                        trackpoints_for_stats
-                    )
-                    top_climbs = await stats_service.detect_climbs(trackpoints_for_stats)
-                    gradient_dist = await stats_service.classify_gradients(trackpoints_for_stats)
-
-                    # Fix floating-point precision issue: ensure moving_time <= total_time
-                    moving_time = speed_metrics.get("moving_time_minutes")
-                    total_time = speed_metrics.get("total_time_minutes")
-                    if (
-                        moving_time is not None
-                        and total_time is not None
-                        and moving_time > total_time
-                    ):
-                        # Clamp moving_time to total_time (precision error fix)
-                        speed_metrics["moving_time_minutes"] = total_time
-
-                    # Calculate weighted average gradient from distribution
-                    total_distance = (
-                        gradient_dist["llano"]["distance_km"]
-                        + gradient_dist["moderado"]["distance_km"]
-                        + gradient_dist["empinado"]["distance_km"]
-                        + gradient_dist["muy_empinado"]["distance_km"]
-                    )
-
-                    if total_distance > 0:
-                        avg_gradient = (
-                            (gradient_dist["llano"]["distance_km"] * 1.5)
-                            + (gradient_dist["moderado"]["distance_km"] * 4.5)
-                            + (gradient_dist["empinado"]["distance_km"] * 8.0)
-                            + (gradient_dist["muy_empinado"]["distance_km"] * 12.0)
-                        ) / total_distance
-                    else:
-                        avg_gradient = None
-
-                    # Find max gradient from trackpoints
-                    max_gradient = None
-                    if parsed_data["has_elevation"]:
-                        gradients: list[float] = [
-                            float(p["gradient"])
-                            for p in trackpoints_for_stats
-                            if p.get("gradient") is not None
-                        ]
-                        max_gradient = max(gradients) if gradients else None
-
-                    # Convert top climbs to JSON format
-                    top_climbs_data = (
-                        [
-                            {
-                                "start_km": climb["start_km"],
-                                "end_km": climb["end_km"],
-                                "elevation_gain_m": climb["elevation_gain_m"],
-                                "avg_gradient": climb["avg_gradient"],
-                                "description": f"Subida {i+1}: {climb['elevation_gain_m']:.0f}m gain, {climb['avg_gradient']:.1f}% avg gradient",
-                            }
-                            for i, climb in enumerate(top_climbs[:3])
-                        ]
-                        if top_climbs
-                        else None
-                    )
-
-                    # Create RouteStatistics record
-                    route_stats = RouteStatistics(
-                        gpx_file_id=gpx_file.gpx_file_id,
-                        avg_speed_kmh=speed_metrics.get("avg_speed_kmh"),
-                        max_speed_kmh=speed_metrics.get("max_speed_kmh"),
-                        total_time_minutes=speed_metrics.get("total_time_minutes"),
-                        moving_time_minutes=speed_metrics.get("moving_time_minutes"),
-                        avg_gradient=avg_gradient,
-                        max_gradient=max_gradient,
-                        top_climbs=top_climbs_data if top_climbs_data else None,
-                    )
-                    db.add(route_stats)
-                    await db.commit()
-                    await db.refresh(route_stats)
-
-                    logger.info(
-                        f"Route statistics created for GPX file {gpx_file_id}: "
-                        f"avg_speed={speed_metrics.get('avg_speed_kmh'):.1f} km/h, "
-                        f"climbs={len(top_climbs) if top_climbs else 0}"
-                    )
-
-                except Exception as stats_error:
-                    # Log error but don't fail the entire GPX processing
-                    logger.error(
-                        f"Error calculating route statistics for GPX file {gpx_file_id}: {stats_error}",
-                        exc_info=True,
-                    )
-
-            # LOG METRIC: Background Processing Complete
-            processing_time_seconds = (datetime.now(UTC) - processing_start_time).total_seconds()
-            logger.info(
-                "GPX_PROCESSING_COMPLETE",
-                extra={
-                    "metric_type": "gpx_processing_complete",
-                    "trip_id": trip_id,
-                    "gpx_file_id": gpx_file_id,
-                    "processing_mode": "async",
-                    "processing_time_seconds": round(processing_time_seconds, 2),
-                    "file_size_mb": round(file_size_mb, 2),
-                    "total_points": gpx_file.total_points,
-                    "simplified_points": gpx_file.simplified_points,
-                    "distance_km": round(gpx_file.distance_km, 2),
-                    "has_elevation": gpx_file.has_elevation,
-                    "status": "success",
-                },
-            )
-
-        except ValueError as e:
-            # GPX parsing error - mark as failed
-            # LOG METRIC: Background Processing Error
-            processing_time_seconds = (datetime.now(UTC) - processing_start_time).total_seconds()
-            logger.error(
-                "GPX_PROCESSING_ERROR",
-                extra={
-                    "metric_type": "gpx_processing_error",
-                    "trip_id": trip_id,
-                    "gpx_file_id": gpx_file_id,
-                    "processing_mode": "async",
-                    "file_size_mb": round(file_size_mb, 2),
-                    "processing_time_seconds": round(processing_time_seconds, 2),
-                    "error_type": "INVALID_GPX_FORMAT",
-                    "error_message": str(e),
-                },
-            )
-            logger.error(f"GPX parsing error in background task for {gpx_file_id}: {e}")
-            if gpx_file:
-                gpx_file.processing_status = "failed"
-                gpx_file.error_message = str(e)
-                await db.commit()
-
-        except Exception as e:
-            # Unexpected error - mark as failed
-            # LOG METRIC: Background Processing Error
-            processing_time_seconds = (datetime.now(UTC) - processing_start_time).total_seconds()
-            logger.error(
-                "GPX_PROCESSING_ERROR",
-                extra={
-                    "metric_type": "gpx_processing_error",
-                    "trip_id": trip_id,
-                    "gpx_file_id": gpx_file_id,
-                    "processing_mode": "async",
-                    "file_size_mb": round(file_size_mb, 2),
-                    "processing_time_seconds": round(processing_time_seconds, 2),
-                    "error_type": "INTERNAL_ERROR",
-                    "error_message": str(e),
-                },
-            )
-            logger.error(
-                f"Unexpected error in background GPX processing for {gpx_file_id}: {e}",
-                exc_info=True,
-            )
-            if gpx_file:
-                gpx_file.processing_status = "failed"
-                gpx_file.error_message = "Error interno al procesar el archivo GPX"
-                await db.commit()
-
-        # Session will be automatically closed by async context manager
-        break  # Exit after first (and only) session iteration
-
-
 # ============================================================================
 # Trip-Scoped GPX Endpoints (/trips/{trip_id}/gpx)
 # ============================================================================
@@ -341,7 +75,6 @@ async def process_gpx_background(
 async def upload_gpx_file(
     trip_id: str,
     file: UploadFile = File(...),
-    background_tasks: BackgroundTasks = None,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> GPXUploadSuccessResponse:
@@ -365,7 +98,6 @@ async def upload_gpx_file(
     Args:
         trip_id: Trip identifier
         file: GPX file upload
-        background_tasks: FastAPI background tasks
         current_user: Authenticated user
         db: Database session
 
@@ -530,21 +262,8 @@ async def upload_gpx_file(
                 await db.commit()
                 await db.refresh(gpx_file)
 
-                # Save trackpoints
-                trackpoints = []
-                for point_data in parsed_data["trackpoints"]:
-                    track_point = TrackPoint(
-                        gpx_file_id=gpx_file.gpx_file_id,
-                        latitude=point_data["latitude"],
-                        longitude=point_data["longitude"],
-                        elevation=point_data["elevation"],
-                        distance_km=point_data["distance_km"],
-                        sequence=point_data["sequence"],
-                        gradient=point_data["gradient"],
-                    )
-                    trackpoints.append(track_point)
-
-                db.add_all(trackpoints)
+                # Save simplified track
+                await gpx_service.save_track(gpx_file, parsed_data["trackpoints"])
                 await db.commit()
 
                 # Calculate advanced route statistics if timestamps available (User Story 5)
@@ -556,7 +275,7 @@ async def upload_gpx_file(
                     try:
                         # Convert GPX trackpoints to dict format for RouteStatsService
                         trackpoints_for_stats = gpx_service.convert_points_for_stats(
-                            parsed_data["original_points"]
+                            parsed_data["track"]
                         )
 
                         # Initialize RouteStatsService
@@ -731,21 +450,8 @@ async def upload_gpx_file(
                     await db.commit()
                     await db.refresh(gpx_file)
 
-                    # Save trackpoints
-                    trackpoints = []
-                    for point_data in parsed_data["trackpoints"]:
-                        track_point = TrackPoint(
-                            gpx_file_id=gpx_file.gpx_file_id,
-                            latitude=point_data["latitude"],
-                            longitude=point_data["longitude"],
-                            elevation=point_data["elevation"],
-                            distance_km=point_data["distance_km"],
-                            sequence=point_data["sequence"],
-                            gradient=point_data["gradient"],
-                        )
-                        trackpoints.append(track_point)
-
-                    db.add_all(trackpoints)
+                    # Save simplified track
+                    await gpx_service.save_track(gpx_file, parsed_data["trackpoints"])
                     await db.commit()
 
                     # Calculate advanced route statistics if timestamps available (User Story 5)
@@ -757,7 +463,7 @@ async def upload_gpx_file(
                         try:
                             # Convert GPX trackpoints to dict format for RouteStatsService
                             trackpoints_for_stats = gpx_service.convert_points_for_stats(
-                                parsed_data["original_points"]
+                                parsed_data["track"]
                             )
 
                             # Initialize RouteStatsService
@@ -923,7 +629,7 @@ async def upload_gpx_file(
                     )
 
             else:
-                # PRODUCTION MODE: Process asynchronously with BackgroundTasks
+                # PRODUCTION MODE: Process asynchronously in a GPX worker (job queue)
                 # LOG METRIC: Processing Mode Decision
                 logger.info(
                     "GPX_PROCESSING_MODE",
@@ -935,10 +641,15 @@ async def upload_gpx_file(
                         "reason": f"file_size > {ASYNC_THRESHOLD_MB}MB threshold",
                     },
                 )
+                # Save original file to storage so the worker can stream it from disk
+                file_url = await gpx_service.save_gpx_to_storage(
+                    trip_id=trip_id, file_content=file_content, filename=file.filename
+                )
+
                 # Create GPX file record with "processing" status
                 gpx_file = GPXFile(
                     trip_id=trip_id,
-                    file_url="",  # Will be set after file is saved in background
+                    file_url=file_url,
                     file_size=file_size,
                     file_name=file.filename,
                     distance_km=0.0,  # Will be updated after processing
@@ -959,30 +670,13 @@ async def upload_gpx_file(
                 )
 
                 db.add(gpx_file)
-                await db.commit()
-                await db.refresh(gpx_file)
+                await db.flush()
 
-                # Add background task to process GPX file
-                if background_tasks is None:
-                    raise HTTPException(
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        detail={
-                            "success": False,
-                            "data": None,
-                            "error": {
-                                "code": "INTERNAL_ERROR",
-                                "message": "BackgroundTasks no disponible para procesamiento asíncrono",
-                            },
-                        },
-                    )
-
-                background_tasks.add_task(
-                    process_gpx_background,
-                    gpx_file_id=str(gpx_file.gpx_file_id),
-                    trip_id=trip_id,
-                    file_content=file_content,
-                    filename=file.filename,
+                # Queue GPX file for a worker (committed together with the record)
+                await GPXJobService(db).enqueue(
+                    gpx_file_id=gpx_file.gpx_file_id, file_path=file_url
                 )
+                await db.refresh(gpx_file)
 
                 # Return 202 Accepted with gpx_file_id for polling
                 from src.schemas.gpx import GPXUploadResponse
@@ -1013,7 +707,7 @@ async def upload_gpx_file(
                     },
                 )
 
-    except HTTPException:
+    except (HTTPException, GPXExecutorBusyError):
         raise
     except Exception as e:
         logger.error(f"Error uploading GPX file to trip {trip_id}: {e}", exc_info=True)
@@ -1269,15 +963,15 @@ async def get_gpx_status(
             gpx_file_id=gpx_file.gpx_file_id,
             processing_status=gpx_file.processing_status,
             distance_km=gpx_file.distance_km if gpx_file.processing_status == "completed" else None,
-            elevation_gain=gpx_file.elevation_gain
-            if gpx_file.processing_status == "completed"
-            else None,
-            total_points=gpx_file.total_points
-            if gpx_file.processing_status == "completed"
-            else None,
-            simplified_points=gpx_file.simplified_points
-            if gpx_file.processing_status == "completed"
-            else None,
+            elevation_gain=(
+                gpx_file.elevation_gain if gpx_file.processing_status == "completed" else None
+            ),
+            total_points=(
+                gpx_file.total_points if gpx_file.processing_status == "completed" else None
+            ),
+            simplified_points=(
+                gpx_file.simplified_points if gpx_file.processing_status == "completed" else None
+            ),
             uploaded_at=gpx_file.uploaded_at,
             processed_at=gpx_file.processed_at,
             error_message=gpx_file.error_message,
@@ -1307,10 +1001,36 @@ async def get_gpx_status(
     response_model=TrackDataSuccessResponse,
     status_code=status.HTTP_200_OK,
     summary="Get simplified trackpoints for map rendering",
-    description="Retrieve simplified GPS trackpoints for route visualization.",
+    description=(
+        "Retrieve simplified GPS trackpoints for route visualization. "
+        "`format` selects the track encoding: `json` (default, one object per point), "
+        "`columnar` (parallel arrays), `polyline` (Google encoded polyline + elevation "
+        "profile arrays) or `binary` (little-endian float32 arrays, "
+        "application/octet-stream). Without `format`, `Accept: application/octet-stream` "
+        "selects `binary`. `zoom` (map zoom level) and/or `max_points` (point budget) "
+        "select a coarser level-of-detail tier (`overview`, `regional`) for small maps."
+    ),
 )
 async def get_track_data(
+    request: Request,
     gpx_file_id: str,
+    response: Response,
+    track_format: str
+    | None = Query(
+        None,
+        alias="format",
+        pattern=f"^({'|'.join(TRACK_FORMATS)})$",
+        description="Track encoding: json, columnar, polyline or binary",
+    ),
+    zoom: int
+    | None = Query(
+        None, ge=0, le=22, description="Map zoom level: selects the level-of-detail tier"
+    ),
+    max_points: int
+    | None = Query(
+        None, ge=2, description="Point budget: finest level-of-detail tier with at most N points"
+    ),
+    accept: str | None = Header(None),
     db: AsyncSession = Depends(get_db),
 ) -> TrackDataSuccessResponse:
     """
@@ -1318,18 +1038,34 @@ async def get_track_data(
 
     Returns simplified trackpoints (Douglas-Peucker algorithm).
 
-    Public endpoint - No authentication required.
+    Public endpoint - No authentication required. Served from the response
+    cache per GPX file, format and tier (ETag/304).
 
     Args:
+        request: Current request
         gpx_file_id: GPX file identifier
+        response: Response (Vary header for content negotiation)
+        track_format: Track encoding (see src/utils/track_formats.py)
+        zoom: Map zoom level (see TRACK_TIERS in src/services/gpx_service.py)
+        max_points: Maximum number of points wanted (coarsest tier if none fits)
+        accept: Accept header (application/octet-stream -> binary)
         db: Database session
 
     Returns:
-        TrackDataSuccessResponse with simplified trackpoints
+        TrackDataSuccessResponse with simplified trackpoints (format=json), the
+        same envelope with a "track" object instead of "trackpoints"
+        (format=columnar/polyline) or a binary track (format=binary)
 
     Raises:
         404: GPX file not found or not yet processed
     """
+    if track_format is None:
+        track_format = "binary" if BINARY_MEDIA_TYPE in (accept or "") else "json"
+
+    cached = cache_lookup(request, f"gpx:{gpx_file_id}", vary=track_format)
+    if cached.response is not None:
+        return cached.response
+
     try:
         # Get GPX file
         result = await db.execute(select(GPXFile).where(GPXFile.gpx_file_id == gpx_file_id))
@@ -1362,13 +1098,16 @@ async def get_track_data(
                 },
             )
 
-        # Get trackpoints
-        trackpoints_result = await db.execute(
-            select(TrackPoint)
-            .where(TrackPoint.gpx_file_id == gpx_file_id)
-            .order_by(TrackPoint.sequence)
-        )
-        trackpoints = trackpoints_result.scalars().all()
+        # Get trackpoints (packed track blob or track_points rows): per-point
+        # dicts for the default JSON format, arrays for the compact formats
+        gpx_service = GPXService(db)
+        tier = await gpx_service.resolve_track_tier(gpx_file, zoom=zoom, max_points=max_points)
+        if track_format == "json":
+            trackpoints = await gpx_service.load_trackpoints(gpx_file_id, tier)
+            points_count = len(trackpoints)
+        else:
+            columns = await gpx_service.load_track_columns(gpx_file_id, tier)
+            points_count = len(columns["latitude"])
 
         # Get route statistics (User Story 5) if available
         from src.models.route_statistics import RouteStatistics
@@ -1378,28 +1117,22 @@ async def get_track_data(
         )
         route_statistics = stats_result.scalar_one_or_none()
 
-        # Calculate gradient distribution (FR-032) if statistics exist
+        # Calculate gradient distribution (FR-032) if statistics exist. Only on the
+        # detail tier: coarser tiers are for small maps and would skew the buckets
         gradient_distribution = None
-        if route_statistics and gpx_file.has_elevation:
-            from src.services.route_stats_service import RouteStatsService
-
-            # Convert trackpoints to dict format for stats service
-            trackpoints_for_stats = []
-            for tp in trackpoints:
-                trackpoints_for_stats.append(
-                    {
-                        "latitude": tp.latitude,
-                        "longitude": tp.longitude,
-                        "elevation": tp.elevation,
-                        "distance_km": tp.distance_km,
-                        "timestamp": None,  # Not needed for gradient classification
-                        "sequence": tp.sequence,
-                    }
-                )
+        if route_statistics and gpx_file.has_elevation and tier == "detail":
+            from src.services.route_stats_service import (
+                RouteStatsService,
+                gradient_distribution_from_columns,
+            )
 
-            # Calculate gradient distribution
-            stats_service = RouteStatsService(db)
-            gradient_distribution = await stats_service.classify_gradients(trackpoints_for_stats)
+            if track_format == "json":
+                stats_service = RouteStatsService(db)
+                gradient_distribution = await stats_service.classify_gradients(trackpoints)
+            else:
+                gradient_distribution = gradient_distribution_from_columns(
+                    columns["distance_km"], columns["elevation"]
+                )
 
         # Convert to response schema
         from src.schemas.gpx import (
@@ -1446,17 +1179,51 @@ async def get_track_data(
             trip_id=gpx_file.trip_id,
             distance_km=gpx_file.distance_km,
             elevation_gain=gpx_file.elevation_gain,
-            simplified_points_count=len(trackpoints),
+            simplified_points_count=points_count,
+            tier=tier,
             has_elevation=gpx_file.has_elevation,
             start_point=CoordinateResponse(
                 latitude=gpx_file.start_lat, longitude=gpx_file.start_lon
             ),
             end_point=CoordinateResponse(latitude=gpx_file.end_lat, longitude=gpx_file.end_lon),
-            trackpoints=[TrackPointResponse.model_validate(tp) for tp in trackpoints],
+            trackpoints=(
+                [TrackPointResponse(**tp) for tp in trackpoints] if track_format == "json" else []
+            ),
             route_statistics=route_stats_response,
         )
 
-        return TrackDataSuccessResponse(success=True, data=track_data)
+        response.headers["Vary"] = "Accept"
+        if track_format == "json":
+            return cached.store(
+                JSONResponse(
+                    content=jsonable_encoder(
+                        TrackDataSuccessResponse(success=True, data=track_data)
+                    ),
+                    headers={"Vary": "Accept"},
+                )
+            )
+
+        # Compact formats: same metadata, track arrays instead of trackpoint objects
+        metadata = track_data.model_dump(mode="json", exclude={"trackpoints"})
+        if track_format == "binary":
+            return cached.store(
+                Response(
+                    content=encode_binary_track(columns, metadata),
+                    media_type=BINARY_MEDIA_TYPE,
+                    headers={"Vary": "Accept"},
+                )
+            )
+
+        track = columnar_track(columns) if track_format == "columnar" else polyline_track(columns)
+        return cached.store(
+            JSONResponse(
+                content={
+                    "success": True,
+                    "data": {**metadata, "format": track_format, "track": track},
+                },
+                headers={"Vary": "Accept"},
+            )
+        )
 
     except HTTPException:
         raise
@@ -16,13 +16,14 @@ from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, s
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import get_current_user, get_db
-from src.models.gpx import GPXFile, TrackPoint
+from src.models.gpx import GPXFile
 from src.models.trip import TripStatus
 from src.models.user import User
 from src.schemas.gpx_wizard import GPXAnalysisResponse, GPXTelemetry
 from src.schemas.trip import TripCreateRequest
 from src.services.gpx_service import GPXService, clean_filename_for_title
 from src.services.trip_service import TripService
+from src.utils.gpx_executor import GPXExecutorBusyError
 
 logger = logging.getLogger(__name__)
 
@@ -250,6 +251,10 @@ async def analyze_gpx_file(
             },
         )
 
+    except GPXExecutorBusyError:
+        # Pool saturated: answered with 503 by the application exception handler
+        raise
+
     except Exception as e:
         # Unexpected errors
         logger.error(
@@ -452,11 +457,12 @@ async def create_trip_with_gpx(
         trip_service = TripService(db)
         gpx_service = GPXService(db)
 
-        # Extract telemetry first to get difficulty and distance
-        logger.info(f"Extracting telemetry from GPX file for user {user_id}")
+        # Parse the GPX file once: telemetry (difficulty, distance), simplified
+        # trackpoints and route statistics all come from the same track
+        logger.info(f"Analyzing GPX file for user {user_id}")
 
         try:
-            telemetry_data = await gpx_service.extract_telemetry_quick(file_content)
+            analysis = await gpx_service.analyze_gpx(file_content)
         except ValueError as e:
             # GPX parsing/validation errors
             error_message = str(e)
@@ -480,6 +486,9 @@ async def create_trip_with_gpx(
                 },
             )
 
+        telemetry_data = analysis["telemetry"]
+        parsed_data = analysis["route"]
+
         # Create trip with telemetry data
         trip_data = TripCreateRequest(
             title=title,
@@ -497,9 +506,6 @@ async def create_trip_with_gpx(
         # Upload GPX file and link to trip
         logger.info(f"Uploading GPX file for trip {trip.trip_id}")
 
-        # Parse GPX file
-        parsed_data = await gpx_service.parse_gpx_file(file_content)
-
         # Save original file to storage
         file_url = await gpx_service.save_gpx_to_storage(
             trip_id=trip.trip_id,
@@ -534,42 +540,21 @@ async def create_trip_with_gpx(
         await db.commit()
         await db.refresh(gpx_file_record)
 
-        # Save trackpoints
-        trackpoints = []
-        for point_data in parsed_data["trackpoints"]:
-            track_point = TrackPoint(
-                gpx_file_id=gpx_file_record.gpx_file_id,
-                latitude=point_data["latitude"],
-                longitude=point_data["longitude"],
-                elevation=point_data["elevation"],
-                distance_km=point_data["distance_km"],
-                sequence=point_data["sequence"],
-                gradient=point_data["gradient"],
-            )
-            trackpoints.append(track_point)
-
-        db.add_all(trackpoints)
+        # Save simplified track
+        await gpx_service.save_track(gpx_file_record, parsed_data["trackpoints"])
 
-        # Calculate route statistics if GPX has timestamps (Feature 003 - User Story 5)
-        if parsed_data["has_timestamps"]:
+        # Save route statistics if GPX has timestamps (Feature 003 - User Story 5)
+        if analysis["route_statistics"] is not None:
             try:
                 from src.models.route_statistics import RouteStatistics
-                from src.services.route_stats_service import RouteStatsService
 
                 logger.info(
-                    f"Calculating route statistics for GPX file {gpx_file_record.gpx_file_id}..."
-                )
-
-                # Convert original points to format expected by RouteStatsService
-                trackpoints_for_stats = gpx_service.convert_points_for_stats(
-                    parsed_data["original_points"]
+                    f"Saving route statistics for GPX file {gpx_file_record.gpx_file_id}..."
                 )
 
-                # Calculate statistics
-                stats_service = RouteStatsService(db)
-                speed_metrics = await stats_service.calculate_speed_metrics(trackpoints_for_stats)
-                top_climbs = await stats_service.detect_climbs(trackpoints_for_stats)
-                gradient_dist = await stats_service.classify_gradients(trackpoints_for_stats)
+                speed_metrics = analysis["route_statistics"]["speed_metrics"]
+                top_climbs = analysis["route_statistics"]["top_climbs"]
+                gradient_dist = analysis["route_statistics"]["gradient_distribution"]
 
                 # Fix floating-point precision issue: ensure moving_time <= total_time
                 moving_time = speed_metrics.get("moving_time_minutes")
@@ -600,7 +585,7 @@ async def create_trip_with_gpx(
                 if parsed_data["has_elevation"]:
                     gradients: list[float] = [
                         float(p["gradient"])
-                        for p in trackpoints_for_stats
+                        for p in parsed_data["trackpoints"]
                         if p.get("gradient") is not None
                     ]
                     max_gradient = max(gradients) if gradients else None
@@ -693,8 +678,8 @@ async def create_trip_with_gpx(
 
         return {"success": True, "data": response_data, "error": None}
 
-    except HTTPException:
-        # Re-raise HTTP exceptions (validation errors, etc.)
+    except (HTTPException, GPXExecutorBusyError):
+        # Re-raise HTTP exceptions (validation errors, etc.) and pool saturation (503)
         raise
 
     except Exception as e:
@@ -26,6 +26,7 @@ from src.schemas.poi import (
     POIUpdateInput,
 )
 from src.services.poi_service import POIService
+from src.utils.image_executor import ImageExecutorBusyError
 
 logger = logging.getLogger(__name__)
 
@@ -402,6 +403,10 @@ async def upload_poi_photo(
             },
         )
 
+    except ImageExecutorBusyError:
+        # Pool saturated or timed out: answered with 503 by the application exception handler
+        raise
+
     except Exception as e:
         logger.error(f"Error uploading photo to POI {poi_id}: {e}", exc_info=True)
         raise HTTPException(
@@ -26,6 +26,7 @@ from src.schemas.profile import (
     ProfileUpdateRequest,
 )
 from src.services.profile_service import ProfileService
+from src.utils.image_executor import ImageExecutorBusyError
 
 logger = logging.getLogger(__name__)
 
@@ -285,6 +286,10 @@ async def upload_profile_photo(
             },
         )
 
+    except ImageExecutorBusyError:
+        # Pool saturated or timed out: answered with 503 by the application exception handler
+        raise
+
     except Exception as e:
         logger.error(f"Error uploading photo for {username}: {str(e)}")
         raise HTTPException(
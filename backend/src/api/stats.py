@@ -12,11 +12,12 @@ Endpoints:
 import logging
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import get_db
 from src.services.stats_service import StatsService
+from src.utils.response_cache import cache_lookup
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +48,7 @@ def create_response(
 
 @router.get("/{username}/stats")
 async def get_user_stats(
+    request: Request,
     username: str,
     db: AsyncSession = Depends(get_db),
 ) -> dict:
@@ -63,7 +65,10 @@ async def get_user_stats(
 
     **Functional Requirements**: FR-019
 
+    Served from the response cache (ETag/304).
+
     Args:
+        request: Current request
         username: Username to get stats for
         db: Database session
 
@@ -73,13 +78,19 @@ async def get_user_stats(
     Raises:
         HTTPException 404: If user not found
     """
+    cached = cache_lookup(request, "stats")
+    if cached.response is not None:
+        return cached.response
+
     try:
         stats_service = StatsService(db)
         stats = await stats_service.get_user_stats(username)
 
-        return create_response(
-            success=True,
-            data=stats.model_dump(),
+        return cached.store(
+            create_response(
+                success=True,
+                data=stats.model_dump(),
+            )
         )
 
     except ValueError as e:
@@ -157,6 +168,7 @@ async def get_user_achievements(
 
 @achievements_router.get("/achievements")
 async def list_all_achievements(
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ) -> dict:
     """
@@ -167,19 +179,28 @@ async def list_all_achievements(
 
     **Functional Requirements**: FR-024
 
+    Served from the response cache (ETag/304).
+
     Args:
+        request: Current request
         db: Database session
 
     Returns:
         AchievementDefinitionList with all available achievements
     """
+    cached = cache_lookup(request, "achievements")
+    if cached.response is not None:
+        return cached.response
+
     try:
         stats_service = StatsService(db)
         achievements = await stats_service.list_all_achievements()
 
-        return create_response(
-            success=True,
-            data=achievements.model_dump(),
+        return cached.store(
+            create_response(
+                success=True,
+                data=achievements.model_dump(),
+            )
         )
 
     except Exception as e:
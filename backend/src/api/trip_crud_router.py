@@ -11,8 +11,7 @@ Feature 013: Public trips feed
 import logging
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import get_current_user, get_db, get_optional_current_user
@@ -30,6 +29,7 @@ from src.schemas.trip import (
     TripUpdateRequest,
 )
 from src.services.trip_service import TripService
+from src.utils.response_cache import cache_lookup
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +44,7 @@ router = APIRouter(prefix="/trips", tags=["trips"])
     description="Get paginated list of published trips with public visibility (Feature 013).",
 )
 async def get_public_trips(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     limit: int = Query(
         default=None,
@@ -69,7 +70,11 @@ async def get_public_trips(
     - Default: Configurable via PUBLIC_FEED_PAGE_SIZE (default 8)
     - Max: Configurable via PUBLIC_FEED_MAX_PAGE_SIZE (default 50)
 
+    Anonymous responses are served from the response cache (ETag/304);
+    authenticated ones carry per-viewer like/follow flags and are not cached.
+
     Args:
+        request: Current request
         page: Page number (1-indexed, default 1)
         limit: Items per page (configurable, default 8, max 50)
         db: Database session
@@ -87,7 +92,7 @@ async def get_public_trips(
                     "title": "Vía Verde del Aceite",
                     "start_date": "2024-05-15",
                     "distance_km": 127.3,
-                    "photo": {"photo_url": "...", "thumbnail_url": "..."},
+                    "photo": {"photo_url": "...", "thumbnail_url": "...", "variants": [...]},
                     "location": {"name": "Baeza, España"},
                     "author": {"user_id": "123e...", "username": "maria_ciclista", ...},
                     "published_at": "2024-12-22T15:45:00Z"
@@ -107,9 +112,16 @@ async def get_public_trips(
     elif limit > settings.public_feed_max_page_size:
         limit = settings.public_feed_max_page_size
 
+    cached = cache_lookup(request, "trips", enabled=current_user is None)
+    if cached.response is not None:
+        return cached.response
+
     try:
         service = TripService(db)
         trips, total = await service.get_public_trips(page=page, limit=limit)
+        trip_interactions = await service.get_trip_interactions(
+            trips, viewer_id=current_user.id if current_user else None
+        )
 
         # Calculate total pages
         total_pages = (total + limit - 1) // limit if total > 0 else 0
@@ -125,6 +137,7 @@ async def get_public_trips(
                 first_photo = PublicPhotoSummary(
                     photo_url=photo.photo_url,
                     thumbnail_url=photo.thumbnail_url,
+                    variants=photo.variants,
                 )
 
             # Extract first location (sequence=0)
@@ -134,35 +147,11 @@ async def get_public_trips(
                 location = trip.locations[0]
                 first_location = PublicLocationSummary(name=location.name)
 
-            # Count likes for this trip (Feature 004 - US2)
-            from src.models.like import Like
-
-            like_count_result = await db.execute(
-                select(func.count(Like.id)).where(Like.trip_id == trip.trip_id)
-            )
-            like_count = like_count_result.scalar() or 0
-
-            # Check if current user has liked this trip (Feature 004 - US2)
-            is_liked = None
-            if current_user:
-                like_result = await db.execute(
-                    select(Like).where(
-                        Like.trip_id == trip.trip_id, Like.user_id == current_user.id
-                    )
-                )
-                is_liked = like_result.scalar_one_or_none() is not None
-
-            # Check if current user follows this trip's author (Feature 004 - US1)
-            from src.models.social import Follow
-
-            is_following = None
-            if current_user:
-                follow_result = await db.execute(
-                    select(Follow).where(
-                        Follow.follower_id == current_user.id, Follow.following_id == trip.user.id
-                    )
-                )
-                is_following = follow_result.scalar_one_or_none() is not None
+            # Likes and follow flags resolved for the whole page (Feature 004 - US1, US2)
+            interactions = trip_interactions[str(trip.trip_id)]
+            like_count = interactions["like_count"]
+            is_liked = interactions["is_liked"]
+            is_following = interactions["is_following"]
 
             # Map user to PublicUserSummary
             author = PublicUserSummary(
@@ -199,9 +188,11 @@ async def get_public_trips(
 
         logger.info(f"Public feed: page={page}, limit={limit}, total={total}")
 
-        return PublicTripListResponse(
-            trips=public_trips,
-            pagination=pagination,
+        return cached.store(
+            PublicTripListResponse(
+                trips=public_trips,
+                pagination=pagination,
+            )
         )
 
     except Exception as e:
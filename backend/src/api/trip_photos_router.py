@@ -1,7 +1,8 @@
 """
 Trip Photos API endpoints for Travel Diary feature.
 
-Provides REST API for managing trip photo gallery: upload, delete, and reorder photos.
+Provides REST API for managing trip photo gallery: upload, delete, and reorder photos,
+and serves resized photo variants on demand.
 
 Functional Requirements: FR-009, FR-010, FR-011, FR-012, FR-013
 """
@@ -9,13 +10,16 @@ Functional Requirements: FR-009, FR-010, FR-011, FR-012, FR-013
 import logging
 from typing import Any
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi.responses import FileResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import get_current_user, get_db
+from src.config import settings
 from src.models.user import User
 from src.services.trip_service import TripService
+from src.utils.image_executor import ImageExecutorBusyError
 
 logger = logging.getLogger(__name__)
 
@@ -94,6 +98,7 @@ async def upload_photo(
                 "file_size": photo_record.file_size,
                 "width": photo_record.width,
                 "height": photo_record.height,
+                "variants": photo_record.variants,
                 "uploaded_at": photo_record.uploaded_at.isoformat() + "Z"
                 if photo_record.uploaded_at
                 else None,
@@ -136,6 +141,9 @@ async def upload_photo(
                 },
             },
         )
+    except ImageExecutorBusyError:
+        # Pool saturated or timed out: answered with 503 by the application exception handler
+        raise
     except Exception as e:
         logger.error(f"Error uploading photo to trip {trip_id}: {e}", exc_info=True)
         raise HTTPException(
@@ -331,3 +339,76 @@ async def reorder_photos(
                 },
             },
         )
+
+
+@router.get(
+    "/{trip_id}/photos/{photo_id}/variant",
+    response_class=FileResponse,
+    summary="Get resized photo variant",
+    description=(
+        "Serve a photo resized to one of the configured widths, as JPEG or WebP. "
+        "Rendered on first request and cached on disk."
+    ),
+)
+async def get_photo_variant(
+    trip_id: str,
+    photo_id: str,
+    width: int = Query(..., description="Width in pixels (one of PHOTO_VARIANT_WIDTHS)"),
+    format: str = Query("jpeg", description="Encoding: jpeg or webp"),
+    db: AsyncSession = Depends(get_db),
+) -> FileResponse:
+    """
+    Get a resized photo variant.
+
+    Public like the /storage files it is rendered from. Photos never change
+    after upload, so variants are served as immutable.
+
+    Args:
+        trip_id: Trip identifier
+        photo_id: Photo identifier
+        width: Requested width
+        format: Requested encoding
+        db: Database session
+
+    Returns:
+        Variant image file
+
+    Raises:
+        400: Width or format not offered
+        404: Photo not found
+        503: Image processing pool saturated
+    """
+    if width not in settings.photo_variant_widths or format not in settings.photo_variant_formats:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "success": False,
+                "data": None,
+                "error": {
+                    "code": "VALIDATION_ERROR",
+                    "message": "Tamaño o formato de foto no disponible",
+                },
+            },
+        )
+
+    service = TripService(db)
+    try:
+        path = await service.get_photo_variant(trip_id, photo_id, width, format)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "success": False,
+                "data": None,
+                "error": {
+                    "code": "NOT_FOUND",
+                    "message": str(e),
+                },
+            },
+        )
+
+    return FileResponse(
+        path,
+        media_type=f"image/{format}",
+        headers={"Cache-Control": "public, max-age=31536000, immutable"},
+    )
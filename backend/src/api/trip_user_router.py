@@ -10,13 +10,14 @@ Feature 013: Trip visibility filtering
 import logging
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import get_db, get_optional_current_user
 from src.models.trip import TripStatus
 from src.models.user import User
 from src.services.trip_service import TripService
+from src.utils.response_cache import cache_lookup
 
 logger = logging.getLogger(__name__)
 
@@ -170,15 +171,22 @@ async def get_user_trips(
     description="FR-027: List all available tags ordered by popularity",
 )
 async def get_all_tags(
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ) -> dict[str, Any]:
     """
     Get all tags ordered by usage count (T089, FR-027).
 
+    Served from the response cache (ETag/304).
+
     **Returns:**
     - List of tags with usage counts
     - Ordered by usage_count descending (most popular first)
     """
+    cached = cache_lookup(request, "tags")
+    if cached.response is not None:
+        return cached.response
+
     try:
         service = TripService(db)
         tags = await service.get_all_tags()
@@ -194,11 +202,13 @@ async def get_all_tags(
             for tag in tags
         ]
 
-        return {
-            "success": True,
-            "data": {"tags": tags_data, "count": len(tags_data)},
-            "error": None,
-        }
+        return cached.store(
+            {
+                "success": True,
+                "data": {"tags": tags_data, "count": len(tags_data)},
+                "error": None,
+            }
+        )
 
     except Exception as e:
         logger.error(f"Error getting tags: {e}", exc_info=True)
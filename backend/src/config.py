@@ -44,11 +44,24 @@ class Settings(BaseSettings):
     refresh_token_expire_days: int = Field(
         default=30, ge=1, description="Refresh token expiration in days"
     )
+    user_cache_ttl_seconds: int = Field(
+        default=10,
+        ge=0,
+        description="Seconds an authenticated user is served without a query (0 = disabled)",
+    )
+    user_cache_max_entries: int = Field(
+        default=10000, ge=1, description="Maximum users kept in the authenticated user cache"
+    )
 
     # Password Hashing
     bcrypt_rounds: int = Field(
         default=12, ge=4, le=31, description="Bcrypt rounds (4-31, recommended 12 for production)"
     )
+    password_hash_workers: int = Field(
+        default=4,
+        ge=0,
+        description="Threads hashing/verifying passwords off the event loop (0 = run inline)",
+    )
 
     # Email Configuration
     smtp_host: str = Field(default="localhost", description="SMTP server host")
@@ -86,6 +99,119 @@ class Settings(BaseSettings):
         default="trip_photos", description="Trip photos subdirectory relative to storage_path"
     )
 
+    # Travel Diary - Responsive photo variants (stored as Union to prevent JSON parsing)
+    photo_variant_widths: str | list[int] = Field(
+        default=[320, 640, 1200],
+        description="Widths of the responsive photo variants (comma-separated)",
+    )
+    photo_variant_formats: str | list[str] = Field(
+        default=["jpeg", "webp"],
+        description="Encodings of each responsive variant (comma-separated: jpeg, webp)",
+    )
+    photo_quality_webp: int = Field(
+        default=80, ge=50, le=100, description="WebP quality for photo variants (50-100)"
+    )
+    photo_variants_on_upload: bool = Field(
+        default=True,
+        description="Render the variant ladder at upload (False: only on demand, on first request)",
+    )
+    photo_variant_cache_path: str = Field(
+        default="photo_variants",
+        description="On-demand photo variant cache subdirectory relative to storage_path",
+    )
+    photo_variant_cache_max_mb: int = Field(
+        default=1024, ge=1, description="Maximum size of the on-demand photo variant cache in MB"
+    )
+
+    # Image processing pool (trip, POI and profile photos)
+    image_process_workers: int = Field(
+        default=2, ge=0, description="Threads decoding/resizing photos (0 = run inline)"
+    )
+    image_process_max_pending: int = Field(
+        default=16, ge=1, description="Maximum photo jobs running or queued (503 beyond)"
+    )
+    image_process_timeout_seconds: int = Field(
+        default=30, ge=1, description="Maximum queue wait of a photo job (503 beyond)"
+    )
+
+    # GPS Routes - Analysis process pool
+    gpx_process_workers: int = Field(
+        default=2, ge=0, description="Worker processes for GPX analysis (0 = run inline)"
+    )
+    gpx_process_max_pending: int = Field(
+        default=8, ge=1, description="Maximum GPX analyses running or queued (503 beyond)"
+    )
+
+    # GPS Routes - Simplified track storage
+    gpx_track_storage: str = Field(
+        default="rows",
+        description="Where simplified tracks are stored: 'rows' (track_points) or 'blob'",
+    )
+
+    # GPS Routes - Background job queue (large uploads, see src/workers/gpx_worker.py)
+    gpx_job_max_attempts: int = Field(
+        default=3, ge=1, description="Attempts before a GPX job is marked as failed"
+    )
+    gpx_job_lease_seconds: int = Field(
+        default=600,
+        ge=30,
+        description="GPX job lease, renewed while processing (expired leases are re-queued)",
+    )
+    gpx_job_retry_backoff_seconds: int = Field(
+        default=30, ge=0, description="Delay before the first retry (doubled on each attempt)"
+    )
+    gpx_job_poll_seconds: float = Field(
+        default=2.0, gt=0, description="Seconds between queue polls when a worker is idle"
+    )
+    gpx_worker_embedded: bool = Field(
+        default=True,
+        description="Run a GPX worker loop inside the API process (disable with dedicated workers)",
+    )
+
+    # GPS Routes - Analysis cache (keyed by SHA-256 of the GPX file)
+    gpx_cache_enabled: bool = Field(default=True, description="Cache GPX analysis results")
+    gpx_cache_max_entries: int = Field(
+        default=128, ge=1, description="Maximum GPX analysis results kept in memory"
+    )
+    gpx_cache_max_mb: int = Field(
+        default=256, ge=1, description="Maximum size of GPX analysis results kept in memory in MB"
+    )
+    gpx_cache_ttl_seconds: int = Field(
+        default=3600, ge=1, description="Lifetime of cached GPX analysis results in seconds"
+    )
+    gpx_cache_disk_enabled: bool = Field(
+        default=False, description="Also persist GPX analysis results on disk"
+    )
+    gpx_cache_path: str = Field(
+        default="gpx_cache", description="GPX analysis cache subdirectory relative to storage_path"
+    )
+
+    # Public endpoints - Response cache (see src/utils/response_cache.py)
+    response_cache_enabled: bool = Field(
+        default=True, description="Cache responses of public read endpoints"
+    )
+    response_cache_backend: str = Field(
+        default="memory",
+        description="Cache backend: 'memory' (per process) or 'file' (shared by local workers)",
+    )
+    response_cache_max_entries: int = Field(
+        default=1024, ge=1, description="Maximum responses kept by the memory backend"
+    )
+    response_cache_ttl_seconds: int = Field(
+        default=300, ge=1, description="Lifetime of cached responses in seconds"
+    )
+    response_cache_path: str = Field(
+        default="response_cache",
+        description="File backend directory relative to storage_path",
+    )
+
+    # Cycling types - In-memory registry (see src/services/cycling_type_registry.py)
+    cycling_type_registry_check_seconds: int = Field(
+        default=5,
+        ge=0,
+        description="Seconds between registry version checks (0 = check on every lookup)",
+    )
+
     # Travel Diary - Geocoding
     google_places_api_key: str = Field(
         default="", description="Google Places API key for geocoding (optional)"
@@ -111,6 +237,20 @@ class Settings(BaseSettings):
         default=50, ge=1, le=100, description="Maximum items per page in public feed"
     )
 
+    # Personalized Feed - Home timeline (fan-out on write, see src/services/timeline_service.py)
+    home_timeline_enabled: bool = Field(
+        default=False,
+        description="Fan out published trips to follower timelines and read the feed from them",
+    )
+    home_timeline_fanout_max_followers: int = Field(
+        default=5000,
+        ge=0,
+        description="Authors with more followers are read on demand instead of fanned out",
+    )
+    home_timeline_fanout_batch_size: int = Field(
+        default=1000, ge=1, description="Timeline entries written per transaction during fan-out"
+    )
+
     # CORS (stored as Union to prevent automatic JSON parsing from env var)
     cors_origins: str | list[str] = Field(
         default="http://localhost:3000,http://localhost:5173",
@@ -152,6 +292,28 @@ class Settings(BaseSettings):
             return [origin.strip() for origin in v.split(",") if origin.strip()]
         return v
 
+    @field_validator("photo_variant_widths", mode="before")
+    @classmethod
+    def parse_photo_variant_widths(cls, v: Any) -> list[int]:
+        """Parse variant widths from comma-separated string or list (sorted, unique)."""
+        if isinstance(v, str):
+            v = [width.strip() for width in v.split(",") if width.strip()]
+        widths = sorted({int(width) for width in v})
+        if not widths or widths[0] < 16:
+            raise ValueError("photo_variant_widths must contain widths of at least 16px")
+        return widths
+
+    @field_validator("photo_variant_formats", mode="before")
+    @classmethod
+    def parse_photo_variant_formats(cls, v: Any) -> list[str]:
+        """Parse variant formats from comma-separated string or list."""
+        if isinstance(v, str):
+            v = [fmt.strip().lower() for fmt in v.split(",") if fmt.strip()]
+        allowed = {"jpeg", "webp"}
+        if not v or not set(v) <= allowed:
+            raise ValueError(f"photo_variant_formats must be a subset of {allowed}")
+        return list(dict.fromkeys(v))
+
     @field_validator("app_env")
     @classmethod
     def validate_app_env(cls, v: str) -> str:
@@ -171,6 +333,24 @@ class Settings(BaseSettings):
             raise ValueError(f"log_level must be one of {allowed_levels}")
         return v_upper
 
+    @field_validator("gpx_track_storage")
+    @classmethod
+    def validate_gpx_track_storage(cls, v: str) -> str:
+        """Validate simplified track storage mode."""
+        allowed_modes = {"rows", "blob"}
+        if v.lower() not in allowed_modes:
+            raise ValueError(f"gpx_track_storage must be one of {allowed_modes}")
+        return v.lower()
+
+    @field_validator("response_cache_backend")
+    @classmethod
+    def validate_response_cache_backend(cls, v: str) -> str:
+        """Validate response cache backend."""
+        allowed_backends = {"memory", "file"}
+        if v.lower() not in allowed_backends:
+            raise ValueError(f"response_cache_backend must be one of {allowed_backends}")
+        return v.lower()
+
     @property
     def is_production(self) -> bool:
         """Check if running in production environment."""
@@ -203,6 +383,27 @@ class Settings(BaseSettings):
 
         return str(Path(self.storage_path) / self.trip_photos_path)
 
+    @property
+    def photo_variant_cache_full_path(self) -> str:
+        """Get full path for the on-demand photo variant cache."""
+        from pathlib import Path
+
+        return str(Path(self.storage_path) / self.photo_variant_cache_path)
+
+    @property
+    def gpx_cache_full_path(self) -> str:
+        """Get full path for the on-disk GPX analysis cache."""
+        from pathlib import Path
+
+        return str(Path(self.storage_path) / self.gpx_cache_path)
+
+    @property
+    def response_cache_full_path(self) -> str:
+        """Get full path for the file response cache backend."""
+        from pathlib import Path
+
+        return str(Path(self.storage_path) / self.response_cache_path)
+
 
 # Global settings instance
 settings = Settings()
@@ -4,6 +4,9 @@ FastAPI application entry point for ContraVento backend.
 Initializes the FastAPI app with middleware, error handling, and routing.
 """
 
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -29,6 +32,32 @@ from src.models.trip import Tag, Trip, TripLocation, TripPhoto, TripTag  # noqa:
 # Import all models to ensure SQLAlchemy relationships are resolved
 # This must happen before any route handlers are registered
 from src.models.user import User, UserProfile  # noqa: F401
+from src.utils.gpx_executor import GPXExecutorBusyError, shutdown_gpx_executor
+from src.utils.image_executor import ImageExecutorBusyError, shutdown_image_executor
+from src.utils.password_executor import shutdown_password_executor
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Start the embedded GPX worker (if enabled) and release resources on shutdown."""
+    worker_task = None
+    stop_event = asyncio.Event()
+    if settings.gpx_worker_embedded:
+        from src.workers.gpx_worker import default_worker_id, run_worker
+
+        worker_task = asyncio.create_task(
+            run_worker(default_worker_id(), settings.gpx_job_poll_seconds, stop_event)
+        )
+
+    yield
+
+    if worker_task is not None:
+        stop_event.set()
+        await worker_task
+    shutdown_gpx_executor()
+    shutdown_password_executor()
+    shutdown_image_executor()
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -37,6 +66,7 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs" if settings.is_development or settings.is_testing else None,
     redoc_url="/redoc" if settings.is_development or settings.is_testing else None,
+    lifespan=lifespan,
 )
 
 
@@ -175,6 +205,56 @@ async def validation_exception_handler(
     )
 
 
+@app.exception_handler(GPXExecutorBusyError)
+async def gpx_busy_exception_handler(request: Request, exc: GPXExecutorBusyError) -> JSONResponse:
+    """
+    Handle GPX process pool saturation with 503 and Retry-After.
+
+    Args:
+        request: FastAPI request
+        exc: Saturation error
+
+    Returns:
+        Standardized error response
+    """
+    error = {
+        "code": "GPX_PROCESSING_BUSY",
+        "message": str(exc),
+    }
+
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=create_response(success=False, error=error),
+        headers={"Retry-After": "5"},
+    )
+
+
+@app.exception_handler(ImageExecutorBusyError)
+async def image_busy_exception_handler(
+    request: Request, exc: ImageExecutorBusyError
+) -> JSONResponse:
+    """
+    Handle photo processing pool saturation (or job timeout) with 503 and Retry-After.
+
+    Args:
+        request: FastAPI request
+        exc: Saturation or timeout error
+
+    Returns:
+        Standardized error response
+    """
+    error = {
+        "code": "IMAGE_PROCESSING_BUSY",
+        "message": str(exc),
+    }
+
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=create_response(success=False, error=error),
+        headers={"Retry-After": "5"},
+    )
+
+
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """
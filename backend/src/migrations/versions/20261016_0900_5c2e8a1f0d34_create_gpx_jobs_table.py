@@ -0,0 +1,57 @@
+"""create_gpx_jobs_table
+
+Feature 003 - Durable queue for background GPX processing
+
+Creates the gpx_jobs table leased by GPX workers (src/workers/gpx_worker.py)
+to process large uploads outside the API process, with retries.
+
+Revision ID: 5c2e8a1f0d34
+Revises: 1f920057696f
+Create Date: 2026-10-16 09:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c2e8a1f0d34"
+down_revision: Union[str, None] = "1f920057696f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create gpx_jobs table."""
+    op.create_table(
+        "gpx_jobs",
+        sa.Column("job_id", sa.String(36), primary_key=True),
+        sa.Column(
+            "gpx_file_id",
+            sa.String(36),
+            sa.ForeignKey("gpx_files.gpx_file_id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("file_path", sa.String(500), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False, server_default="pending"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("max_attempts", sa.Integer(), nullable=False, server_default="3"),
+        sa.Column("available_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("leased_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("worker_id", sa.String(100), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+    op.create_index("ix_gpx_jobs_gpx_file_id", "gpx_jobs", ["gpx_file_id"])
+    op.create_index("idx_gpx_jobs_status_available", "gpx_jobs", ["status", "available_at"])
+
+
+def downgrade() -> None:
+    """Drop gpx_jobs table."""
+    op.drop_index("idx_gpx_jobs_status_available", table_name="gpx_jobs")
+    op.drop_index("ix_gpx_jobs_gpx_file_id", table_name="gpx_jobs")
+    op.drop_table("gpx_jobs")
@@ -0,0 +1,191 @@
+"""add track_blob to gpx_files
+
+Feature 003 - Compact simplified track storage
+
+Adds gpx_files.track_blob (simplified track packed by src/utils/track_codec.py)
+and backfills it from the existing track_points rows, so tracks are read with a
+single-row fetch. The rows are kept; once GPX_TRACK_STORAGE=blob is enabled
+they are no longer read and can be deleted to shrink track_points.
+
+Revision ID: 8d41b7e2a9c5
+Revises: 5c2e8a1f0d34
+Create Date: 2026-10-16 10:00:00.000000+00:00
+
+"""
+import struct
+import uuid
+import zlib
+from typing import Any, Sequence, Union
+
+from alembic import op
+import numpy as np
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d41b7e2a9c5"
+down_revision: Union[str, None] = "5c2e8a1f0d34"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Track blob format v1 as written at this revision (see src/utils/track_codec.py)
+_HEADER = struct.Struct("<3sBIB")  # magic, version, point count, flags
+MAGIC = b"CVT"
+VERSION = 1
+FLAG_ELEVATION = 0x01
+FLAG_GRADIENT = 0x02
+COORD_SCALE = 10_000_000
+DISTANCE_SCALE = 1000
+ELEVATION_SCALE = 1000
+GRADIENT_SCALE = 100
+MISSING = np.iinfo(np.int32).min
+
+
+def _fixed(values: np.ndarray, scale: int) -> np.ndarray:
+    fixed = np.full(values.shape, MISSING, dtype=np.int64)
+    present = ~np.isnan(values)
+    fixed[present] = np.rint(values[present] * scale).astype(np.int64)
+    return fixed
+
+
+def _from_fixed(fixed: np.ndarray, scale: int) -> np.ndarray:
+    values = fixed / scale
+    values[fixed == MISSING] = np.nan
+    return values
+
+
+def _delta(fixed: np.ndarray, nullable: bool = False) -> np.ndarray:
+    present = fixed != MISSING if nullable else np.ones(fixed.shape, dtype=bool)
+    encoded = np.full(fixed.shape, MISSING, dtype=np.int32)
+    encoded[present] = np.diff(fixed[present], prepend=0).astype(np.int32)
+    return encoded
+
+
+def _undelta(encoded: np.ndarray, nullable: bool = False) -> np.ndarray:
+    present = encoded != MISSING if nullable else np.ones(encoded.shape, dtype=bool)
+    fixed = np.full(encoded.shape, MISSING, dtype=np.int64)
+    fixed[present] = np.cumsum(encoded[present], dtype=np.int32)
+    return fixed
+
+
+def _column(trackpoints: list[dict[str, Any]], key: str) -> np.ndarray:
+    return np.array(
+        [np.nan if point[key] is None else point[key] for point in trackpoints], dtype=np.float64
+    )
+
+
+def encode_track(trackpoints: list[dict[str, Any]]) -> bytes:
+    """Pack trackpoint dicts (ordered by sequence) into a v1 track blob."""
+    ele = _column(trackpoints, "elevation")
+    gradient = _column(trackpoints, "gradient")
+
+    flags = 0
+    arrays = [
+        _delta(_fixed(_column(trackpoints, "latitude"), COORD_SCALE)),
+        _delta(_fixed(_column(trackpoints, "longitude"), COORD_SCALE)),
+        _delta(_fixed(_column(trackpoints, "distance_km"), DISTANCE_SCALE)),
+    ]
+    if not np.isnan(ele).all():
+        flags |= FLAG_ELEVATION
+        arrays.append(_delta(_fixed(ele, ELEVATION_SCALE), nullable=True))
+    if not np.isnan(gradient).all():
+        flags |= FLAG_GRADIENT
+        arrays.append(_fixed(gradient, GRADIENT_SCALE).astype(np.int32))
+
+    body = b"".join(array.astype("<i4", copy=False).tobytes() for array in arrays)
+    return _HEADER.pack(MAGIC, VERSION, len(trackpoints), flags) + zlib.compress(body)
+
+
+def decode_track(blob: bytes) -> list[dict[str, Any]]:
+    """Unpack a v1 track blob into trackpoint dicts (missing values as None)."""
+    _, _, count, flags = _HEADER.unpack_from(blob)
+    n_arrays = 3 + bool(flags & FLAG_ELEVATION) + bool(flags & FLAG_GRADIENT)
+    body = zlib.decompress(blob[_HEADER.size :])
+    arrays = iter(np.frombuffer(body, dtype="<i4").reshape(n_arrays, count))
+
+    lat = _undelta(next(arrays)) / COORD_SCALE
+    lon = _undelta(next(arrays)) / COORD_SCALE
+    distance = _undelta(next(arrays)) / DISTANCE_SCALE
+    ele = np.full(count, np.nan)
+    if flags & FLAG_ELEVATION:
+        ele = _from_fixed(_undelta(next(arrays), nullable=True), ELEVATION_SCALE)
+    gradient = np.full(count, np.nan)
+    if flags & FLAG_GRADIENT:
+        gradient = _from_fixed(next(arrays).astype(np.int64), GRADIENT_SCALE)
+
+    return [
+        {
+            "latitude": point_lat,
+            "longitude": point_lon,
+            "elevation": None if e != e else e,
+            "distance_km": point_distance,
+            "sequence": sequence,
+            "gradient": None if g != g else g,
+        }
+        for sequence, (point_lat, point_lon, e, point_distance, g) in enumerate(
+            zip(
+                lat.tolist(),
+                lon.tolist(),
+                ele.tolist(),
+                distance.tolist(),
+                gradient.tolist(),
+                strict=True,
+            )
+        )
+    ]
+
+
+def upgrade() -> None:
+    """Add track_blob column and backfill it from track_points."""
+    with op.batch_alter_table("gpx_files", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("track_blob", sa.LargeBinary(), nullable=True))
+
+    conn = op.get_bind()
+    gpx_file_ids = (
+        conn.execute(sa.text("SELECT DISTINCT gpx_file_id FROM track_points")).scalars().all()
+    )
+
+    for gpx_file_id in gpx_file_ids:
+        rows = conn.execute(
+            sa.text(
+                "SELECT latitude, longitude, elevation, distance_km, sequence, gradient "
+                "FROM track_points WHERE gpx_file_id = :gpx_file_id ORDER BY sequence"
+            ),
+            {"gpx_file_id": gpx_file_id},
+        ).mappings()
+        conn.execute(
+            sa.text("UPDATE gpx_files SET track_blob = :track_blob WHERE gpx_file_id = :gpx_file_id"),
+            {"track_blob": encode_track([dict(row) for row in rows]), "gpx_file_id": gpx_file_id},
+        )
+
+
+def downgrade() -> None:
+    """Restore track_points rows for blob-only tracks, then drop track_blob."""
+    conn = op.get_bind()
+    blob_only = conn.execute(
+        sa.text(
+            "SELECT gpx_file_id, track_blob FROM gpx_files "
+            "WHERE track_blob IS NOT NULL AND NOT EXISTS "
+            "(SELECT 1 FROM track_points WHERE track_points.gpx_file_id = gpx_files.gpx_file_id)"
+        )
+    ).all()
+
+    for gpx_file_id, track_blob in blob_only:
+        rows = [
+            {**point, "point_id": str(uuid.uuid4()), "gpx_file_id": gpx_file_id}
+            for point in decode_track(track_blob)
+        ]
+        if rows:
+            conn.execute(
+                sa.text(
+                    "INSERT INTO track_points (point_id, gpx_file_id, latitude, longitude, "
+                    "elevation, distance_km, sequence, gradient) VALUES (:point_id, "
+                    ":gpx_file_id, :latitude, :longitude, :elevation, :distance_km, "
+                    ":sequence, :gradient)"
+                ),
+                rows,
+            )
+
+    # Plain ALTER TABLE (SQLite >= 3.35): a batch table rebuild of gpx_files would
+    # cascade-delete its track_points, route_statistics and gpx_jobs rows
+    op.drop_column("gpx_files", "track_blob")
@@ -0,0 +1,271 @@
+"""create gpx_track_tiers table
+
+Feature 003 - Level-of-detail track tiers
+
+Creates gpx_track_tiers (coarser simplifications of each stored track, packed
+by src/utils/track_codec.py) served by GET /gpx/{id}/track for low zoom levels
+and point budgets, and backfills them from the stored detail tracks.
+
+Revision ID: 3b7f9c2d6e18
+Revises: 8d41b7e2a9c5
+Create Date: 2026-10-16 11:00:00.000000+00:00
+
+"""
+import struct
+import zlib
+from typing import Any, Sequence, Union
+
+from alembic import op
+import numpy as np
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3b7f9c2d6e18"
+down_revision: Union[str, None] = "8d41b7e2a9c5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Track blob format v1 as written at this revision (see src/utils/track_codec.py)
+_HEADER = struct.Struct("<3sBIB")  # magic, version, point count, flags
+MAGIC = b"CVT"
+VERSION = 1
+FLAG_ELEVATION = 0x01
+FLAG_GRADIENT = 0x02
+COORD_SCALE = 10_000_000
+DISTANCE_SCALE = 1000
+ELEVATION_SCALE = 1000
+GRADIENT_SCALE = 100
+MISSING = np.iinfo(np.int32).min
+
+
+def _fixed(values: np.ndarray, scale: int) -> np.ndarray:
+    fixed = np.full(values.shape, MISSING, dtype=np.int64)
+    present = ~np.isnan(values)
+    fixed[present] = np.rint(values[present] * scale).astype(np.int64)
+    return fixed
+
+
+def _from_fixed(fixed: np.ndarray, scale: int) -> np.ndarray:
+    values = fixed / scale
+    values[fixed == MISSING] = np.nan
+    return values
+
+
+def _delta(fixed: np.ndarray, nullable: bool = False) -> np.ndarray:
+    present = fixed != MISSING if nullable else np.ones(fixed.shape, dtype=bool)
+    encoded = np.full(fixed.shape, MISSING, dtype=np.int32)
+    encoded[present] = np.diff(fixed[present], prepend=0).astype(np.int32)
+    return encoded
+
+
+def _undelta(encoded: np.ndarray, nullable: bool = False) -> np.ndarray:
+    present = encoded != MISSING if nullable else np.ones(encoded.shape, dtype=bool)
+    fixed = np.full(encoded.shape, MISSING, dtype=np.int64)
+    fixed[present] = np.cumsum(encoded[present], dtype=np.int32)
+    return fixed
+
+
+def _column(trackpoints: list[dict[str, Any]], key: str) -> np.ndarray:
+    return np.array(
+        [np.nan if point[key] is None else point[key] for point in trackpoints], dtype=np.float64
+    )
+
+
+def encode_track(trackpoints: list[dict[str, Any]]) -> bytes:
+    """Pack trackpoint dicts (ordered by sequence) into a v1 track blob."""
+    ele = _column(trackpoints, "elevation")
+    gradient = _column(trackpoints, "gradient")
+
+    flags = 0
+    arrays = [
+        _delta(_fixed(_column(trackpoints, "latitude"), COORD_SCALE)),
+        _delta(_fixed(_column(trackpoints, "longitude"), COORD_SCALE)),
+        _delta(_fixed(_column(trackpoints, "distance_km"), DISTANCE_SCALE)),
+    ]
+    if not np.isnan(ele).all():
+        flags |= FLAG_ELEVATION
+        arrays.append(_delta(_fixed(ele, ELEVATION_SCALE), nullable=True))
+    if not np.isnan(gradient).all():
+        flags |= FLAG_GRADIENT
+        arrays.append(_fixed(gradient, GRADIENT_SCALE).astype(np.int32))
+
+    body = b"".join(array.astype("<i4", copy=False).tobytes() for array in arrays)
+    return _HEADER.pack(MAGIC, VERSION, len(trackpoints), flags) + zlib.compress(body)
+
+
+def decode_track(blob: bytes) -> list[dict[str, Any]]:
+    """Unpack a v1 track blob into trackpoint dicts (missing values as None)."""
+    _, _, count, flags = _HEADER.unpack_from(blob)
+    n_arrays = 3 + bool(flags & FLAG_ELEVATION) + bool(flags & FLAG_GRADIENT)
+    body = zlib.decompress(blob[_HEADER.size :])
+    arrays = iter(np.frombuffer(body, dtype="<i4").reshape(n_arrays, count))
+
+    lat = _undelta(next(arrays)) / COORD_SCALE
+    lon = _undelta(next(arrays)) / COORD_SCALE
+    distance = _undelta(next(arrays)) / DISTANCE_SCALE
+    ele = np.full(count, np.nan)
+    if flags & FLAG_ELEVATION:
+        ele = _from_fixed(_undelta(next(arrays), nullable=True), ELEVATION_SCALE)
+    gradient = np.full(count, np.nan)
+    if flags & FLAG_GRADIENT:
+        gradient = _from_fixed(next(arrays).astype(np.int64), GRADIENT_SCALE)
+
+    return [
+        {
+            "latitude": point_lat,
+            "longitude": point_lon,
+            "elevation": None if e != e else e,
+            "distance_km": point_distance,
+            "sequence": sequence,
+            "gradient": None if g != g else g,
+        }
+        for sequence, (point_lat, point_lon, e, point_distance, g) in enumerate(
+            zip(
+                lat.tolist(),
+                lon.tolist(),
+                ele.tolist(),
+                distance.tolist(),
+                gradient.tolist(),
+                strict=True,
+            )
+        )
+    ]
+
+
+# Coarser tiers at this revision: name -> RDP epsilon in degrees (see TRACK_TIERS)
+TIER_EPSILONS = {
+    "regional": 0.0005,  # ≈ 50 meters
+    "overview": 0.002,  # ≈ 200 meters
+}
+
+
+def _rdp_mask(lat: np.ndarray, lon: np.ndarray, epsilon: float) -> np.ndarray:
+    """Ramer-Douglas-Peucker keep-mask over (lat, lon) degrees."""
+    n = lat.shape[0]
+    mask = np.ones(n, dtype=bool)
+    stack = [(0, n - 1)]
+    while stack:
+        start, last = stack.pop()
+        if last - start < 2:
+            continue
+
+        px = lat[start + 1 : last]
+        py = lon[start + 1 : last]
+        dx = lat[last] - lat[start]
+        dy = lon[last] - lon[start]
+        if dx == 0 and dy == 0:
+            distances = np.hypot(px - lat[start], py - lon[start])
+        else:
+            distances = np.abs(dx * (lon[start] - py) - dy * (lat[start] - px)) / np.hypot(dx, dy)
+
+        index = int(np.argmax(distances))
+        if distances[index] > epsilon:
+            split = start + 1 + index
+            stack.append((start, split))
+            stack.append((split, last))
+        else:
+            mask[start + 1 : last] = False
+    return mask
+
+
+def build_track_tiers(trackpoints: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    """Simplify the detail track into each coarser tier, recomputing gradients."""
+    lat = _column(trackpoints, "latitude")
+    lon = _column(trackpoints, "longitude")
+    distance_km = _column(trackpoints, "distance_km")
+    ele = _column(trackpoints, "elevation")
+
+    tiers = {}
+    for tier, epsilon in TIER_EPSILONS.items():
+        mask = _rdp_mask(lat, lon, epsilon)
+        tier_distance = distance_km[mask]
+        tier_ele = ele[mask]
+
+        # Gradient (%) relative to the previous kept point
+        gradients = np.full(tier_ele.shape[0], np.nan)
+        distance_m = np.diff(tier_distance) * 1000
+        elevation_diff = np.diff(tier_ele)
+        valid = (distance_m > 0) & ~np.isnan(elevation_diff)
+        gradients[1:][valid] = elevation_diff[valid] / distance_m[valid] * 100
+
+        tiers[tier] = [
+            {
+                "latitude": point_lat,
+                "longitude": point_lon,
+                "elevation": None if e != e else e,
+                "distance_km": point_distance,
+                "sequence": sequence,
+                "gradient": None if g != g else round(g, 2),
+            }
+            for sequence, (point_lat, point_lon, e, point_distance, g) in enumerate(
+                zip(
+                    lat[mask].tolist(),
+                    lon[mask].tolist(),
+                    tier_ele.tolist(),
+                    tier_distance.tolist(),
+                    gradients.tolist(),
+                    strict=True,
+                )
+            )
+        ]
+    return tiers
+
+
+def upgrade() -> None:
+    """Create gpx_track_tiers table and backfill it from the detail tracks."""
+    op.create_table(
+        "gpx_track_tiers",
+        sa.Column(
+            "gpx_file_id",
+            sa.String(36),
+            sa.ForeignKey("gpx_files.gpx_file_id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("tier", sa.String(20), primary_key=True),
+        sa.Column("epsilon", sa.Float(), nullable=False),
+        sa.Column("point_count", sa.Integer(), nullable=False),
+        sa.Column("track_blob", sa.LargeBinary(), nullable=False),
+    )
+
+    conn = op.get_bind()
+    gpx_files = conn.execute(
+        sa.text("SELECT gpx_file_id, track_blob FROM gpx_files WHERE processing_status = 'completed'")
+    ).all()
+
+    for gpx_file_id, track_blob in gpx_files:
+        if track_blob is not None:
+            trackpoints = decode_track(track_blob)
+        else:
+            rows = conn.execute(
+                sa.text(
+                    "SELECT latitude, longitude, elevation, distance_km, sequence, gradient "
+                    "FROM track_points WHERE gpx_file_id = :gpx_file_id ORDER BY sequence"
+                ),
+                {"gpx_file_id": gpx_file_id},
+            ).mappings()
+            trackpoints = [dict(row) for row in rows]
+        if not trackpoints:
+            continue
+
+        conn.execute(
+            sa.text(
+                "INSERT INTO gpx_track_tiers (gpx_file_id, tier, epsilon, point_count, "
+                "track_blob) VALUES (:gpx_file_id, :tier, :epsilon, :point_count, :track_blob)"
+            ),
+            [
+                {
+                    "gpx_file_id": gpx_file_id,
+                    "tier": tier,
+                    "epsilon": TIER_EPSILONS[tier],
+                    "point_count": len(points),
+                    "track_blob": encode_track(points),
+                }
+                for tier, points in build_track_tiers(trackpoints).items()
+            ],
+        )
+
+
+def downgrade() -> None:
+    """Drop gpx_track_tiers table."""
+    op.drop_table("gpx_track_tiers")
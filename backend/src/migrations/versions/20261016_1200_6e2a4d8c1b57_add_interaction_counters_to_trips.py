@@ -0,0 +1,52 @@
+"""add interaction counters to trips
+
+Feature 004 - Denormalized interaction counters
+
+Adds trips.likes_count, trips.comments_count and trips.shares_count (kept in
+sync on write by src/models/interaction_counters.py) and backfills them from
+the likes, comments and shares tables.
+
+Revision ID: 6e2a4d8c1b57
+Revises: 3b7f9c2d6e18
+Create Date: 2026-10-16 12:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6e2a4d8c1b57"
+down_revision: Union[str, None] = "3b7f9c2d6e18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTERS = {
+    "likes_count": "likes",
+    "comments_count": "comments",
+    "shares_count": "shares",
+}
+
+
+def upgrade() -> None:
+    """Add counter columns and backfill them."""
+    # Plain ADD COLUMN: a batch table rebuild of trips would cascade-delete its children
+    for column in COUNTERS:
+        op.add_column(
+            "trips", sa.Column(column, sa.Integer(), nullable=False, server_default="0")
+        )
+
+    for column, table in COUNTERS.items():
+        op.execute(
+            f"UPDATE trips SET {column} = "
+            f"(SELECT COUNT(*) FROM {table} WHERE {table}.trip_id = trips.trip_id)"
+        )
+
+
+def downgrade() -> None:
+    """Drop counter columns."""
+    # Plain ALTER TABLE (SQLite >= 3.35), see upgrade()
+    for column in COUNTERS:
+        op.drop_column("trips", column)
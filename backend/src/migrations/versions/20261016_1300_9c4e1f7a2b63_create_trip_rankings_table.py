@@ -0,0 +1,105 @@
+"""create trip_rankings table
+
+Feature 004 - Precomputed community ranking
+
+Creates trip_rankings (popularity and hot score of every published, public
+trip, kept up to date by src/models/trip_ranking.py) read by the community
+feed, and backfills it from the trips interaction counters.
+
+Revision ID: 9c4e1f7a2b63
+Revises: 6e2a4d8c1b57
+Create Date: 2026-10-16 13:00:00.000000+00:00
+
+"""
+import math
+from datetime import UTC, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9c4e1f7a2b63"
+down_revision: Union[str, None] = "6e2a4d8c1b57"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Hot score parameters at this revision (see src/models/trip_ranking.py)
+HOT_SCORE_GRAVITY = 45000
+HOT_SCORE_EPOCH = datetime(2024, 1, 1, tzinfo=UTC)
+
+trips = sa.table(
+    "trips",
+    sa.column("trip_id", sa.String),
+    sa.column("user_id", sa.String),
+    sa.column("status", sa.String),
+    sa.column("is_private", sa.Boolean),
+    sa.column("published_at", sa.DateTime(timezone=True)),
+    sa.column("created_at", sa.DateTime(timezone=True)),
+    sa.column("likes_count", sa.Integer),
+    sa.column("comments_count", sa.Integer),
+    sa.column("shares_count", sa.Integer),
+)
+
+
+def _hot_score(score: int, published_at: datetime) -> float:
+    """log10(max(score, 1)) + age / HOT_SCORE_GRAVITY (naive dates taken as UTC)."""
+    if published_at.tzinfo is None:
+        published_at = published_at.replace(tzinfo=UTC)
+    age = (published_at - HOT_SCORE_EPOCH).total_seconds()
+    return round(math.log10(max(score, 1)) + age / HOT_SCORE_GRAVITY, 7)
+
+
+def upgrade() -> None:
+    """Create trip_rankings table and backfill it."""
+    rankings = op.create_table(
+        "trip_rankings",
+        sa.Column(
+            "trip_id",
+            sa.String(36),
+            sa.ForeignKey("trips.trip_id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("user_id", sa.String(36), nullable=False),
+        sa.Column("published_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("score", sa.Integer(), nullable=False),
+        sa.Column("hot_score", sa.Float(), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "idx_trip_ranking_score", "trip_rankings", ["score", "published_at", "trip_id"]
+    )
+    op.create_index("idx_trip_ranking_hot", "trip_rankings", ["hot_score", "trip_id"])
+
+    # Backfill from the interaction counters of published, public trips
+    ranked = op.get_bind().execute(
+        sa.select(
+            trips.c.trip_id,
+            trips.c.user_id,
+            sa.func.coalesce(trips.c.published_at, trips.c.created_at),
+            trips.c.likes_count + trips.c.comments_count + trips.c.shares_count,
+        ).where(trips.c.status == "PUBLISHED", trips.c.is_private.is_(False))
+    ).all()
+
+    refreshed_at = datetime.now(UTC)
+    rows = [
+        {
+            "trip_id": trip_id,
+            "user_id": user_id,
+            "published_at": published_at,
+            "score": score,
+            "hot_score": _hot_score(score, published_at),
+            "refreshed_at": refreshed_at,
+        }
+        for trip_id, user_id, published_at, score in ranked
+    ]
+    if rows:
+        op.bulk_insert(rankings, rows)
+
+
+def downgrade() -> None:
+    """Drop trip_rankings table."""
+    op.drop_index("idx_trip_ranking_hot", table_name="trip_rankings")
+    op.drop_index("idx_trip_ranking_score", table_name="trip_rankings")
+    op.drop_table("trip_rankings")
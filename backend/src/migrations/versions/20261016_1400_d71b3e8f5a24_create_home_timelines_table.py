@@ -0,0 +1,61 @@
+"""create home_timelines table
+
+Feature 004 - Home timeline (fan-out on write)
+
+Creates home_timelines, the per-user list of followed users' trips written on
+trip publication by src/services/timeline_service.py. Left empty: timelines
+are only written with HOME_TIMELINE_ENABLED, so run
+scripts/dev-tools/rebuild_home_timelines.py before enabling it.
+
+Revision ID: d71b3e8f5a24
+Revises: 9c4e1f7a2b63
+Create Date: 2026-10-16 14:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d71b3e8f5a24"
+down_revision: Union[str, None] = "9c4e1f7a2b63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create home_timelines table."""
+    op.create_table(
+        "home_timelines",
+        sa.Column(
+            "user_id",
+            sa.String(36),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "trip_id",
+            sa.String(36),
+            sa.ForeignKey("trips.trip_id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("author_id", sa.String(36), nullable=False),
+        sa.Column("published_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_home_timelines_user_published",
+        "home_timelines",
+        ["user_id", "published_at", "trip_id"],
+    )
+    op.create_index(
+        "ix_home_timelines_user_author", "home_timelines", ["user_id", "author_id"]
+    )
+
+
+def downgrade() -> None:
+    """Drop home_timelines table."""
+    op.drop_index("ix_home_timelines_user_author", table_name="home_timelines")
+    op.drop_index("ix_home_timelines_user_published", table_name="home_timelines")
+    op.drop_table("home_timelines")
@@ -0,0 +1,39 @@
+"""create cycling_type_registry table
+
+Single-row version counter of cycling_types, bumped with every cycling type
+change so each worker's in-memory registry
+(src/services/cycling_type_registry.py) knows when to reload.
+
+Revision ID: 4f8a2c6e9d31
+Revises: d71b3e8f5a24
+Create Date: 2026-10-16 15:00:00.000000+00:00
+
+"""
+from datetime import UTC, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4f8a2c6e9d31"
+down_revision: Union[str, None] = "d71b3e8f5a24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create cycling_type_registry table with its single row."""
+    registry = op.create_table(
+        "cycling_type_registry",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.bulk_insert(registry, [{"id": 1, "version": 1, "updated_at": datetime.now(UTC)}])
+
+
+def downgrade() -> None:
+    """Drop cycling_type_registry table."""
+    op.drop_table("cycling_type_registry")
@@ -0,0 +1,39 @@
+"""add variants to trip_photos
+
+Responsive photo variants
+
+Adds trip_photos.variants, the responsive sizes/encodings stored for each
+photo ([{url, width, height, format, file_size}], smallest first). Existing
+photos get an empty list and keep being served from photo_url/thumb_url.
+
+Revision ID: b83d5f1c7a42
+Revises: 4f8a2c6e9d31
+Create Date: 2026-10-16 16:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b83d5f1c7a42"
+down_revision: Union[str, None] = "4f8a2c6e9d31"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add variants column."""
+    # Plain ADD COLUMN; the server default fills existing rows
+    op.add_column(
+        "trip_photos",
+        sa.Column("variants", sa.JSON(), nullable=False, server_default="[]"),
+    )
+
+
+def downgrade() -> None:
+    """Drop variants column."""
+    # Plain ALTER TABLE (SQLite >= 3.35)
+    op.drop_column("trip_photos", "variants")
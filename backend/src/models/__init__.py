@@ -5,9 +5,12 @@ Exports all models for Alembic autogenerate.
 """
 
 from src.models.auth import PasswordReset
+from src.models.cache_invalidation import CACHE_TAGS  # noqa: F401 (registers listeners)
 from src.models.comment import Comment
-from src.models.cycling_type import CyclingType
-from src.models.gpx import GPXFile, TrackPoint
+from src.models.cycling_type import CyclingType, CyclingTypeRegistryVersion
+from src.models.gpx import GPXFile, TrackPoint, TrackTier
+from src.models.gpx_job import GPXJob
+from src.models.interaction_counters import INTERACTION_COUNTERS  # noqa: F401 (registers listeners)
 from src.models.like import Like
 from src.models.notification import Notification
 from src.models.poi import PointOfInterest, POIType
@@ -15,7 +18,9 @@ from src.models.route_statistics import RouteStatistics
 from src.models.share import Share
 from src.models.social import Follow
 from src.models.stats import Achievement, UserAchievement, UserStats
+from src.models.timeline import TimelineEntry
 from src.models.trip import Tag, Trip, TripLocation, TripPhoto, TripTag
+from src.models.trip_ranking import TripRanking
 from src.models.user import User, UserProfile, UserRole
 
 __all__ = [
@@ -24,7 +29,9 @@ __all__ = [
     "UserRole",
     "PasswordReset",
     "CyclingType",
+    "CyclingTypeRegistryVersion",
     "Follow",
+    "TimelineEntry",
     "Like",
     "Comment",
     "Share",
@@ -37,8 +44,11 @@ __all__ = [
     "Tag",
     "TripTag",
     "TripLocation",
+    "TripRanking",
     "GPXFile",
     "TrackPoint",
+    "TrackTier",
+    "GPXJob",
     "RouteStatistics",
     "PointOfInterest",
     "POIType",
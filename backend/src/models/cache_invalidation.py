@@ -0,0 +1,126 @@
+"""
+Response cache invalidation on write.
+
+Maps the models written in a transaction to the response cache tags built
+from them (src/utils/response_cache.py) and invalidates those tags when the
+transaction commits, so every service that writes through the ORM keeps the
+cached public endpoints fresh without calling the cache itself. Rolled back
+transactions invalidate nothing.
+
+Writes that bypass the ORM unit of work (Core insert/update/delete) register
+their tags explicitly with invalidate_on_commit().
+
+Updated or deleted users are also evicted from the authenticated user cache
+(src/utils/user_cache.py) on commit.
+"""
+
+from typing import Any
+
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.models.comment import Comment
+from src.models.cycling_type import CyclingType
+from src.models.gpx import GPXFile, TrackPoint, TrackTier
+from src.models.like import Like
+from src.models.route_statistics import RouteStatistics
+from src.models.share import Share
+from src.models.stats import Achievement, UserAchievement, UserStats
+from src.models.trip import Tag, Trip, TripLocation, TripPhoto, TripTag
+from src.models.user import User, UserProfile
+from src.utils import response_cache
+from src.utils.user_cache import evict_users
+
+# Model -> tags of the cached responses that include its rows
+CACHE_TAGS: dict[type, tuple[str, ...]] = {
+    Trip: ("trips",),
+    TripPhoto: ("trips",),
+    TripLocation: ("trips",),
+    Like: ("trips",),
+    Comment: ("trips",),
+    Share: ("trips",),
+    Tag: ("tags",),
+    TripTag: ("tags",),
+    CyclingType: ("cycling_types",),
+    Achievement: ("achievements", "stats"),
+    UserStats: ("stats",),
+    UserAchievement: ("stats",),
+    User: ("trips", "stats"),
+    UserProfile: ("trips", "stats"),
+}
+
+# User columns shown in cached responses. Other updates (login bookkeeping such as
+# last_login_at or failed_login_attempts) invalidate nothing.
+USER_CACHED_COLUMNS = ("username", "profile_visibility", "trip_visibility", "is_active")
+
+# Models whose responses are cached per GPX file
+GPX_MODELS = (GPXFile, TrackPoint, TrackTier, RouteStatistics)
+
+_PENDING_KEY = "response_cache_tags"
+_PENDING_USERS_KEY = "user_cache_evictions"
+
+
+def cache_tags(instance: Any) -> tuple[str, ...]:
+    """
+    Response cache tags affected by writing a model instance.
+
+    Args:
+        instance: Inserted, updated or deleted instance
+
+    Returns:
+        Tags to invalidate
+    """
+    if isinstance(instance, GPX_MODELS):
+        return (f"gpx:{instance.gpx_file_id}",)
+    return CACHE_TAGS.get(type(instance), ())
+
+
+def invalidate_on_commit(session: Session | AsyncSession, *tags: str) -> None:
+    """
+    Invalidate response cache tags when the session's transaction commits.
+
+    For Core statements, which the flush listener does not see.
+
+    Args:
+        session: Session running the write
+        *tags: Tags to invalidate
+    """
+    session.info.setdefault(_PENDING_KEY, set()).update(tags)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_tags(session: Session, flush_context: Any) -> None:
+    pending = session.info.setdefault(_PENDING_KEY, set())
+    for instance in (*session.new, *session.deleted):
+        pending.update(cache_tags(instance))
+    for instance in session.dirty:
+        if isinstance(instance, User) and not _cached_user_columns_changed(instance):
+            continue
+        pending.update(cache_tags(instance))
+
+    users = [user.id for user in (*session.dirty, *session.deleted) if isinstance(user, User)]
+    if users:
+        session.info.setdefault(_PENDING_USERS_KEY, set()).update(users)
+
+
+def _cached_user_columns_changed(user: User) -> bool:
+    attrs = inspect(user).attrs
+    return any(attrs[column].history.has_changes() for column in USER_CACHED_COLUMNS)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_tags(session: Session) -> None:
+    tags = session.info.pop(_PENDING_KEY, None)
+    if tags:
+        response_cache.invalidate(*tags)
+
+    users = session.info.pop(_PENDING_USERS_KEY, None)
+    if users:
+        evict_users(*users)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_tags(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_PENDING_USERS_KEY, None)
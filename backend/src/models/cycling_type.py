@@ -2,12 +2,18 @@
 CyclingType model for managing cycling type categories.
 
 Allows dynamic management of cycling types through database instead of hardcoded values.
+
+Every insert/update/delete of a cycling type also bumps the shared registry
+version (CyclingTypeRegistryVersion), which tells each worker's in-memory
+registry (src/services/cycling_type_registry.py) to reload.
 """
 
 from datetime import UTC, datetime
+from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import Boolean, DateTime, String, Text
+from sqlalchemy import Boolean, DateTime, Integer, String, Text, event, insert, update
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.database import Base
@@ -90,3 +96,55 @@ class CyclingType(Base):
     def __repr__(self) -> str:
         """String representation for debugging."""
         return f"<CyclingType(code={self.code}, display_name={self.display_name}, active={self.is_active})>"
+
+
+class CyclingTypeRegistryVersion(Base):
+    """
+    Single-row version counter of the cycling_types table.
+
+    Incremented in the same transaction as every cycling type change, so
+    workers detect a stale in-memory registry with one primary key lookup
+    instead of reloading the table.
+    """
+
+    __tablename__ = "cycling_type_registry"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)  # Always REGISTRY_ROW_ID
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<CyclingTypeRegistryVersion(version={self.version})>"
+
+
+REGISTRY_ROW_ID = 1
+
+
+def bump_registry_version(connection: Connection) -> None:
+    """
+    Increment the cycling type registry version.
+
+    Args:
+        connection: Connection of the current transaction
+    """
+    now = datetime.now(UTC)
+    result = connection.execute(
+        update(CyclingTypeRegistryVersion)
+        .where(CyclingTypeRegistryVersion.id == REGISTRY_ROW_ID)
+        .values(version=CyclingTypeRegistryVersion.version + 1, updated_at=now)
+    )
+    if result.rowcount == 0:
+        connection.execute(
+            insert(CyclingTypeRegistryVersion).values(id=REGISTRY_ROW_ID, version=1, updated_at=now)
+        )
+
+
+@event.listens_for(CyclingType, "after_insert")
+@event.listens_for(CyclingType, "after_update")
+@event.listens_for(CyclingType, "after_delete")
+def _bump_on_change(mapper: Any, connection: Connection, target: CyclingType) -> None:
+    bump_registry_version(connection)
@@ -8,8 +8,18 @@ Supports both PostgreSQL (production) and SQLite (development/testing).
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, String, Text
-from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+)
+from sqlalchemy.orm import Mapped, deferred, relationship
 
 from src.database import Base
 
@@ -65,6 +75,10 @@ class GPXFile(Base):
     total_points = Column(Integer, nullable=False)  # Original trackpoint count
     simplified_points = Column(Integer, nullable=False)  # Simplified trackpoint count
 
+    # Simplified track packed in one column (src/utils/track_codec.py), used instead
+    # of track_points rows when GPX_TRACK_STORAGE=blob. Deferred: only loaded by track reads
+    track_blob = deferred(Column(LargeBinary, nullable=True))
+
     # GPX content flags
     has_elevation = Column(Boolean, nullable=False)  # Whether GPX includes elevation data
     has_timestamps = Column(Boolean, nullable=False)  # Whether GPX includes timestamps
@@ -93,6 +107,11 @@ class GPXFile(Base):
         order_by="TrackPoint.sequence",
         cascade="all, delete-orphan",
     )
+    track_tiers: Mapped[list["TrackTier"]] = relationship(
+        "TrackTier",
+        back_populates="gpx_file",
+        cascade="all, delete-orphan",
+    )
     route_statistics: Mapped["RouteStatistics"] = relationship(
         "RouteStatistics",
         back_populates="gpx_file",
@@ -150,3 +169,37 @@ class TrackPoint(Base):
             f"<TrackPoint(point_id={self.point_id}, "
             f"gpx_file_id={self.gpx_file_id}, sequence={self.sequence})>"
         )
+
+
+class TrackTier(Base):
+    """
+    TrackTier model - Coarser level-of-detail versions of the simplified track.
+
+    Derived from the stored (detail) track at ingest with larger Douglas-Peucker
+    tolerances, so small maps (feed and trip list thumbnails, low zoom levels)
+    fetch a few dozen points instead of thousands. Each tier is packed with
+    src/utils/track_codec.py. Tier names and tolerances: GPXService TRACK_TIERS.
+    """
+
+    __tablename__ = "gpx_track_tiers"
+
+    # Composite primary key: one row per GPX file and tier
+    gpx_file_id = Column(
+        String(36),
+        ForeignKey("gpx_files.gpx_file_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    tier = Column(String(20), primary_key=True)  # overview, regional
+
+    epsilon = Column(Float, nullable=False)  # Douglas-Peucker tolerance in degrees
+    point_count = Column(Integer, nullable=False)  # Number of points in the tier
+    track_blob = Column(LargeBinary, nullable=False)  # Packed track (track_codec)
+
+    # Relationships
+    gpx_file: Mapped["GPXFile"] = relationship("GPXFile", back_populates="track_tiers")
+
+    def __repr__(self) -> str:
+        return (
+            f"<TrackTier(gpx_file_id={self.gpx_file_id}, "
+            f"tier={self.tier}, points={self.point_count})>"
+        )
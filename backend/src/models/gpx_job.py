@@ -0,0 +1,89 @@
+"""
+SQLAlchemy model for the GPX processing job queue (Feature 003).
+
+Large GPX uploads are saved to storage and processed by separate worker
+processes (src/workers/gpx_worker.py). Each upload gets a GPXJob row that
+workers lease, so jobs survive API restarts and failed jobs are retried.
+"""
+
+import uuid
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from src.database import Base
+
+if TYPE_CHECKING:
+    from src.models.gpx import GPXFile
+
+
+def generate_uuid() -> str:
+    """Generate UUID string for primary keys."""
+    return str(uuid.uuid4())
+
+
+class GPXJob(Base):
+    """
+    GPXJob model - Durable queue entry for background GPX processing.
+
+    Lifecycle:
+    - pending: Waiting for a worker (new or scheduled for retry)
+    - processing: Leased by a worker until leased_until
+    - completed: GPX processed successfully
+    - failed: Gave up after max_attempts (GPXFile marked as failed)
+
+    A processing job whose lease expired (worker crashed or was redeployed)
+    is picked up again by the next worker.
+    """
+
+    __tablename__ = "gpx_jobs"
+
+    # Primary key
+    job_id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
+
+    # Foreign keys
+    gpx_file_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("gpx_files.gpx_file_id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    # Original GPX file in storage
+    file_path: Mapped[str] = mapped_column(String(500), nullable=False)
+
+    # Queue state
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")
+    # Times the job was leased
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=3)
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+    )  # Earliest time a worker may lease the job (retry backoff)
+    leased_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Worker holding the lease
+    worker_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+    )
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    # Relationships
+    gpx_file: Mapped["GPXFile"] = relationship("GPXFile")
+
+    __table_args__ = (Index("idx_gpx_jobs_status_available", "status", "available_at"),)
+
+    def __repr__(self) -> str:
+        return (
+            f"<GPXJob(job_id={self.job_id}, gpx_file_id={self.gpx_file_id}, "
+            f"status={self.status}, attempts={self.attempts})>"
+        )
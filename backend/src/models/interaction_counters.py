@@ -0,0 +1,69 @@
+"""
+Trip interaction counters maintained on write (Feature 004).
+
+Keeps Trip.likes_count, Trip.comments_count and Trip.shares_count in step with
+the likes, comments and shares tables. Mapper events issue an atomic
+``UPDATE trips SET <counter> = <counter> ± 1`` in the same flush (and so the
+same transaction) as the row insert or delete, whichever code path writes it:
+LikeService, CommentService, share creation, cascades from user deletion.
+The trip's community ranking row (src/models/trip_ranking.py) is refreshed
+alongside.
+
+Bulk Core statements (``delete(Like).where(...)``) and database-level cascades
+bypass these events; TripService.reconcile_interaction_counters() repairs any
+drift and refreshes the rankings.
+"""
+
+from typing import Any
+
+from sqlalchemy import event, update
+from sqlalchemy.orm import object_session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.models.comment import Comment
+from src.models.like import Like
+from src.models.share import Share
+from src.models.trip import Trip
+from src.models.trip_ranking import refresh_trip_rankings
+
+# Counter column on Trip for each interaction model
+INTERACTION_COUNTERS = {
+    Like: "likes_count",
+    Comment: "comments_count",
+    Share: "shares_count",
+}
+
+
+def _adjust_counter(connection: Any, target: Any, counter: str, delta: int) -> None:
+    """Add delta to a trip counter (database, ranking and loaded Trip, if any)."""
+    counter_column = getattr(Trip, counter)
+    connection.execute(
+        update(Trip).where(Trip.trip_id == target.trip_id)
+        # Keep updated_at: an interaction is not an edit of the trip
+        .values({counter: counter_column + delta, "updated_at": Trip.updated_at})
+    )
+    refresh_trip_rankings(connection, [target.trip_id])
+
+    # Trips already loaded in the session would otherwise keep the old value
+    session = object_session(target)
+    if session is None:
+        return
+    trip = session.identity_map.get(session.identity_key(Trip, target.trip_id))
+    if trip is not None and counter in trip.__dict__:
+        set_committed_value(trip, counter, max(0, trip.__dict__[counter] + delta))
+
+
+def _register(model: type, counter: str) -> None:
+    """Attach insert/delete listeners that keep one counter in sync."""
+
+    @event.listens_for(model, "after_insert")
+    def increment(mapper: Any, connection: Any, target: Any) -> None:
+        _adjust_counter(connection, target, counter, 1)
+
+    @event.listens_for(model, "after_delete")
+    def decrement(mapper: Any, connection: Any, target: Any) -> None:
+        _adjust_counter(connection, target, counter, -1)
+
+
+for _model, _counter in INTERACTION_COUNTERS.items():
+    _register(_model, _counter)
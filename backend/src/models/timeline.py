@@ -0,0 +1,59 @@
+"""
+Home timeline model (fan-out on write).
+
+Precomputed per-user list of trips from followed users, written when a trip
+is published so the feed reads it as one indexed range query instead of
+querying trips IN (every followed user).
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database import Base
+
+
+class TimelineEntry(Base):
+    """
+    Home timeline entry: a trip delivered to a follower's timeline.
+
+    Written by src/services/timeline_service.py on trip publication and on
+    follow; removed on unfollow. Authors above the fan-out threshold
+    (settings.home_timeline_fanout_max_followers) are not fanned out and are
+    read on demand instead.
+
+    Constraints:
+    - Primary key (user_id, trip_id): a trip appears once per timeline
+    - CASCADE delete when the user or trip is deleted
+
+    Indexes:
+    - (user_id, published_at, trip_id): Timeline pages, newest first
+    - (user_id, author_id): Remove an author's trips on unfollow
+    """
+
+    __tablename__ = "home_timelines"
+
+    user_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )  # Timeline owner (follower)
+    trip_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("trips.trip_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    author_id: Mapped[str] = mapped_column(String(36), nullable=False)  # Trip author
+    published_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )  # Copy of Trip.published_at (timeline order)
+
+    __table_args__ = (
+        Index("ix_home_timelines_user_published", "user_id", "published_at", "trip_id"),
+        Index("ix_home_timelines_user_author", "user_id", "author_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<TimelineEntry(user_id={self.user_id}, trip_id={self.trip_id})>"
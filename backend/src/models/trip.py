@@ -10,6 +10,7 @@ import uuid
 from datetime import UTC, datetime
 
 from sqlalchemy import (
+    JSON,
     Boolean,
     Column,
     Date,
@@ -93,6 +94,14 @@ class Trip(Base):
     )
     published_at = Column(DateTime(timezone=True), nullable=True)  # When first published
 
+    # Interaction counters (Feature 004), denormalized so feeds never load the rows
+    # to count them. Kept in sync on every Like/Comment/Share insert and delete
+    # (src/models/interaction_counters.py); TripService.reconcile_interaction_counters()
+    # recomputes them from the source tables
+    likes_count = Column(Integer, nullable=False, default=0, server_default="0")
+    comments_count = Column(Integer, nullable=False, default=0, server_default="0")
+    shares_count = Column(Integer, nullable=False, default=0, server_default="0")
+
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="trips")  # type: ignore
     photos: Mapped[list["TripPhoto"]] = relationship(
@@ -185,6 +194,8 @@ class TripPhoto(Base):
     file_size = Column(Integer, nullable=False, default=0)  # File size in bytes
     width = Column(Integer, nullable=False, default=0)  # Image width in pixels
     height = Column(Integer, nullable=False, default=0)  # Image height in pixels
+    # Responsive variants: [{url, width, height, format, file_size}], smallest first
+    variants = Column(JSON, nullable=False, default=list, server_default="[]")
 
     # Metadata
     uploaded_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC))
@@ -224,6 +235,16 @@ class TripPhoto(Base):
         """Allow setting display_order by writing to order."""
         self.order = value
 
+    @property
+    def file_urls(self) -> list[str]:
+        """URLs of every stored file of the photo (optimized, thumbnail and variants)."""
+        urls = [self.photo_url, self.thumb_url]
+        variants: list[dict] = self.variants or []
+        for variant in variants:
+            if variant["url"] not in urls:
+                urls.append(variant["url"])
+        return urls
+
     def __repr__(self) -> str:
         return f"<TripPhoto(photo_id={self.photo_id}, trip_id={self.trip_id})>"
 
@@ -0,0 +1,163 @@
+"""
+Community trip ranking (Feature 004 - T027).
+
+Precomputed popularity ranking of the trips eligible for the community feed
+(published and public), so the feed reads it as an index range scan instead
+of scoring and sorting every published trip on each request.
+
+Two orders are kept per trip:
+- score: likes + comments + shares (the community backfill order)
+- hot_score: score decayed by age, log10(max(score, 1)) + age / 45000 s.
+  A newer trip outranks an older one unless the older has 10x the
+  interactions per 12.5 hours between them. The decay is relative to a fixed
+  epoch, so a row only changes when its trip does and never needs a
+  time-based refresh.
+
+Rows are refreshed incrementally in the same flush as the change that moves
+them: Trip insert/update/delete (listeners below) and interaction counter
+changes (src/models/interaction_counters.py). refresh_trip_rankings() also
+rebuilds the whole table (migration, scripts/dev-tools/reconcile_trip_counters.py).
+"""
+
+import math
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    delete,
+    event,
+    func,
+    insert,
+    inspect,
+    select,
+)
+from sqlalchemy.engine import Connection
+
+from src.database import Base
+from src.models.trip import Trip, TripStatus
+
+# Hot score: seconds of recency worth one order of magnitude of interactions
+HOT_SCORE_GRAVITY = 45000
+HOT_SCORE_EPOCH = datetime(2024, 1, 1, tzinfo=UTC)
+
+# Trip attributes that decide whether (and where) a trip is ranked
+RANKING_TRIP_ATTRIBUTES = ("status", "is_private", "published_at", "user_id")
+
+
+class TripRanking(Base):
+    """
+    TripRanking model - One row per trip eligible for the community feed.
+
+    Denormalizes the author and publication date so ranked pages are
+    filtered and ordered without touching the trips table.
+    """
+
+    __tablename__ = "trip_rankings"
+
+    # Primary key (1:1 with trips)
+    trip_id = Column(String(36), ForeignKey("trips.trip_id", ondelete="CASCADE"), primary_key=True)
+
+    user_id = Column(String(36), nullable=False)  # Trip author (own/followed exclusion)
+    published_at = Column(DateTime(timezone=True), nullable=False)  # Tie-breaker (or created_at)
+    score = Column(Integer, nullable=False)  # likes + comments + shares
+    hot_score = Column(Float, nullable=False)  # Time-decayed score, see hot_score()
+    refreshed_at = Column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
+    )
+
+    __table_args__ = (
+        Index("idx_trip_ranking_score", "score", "published_at", "trip_id"),  # Popular order
+        Index("idx_trip_ranking_hot", "hot_score", "trip_id"),  # Hot order
+    )
+
+    def __repr__(self) -> str:
+        return f"<TripRanking(trip_id={self.trip_id}, score={self.score})>"
+
+
+def hot_score(score: int, published_at: datetime) -> float:
+    """
+    Time-decayed popularity of a trip.
+
+    Args:
+        score: likes + comments + shares
+        published_at: Publication date (naive values are taken as UTC)
+
+    Returns:
+        Hot score, higher is hotter
+    """
+    if published_at.tzinfo is None:
+        published_at = published_at.replace(tzinfo=UTC)
+    age = (published_at - HOT_SCORE_EPOCH).total_seconds()
+    return round(math.log10(max(score, 1)) + age / HOT_SCORE_GRAVITY, 7)
+
+
+def refresh_trip_rankings(connection: Connection, trip_ids: list[str] | None = None) -> int:
+    """
+    Recompute the ranking rows of some trips (or all of them) from the trips table.
+
+    Drops the rows of trips that are no longer eligible and rewrites the rest.
+
+    Args:
+        connection: Connection of the current transaction
+        trip_ids: Trips to refresh (None = rebuild the whole table)
+
+    Returns:
+        Number of ranked trips written
+    """
+    delete_query = delete(TripRanking)
+    trips_query = select(
+        Trip.trip_id,
+        Trip.user_id,
+        func.coalesce(Trip.published_at, Trip.created_at),
+        Trip.likes_count + Trip.comments_count + Trip.shares_count,
+    ).where(
+        Trip.status == TripStatus.PUBLISHED,
+        Trip.is_private.is_(False),
+    )
+    if trip_ids is not None:
+        delete_query = delete_query.where(TripRanking.trip_id.in_(trip_ids))
+        trips_query = trips_query.where(Trip.trip_id.in_(trip_ids))
+
+    connection.execute(delete_query)
+
+    refreshed_at = datetime.now(UTC)
+    rows = [
+        {
+            "trip_id": trip_id,
+            "user_id": user_id,
+            "published_at": published_at,
+            "score": score,
+            "hot_score": hot_score(score, published_at),
+            "refreshed_at": refreshed_at,
+        }
+        for trip_id, user_id, published_at, score in connection.execute(trips_query)
+    ]
+    if rows:
+        connection.execute(insert(TripRanking), rows)
+
+    return len(rows)
+
+
+@event.listens_for(Trip, "after_insert")
+def _rank_new_trip(mapper: Any, connection: Connection, target: Any) -> None:
+    if target.status == TripStatus.PUBLISHED and not target.is_private:
+        refresh_trip_rankings(connection, [target.trip_id])
+
+
+@event.listens_for(Trip, "after_update")
+def _rerank_updated_trip(mapper: Any, connection: Connection, target: Any) -> None:
+    state = inspect(target)
+    if any(state.attrs[name].history.has_changes() for name in RANKING_TRIP_ATTRIBUTES):
+        refresh_trip_rankings(connection, [target.trip_id])
+
+
+@event.listens_for(Trip, "after_delete")
+def _unrank_deleted_trip(mapper: Any, connection: Connection, target: Any) -> None:
+    connection.execute(delete(TripRanking).where(TripRanking.trip_id == target.trip_id))
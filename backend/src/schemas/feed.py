@@ -32,6 +32,32 @@ class UserSummary(BaseModel):
         from_attributes = True
 
 
+class PhotoVariant(BaseModel):
+    """
+    One responsive size/encoding of a trip photo (srcset candidate).
+
+    Clients pick the smallest variant that covers the rendered width,
+    preferring WebP when supported.
+    """
+
+    url: str = Field(..., description="Variant URL")
+    width: int = Field(..., description="Width in pixels")
+    height: int = Field(..., description="Height in pixels")
+    format: str = Field(..., description="Encoding: jpeg or webp")
+    file_size: int = Field(..., description="File size in bytes")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "url": "/storage/trip_photos/2024/12/550e.../abc123_640w.webp",
+                "width": 640,
+                "height": 480,
+                "format": "webp",
+                "file_size": 48213,
+            }
+        }
+
+
 class PhotoSummary(BaseModel):
     """
     Photo summary for feed items.
@@ -41,6 +67,9 @@ class PhotoSummary(BaseModel):
 
     photo_url: str = Field(..., description="Photo URL")
     caption: str | None = Field(None, description="Photo caption (nullable)")
+    variants: list[PhotoVariant] = Field(
+        default_factory=list, description="Responsive variants, smallest first"
+    )
 
     class Config:
         from_attributes = True
@@ -140,10 +169,15 @@ class FeedResponse(BaseModel):
     """
 
     trips: list[FeedItem] = Field(default_factory=list, description="Array of feed items")
-    total_count: int = Field(..., ge=0, description="Total number of trips in feed")
-    page: int = Field(..., ge=1, description="Current page number")
+    total_count: int | None = Field(
+        None, ge=0, description="Total number of trips in feed (null in cursor mode)"
+    )
+    page: int | None = Field(None, ge=1, description="Current page number (null in cursor mode)")
     limit: int = Field(..., ge=1, le=50, description="Items per page")
     has_more: bool = Field(..., description="True if more pages exist beyond current page")
+    next_cursor: str | None = Field(
+        None, description="Cursor of the next page (cursor mode only, null if no more trips)"
+    )
 
     class Config:
         from_attributes = True
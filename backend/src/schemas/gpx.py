@@ -280,6 +280,9 @@ class TrackDataResponse(BaseModel):
     simplified_points_count: int = Field(
         ..., ge=0, description="Number of points in trackpoints array"
     )
+    tier: str = Field(
+        "detail", description="Level-of-detail tier served: detail, regional or overview"
+    )
     has_elevation: bool = Field(..., description="True if trackpoints contain elevation data")
     start_point: CoordinateResponse = Field(..., description="Route start coordinate")
     end_point: CoordinateResponse = Field(..., description="Route end coordinate")
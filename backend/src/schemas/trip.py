@@ -13,7 +13,7 @@ try:
 except ImportError:
     from typing import Self
 
-from src.schemas.feed import UserSummary  # Feature 004 - Author info in trip detail
+from src.schemas.feed import PhotoVariant, UserSummary  # Feature 004 - Author info in trip detail
 
 # ============================================================================
 # Request Schemas (Input)
@@ -332,6 +332,7 @@ class TripPhotoResponse(BaseModel):
         order: Display order (0-based)
         width: Original photo width in pixels
         height: Original photo height in pixels
+        variants: Responsive sizes/encodings for srcset (empty for older photos)
     """
 
     photo_id: str = Field(..., serialization_alias="id", description="Unique photo identifier")
@@ -341,6 +342,9 @@ class TripPhotoResponse(BaseModel):
     order: int = Field(..., description="Display order (0-based)")
     width: int | None = Field(None, description="Original photo width")
     height: int | None = Field(None, description="Original photo height")
+    variants: list[PhotoVariant] = Field(
+        default_factory=list, description="Responsive variants, smallest first"
+    )
 
     class Config:
         """Pydantic config."""
@@ -643,10 +647,14 @@ class PublicPhotoSummary(BaseModel):
     Attributes:
         photo_url: URL to optimized photo
         thumbnail_url: URL to thumbnail
+        variants: Responsive sizes/encodings for srcset (empty for older photos)
     """
 
     photo_url: str = Field(..., description="URL to optimized photo")
     thumbnail_url: str = Field(..., description="URL to thumbnail")
+    variants: list[PhotoVariant] = Field(
+        default_factory=list, description="Responsive variants, smallest first"
+    )
 
     class Config:
         """Pydantic config."""
@@ -10,6 +10,7 @@ Business logic for authentication flows including:
 
 import logging
 from datetime import UTC, datetime, timedelta
+from uuid import uuid4
 
 from jose import JWTError
 from sqlalchemy import or_, select
@@ -31,8 +32,10 @@ from src.utils.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
-    hash_password,
-    verify_password,
+    hash_password_async,
+    hash_token,
+    verify_password_async,
+    verify_token_hash,
 )
 
 logger = logging.getLogger(__name__)
@@ -88,7 +91,7 @@ class AuthService:
         user = User(
             username=data.username,
             email=data.email.lower(),
-            hashed_password=hash_password(data.password),
+            hashed_password=await hash_password_async(data.password),
             is_active=True,
             is_verified=auto_verify,  # Auto-verify in test environment
         )
@@ -107,7 +110,7 @@ class AuthService:
             )
 
             # Store verification token
-            token_hash = hash_password(token)  # Hash token for security
+            token_hash = await hash_password_async(token)  # Hash token for security
             password_reset = PasswordReset(
                 user_id=user.id,
                 token_hash=token_hash,
@@ -176,7 +179,6 @@ class AuthService:
         user.is_verified = True
 
         # Mark token as used
-        hash_password(token)
         result = await self.db.execute(
             select(PasswordReset).where(
                 PasswordReset.user_id == user_id,
@@ -242,7 +244,7 @@ class AuthService:
         )
 
         # Store token
-        token_hash = hash_password(token)
+        token_hash = await hash_password_async(token)
         password_reset = PasswordReset(
             user_id=user.id,
             token_hash=token_hash,
@@ -283,7 +285,7 @@ class AuthService:
             raise ValueError("Demasiados intentos fallidos. Cuenta bloqueada por 15 minutos.")
 
         # Verify credentials
-        if not user or not verify_password(data.password, user.hashed_password):
+        if not user or not await verify_password_async(data.password, user.hashed_password):
             # Increment failed attempts
             if user:
                 user.failed_login_attempts += 1
@@ -315,17 +317,7 @@ class AuthService:
 
         # Create tokens
         access_token = create_access_token({"sub": user.id, "username": user.username})
-        refresh_token = create_refresh_token({"sub": user.id})
-
-        # Store refresh token
-        token_hash = hash_password(refresh_token)
-        refresh_token_record = PasswordReset(
-            user_id=user.id,
-            token_hash=token_hash,
-            token_type="refresh_token",
-            expires_at=datetime.now(UTC) + timedelta(days=settings.refresh_token_expire_days),
-        )
-        self.db.add(refresh_token_record)
+        refresh_token = self._issue_refresh_token(user)
 
         await self.db.commit()
 
@@ -366,27 +358,7 @@ class AuthService:
         if not user_id:
             raise ValueError("Token de refresco inválido")
 
-        # Get all unused refresh tokens for this user
-        # We can't filter by token_hash directly because bcrypt hashes are different each time
-        result = await self.db.execute(
-            select(PasswordReset)
-            .where(
-                PasswordReset.user_id == user_id,
-                PasswordReset.token_type == "refresh_token",
-                PasswordReset.used_at.is_(None),
-                PasswordReset.expires_at > datetime.now(UTC),
-            )
-            .order_by(PasswordReset.created_at.desc())
-        )
-        token_records = result.scalars().all()
-
-        # Find the token that matches the provided refresh token
-        token_record = None
-        for record in token_records:
-            if verify_password(refresh_token, record.token_hash):
-                token_record = record
-                break
-
+        token_record = await self._find_refresh_token(refresh_token, payload)
         if not token_record:
             raise ValueError("Token de refresco inválido o expirado")
 
@@ -402,17 +374,7 @@ class AuthService:
 
         # Create new tokens
         new_access_token = create_access_token({"sub": user.id, "username": user.username})
-        new_refresh_token = create_refresh_token({"sub": user.id})
-
-        # Store new refresh token
-        new_token_hash = hash_password(new_refresh_token)
-        new_refresh_record = PasswordReset(
-            user_id=user.id,
-            token_hash=new_token_hash,
-            token_type="refresh_token",
-            expires_at=datetime.now(UTC) + timedelta(days=settings.refresh_token_expire_days),
-        )
-        self.db.add(new_refresh_record)
+        new_refresh_token = self._issue_refresh_token(user)
 
         await self.db.commit()
 
@@ -450,15 +412,7 @@ class AuthService:
             raise ValueError("Token de refresco inválido")
 
         # Find and mark token as used
-        hash_password(refresh_token)
-        result = await self.db.execute(
-            select(PasswordReset).where(
-                PasswordReset.user_id == user_id,
-                PasswordReset.token_type == "refresh_token",
-                PasswordReset.used_at.is_(None),
-            )
-        )
-        token_record = result.scalar_one_or_none()
+        token_record = await self._find_refresh_token(refresh_token, payload)
 
         if token_record:
             token_record.used_at = datetime.now(UTC)
@@ -468,6 +422,76 @@ class AuthService:
 
         return True
 
+    def _issue_refresh_token(self, user: User) -> str:
+        """
+        Create a refresh token and add its record to the session (caller commits).
+
+        The token carries the record ID as its jti claim and the record stores
+        its hash_token() digest, so it is found by primary key and checked with
+        one HMAC instead of bcrypt-verifying every outstanding token.
+
+        Args:
+            user: Token owner
+
+        Returns:
+            Encoded refresh token
+        """
+        record_id = str(uuid4())
+        refresh_token = create_refresh_token({"sub": user.id, "jti": record_id})
+        self.db.add(
+            PasswordReset(
+                id=record_id,
+                user_id=user.id,
+                token_hash=hash_token(refresh_token),
+                token_type="refresh_token",
+                expires_at=datetime.now(UTC) + timedelta(days=settings.refresh_token_expire_days),
+            )
+        )
+        return refresh_token
+
+    async def _find_refresh_token(self, refresh_token: str, payload: dict) -> PasswordReset | None:
+        """
+        Find the unused, unexpired record of a refresh token.
+
+        Tokens issued before jti claims existed are stored as bcrypt hashes:
+        they are still matched by verifying the user's outstanding bcrypt
+        records, until they are rotated by a refresh or expire.
+
+        Args:
+            refresh_token: Refresh token from the client
+            payload: Decoded token payload
+
+        Returns:
+            Matching record, or None
+        """
+        conditions = (
+            PasswordReset.user_id == payload["sub"],
+            PasswordReset.token_type == "refresh_token",
+            PasswordReset.used_at.is_(None),
+            PasswordReset.expires_at > datetime.now(UTC),
+        )
+
+        record_id = payload.get("jti")
+        if record_id:
+            result = await self.db.execute(
+                select(PasswordReset).where(PasswordReset.id == record_id, *conditions)
+            )
+            record = result.scalar_one_or_none()
+            if record and verify_token_hash(refresh_token, record.token_hash):
+                return record
+            return None
+
+        # Legacy token (bcrypt-hashed record)
+        result = await self.db.execute(
+            select(PasswordReset)
+            .where(*conditions, PasswordReset.token_hash.like("$2%"))
+            .order_by(PasswordReset.created_at.desc())
+        )
+        for record in result.scalars().all():
+            if await verify_password_async(refresh_token, record.token_hash):
+                return record
+        return None
+
     async def request_password_reset(self, email: str) -> bool:
         """
         Request password reset email.
@@ -494,7 +518,7 @@ class AuthService:
         )
 
         # Store token
-        token_hash = hash_password(token)
+        token_hash = await hash_password_async(token)
         password_reset = PasswordReset(
             user_id=user.id,
             token_hash=token_hash,
@@ -545,7 +569,6 @@ class AuthService:
             raise ValueError("Usuario no encontrado")
 
         # Verify token exists and is not used
-        hash_password(token)
         result = await self.db.execute(
             select(PasswordReset).where(
                 PasswordReset.user_id == user_id,
@@ -560,7 +583,7 @@ class AuthService:
             raise ValueError("Enlace de restablecimiento inválido o expirado")
 
         # Update password
-        user.hashed_password = hash_password(new_password)
+        user.hashed_password = await hash_password_async(new_password)
 
         # Mark token as used
         token_record.used_at = datetime.now(UTC)
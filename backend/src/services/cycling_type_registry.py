@@ -0,0 +1,116 @@
+"""
+In-memory cycling type registry.
+
+Active cycling types change only through the admin endpoints but are read on
+every profile validation and every GET /cycling-types. The registry keeps them
+in memory per worker and reloads them only when the shared version counter
+(cycling_type_registry table, bumped in the same transaction as every cycling
+type change) no longer matches the loaded version.
+
+The version is checked at most every settings.cycling_type_registry_check_seconds,
+so a change made by another worker is seen within that delay; the worker that
+made the change refreshes immediately (CyclingTypeService.create/update/delete).
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.models.cycling_type import REGISTRY_ROW_ID, CyclingType, CyclingTypeRegistryVersion
+from src.schemas.cycling_type import CyclingTypePublicResponse
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CyclingTypeSnapshot:
+    """Active cycling types as of one registry version."""
+
+    version: int
+    active_codes: frozenset[str]
+    public: tuple[CyclingTypePublicResponse, ...]  # Ordered by display name
+
+
+class CyclingTypeRegistry:
+    """Process-wide cache of active cycling types, validated by version."""
+
+    def __init__(self):
+        self._snapshot: CyclingTypeSnapshot | None = None
+        self._checked_at = 0.0  # time.monotonic() of the last version check
+
+    async def get(self, db: AsyncSession) -> CyclingTypeSnapshot:
+        """
+        Return the active cycling types, reloading them if they changed.
+
+        Args:
+            db: Database session (used only for version checks and reloads)
+
+        Returns:
+            Current snapshot
+        """
+        snapshot = self._snapshot
+        now = time.monotonic()
+        if (
+            snapshot is not None
+            and settings.cycling_type_registry_check_seconds > 0
+            and now - self._checked_at < settings.cycling_type_registry_check_seconds
+        ):
+            return snapshot
+
+        version = await self._current_version(db)
+        self._checked_at = now
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        return await self._load(db, version)
+
+    async def refresh(self, db: AsyncSession) -> CyclingTypeSnapshot:
+        """
+        Reload the active cycling types now (after a change made by this worker).
+
+        Args:
+            db: Database session
+
+        Returns:
+            Reloaded snapshot
+        """
+        self._checked_at = time.monotonic()
+        return await self._load(db, await self._current_version(db))
+
+    def invalidate(self) -> None:
+        """Drop the loaded snapshot; the next lookup reloads it."""
+        self._snapshot = None
+
+    @staticmethod
+    async def _current_version(db: AsyncSession) -> int:
+        result = await db.execute(
+            select(CyclingTypeRegistryVersion.version).where(
+                CyclingTypeRegistryVersion.id == REGISTRY_ROW_ID
+            )
+        )
+        return result.scalar() or 0
+
+    async def _load(self, db: AsyncSession, version: int) -> CyclingTypeSnapshot:
+        result = await db.execute(
+            select(CyclingType)
+            .where(CyclingType.is_active == True)  # noqa: E712
+            .order_by(CyclingType.display_name)
+        )
+        cycling_types = result.scalars().all()
+
+        snapshot = CyclingTypeSnapshot(
+            version=version,
+            active_codes=frozenset(ct.code for ct in cycling_types),
+            public=tuple(CyclingTypePublicResponse.model_validate(ct) for ct in cycling_types),
+        )
+        self._snapshot = snapshot
+        logger.debug(f"Loaded {len(cycling_types)} cycling types (registry version {version})")
+        return snapshot
+
+
+# Shared by every request of the worker
+cycling_type_registry = CyclingTypeRegistry()
@@ -2,6 +2,9 @@
 CyclingType service layer.
 
 Business logic for managing cycling types.
+
+Active types are read from the in-memory registry
+(src/services/cycling_type_registry.py), refreshed after every change.
 """
 
 import logging
@@ -16,6 +19,7 @@ from src.schemas.cycling_type import (
     CyclingTypeResponse,
     CyclingTypeUpdateRequest,
 )
+from src.services.cycling_type_registry import cycling_type_registry
 
 logger = logging.getLogger(__name__)
 
@@ -60,21 +64,15 @@ class CyclingTypeService:
         """
         Get all active cycling types (public endpoint).
 
-        Returns only active types with simplified response.
+        Returns only active types with simplified response, served from the
+        in-memory registry.
 
         Returns:
             List of active cycling types (public format)
         """
-        query = (
-            select(CyclingType)
-            .where(CyclingType.is_active == True)  # noqa: E712
-            .order_by(CyclingType.display_name)
-        )
+        snapshot = await cycling_type_registry.get(self.db)
 
-        result = await self.db.execute(query)
-        cycling_types = result.scalars().all()
-
-        return [CyclingTypePublicResponse.model_validate(ct) for ct in cycling_types]
+        return list(snapshot.public)
 
     async def get_by_code(self, code: str) -> CyclingTypeResponse | None:
         """
@@ -124,6 +122,7 @@ class CyclingTypeService:
         self.db.add(cycling_type)
         await self.db.commit()
         await self.db.refresh(cycling_type)
+        await cycling_type_registry.refresh(self.db)
 
         logger.info(f"Created cycling type: {cycling_type.code}")
 
@@ -163,6 +162,7 @@ class CyclingTypeService:
 
         await self.db.commit()
         await self.db.refresh(cycling_type)
+        await cycling_type_registry.refresh(self.db)
 
         logger.info(f"Updated cycling type: {cycling_type.code}")
 
@@ -198,17 +198,18 @@ class CyclingTypeService:
             await self.db.commit()
             logger.info(f"Hard deleted cycling type: {code}")
 
+        await cycling_type_registry.refresh(self.db)
+
     async def get_active_codes(self) -> set[str]:
         """
         Get set of all active cycling type codes.
 
-        Used by validators to check if a cycling type is valid.
+        Used by validators to check if a cycling type is valid. Served from
+        the in-memory registry.
 
         Returns:
             Set of active cycling type codes (lowercase)
         """
-        query = select(CyclingType.code).where(CyclingType.is_active == True)  # noqa: E712
-        result = await self.db.execute(query)
-        codes = result.scalars().all()
+        snapshot = await cycling_type_registry.get(self.db)
 
-        return set(codes)
+        return set(snapshot.active_codes)
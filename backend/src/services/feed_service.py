@@ -5,21 +5,135 @@ Implements hybrid feed algorithm:
 1. Chronological trips from followed users
 2. Popular community backfill if needed
 
+Two pagination modes:
+- page/offset (get_personalized_feed): counts every bucket to place the page
+- cursor/keyset (get_personalized_feed_cursor): no counts, seeks from the last
+  item shown, so deep pages cost the same as the first one
+
+Community trips are read from the precomputed trip_rankings table
+(src/models/trip_ranking.py), which get_trending_trips() also pages by rank.
+With settings.home_timeline_enabled, followed users' trips are read from the
+reader's home timeline (src/services/timeline_service.py).
+
 Success Criteria: SC-001 (<1s p95)
 """
 
+import base64
+import binascii
+import json
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy import and_, desc, func, not_, select
+from sqlalchemy import Select, and_, desc, func, not_, select, true, tuple_, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from src.models.comment import Comment
+from src.config import settings
 from src.models.like import Like
-from src.models.share import Share
 from src.models.social import Follow
+from src.models.timeline import TimelineEntry
 from src.models.trip import Trip, TripStatus, TripTag
-from src.models.user import User
+from src.models.trip_ranking import TripRanking
+from src.models.user import User, UserProfile
+
+# Feed buckets in display order (sequential algorithm)
+FEED_BUCKETS = ("own", "followed", "community")
+
+# Community ranking orders: descending sort key, made unique by trip_id
+RANKING_ORDERS = {
+    "popular": (TripRanking.score, TripRanking.published_at, TripRanking.trip_id),
+    "hot": (TripRanking.hot_score, TripRanking.trip_id),
+}
+
+
+def _encode_feed_cursor(bucket: str, trip: Trip, score: int | None = None) -> str:
+    """
+    Encode an opaque feed cursor: bucket + position of the last trip shown.
+
+    Position is (published_at, trip_id), preceded by the popularity score in
+    the community bucket (its sort key).
+    """
+    position = {"b": bucket, "p": trip.published_at.isoformat(), "t": trip.trip_id}
+    if score is not None:
+        position["s"] = score
+    payload = json.dumps(position, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def _decode_feed_cursor(cursor: str) -> tuple[str, tuple | None]:
+    """
+    Decode a cursor from _encode_feed_cursor().
+
+    An empty cursor means the start of the feed.
+
+    Returns:
+        Tuple of (bucket, keyset position or None for the start of the bucket)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not cursor:
+        return FEED_BUCKETS[0], None
+
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        position = json.loads(payload)
+        bucket = position["b"]
+        published_at = datetime.fromisoformat(position["p"])
+        trip_id = str(position["t"])
+        score = int(position["s"]) if bucket == "community" else None
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValueError("Cursor de paginación inválido")
+
+    if bucket not in FEED_BUCKETS:
+        raise ValueError("Cursor de paginación inválido")
+    if bucket == "community":
+        return bucket, (score, published_at, trip_id)
+    return bucket, (published_at, trip_id)
+
+
+def _encode_ranking_cursor(ranking: str, key: tuple) -> str:
+    """Encode an opaque ranking cursor: ranking + sort key of the last trip shown."""
+    values = [value.isoformat() if isinstance(value, datetime) else value for value in key]
+    payload = json.dumps({"r": ranking, "k": values}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def _decode_ranking_cursor(ranking: str, cursor: str) -> tuple | None:
+    """
+    Decode a cursor from _encode_ranking_cursor().
+
+    Returns:
+        Sort key of the last trip shown (None for the first page)
+
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another ranking
+    """
+    if not cursor:
+        return None
+
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        position = json.loads(payload)
+        if position["r"] != ranking:
+            raise ValueError(position["r"])
+        if ranking == "hot":
+            hot_score, trip_id = position["k"]
+            return float(hot_score), str(trip_id)
+        score, published_at, trip_id = position["k"]
+        return int(score), datetime.fromisoformat(published_at), str(trip_id)
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValueError("Cursor de paginación inválido")
+
+
+def _feed_item_options() -> tuple:
+    """Eager loading options for trips converted with FeedService._trips_to_feed_items()."""
+    return (
+        selectinload(Trip.user).selectinload(User.profile),
+        selectinload(Trip.photos),
+        selectinload(Trip.locations),
+        selectinload(Trip.trip_tags).selectinload(TripTag.tag),
+    )
 
 
 class FeedService:
@@ -174,6 +288,218 @@ class FeedService:
             "has_more": has_more,
         }
 
+    @staticmethod
+    async def get_personalized_feed_cursor(
+        db: AsyncSession,
+        user_id: str,
+        cursor: str = "",
+        limit: int = 10,
+    ) -> dict[str, Any]:
+        """
+        Get personalized feed with keyset (cursor) pagination.
+
+        Same order as get_personalized_feed() (own, followed, community trips),
+        but each page continues from an opaque cursor holding the bucket and
+        the position of the last trip shown, instead of an offset:
+        - No COUNT queries
+        - Index seeks on (published_at, trip_id) instead of OFFSET scans
+
+        Args:
+            db: Database session
+            user_id: Current user ID
+            cursor: next_cursor of the previous page ("" for the first page)
+            limit: Items per page (min 1, max 50)
+
+        Returns:
+            Dict with:
+            - trips: List of FeedItem dicts
+            - limit: Items per page
+            - has_more: True if more trips exist
+            - next_cursor: Cursor of the next page (None if no more trips)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        limit = max(1, min(50, limit))
+        bucket, position = _decode_feed_cursor(cursor)
+
+        following_query = select(Follow.following_id).where(Follow.follower_id == user_id)
+        following_ids = list((await db.execute(following_query)).scalars().all())
+
+        # Fetch one extra trip to know whether another page exists
+        wanted = limit + 1
+        page: list[tuple[str, Trip, int | None]] = []
+        for current in FEED_BUCKETS[FEED_BUCKETS.index(bucket) :]:
+            rows = await FeedService._get_bucket_after(
+                db=db,
+                bucket=current,
+                user_id=user_id,
+                following_ids=following_ids,
+                position=position if current == bucket else None,
+                limit=wanted - len(page),
+            )
+            page.extend((current, trip, score) for trip, score in rows)
+            if len(page) >= wanted:
+                break
+
+        has_more = len(page) > limit
+        page = page[:limit]
+        next_cursor = _encode_feed_cursor(*page[-1]) if has_more else None
+
+        trips = await FeedService._trips_to_feed_items(
+            trips=[trip for _, trip, _ in page],
+            current_user_id=user_id,
+            db=db,
+        )
+
+        return {
+            "trips": trips,
+            "limit": limit,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
+        }
+
+    @staticmethod
+    async def get_trending_trips(
+        db: AsyncSession,
+        user_id: str,
+        ranking: str = "hot",
+        cursor: str = "",
+        limit: int = 10,
+    ) -> dict[str, Any]:
+        """
+        Get community trips by rank with keyset (cursor) pagination.
+
+        Reads the precomputed trip_rankings table in index order, so every page
+        is a range scan from the last trip shown.
+
+        Args:
+            db: Database session
+            user_id: Current user ID (for is_liked_by_me and is_following flags)
+            ranking: "hot" (time-decayed) or "popular" (likes + comments + shares)
+            cursor: next_cursor of the previous page ("" for the first page)
+            limit: Items per page (min 1, max 50)
+
+        Returns:
+            Dict with:
+            - trips: List of FeedItem dicts
+            - limit: Items per page
+            - has_more: True if more trips exist
+            - next_cursor: Cursor of the next page (None if no more trips)
+
+        Raises:
+            ValueError: If the ranking is unknown or the cursor is malformed
+        """
+        if ranking not in RANKING_ORDERS:
+            raise ValueError(f"Ranking desconocido: {ranking}")
+        limit = max(1, min(50, limit))
+        order = RANKING_ORDERS[ranking]
+        position = _decode_ranking_cursor(ranking, cursor)
+
+        query = select(Trip, *order).join(TripRanking, TripRanking.trip_id == Trip.trip_id)
+        if position is not None:
+            query = query.where(tuple_(*order) < tuple_(*position))
+        query = (
+            query.options(*_feed_item_options())
+            .order_by(*(desc(column) for column in order))
+            .limit(limit + 1)  # One extra row tells whether another page exists
+        )
+        rows = (await db.execute(query)).all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = _encode_ranking_cursor(ranking, tuple(rows[-1])[1:]) if has_more else None
+
+        trips = await FeedService._trips_to_feed_items(
+            trips=[row[0] for row in rows],
+            current_user_id=user_id,
+            db=db,
+        )
+
+        return {
+            "trips": trips,
+            "limit": limit,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
+        }
+
+    @staticmethod
+    async def _get_bucket_after(
+        db: AsyncSession,
+        bucket: str,
+        user_id: str,
+        following_ids: list[str],
+        position: tuple | None,
+        limit: int,
+    ) -> list[tuple[Trip, int | None]]:
+        """
+        Keyset page of one feed bucket.
+
+        Uses the same filters and order as _get_own_trips(), _get_followed_trips()
+        and _get_community_trips(), with trip_id as a tie-breaker.
+
+        Args:
+            db: Database session
+            bucket: "own", "followed" or "community"
+            user_id: Current user ID
+            following_ids: IDs of users the current user follows
+            position: Keyset position of the last trip shown (None = bucket start)
+            limit: Number of trips to fetch
+
+        Returns:
+            List of (trip, popularity score) tuples; score is None outside community
+        """
+        if bucket == "followed":
+            query, order = await FeedService._followed_trips_query(db, user_id, following_ids)
+            if query is None:
+                return []
+            if position is not None:
+                query = query.where(tuple_(*order) < tuple_(*position))
+            query = (
+                query.options(*_feed_item_options())
+                .order_by(*(desc(column) for column in order))
+                .limit(limit)
+            )
+            trips = (await db.execute(query)).scalars().all()
+            return [(trip, None) for trip in trips]
+
+        if bucket == "own":
+            conditions = [Trip.user_id == user_id, Trip.status == TripStatus.PUBLISHED]
+        else:
+            # Ranked trips are published and public
+            conditions = [
+                TripRanking.user_id != user_id,  # Exclude own trips
+                not_(TripRanking.user_id.in_(following_ids)) if following_ids else true(),
+            ]
+
+        if bucket != "community":
+            if position is not None:
+                conditions.append(tuple_(Trip.published_at, Trip.trip_id) < tuple_(*position))
+            query = (
+                select(Trip)
+                .where(and_(*conditions))
+                .options(*_feed_item_options())
+                .order_by(desc(Trip.published_at), desc(Trip.trip_id))
+                .limit(limit)
+            )
+            trips = (await db.execute(query)).scalars().all()
+            return [(trip, None) for trip in trips]
+
+        # Community: popular ranking order (index range scan on trip_rankings)
+        order = RANKING_ORDERS["popular"]
+        if position is not None:
+            conditions.append(tuple_(*order) < tuple_(*position))
+        query = (
+            select(Trip, TripRanking.score)
+            .join(TripRanking, TripRanking.trip_id == Trip.trip_id)
+            .where(and_(*conditions))
+            .options(*_feed_item_options())
+            .order_by(*(desc(column) for column in order))
+            .limit(limit)
+        )
+        result = await db.execute(query)
+        return [tuple(row) for row in result.all()]
+
     @staticmethod
     async def _get_own_trips(
         db: AsyncSession,
@@ -220,15 +546,7 @@ class FeedService:
                     Trip.status == TripStatus.PUBLISHED,
                 )
             )
-            .options(
-                selectinload(Trip.user).selectinload(User.profile),
-                selectinload(Trip.photos),
-                selectinload(Trip.locations),
-                selectinload(Trip.trip_tags).selectinload(TripTag.tag),
-                selectinload(Trip.likes),
-                selectinload(Trip.comments),
-                selectinload(Trip.shares),
-            )
+            .options(*_feed_item_options())
             .order_by(desc(Trip.published_at))
             .limit(limit)
             .offset(offset)
@@ -238,14 +556,11 @@ class FeedService:
         trips = trips_result.scalars().all()
 
         # Convert to FeedItem dicts
-        feed_items = []
-        for trip in trips:
-            feed_item = await FeedService._trip_to_feed_item(
-                trip=trip,
-                current_user_id=user_id,
-                db=db,
-            )
-            feed_items.append(feed_item)
+        feed_items = await FeedService._trips_to_feed_items(
+            trips=trips,
+            current_user_id=user_id,
+            db=db,
+        )
 
         return feed_items, total_count
 
@@ -268,27 +583,15 @@ class FeedService:
         Returns:
             Tuple of (trips list, total count)
         """
-        # Get IDs of users that current user follows
-        following_query = select(Follow.following_id).where(Follow.follower_id == user_id)
+        base_query, order = await FeedService._followed_trips_query(db, user_id)
 
-        following_result = await db.execute(following_query)
-        following_ids = [row[0] for row in following_result.fetchall()]
-
-        if not following_ids:
+        if base_query is None:
             return [], 0
 
-        # Build base query for count
-        count_base_query = select(Trip.trip_id).where(
-            and_(
-                Trip.user_id.in_(following_ids),
-                Trip.user_id != user_id,  # Exclude own trips
-                Trip.status == TripStatus.PUBLISHED,
-                Trip.is_private.is_(False),  # Exclude private trips
-            )
-        )
-
         # Get total count
-        count_query = select(func.count()).select_from(count_base_query.subquery())
+        count_query = select(func.count()).select_from(
+            base_query.with_only_columns(Trip.trip_id).subquery()
+        )
         count_result = await db.execute(count_query)
         total_count = count_result.scalar() or 0
 
@@ -298,25 +601,8 @@ class FeedService:
 
         # Get published trips from followed users (exclude own trips)
         trips_query = (
-            select(Trip)
-            .where(
-                and_(
-                    Trip.user_id.in_(following_ids),
-                    Trip.user_id != user_id,  # Exclude own trips
-                    Trip.status == TripStatus.PUBLISHED,
-                    Trip.is_private.is_(False),  # Exclude private trips
-                )
-            )
-            .options(
-                selectinload(Trip.user).selectinload(User.profile),
-                selectinload(Trip.photos),
-                selectinload(Trip.locations),
-                selectinload(Trip.trip_tags).selectinload(TripTag.tag),
-                selectinload(Trip.likes),
-                selectinload(Trip.comments),
-                selectinload(Trip.shares),
-            )
-            .order_by(desc(Trip.published_at))
+            base_query.options(*_feed_item_options())
+            .order_by(*(desc(column) for column in order))
             .limit(limit)
             .offset(offset)
         )
@@ -325,17 +611,82 @@ class FeedService:
         trips = trips_result.scalars().all()
 
         # Convert to FeedItem dicts
-        feed_items = []
-        for trip in trips:
-            feed_item = await FeedService._trip_to_feed_item(
-                trip=trip,
-                current_user_id=user_id,
-                db=db,
-            )
-            feed_items.append(feed_item)
+        feed_items = await FeedService._trips_to_feed_items(
+            trips=trips,
+            current_user_id=user_id,
+            db=db,
+        )
 
         return feed_items, total_count
 
+    @staticmethod
+    async def _followed_trips_query(
+        db: AsyncSession,
+        user_id: str,
+        following_ids: list[str] | None = None,
+    ) -> tuple[Select | None, tuple]:
+        """
+        Query of published, public trips from users that current user follows.
+
+        With the home timeline enabled, trips come from the user's timeline
+        (an index range on home_timelines) plus, if the user follows authors
+        above the fan-out threshold, those authors' trips pulled directly.
+        Otherwise trips are filtered by user_id IN (following_ids).
+
+        Args:
+            db: Database session
+            user_id: Current user ID
+            following_ids: IDs of users the current user follows (queried if None)
+
+        Returns:
+            Tuple of (select of Trip or None if the user follows nobody,
+            (published_at, trip_id) columns to order and seek by)
+        """
+        visible = (
+            Trip.status == TripStatus.PUBLISHED,
+            Trip.is_private.is_(False),  # Exclude private trips
+        )
+
+        if not settings.home_timeline_enabled:
+            if following_ids is None:
+                following_query = select(Follow.following_id).where(Follow.follower_id == user_id)
+                following_ids = list((await db.execute(following_query)).scalars().all())
+            if not following_ids:
+                return None, ()
+
+            query = select(Trip).where(
+                Trip.user_id.in_(following_ids),
+                Trip.user_id != user_id,  # Exclude own trips
+                *visible,
+            )
+            return query, (Trip.published_at, Trip.trip_id)
+
+        # Followed authors above the fan-out threshold are pulled, not fanned out
+        pulled_query = (
+            select(Follow.following_id)
+            .join(UserProfile, UserProfile.user_id == Follow.following_id)
+            .where(
+                Follow.follower_id == user_id,
+                UserProfile.followers_count > settings.home_timeline_fanout_max_followers,
+            )
+        )
+        pulled_ids = list((await db.execute(pulled_query)).scalars().all())
+
+        timeline = select(TimelineEntry.trip_id, TimelineEntry.published_at).where(
+            TimelineEntry.user_id == user_id
+        )
+        if pulled_ids:
+            timeline = timeline.where(TimelineEntry.author_id.not_in(pulled_ids))
+            pulled = select(Trip.trip_id, Trip.published_at).where(
+                Trip.user_id.in_(pulled_ids), *visible
+            )
+            source = union_all(timeline, pulled).subquery()
+        else:
+            source = timeline.subquery()
+
+        query = select(Trip).join(source, source.c.trip_id == Trip.trip_id).where(*visible)
+        return query, (source.c.published_at, source.c.trip_id)
+
     @staticmethod
     async def _get_community_trips(
         db: AsyncSession,
@@ -347,7 +698,8 @@ class FeedService:
         """
         T027: Get popular community trips for backfill.
 
-        Popular = trips with most interactions (likes + comments + shares).
+        Popular = trips with most interactions (likes + comments + shares),
+        read from the precomputed trip_rankings table.
         Excludes trips already shown from followed users.
 
         Args:
@@ -362,64 +714,30 @@ class FeedService:
         """
         exclude_trip_ids = exclude_trip_ids or set()
 
-        # Subquery for popularity score (likes + comments + shares)
-        popularity_score = (
-            func.count(Like.id).label("likes")
-            + func.count(Comment.id).label("comments")
-            + func.count(Share.id).label("shares")
-        )
-
         # Get list of followed user IDs (to exclude from community)
         followed_users_query = select(Follow.following_id).where(Follow.follower_id == user_id)
         followed_users_result = await db.execute(followed_users_query)
         followed_user_ids = [row[0] for row in followed_users_result.fetchall()]
 
-        # Get published trips from community (exclude own trips, followed users' trips, and already shown)
+        # Ranked trips (published and public), excluding own trips, followed users'
+        # trips, and already shown
+        conditions = and_(
+            TripRanking.user_id != user_id,  # Exclude own trips
+            not_(TripRanking.user_id.in_(followed_user_ids))
+            if followed_user_ids
+            else True,  # Exclude followed users
+            not_(TripRanking.trip_id.in_(exclude_trip_ids)) if exclude_trip_ids else True,
+        )
         base_query = (
             select(Trip)
-            .outerjoin(Like, Trip.trip_id == Like.trip_id)
-            .outerjoin(Comment, Trip.trip_id == Comment.trip_id)
-            .outerjoin(Share, Trip.trip_id == Share.trip_id)
-            .where(
-                and_(
-                    Trip.user_id != user_id,  # Exclude own trips
-                    not_(Trip.user_id.in_(followed_user_ids))
-                    if followed_user_ids
-                    else True,  # Exclude followed users
-                    Trip.status == TripStatus.PUBLISHED,
-                    Trip.is_private.is_(False),  # Exclude private trips
-                    not_(Trip.trip_id.in_(exclude_trip_ids)) if exclude_trip_ids else True,
-                )
-            )
-            .group_by(Trip.trip_id)
-            .options(
-                selectinload(Trip.user).selectinload(User.profile),
-                selectinload(Trip.photos),
-                selectinload(Trip.locations),
-                selectinload(Trip.trip_tags).selectinload(TripTag.tag),
-                selectinload(Trip.likes),
-                selectinload(Trip.comments),
-                selectinload(Trip.shares),
-            )
-            .order_by(desc(popularity_score), desc(Trip.published_at))
+            .join(TripRanking, TripRanking.trip_id == Trip.trip_id)
+            .where(conditions)
+            .options(*_feed_item_options())
+            .order_by(*(desc(column) for column in RANKING_ORDERS["popular"]))
         )
 
-        # Get total count
-        count_query = select(func.count()).select_from(
-            select(Trip.trip_id)
-            .where(
-                and_(
-                    Trip.user_id != user_id,
-                    not_(Trip.user_id.in_(followed_user_ids))
-                    if followed_user_ids
-                    else True,  # Exclude followed users
-                    Trip.status == TripStatus.PUBLISHED,
-                    Trip.is_private.is_(False),  # Exclude private trips
-                    not_(Trip.trip_id.in_(exclude_trip_ids)) if exclude_trip_ids else True,
-                )
-            )
-            .subquery()
-        )
+        # Get total count (trip_rankings only)
+        count_query = select(func.count()).select_from(TripRanking).where(conditions)
         count_result = await db.execute(count_query)
         total_count = count_result.scalar() or 0
 
@@ -429,46 +747,94 @@ class FeedService:
         trips = trips_result.scalars().all()
 
         # Convert to FeedItem dicts
-        feed_items = []
-        for trip in trips:
-            feed_item = await FeedService._trip_to_feed_item(
-                trip=trip,
-                current_user_id=user_id,
-                db=db,
-            )
-            feed_items.append(feed_item)
+        feed_items = await FeedService._trips_to_feed_items(
+            trips=trips,
+            current_user_id=user_id,
+            db=db,
+        )
 
         return feed_items, total_count
 
     @staticmethod
-    async def _trip_to_feed_item(
-        trip: Trip,
+    async def _trips_to_feed_items(
+        trips: list[Trip],
         current_user_id: str,
         db: AsyncSession,
-    ) -> dict[str, Any]:
+    ) -> list[dict[str, Any]]:
         """
-        Convert Trip model to FeedItem dict.
+        Convert a page of trips to FeedItem dicts.
 
-        Includes author info, photos, locations, tags, and interaction counters.
+        Resolves is_liked_by_me and is_following for the whole page with one
+        IN (...) query each, instead of loading every Like row or querying
+        Follow per trip.
 
         Args:
-            trip: Trip model instance
+            trips: Trips loaded with _feed_item_options()
             current_user_id: Current user ID (for is_liked_by_me and is_following flags)
             db: Database session
 
         Returns:
-            FeedItem dict matching schema
+            FeedItem dicts in the same order as trips
         """
-        # Check if current user follows trip author (Feature 004 - US1)
-        is_following = None
-        if current_user_id and trip.user.id != current_user_id:
-            follow_result = await db.execute(
-                select(Follow).where(
-                    Follow.follower_id == current_user_id, Follow.following_id == trip.user.id
+        if not trips:
+            return []
+
+        liked_trip_ids = set(
+            (
+                await db.execute(
+                    select(Like.trip_id).where(
+                        Like.user_id == current_user_id,
+                        Like.trip_id.in_([trip.trip_id for trip in trips]),
+                    )
                 )
             )
-            is_following = follow_result.scalar_one_or_none() is not None
+            .scalars()
+            .all()
+        )
+        followed_user_ids = set(
+            (
+                await db.execute(
+                    select(Follow.following_id).where(
+                        Follow.follower_id == current_user_id,
+                        Follow.following_id.in_({trip.user_id for trip in trips}),
+                    )
+                )
+            )
+            .scalars()
+            .all()
+        )
 
+        return [
+            FeedService._trip_to_feed_item(
+                trip=trip,
+                # Owner never "follows" themselves (Feature 004 - US1)
+                is_following=(
+                    trip.user.id in followed_user_ids if trip.user.id != current_user_id else None
+                ),
+                is_liked_by_me=trip.trip_id in liked_trip_ids,
+            )
+            for trip in trips
+        ]
+
+    @staticmethod
+    def _trip_to_feed_item(
+        trip: Trip,
+        is_following: bool | None,
+        is_liked_by_me: bool,
+    ) -> dict[str, Any]:
+        """
+        Convert Trip model to FeedItem dict.
+
+        Includes author info, photos, locations, tags, and interaction counters.
+
+        Args:
+            trip: Trip model instance
+            is_following: Whether the current user follows the author (None for own trips)
+            is_liked_by_me: Whether the current user liked the trip
+
+        Returns:
+            FeedItem dict matching schema
+        """
         # Author (UserSummary)
         author = {
             "user_id": trip.user.id,  # Feature 004 - US1
@@ -481,7 +847,10 @@ class FeedService:
         }
 
         # Photos (PhotoSummary array)
-        photos = [{"photo_url": photo.photo_url, "caption": photo.caption} for photo in trip.photos]
+        photos = [
+            {"photo_url": photo.photo_url, "caption": photo.caption, "variants": photo.variants}
+            for photo in trip.photos
+        ]
 
         # Locations (LocationSummary array)
         locations = [
@@ -496,14 +865,6 @@ class FeedService:
         # Tags (TagSummary array)
         tags = [{"name": tt.tag.name, "normalized": tt.tag.normalized} for tt in trip.trip_tags]
 
-        # Interaction counters
-        likes_count = len(trip.likes)
-        comments_count = len(trip.comments)
-        shares_count = len(trip.shares)
-
-        # is_liked_by_me flag
-        is_liked_by_me = any(like.user_id == current_user_id for like in trip.likes)
-
         return {
             "trip_id": trip.trip_id,
             "title": trip.title,
@@ -515,9 +876,10 @@ class FeedService:
             "end_date": trip.end_date,
             "locations": locations,
             "tags": tags,
-            "likes_count": likes_count,
-            "comments_count": comments_count,
-            "shares_count": shares_count,
+            # Interaction counters (denormalized on Trip)
+            "likes_count": trip.likes_count,
+            "comments_count": trip.comments_count,
+            "shares_count": trip.shares_count,
             "is_liked_by_me": is_liked_by_me,
             "created_at": trip.created_at,
         }
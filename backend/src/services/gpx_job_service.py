@@ -0,0 +1,536 @@
+"""
+GPX Job Service - Durable queue for background GPX processing (Feature 003).
+
+Large uploads (>1MB) are saved to storage and answered with 202 Accepted; the
+actual processing runs in worker processes (src/workers/gpx_worker.py) that
+take jobs from the gpx_jobs table:
+
+- enqueue(): called by the upload endpoint in the same transaction as the
+  GPXFile record, so no accepted upload is lost if the API restarts.
+- claim_next(): leases the oldest available job with a conditional UPDATE
+  (works on SQLite and PostgreSQL; concurrent workers never get the same job).
+  Jobs whose lease expired (worker crashed) become available again.
+- run_next(): renews the lease while the job is processed, so long jobs are
+  not taken over by another worker.
+- process_job(): parses the GPX file from disk and stages the results.
+  Idempotent: previous trackpoints/statistics of the file are replaced.
+- complete(): commits the results only if the worker still holds the lease;
+  otherwise they are dropped (another worker owns the job now).
+- fail(): retries with exponential backoff until max_attempts, then marks
+  the job and the GPXFile as failed. Invalid GPX files are not retried.
+"""
+
+import asyncio
+import logging
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, and_, delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.config import settings
+from src.models.cache_invalidation import invalidate_on_commit
+from src.models.gpx import GPXFile
+from src.models.gpx_job import GPXJob
+from src.models.route_statistics import RouteStatistics
+from src.services.gpx_service import GPXService
+
+logger = logging.getLogger(__name__)
+
+# Candidate jobs fetched per claim attempt (others may be taken concurrently)
+CLAIM_BATCH_SIZE = 5
+
+
+class GPXJobService:
+    """Service for enqueueing, leasing and processing GPX jobs."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize GPX job service.
+
+        Args:
+            db: Database session
+        """
+        self.db = db
+
+    async def enqueue(self, gpx_file_id: str, file_path: str) -> GPXJob:
+        """
+        Queue a saved GPX file for background processing.
+
+        Commits the session, so pending changes (the GPXFile record) are
+        persisted together with the job.
+
+        Args:
+            gpx_file_id: GPX file record to process
+            file_path: Path of the original GPX file in storage
+
+        Returns:
+            Created GPXJob
+        """
+        job = GPXJob(
+            gpx_file_id=gpx_file_id,
+            file_path=file_path,
+            status="pending",
+            attempts=0,
+            max_attempts=settings.gpx_job_max_attempts,
+            available_at=datetime.now(UTC),
+        )
+        self.db.add(job)
+        await self.db.commit()
+
+        logger.info(f"GPX job {job.job_id} queued for file {gpx_file_id}")
+        return job
+
+    async def claim_next(self, worker_id: str) -> GPXJob | None:
+        """
+        Lease the next available job.
+
+        A job is available if it is pending and its retry time has come, or
+        if it is processing but its lease has expired.
+
+        Args:
+            worker_id: Identifier of the claiming worker (logged and stored)
+
+        Returns:
+            Leased GPXJob (status "processing"), or None if the queue is empty
+        """
+        now = datetime.now(UTC)
+        available = or_(
+            and_(GPXJob.status == "pending", GPXJob.available_at <= now),
+            and_(GPXJob.status == "processing", GPXJob.leased_until < now),
+        )
+
+        result = await self.db.execute(
+            select(GPXJob.job_id)
+            .where(available)
+            .order_by(GPXJob.available_at)
+            .limit(CLAIM_BATCH_SIZE)
+        )
+        for job_id in result.scalars().all():
+            # Conditional update: only one worker can move the job out of the
+            # available state, the others see rowcount 0 and try the next one
+            claim = (
+                update(GPXJob)
+                .where(GPXJob.job_id == job_id, available)
+                .values(
+                    status="processing",
+                    worker_id=worker_id,
+                    leased_until=now + timedelta(seconds=settings.gpx_job_lease_seconds),
+                    attempts=GPXJob.attempts + 1,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            claimed = cast(CursorResult, await self.db.execute(claim))
+            await self.db.commit()
+            if claimed.rowcount != 1:
+                continue
+
+            job = await self.db.get(GPXJob, job_id, populate_existing=True)
+            if job is None:
+                # Deleted together with its GPX file after the claim
+                continue
+            if job.attempts > job.max_attempts:
+                # Lease expired on the last attempt (worker kept crashing)
+                await self.fail(job, worker_id, "Tiempo de procesamiento agotado", retry=False)
+                continue
+
+            logger.info(
+                f"GPX job {job.job_id} leased by {worker_id} "
+                f"(attempt {job.attempts}/{job.max_attempts})"
+            )
+            return job
+
+        return None
+
+    async def renew_lease(self, job_id: str, worker_id: str) -> bool:
+        """
+        Extend the lease of a job the worker still holds by gpx_job_lease_seconds.
+
+        Args:
+            job_id: Leased job
+            worker_id: Worker holding the lease
+
+        Returns:
+            False if the lease was lost (expired and claimed by another worker)
+        """
+        renewed = cast(
+            CursorResult,
+            await self.db.execute(
+                update(GPXJob)
+                .where(_leased_by(job_id, worker_id))
+                .values(
+                    leased_until=datetime.now(UTC)
+                    + timedelta(seconds=settings.gpx_job_lease_seconds)
+                )
+                .execution_options(synchronize_session=False)
+            ),
+        )
+        await self.db.commit()
+        return renewed.rowcount == 1
+
+    async def complete(self, job: GPXJob, worker_id: str) -> bool:
+        """
+        Mark a leased job as completed, committing the results staged by process_job().
+
+        Args:
+            job: Leased job
+            worker_id: Worker holding the lease
+
+        Returns:
+            False if the lease was lost: the results are rolled back
+        """
+        job_id = job.job_id  # job is expired by a rollback
+        completed = cast(
+            CursorResult,
+            await self.db.execute(
+                update(GPXJob)
+                .where(_leased_by(job_id, worker_id))
+                .values(
+                    status="completed",
+                    leased_until=None,
+                    last_error=None,
+                    completed_at=datetime.now(UTC),
+                )
+            ),
+        )
+        if completed.rowcount != 1:
+            await self.db.rollback()
+            logger.warning(f"GPX job {job_id} lease lost by {worker_id}, result dropped")
+            return False
+
+        await self.db.commit()
+        return True
+
+    async def fail(self, job: GPXJob, worker_id: str, error: str, retry: bool = True) -> bool:
+        """
+        Record a failed attempt.
+
+        The job is scheduled again after gpx_job_retry_backoff_seconds * 2^(attempt-1)
+        while attempts remain; otherwise it is marked failed together with its
+        GPXFile, which the status endpoint then reports to the client.
+
+        Args:
+            job: Leased job
+            worker_id: Worker holding the lease
+            error: Error message (stored on the job, and on the GPXFile if final)
+            retry: False for errors that cannot succeed on retry (invalid GPX)
+
+        Returns:
+            False if the lease was lost: nothing is recorded
+        """
+        job_id = job.job_id  # job is expired by a rollback
+        final = not (retry and job.attempts < job.max_attempts)
+        if final:
+            values: dict[str, Any] = {"status": "failed", "completed_at": datetime.now(UTC)}
+        else:
+            backoff = settings.gpx_job_retry_backoff_seconds * 2 ** (job.attempts - 1)
+            values = {
+                "status": "pending",
+                "available_at": datetime.now(UTC) + timedelta(seconds=backoff),
+            }
+
+        failed = cast(
+            CursorResult,
+            await self.db.execute(
+                update(GPXJob)
+                .where(_leased_by(job_id, worker_id))
+                .values(last_error=error, leased_until=None, **values)
+            ),
+        )
+        if failed.rowcount != 1:
+            await self.db.rollback()
+            logger.warning(f"GPX job {job_id} lease lost by {worker_id}, failure dropped")
+            return False
+
+        if not final:
+            await self.db.commit()
+            logger.warning(
+                f"GPX job {job.job_id} failed (attempt {job.attempts}/{job.max_attempts}), "
+                f"retrying in {backoff}s: {error}"
+            )
+            return True
+
+        await self.db.execute(
+            update(GPXFile)
+            .where(GPXFile.gpx_file_id == job.gpx_file_id)
+            .values(processing_status="failed", error_message=error)
+            .execution_options(synchronize_session=False)
+        )
+        invalidate_on_commit(self.db, f"gpx:{job.gpx_file_id}")
+        await self.db.commit()
+        logger.error(f"GPX job {job.job_id} failed permanently: {error}")
+        return True
+
+    async def run_next(self, worker_id: str) -> bool:
+        """
+        Claim and process one job.
+
+        Args:
+            worker_id: Identifier of the worker
+
+        Returns:
+            True if a job was processed (successfully or not), False if the queue was empty
+        """
+        job = await self.claim_next(worker_id)
+        if job is None:
+            return False
+
+        heartbeat = asyncio.create_task(self._keep_leased(job.job_id, worker_id))
+        try:
+            try:
+                await self.process_job(job)
+            finally:
+                heartbeat.cancel()
+                await asyncio.gather(heartbeat, return_exceptions=True)
+        except ValueError as e:
+            # Invalid GPX file: retrying will not help
+            await self.db.rollback()
+            await self.db.refresh(job)
+            await self.fail(job, worker_id, str(e), retry=False)
+        except Exception as e:
+            logger.error(f"Unexpected error processing GPX job {job.job_id}: {e}", exc_info=True)
+            await self.db.rollback()
+            await self.db.refresh(job)
+            await self.fail(job, worker_id, "Error interno al procesar el archivo GPX")
+        else:
+            await self.complete(job, worker_id)
+
+        return True
+
+    async def _keep_leased(self, job_id: str, worker_id: str) -> None:
+        """Renew the lease every third of gpx_job_lease_seconds until cancelled."""
+        interval = settings.gpx_job_lease_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                # Own session: the processing session is busy with the job's writes
+                async with AsyncSession(self.db.bind) as db:
+                    if not await GPXJobService(db).renew_lease(job_id, worker_id):
+                        logger.warning(f"GPX job {job_id} lease lost by {worker_id}")
+                        return
+            except Exception as e:
+                # Database briefly unavailable: try again before the lease runs out
+                logger.warning(f"GPX job {job_id} lease renewal failed: {e}")
+
+    async def process_job(self, job: GPXJob) -> None:
+        """
+        Parse the job's GPX file and stage trackpoints and route statistics.
+
+        Replaces any trackpoints/statistics left by a previous attempt, so a
+        job can safely run again. The results are flushed, not committed:
+        complete() commits them only if the worker still holds the lease.
+
+        Args:
+            job: Leased job
+
+        Raises:
+            ValueError: If the GPX file is invalid or its record no longer exists
+            OSError: If the stored file cannot be read
+        """
+        processing_start_time = datetime.now(UTC)
+        file_size_mb = Path(job.file_path).stat().st_size / (1024 * 1024)
+
+        gpx_file = await self.db.get(GPXFile, job.gpx_file_id)
+        if gpx_file is None:
+            raise ValueError(f"Archivo GPX {job.gpx_file_id} no encontrado")
+
+        # LOG METRIC: Background Processing Start
+        logger.info(
+            "GPX_BACKGROUND_START",
+            extra={
+                "metric_type": "gpx_background_start",
+                "gpx_file_id": gpx_file.gpx_file_id,
+                "trip_id": gpx_file.trip_id,
+                "job_id": job.job_id,
+                "attempt": job.attempts,
+                "file_size_mb": round(file_size_mb, 2),
+            },
+        )
+
+        try:
+            # Parse and analyze GPX file in one pass (streamed from storage,
+            # waiting for a free worker if needed)
+            gpx_service = GPXService(self.db)
+            analysis = await gpx_service.analyze_gpx(job.file_path, wait_for_worker=True)
+            parsed_data = analysis["route"]
+        except ValueError as e:
+            # LOG METRIC: Background Processing Error
+            logger.error(
+                "GPX_PROCESSING_ERROR",
+                extra={
+                    "metric_type": "gpx_processing_error",
+                    "trip_id": gpx_file.trip_id,
+                    "gpx_file_id": gpx_file.gpx_file_id,
+                    "processing_mode": "async",
+                    "file_size_mb": round(file_size_mb, 2),
+                    "processing_time_seconds": round(
+                        (datetime.now(UTC) - processing_start_time).total_seconds(), 2
+                    ),
+                    "error_type": "INVALID_GPX_FORMAT",
+                    "error_message": str(e),
+                },
+            )
+            raise
+
+        # Drop statistics of an interrupted previous attempt (save_track replaces the track)
+        await self.db.execute(
+            delete(RouteStatistics).where(RouteStatistics.gpx_file_id == job.gpx_file_id)
+        )
+
+        # Update GPX file record with parsed data
+        gpx_file.distance_km = parsed_data["distance_km"]
+        gpx_file.elevation_gain = parsed_data["elevation_gain"]
+        gpx_file.elevation_loss = parsed_data["elevation_loss"]
+        gpx_file.max_elevation = parsed_data["max_elevation"]
+        gpx_file.min_elevation = parsed_data["min_elevation"]
+        gpx_file.start_lat = parsed_data["start_lat"]
+        gpx_file.start_lon = parsed_data["start_lon"]
+        gpx_file.end_lat = parsed_data["end_lat"]
+        gpx_file.end_lon = parsed_data["end_lon"]
+        gpx_file.total_points = parsed_data["total_points"]
+        gpx_file.simplified_points = parsed_data["simplified_points_count"]
+        gpx_file.has_elevation = parsed_data["has_elevation"]
+        gpx_file.has_timestamps = parsed_data["has_timestamps"]
+        gpx_file.processing_status = "completed"
+        gpx_file.error_message = None
+        gpx_file.processed_at = datetime.now(UTC)
+
+        # Save simplified track
+        await gpx_service.save_track(gpx_file, parsed_data["trackpoints"])
+
+        # Save route statistics if GPX has timestamps (T134 - User Story 5)
+        if analysis["route_statistics"] is not None:
+            try:
+                route_stats = self._build_route_statistics(
+                    gpx_file.gpx_file_id, parsed_data, analysis["route_statistics"]
+                )
+                self.db.add(route_stats)
+            except Exception as stats_error:
+                # Log error but don't fail the entire GPX processing
+                logger.error(
+                    f"Error calculating route statistics for GPX file {gpx_file.gpx_file_id}: "
+                    f"{stats_error}",
+                    exc_info=True,
+                )
+
+        # GPX record, trackpoints and statistics become visible together (complete())
+        await self.db.flush()
+
+        logger.info(
+            f"Background GPX processing completed for file {gpx_file.gpx_file_id} "
+            f"({gpx_file.simplified_points} points, {parsed_data['distance_km']:.2f} km)"
+        )
+
+        # LOG METRIC: Background Processing Complete
+        processing_time_seconds = (datetime.now(UTC) - processing_start_time).total_seconds()
+        logger.info(
+            "GPX_PROCESSING_COMPLETE",
+            extra={
+                "metric_type": "gpx_processing_complete",
+                "trip_id": gpx_file.trip_id,
+                "gpx_file_id": gpx_file.gpx_file_id,
+                "job_id": job.job_id,
+                "processing_mode": "async",
+                "processing_time_seconds": round(processing_time_seconds, 2),
+                "file_size_mb": round(file_size_mb, 2),
+                "total_points": gpx_file.total_points,
+                "simplified_points": gpx_file.simplified_points,
+                "distance_km": round(gpx_file.distance_km, 2),
+                "has_elevation": gpx_file.has_elevation,
+                "status": "success",
+            },
+        )
+
+    def _build_route_statistics(
+        self, gpx_file_id: str, parsed_data: dict[str, Any], route_statistics: dict[str, Any]
+    ) -> RouteStatistics:
+        """
+        Build the RouteStatistics record for a parsed GPX file with timestamps.
+
+        Args:
+            gpx_file_id: GPX file the statistics belong to
+            parsed_data: Route summary from GPXService.analyze_gpx() ("route")
+            route_statistics: Statistics from GPXService.analyze_gpx() ("route_statistics")
+        """
+        speed_metrics = route_statistics["speed_metrics"]
+        top_climbs = route_statistics["top_climbs"]
+        gradient_dist = route_statistics["gradient_distribution"]
+
+        # Fix floating-point precision issue: ensure moving_time <= total_time
+        moving_time = speed_metrics.get("moving_time_minutes")
+        total_time = speed_metrics.get("total_time_minutes")
+        if moving_time is not None and total_time is not None and moving_time > total_time:
+            # Clamp moving_time to total_time (precision error fix)
+            speed_metrics["moving_time_minutes"] = total_time
+
+        # Calculate weighted average gradient from distribution
+        total_distance = (
+            gradient_dist["llano"]["distance_km"]
+            + gradient_dist["moderado"]["distance_km"]
+            + gradient_dist["empinado"]["distance_km"]
+            + gradient_dist["muy_empinado"]["distance_km"]
+        )
+
+        if total_distance > 0:
+            avg_gradient = (
+                (gradient_dist["llano"]["distance_km"] * 1.5)
+                + (gradient_dist["moderado"]["distance_km"] * 4.5)
+                + (gradient_dist["empinado"]["distance_km"] * 8.0)
+                + (gradient_dist["muy_empinado"]["distance_km"] * 12.0)
+            ) / total_distance
+        else:
+            avg_gradient = None
+
+        # Find max gradient from the simplified trackpoints
+        max_gradient = None
+        if parsed_data["has_elevation"]:
+            gradients: list[float] = [
+                float(p["gradient"])
+                for p in parsed_data["trackpoints"]
+                if p.get("gradient") is not None
+            ]
+            max_gradient = max(gradients) if gradients else None
+
+        # Convert top climbs to JSON format
+        top_climbs_data = (
+            [
+                {
+                    "start_km": climb["start_km"],
+                    "end_km": climb["end_km"],
+                    "elevation_gain_m": climb["elevation_gain_m"],
+                    "avg_gradient": climb["avg_gradient"],
+                    "description": f"Subida {i+1}: {climb['elevation_gain_m']:.0f}m gain, {climb['avg_gradient']:.1f}% avg gradient",
+                }
+                for i, climb in enumerate(top_climbs[:3])
+            ]
+            if top_climbs
+            else None
+        )
+
+        logger.info(
+            f"Route statistics created for GPX file {gpx_file_id}: "
+            f"avg_speed={speed_metrics.get('avg_speed_kmh'):.1f} km/h, "
+            f"climbs={len(top_climbs) if top_climbs else 0}"
+        )
+
+        return RouteStatistics(
+            gpx_file_id=gpx_file_id,
+            avg_speed_kmh=speed_metrics.get("avg_speed_kmh"),
+            max_speed_kmh=speed_metrics.get("max_speed_kmh"),
+            total_time_minutes=speed_metrics.get("total_time_minutes"),
+            moving_time_minutes=speed_metrics.get("moving_time_minutes"),
+            avg_gradient=avg_gradient,
+            max_gradient=max_gradient,
+            top_climbs=top_climbs_data,
+        )
+
+
+def _leased_by(job_id: str, worker_id: str) -> ColumnElement[bool]:
+    """Condition matching a job only while the worker holds its lease."""
+    return and_(
+        GPXJob.job_id == job_id,
+        GPXJob.worker_id == worker_id,
+        GPXJob.status == "processing",
+    )
@@ -8,22 +8,167 @@ Success Criteria: SC-002, SC-003, SC-005, SC-026
 
 import logging
 import re
+import time
 from datetime import UTC, datetime
 from math import atan2, cos, radians, sin, sqrt
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, cast
+from uuid import uuid4
 
-import gpxpy
-import gpxpy.gpx
-from rdp import rdp
+import numpy as np
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
+from src.models.cache_invalidation import invalidate_on_commit
+from src.models.gpx import GPXFile, TrackPoint, TrackTier
+from src.services.route_stats_service import track_statistics
+from src.utils.gpx_cache import GPXAnalysisCache, get_gpx_analysis_cache, gpx_digest
+from src.utils.gpx_executor import GPXExecutorBusyError, get_gpx_executor
+from src.utils.gpx_reader import GPXSource, read_gpx_track
+from src.utils.track_codec import decode_track, decode_track_columns, encode_track
+from src.utils.track_engine import (
+    MISSING_TIME,
+    TrackArrays,
+    cumulative_distance_km,
+    elevation_gain_loss,
+    gradients_percent,
+    length_3d_km,
+    moving_time_seconds,
+    rdp_mask,
+    segment_distances_km,
+    smoothed_elevation_gain_loss,
+    time_bounds,
+)
+
+if TYPE_CHECKING:
+    import asyncpg
+
 logger = logging.getLogger(__name__)
 
 # Elevation anomaly detection range (FR-034)
 MIN_ELEVATION = -420  # Dead Sea depth
 MAX_ELEVATION = 8850  # Mount Everest height
 
+# Douglas-Peucker tolerance for stored/preview trackpoints (0.0001° ≈ 10 meters)
+SIMPLIFY_EPSILON = 0.0001
+
+# Level-of-detail tiers of GET /gpx/{id}/track, finest first: Douglas-Peucker
+# tolerance (degrees) and highest map zoom level served by the tier. "detail" is
+# the stored simplified track; the coarser tiers are derived from it at ingest
+# and stored in gpx_track_tiers.
+TRACK_TIERS = {
+    "detail": (SIMPLIFY_EPSILON, 22),
+    "regional": (0.0005, 13),  # ≈ 50 meters
+    "overview": (0.002, 10),  # ≈ 200 meters
+}
+
+# Column order of the rows written by GPXService.save_trackpoints()
+TRACKPOINT_COLUMNS = (
+    "point_id",
+    "gpx_file_id",
+    "latitude",
+    "longitude",
+    "elevation",
+    "distance_km",
+    "sequence",
+    "gradient",
+)
+
+
+def _nan_to_none(value: float) -> float | None:
+    """Map NaN (missing value in track arrays) to None for JSON/ORM output."""
+    return None if value != value else value
+
+
+def select_track_tier(
+    tier_points: dict[str, int], zoom: int | None = None, max_points: int | None = None
+) -> str:
+    """
+    Pick the level-of-detail tier to serve for a map zoom level and/or point budget.
+
+    Args:
+        tier_points: Point count of each stored tier (always includes "detail")
+        zoom: Map zoom level; selects the coarsest tier that still serves it
+        max_points: Point budget; selects the finest tier (no finer than the zoom
+            tier) with at most this many points, or the coarsest tier if none fits
+
+    Returns:
+        Tier name (a TRACK_TIERS key)
+    """
+    candidates = [tier for tier in TRACK_TIERS if tier in tier_points]
+    if zoom is not None:
+        # Start at the coarsest tier whose zoom range still covers the requested zoom
+        start = next(
+            (
+                index
+                for index in reversed(range(len(candidates)))
+                if TRACK_TIERS[candidates[index]][1] >= zoom
+            ),
+            0,
+        )
+        candidates = candidates[start:]
+    if max_points is not None:
+        return next(
+            (tier for tier in candidates if tier_points[tier] <= max_points), candidates[-1]
+        )
+    return candidates[0]
+
+
+def build_track_tiers(trackpoints: list[dict[str, Any]]) -> dict[str, list[dict]]:
+    """
+    Derive the coarser level-of-detail tiers from the simplified (detail) track.
+
+    Each tier keeps the detail track's cumulative distances (true route
+    distance, not the shortcut length) and recomputes gradients between
+    the points it keeps.
+
+    Args:
+        trackpoints: Trackpoint dicts as returned by GPXService.parse_gpx_file()["trackpoints"]
+
+    Returns:
+        Trackpoint dicts of every tier except "detail", keyed by tier name
+    """
+    count = len(trackpoints)
+    lat = np.fromiter((p["latitude"] for p in trackpoints), dtype=np.float64, count=count)
+    lon = np.fromiter((p["longitude"] for p in trackpoints), dtype=np.float64, count=count)
+    distance_km = np.fromiter(
+        (p["distance_km"] for p in trackpoints), dtype=np.float64, count=count
+    )
+    ele = np.fromiter(
+        (np.nan if p["elevation"] is None else p["elevation"] for p in trackpoints),
+        dtype=np.float64,
+        count=count,
+    )
+
+    tiers = {}
+    for tier, (epsilon, _) in TRACK_TIERS.items():
+        if tier == "detail":
+            continue
+        mask = rdp_mask(lat, lon, epsilon)
+        gradients = gradients_percent(distance_km[mask], ele[mask])
+        tiers[tier] = [
+            {
+                "latitude": point_lat,
+                "longitude": point_lon,
+                "elevation": _nan_to_none(point_ele),
+                "distance_km": distance,
+                "sequence": sequence,
+                "gradient": round(gradient, 2) if gradient == gradient else None,
+            }
+            for sequence, (point_lat, point_lon, point_ele, distance, gradient) in enumerate(
+                zip(
+                    lat[mask].tolist(),
+                    lon[mask].tolist(),
+                    ele[mask].tolist(),
+                    distance_km[mask].tolist(),
+                    gradients.tolist(),
+                    strict=True,
+                )
+            )
+        ]
+    return tiers
+
 
 def clean_filename_for_title(filename: str) -> str:
     """
@@ -116,27 +261,35 @@ class GPXService:
     Handles GPX file parsing, track simplification, and route statistics calculation.
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, cache: GPXAnalysisCache | None = None):
         """
         Initialize GPX service.
 
         Args:
             db: Database session
+            cache: Analysis cache (defaults to the shared cache, None if disabled)
         """
         self.db = db
+        self.cache = cache if cache is not None else get_gpx_analysis_cache()
 
-    async def parse_gpx_file(self, file_content: bytes) -> dict[str, Any]:
+    async def parse_gpx_file(
+        self, file_content: GPXSource, wait_for_worker: bool = False
+    ) -> dict[str, Any]:
         """
         Parse GPX file and extract track data.
 
+        The CPU-bound work runs in the GPX process pool (see gpx_executor).
+
         Implements:
-        - T023: GPX parsing using gpxpy library
+        - T023: Streaming GPX parsing into columnar arrays (no gpxpy object tree)
         - T024: Track simplification using Douglas-Peucker
         - T025: Distance calculation using Haversine formula
         - T027: Elevation anomaly detection
 
         Args:
-            file_content: Raw GPX file bytes
+            file_content: Raw GPX file bytes, or path to a GPX file on disk
+            wait_for_worker: Wait for a free worker instead of failing when the
+                pool is saturated (background tasks)
 
         Returns:
             Dict with route statistics and simplified trackpoints:
@@ -152,264 +305,185 @@ class GPXService:
             - has_elevation: Whether GPX contains elevation data
             - has_timestamps: Whether GPX contains timestamp data
             - trackpoints: List of simplified trackpoints
+            - track: Columnar TrackArrays with all original points
 
         Raises:
             ValueError: If GPX is invalid, corrupted, or contains anomalous data
+            GPXExecutorBusyError: If the process pool is saturated
 
         Functional Requirements: FR-001, FR-002, FR-003, FR-007, FR-021, FR-034
         Success Criteria: SC-005 (>90% elevation accuracy), SC-026 (30% storage reduction)
         """
         try:
-            import time
-
-            start_time = time.perf_counter()
-
-            # Parse GPX XML
-            gpx = gpxpy.parse(file_content)
-            parse_time = time.perf_counter() - start_time
-            logger.info(f"GPX parse time: {parse_time:.3f}s")
-
-            # Extract all trackpoints
-            extract_start = time.perf_counter()
-            points = []
-            for track in gpx.tracks:
-                for segment in track.segments:
-                    points.extend(segment.points)
-
-            if not points:
-                raise ValueError("El archivo GPX no contiene puntos de track")
-
-            extract_time = time.perf_counter() - extract_start
-            logger.info(f"Point extraction time: {extract_time:.3f}s, {len(points)} points")
-
-            # Detect timestamps
-            has_timestamps = any(
-                p.time is not None for p in points[:100]
-            )  # Sample first 100 points
-
-            # Calculate metrics using gpxpy built-in methods
-            stats_start = time.perf_counter()
-            distance_km = gpx.length_3d() / 1000  # meters to km
-            uphill, downhill = gpx.get_uphill_downhill()
-            stats_time = time.perf_counter() - stats_start
-            logger.info(f"GPX stats calculation time: {stats_time:.3f}s")
-
-            # Extract and validate elevation data (FR-034)
-            elev_start = time.perf_counter()
-            elevations = [p.elevation for p in points if p.elevation is not None]
-            has_elevation = len(elevations) > 0
-
-            if has_elevation:
-                # Anomaly detection (FR-034) - optimized with min/max before loop
-                min_elev = min(elevations)
-                max_elev = max(elevations)
-
-                if min_elev < MIN_ELEVATION or max_elev > MAX_ELEVATION:
-                    raise ValueError(
-                        f"Elevación anómala detectada: {min_elev}m a {max_elev}m. "
-                        f"Rango válido: {MIN_ELEVATION}m a {MAX_ELEVATION}m"
-                    )
-
-                max_elevation = max_elev
-                min_elevation = min_elev
-
-                # Ensure uphill/downhill are not None (gpxpy may return None)
-                uphill = uphill if uphill is not None else 0.0
-                downhill = downhill if downhill is not None else 0.0
-            else:
-                max_elevation = None
-                min_elevation = None
-                uphill = None
-                downhill = None
-
-            elev_time = time.perf_counter() - elev_start
-            logger.info(f"Elevation processing time: {elev_time:.3f}s")
-
-            # Simplify trackpoints (Douglas-Peucker algorithm) - T024
-            # epsilon=0.0001° ≈ 10 meter precision (more aggressive reduction)
-            simplify_start = time.perf_counter()
-            simplified_points = self._simplify_track_optimized(points, epsilon=0.0001)
-            simplify_time = time.perf_counter() - simplify_start
-            logger.info(
-                f"Simplification time: {simplify_time:.3f}s, "
-                f"{len(points)} -> {len(simplified_points)} points "
-                f"({100 * (1 - len(simplified_points) / len(points)):.1f}% reduction)"
+            # Reuse a previous analysis of the same file (e.g. same GPX uploaded again)
+            cache_key = None
+            if self.cache is not None:
+                digest = gpx_digest(file_content)
+                analysis = self.cache.get(
+                    self.cache.make_key(digest, "analysis", epsilon=SIMPLIFY_EPSILON)
+                )
+                if analysis is not None:
+                    return analysis["route"]
+                cache_key = self.cache.make_key(digest, "route", epsilon=SIMPLIFY_EPSILON)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+            result = await get_gpx_executor().run(
+                _run_gpx_task, "_parse_sync", file_content, wait=wait_for_worker
             )
 
-            return {
-                "distance_km": round(distance_km, 2),
-                "elevation_gain": round(uphill, 1) if uphill is not None else None,
-                "elevation_loss": round(downhill, 1) if downhill is not None else None,
-                "max_elevation": round(max_elevation, 1) if max_elevation is not None else None,
-                "min_elevation": round(min_elevation, 1) if min_elevation is not None else None,
-                "start_lat": points[0].latitude,
-                "start_lon": points[0].longitude,
-                "end_lat": points[-1].latitude,
-                "end_lon": points[-1].longitude,
-                "total_points": len(points),
-                "simplified_points_count": len(simplified_points),
-                "has_elevation": has_elevation,
-                "has_timestamps": has_timestamps,
-                "trackpoints": simplified_points,
-                "original_points": points,  # Include original points for statistics calculation
-            }
-
-        except gpxpy.gpx.GPXException as e:
-            raise ValueError(f"Error al procesar archivo GPX: {str(e)}")
+        except GPXExecutorBusyError:
+            raise
         except Exception as e:
             raise ValueError(f"Error al procesar archivo GPX: {str(e)}")
 
-    def _simplify_track_optimized(
-        self, points: list[gpxpy.gpx.GPXTrackPoint], epsilon: float = 0.0001
-    ) -> list[dict[str, Any]]:
-        """
-        OPTIMIZED: Simplify GPS track using Ramer-Douglas-Peucker algorithm.
-
-        Optimizations:
-        - Use dict lookup instead of linear search (O(1) vs O(n))
-        - Pre-calculate point index mapping
-        - Single pass for distance and gradient calculation
-
-        Args:
-            points: Original GPX trackpoints
-            epsilon: Tolerance (0.0001° ≈ 10m precision)
-
-        Returns:
-            Simplified trackpoints (typically 80-95% reduction)
-        """
-        if len(points) < 3:
-            return [self._point_to_dict(p, i, 0.0) for i, p in enumerate(points)]
-
-        # Convert to coordinate array for RDP
-        coords = [(p.latitude, p.longitude) for p in points]
+        if self.cache is not None and cache_key is not None:
+            self.cache.set(cache_key, result)
+        return result
 
-        # Apply Douglas-Peucker algorithm
-        simplified_coords = rdp(coords, epsilon=epsilon)
+    def _parse_sync(self, file_content: GPXSource) -> dict[str, Any]:
+        """CPU-bound part of parse_gpx_file (runs in a worker process)."""
+        start_time = time.perf_counter()
 
-        # Create point lookup dict (OPTIMIZATION: O(1) lookup instead of O(n))
-        point_map = {(p.latitude, p.longitude): p for p in points}
+        # Stream GPX XML into columnar arrays
+        track = read_gpx_track(file_content)
+        parse_time = time.perf_counter() - start_time
+        logger.info(f"GPX parse time: {parse_time:.3f}s, {len(track)} points")
 
-        # Build simplified trackpoints in single pass
-        simplified: list[dict[str, Any]] = []
-        cumulative_distance = 0.0
+        return self._summarize_track(track)
 
-        for i, (lat, lon) in enumerate(simplified_coords):
-            # O(1) lookup
-            original = point_map[(lat, lon)]
-
-            # Calculate gradient if elevation data available
-            gradient = None
-            if i > 0 and original.elevation is not None and simplified:
-                prev_point = simplified[-1]
-                if prev_point["elevation"] is not None:
-                    distance_m = (cumulative_distance - prev_point["distance_km"]) * 1000
-                    elevation_diff = original.elevation - prev_point["elevation"]
-                    if distance_m > 0:
-                        gradient = (elevation_diff / distance_m) * 100  # Percentage
-
-            simplified.append(self._point_to_dict(original, i, cumulative_distance, gradient))
-
-            # Calculate cumulative distance for next point
-            if i < len(simplified_coords) - 1:
-                next_lat, next_lon = simplified_coords[i + 1]
-                segment_distance = self._calculate_distance(lat, lon, next_lat, next_lon)
-                cumulative_distance += segment_distance
-
-        return simplified
-
-    def _simplify_track(
-        self, points: list[gpxpy.gpx.GPXTrackPoint], epsilon: float = 0.0001
-    ) -> list[dict[str, Any]]:
+    def _summarize_track(self, track: TrackArrays) -> dict[str, Any]:
         """
-        Simplify GPS track using Ramer-Douglas-Peucker algorithm.
-
-        Implements T024: Douglas-Peucker simplification.
+        Compute route statistics and simplified trackpoints for a parsed track.
 
         Args:
-            points: Original GPX trackpoints
-            epsilon: Tolerance (0.0001° ≈ 10m precision)
+            track: Original track as columnar arrays
 
         Returns:
-            Simplified trackpoints (typically 80-90% reduction)
+            Same dict as parse_gpx_file()
 
-        Success Criteria: SC-026 (30% storage reduction via simplification)
+        Raises:
+            ValueError: If the track is empty or contains anomalous elevations
         """
-        if len(points) < 3:
-            return [self._point_to_dict(p, i, 0.0) for i, p in enumerate(points)]
-
-        # Convert to coordinate array for RDP
-        coords = [(p.latitude, p.longitude) for p in points]
-
-        # Apply Douglas-Peucker algorithm
-        simplified_coords = rdp(coords, epsilon=epsilon)
-
-        # Map back to original points (preserve elevation)
-        simplified: list[dict[str, Any]] = []
-        cumulative_distance = 0.0
-
-        for i, (lat, lon) in enumerate(simplified_coords):
-            # Find original point
-            original = next(p for p in points if p.latitude == lat and p.longitude == lon)
+        if not len(track):
+            raise ValueError("El archivo GPX no contiene puntos de track")
+
+        # Detect timestamps
+        has_timestamps = bool((track.time[:100] != MISSING_TIME).any())  # Sample first 100 points
+
+        # Calculate metrics (vectorized equivalents of gpxpy built-in methods)
+        stats_start = time.perf_counter()
+        distance_km = length_3d_km(track)
+        stats_time = time.perf_counter() - stats_start
+        logger.info(f"GPX stats calculation time: {stats_time:.3f}s")
+
+        # Extract and validate elevation data (FR-034)
+        elev_start = time.perf_counter()
+        has_elevation = track.has_elevation
+
+        if has_elevation:
+            min_elev = float(np.nanmin(track.ele))
+            max_elev = float(np.nanmax(track.ele))
+
+            if min_elev < MIN_ELEVATION or max_elev > MAX_ELEVATION:
+                raise ValueError(
+                    f"Elevación anómala detectada: {min_elev}m a {max_elev}m. "
+                    f"Rango válido: {MIN_ELEVATION}m a {MAX_ELEVATION}m"
+                )
 
-            # Calculate gradient if elevation data available
-            gradient = None
-            if i > 0 and original.elevation is not None and simplified:
-                prev_point = simplified[-1]
-                if prev_point["elevation"] is not None:
-                    distance_m = (cumulative_distance - prev_point["distance_km"]) * 1000
-                    elevation_diff = original.elevation - prev_point["elevation"]
-                    if distance_m > 0:
-                        gradient = (elevation_diff / distance_m) * 100  # Percentage
+            max_elevation = max_elev
+            min_elevation = min_elev
+            uphill, downhill = smoothed_elevation_gain_loss(track)
+        else:
+            max_elevation = None
+            min_elevation = None
+            uphill = None
+            downhill = None
 
-            simplified.append(self._point_to_dict(original, i, cumulative_distance, gradient))
+        elev_time = time.perf_counter() - elev_start
+        logger.info(f"Elevation processing time: {elev_time:.3f}s")
 
-            # Calculate cumulative distance for next point (T025: Haversine)
-            if i < len(simplified_coords) - 1:
-                next_lat, next_lon = simplified_coords[i + 1]
-                segment_distance = self._calculate_distance(lat, lon, next_lat, next_lon)
-                cumulative_distance += segment_distance
+        # Simplify trackpoints (Douglas-Peucker algorithm) - T024
+        # epsilon=0.0001° ≈ 10 meter precision (more aggressive reduction)
+        simplify_start = time.perf_counter()
+        simplified_points = self._simplify_track_optimized(track, epsilon=SIMPLIFY_EPSILON)
+        simplify_time = time.perf_counter() - simplify_start
+        logger.info(
+            f"Simplification time: {simplify_time:.3f}s, "
+            f"{len(track)} -> {len(simplified_points)} points "
+            f"({100 * (1 - len(simplified_points) / len(track)):.1f}% reduction)"
+        )
 
-        return simplified
+        return {
+            "distance_km": round(distance_km, 2),
+            "elevation_gain": round(uphill, 1) if uphill is not None else None,
+            "elevation_loss": round(downhill, 1) if downhill is not None else None,
+            "max_elevation": round(max_elevation, 1) if max_elevation is not None else None,
+            "min_elevation": round(min_elevation, 1) if min_elevation is not None else None,
+            "start_lat": float(track.lat[0]),
+            "start_lon": float(track.lon[0]),
+            "end_lat": float(track.lat[-1]),
+            "end_lon": float(track.lon[-1]),
+            "total_points": len(track),
+            "simplified_points_count": len(simplified_points),
+            "has_elevation": has_elevation,
+            "has_timestamps": has_timestamps,
+            "trackpoints": simplified_points,
+            "track": track,  # Include original points for statistics calculation
+        }
 
-    def _point_to_dict(
-        self,
-        point: gpxpy.gpx.GPXTrackPoint,
-        sequence: int,
-        distance_km: float,
-        gradient: float = None,
-    ) -> dict[str, Any]:
+    def _simplify_track_optimized(
+        self, track: TrackArrays, epsilon: float = 0.0001
+    ) -> list[dict[str, Any]]:
         """
-        Convert GPX trackpoint to dictionary format.
+        OPTIMIZED: Simplify GPS track using Ramer-Douglas-Peucker algorithm.
+
+        Optimizations:
+        - Vectorized RDP kernel returning a keep-mask (no coordinate lookups)
+        - Distances and gradients computed on arrays in a single pass
 
         Args:
-            point: GPX trackpoint object
-            sequence: Point order in sequence
-            distance_km: Cumulative distance from start
-            gradient: Percentage slope (optional)
+            track: Original track as columnar arrays
+            epsilon: Tolerance (0.0001° ≈ 10m precision)
 
         Returns:
-            Dictionary with point data
+            Simplified trackpoints (typically 80-95% reduction)
         """
-        return {
-            "latitude": point.latitude,
-            "longitude": point.longitude,
-            "elevation": point.elevation if point.elevation else None,
-            "distance_km": round(distance_km, 3),
-            "sequence": sequence,
-            "gradient": round(gradient, 2) if gradient is not None else None,
-        }
+        simplified = track.take(rdp_mask(track.lat, track.lon, epsilon))
+        distance_km = cumulative_distance_km(simplified)
+        gradients = gradients_percent(distance_km, simplified.ele)
+
+        return [
+            {
+                "latitude": lat,
+                "longitude": lon,
+                "elevation": _nan_to_none(ele),
+                "distance_km": round(distance, 3),
+                "sequence": sequence,
+                "gradient": round(gradient, 2) if gradient == gradient else None,
+            }
+            for sequence, (lat, lon, ele, distance, gradient) in enumerate(
+                zip(
+                    simplified.lat.tolist(),
+                    simplified.lon.tolist(),
+                    simplified.ele.tolist(),
+                    distance_km.tolist(),
+                    gradients.tolist(),
+                    strict=True,
+                )
+            )
+        ]
 
-    def convert_points_for_stats(
-        self, points: list[gpxpy.gpx.GPXTrackPoint]
-    ) -> list[dict[str, Any]]:
+    def convert_points_for_stats(self, track: TrackArrays) -> list[dict[str, Any]]:
         """
-        Convert GPX trackpoints to dictionary format for RouteStatsService.
+        Convert original GPX trackpoints to dictionary format for RouteStatsService.
 
-        This method converts original GPX trackpoints (gpxpy objects) to the
+        This method converts the original track (columnar arrays) to the
         dictionary format expected by RouteStatsService for statistics calculation.
 
         Args:
-            points: List of original GPX trackpoint objects
+            track: Original track as columnar arrays
 
         Returns:
             List of trackpoint dictionaries with fields:
@@ -422,42 +496,38 @@ class GPXService:
         Note:
             Distance is calculated cumulatively using Haversine formula.
         """
-        if not points:
+        if not len(track):
             return []
 
-        trackpoints = []
-        cumulative_distance_km = 0.0
-
-        for i, point in enumerate(points):
-            # Calculate cumulative distance (Haversine formula)
-            if i > 0:
-                prev_point = points[i - 1]
-                segment_distance = self._calculate_distance(
-                    prev_point.latitude,
-                    prev_point.longitude,
-                    point.latitude,
-                    point.longitude,
+        distance_km = np.round(cumulative_distance_km(track), 3)
+
+        return [
+            {
+                "latitude": lat,
+                "longitude": lon,
+                "elevation": _nan_to_none(ele),
+                "distance_km": distance,
+                "timestamp": timestamp,
+                "sequence": sequence,
+            }
+            for sequence, (lat, lon, ele, distance, timestamp) in enumerate(
+                zip(
+                    track.lat.tolist(),
+                    track.lon.tolist(),
+                    track.ele.tolist(),
+                    distance_km.tolist(),
+                    track.timestamps(),
+                    strict=True,
                 )
-                cumulative_distance_km += segment_distance
-
-            trackpoints.append(
-                {
-                    "latitude": point.latitude,
-                    "longitude": point.longitude,
-                    "elevation": point.elevation if point.elevation is not None else None,
-                    "distance_km": round(cumulative_distance_km, 3),
-                    "timestamp": point.time if point.time is not None else None,
-                    "sequence": i,
-                }
             )
-
-        return trackpoints
+        ]
 
     def _calculate_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """
         Calculate distance between two GPS coordinates using Haversine formula.
 
-        Implements T025: Distance calculation.
+        Implements T025: Distance calculation. For whole tracks use the
+        vectorized kernels in src.utils.track_engine instead.
 
         Args:
             lat1: Starting latitude
@@ -478,7 +548,7 @@ class GPXService:
         return R * c
 
     async def extract_telemetry_quick(
-        self, file_content: bytes, include_trackpoints: bool = False
+        self, file_content: GPXSource, include_trackpoints: bool = False
     ) -> dict[str, Any]:
         """
         Extract lightweight telemetry data from GPX file for wizard preview.
@@ -498,7 +568,7 @@ class GPXService:
         Performance Goal: <2s for files up to 10MB (SC-002)
 
         Args:
-            file_content: Raw GPX file bytes
+            file_content: Raw GPX file bytes, or path to a GPX file on disk
             include_trackpoints: If True, include simplified trackpoints for map visualization
 
         Returns:
@@ -519,6 +589,7 @@ class GPXService:
 
         Raises:
             ValueError: If GPX is invalid or corrupted
+            GPXExecutorBusyError: If the process pool is saturated
 
         Examples:
             >>> result = await service.extract_telemetry_quick(gpx_content)
@@ -532,157 +603,24 @@ class GPXService:
             >>> len(result["trackpoints"])
             250
         """
-        try:
-            # Parse GPX XML
-            gpx = gpxpy.parse(file_content)
-
-            # Extract all trackpoints
-            points = []
-            for track in gpx.tracks:
-                for segment in track.segments:
-                    points.extend(segment.points)
-
-            if not points:
-                raise ValueError("El archivo GPX no contiene puntos de track")
-
-            # Calculate total distance using Haversine formula
-            total_distance_km = 0.0
-            for i in range(1, len(points)):
-                prev_point = points[i - 1]
-                curr_point = points[i]
-                segment_distance = self._calculate_distance(
-                    prev_point.latitude,
-                    prev_point.longitude,
-                    curr_point.latitude,
-                    curr_point.longitude,
-                )
-                total_distance_km += segment_distance
-
-            # Check for elevation data
-            has_elevation = any(p.elevation is not None for p in points)
-
-            # Check for timestamps and extract dates if available
-            has_timestamps = any(p.time is not None for p in points)
-            start_date = None
-            end_date = None
-            total_time_minutes = None
-            moving_time_minutes = None
-
-            if has_timestamps:
-                # Extract timestamps from points that have them
-                timestamps = [p.time for p in points if p.time is not None]
-                if timestamps:
-                    # Get earliest and latest timestamps
-                    min_time = min(timestamps)
-                    max_time = max(timestamps)
-                    # Convert to date-only format (YYYY-MM-DD)
-                    start_date = min_time.date().isoformat()
-                    end_date = max_time.date().isoformat()
-
-                    # Calculate total time in minutes
-                    total_time_seconds = (max_time - min_time).total_seconds()
-                    total_time_minutes = round(total_time_seconds / 60, 1)
-
-                    # Calculate moving time (exclude stops where speed < 1 km/h)
-                    moving_seconds = 0.0
-                    for i in range(1, len(points)):
-                        prev_point = points[i - 1]
-                        curr_point = points[i]
-
-                        if prev_point.time is not None and curr_point.time is not None:
-                            time_diff = (curr_point.time - prev_point.time).total_seconds()
-
-                            # Calculate speed for this segment
-                            distance_km = self._calculate_distance(
-                                prev_point.latitude,
-                                prev_point.longitude,
-                                curr_point.latitude,
-                                curr_point.longitude,
-                            )
-
-                            if time_diff > 0:
-                                speed_kmh = (distance_km / time_diff) * 3600
-                                # Consider moving if speed >= 1 km/h (filters out stops)
-                                if speed_kmh >= 1.0:
-                                    moving_seconds += time_diff
-
-                    moving_time_minutes = round(moving_seconds / 60, 1)
-
-            # Calculate elevation statistics if data exists
-            elevation_gain = None
-            elevation_loss = None
-            max_elevation = None
-            min_elevation = None
-
-            if has_elevation:
-                elevations = [p.elevation for p in points if p.elevation is not None]
-
-                # Detect anomalous elevations (FR-034)
-                for ele in elevations:
-                    if ele < MIN_ELEVATION or ele > MAX_ELEVATION:
-                        raise ValueError(
-                            f"Elevación anómala detectada: {ele}m. "
-                            f"Los valores deben estar entre {MIN_ELEVATION}m y {MAX_ELEVATION}m"
-                        )
-
-                max_elevation = max(elevations)
-                min_elevation = min(elevations)
-
-                # Calculate cumulative elevation gain/loss
-                gain = 0.0
-                loss = 0.0
-                for i in range(1, len(points)):
-                    prev_ele = points[i - 1].elevation
-                    curr_ele = points[i].elevation
-                    if prev_ele is not None and curr_ele is not None:
-                        diff = curr_ele - prev_ele
-                        if diff > 0:
-                            gain += diff
-                        else:
-                            loss += abs(diff)
-
-                elevation_gain = round(gain, 1)
-                elevation_loss = round(loss, 1)
-
-            # Calculate difficulty using DifficultyCalculator
-            from src.services.difficulty_calculator import DifficultyCalculator
-
-            difficulty = DifficultyCalculator.calculate(total_distance_km, elevation_gain)
-
-            # Build base result
-            result = {
-                "distance_km": round(total_distance_km, 2),
-                "elevation_gain": elevation_gain,
-                "elevation_loss": elevation_loss,
-                "max_elevation": max_elevation,
-                "min_elevation": min_elevation,
-                "has_elevation": has_elevation,
-                "has_timestamps": has_timestamps,
-                "start_date": start_date,
-                "end_date": end_date,
-                "total_time_minutes": total_time_minutes,
-                "moving_time_minutes": moving_time_minutes,
-                "difficulty": difficulty,
-            }
-
-            # Optionally include simplified trackpoints for wizard map visualization
+        if self.cache is not None:
+            # Run (or reuse) the full analysis so the publish step that usually
+            # follows the preview finds the same file already cached
+            analysis = await self.analyze_gpx(file_content)
+            telemetry = analysis["telemetry"]
             if include_trackpoints:
-                simplified_trackpoints = self._simplify_track_optimized(points, epsilon=0.0001)
-                # Convert to simple dict format for JSON serialization
-                result["trackpoints"] = [
-                    {
-                        "latitude": tp["latitude"],
-                        "longitude": tp["longitude"],
-                        "elevation": tp.get("elevation"),
-                        "distance_km": tp["distance_km"],
-                    }
-                    for tp in simplified_trackpoints
-                ]
-            else:
-                result["trackpoints"] = None
+                telemetry["trackpoints"] = self._preview_trackpoints(
+                    analysis["route"]["trackpoints"]
+                )
+            return telemetry
 
-            return result
+        try:
+            return await get_gpx_executor().run(
+                _run_gpx_task, "_telemetry_sync", file_content, include_trackpoints
+            )
 
+        except GPXExecutorBusyError:
+            raise
         except Exception as e:
             if isinstance(e, ValueError):
                 # Re-raise ValueError with original message
@@ -694,6 +632,458 @@ class GPXService:
                 "Verifica que sea un archivo válido con datos de ruta."
             )
 
+    async def analyze_gpx(
+        self, file_content: GPXSource, wait_for_worker: bool = False
+    ) -> dict[str, Any]:
+        """
+        Parse a GPX file once and run every analysis needed to publish a trip.
+
+        Produces the results of extract_telemetry_quick(), parse_gpx_file() and
+        RouteStatsService.calculate_track_statistics() from a single parsed
+        track, sharing segment and cumulative distances between them.
+
+        Feature: 017-gps-trip-wizard
+        Endpoint: POST /trips/gpx-wizard (also used by the GPX job worker)
+
+        Args:
+            file_content: Raw GPX file bytes, or path to a GPX file on disk
+            wait_for_worker: Wait for a free worker instead of failing when the
+                pool is saturated (background tasks)
+
+        Returns:
+            Dict with:
+            - telemetry: Same as extract_telemetry_quick() (without trackpoints)
+            - route: Same as parse_gpx_file()
+            - route_statistics: Same as RouteStatsService.calculate_track_statistics(),
+              None if the track has no timestamps or the statistics failed
+
+        Raises:
+            ValueError: If GPX is invalid, corrupted, or contains anomalous data
+            GPXExecutorBusyError: If the process pool is saturated
+        """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(
+                gpx_digest(file_content), "analysis", epsilon=SIMPLIFY_EPSILON
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("GPX analysis cache hit")
+                return cached
+
+        try:
+            result = await get_gpx_executor().run(
+                _run_gpx_task, "_analyze_sync", file_content, wait=wait_for_worker
+            )
+
+        except GPXExecutorBusyError:
+            raise
+        except Exception as e:
+            if isinstance(e, ValueError):
+                raise
+            logger.error(f"Error al procesar archivo GPX: {e}")
+            raise ValueError(
+                "No se pudo procesar el archivo GPX. "
+                "Verifica que sea un archivo válido con datos de ruta."
+            )
+
+        if self.cache is not None and cache_key is not None:
+            self.cache.set(cache_key, result)
+        return result
+
+    def _analyze_sync(self, file_content: GPXSource) -> dict[str, Any]:
+        """CPU-bound part of analyze_gpx (runs in a worker process)."""
+        track = self._read_track(file_content)
+        segment_km = segment_distances_km(track)
+        telemetry = self._build_telemetry(track, segment_km, include_trackpoints=False)
+        route = self._summarize_track(track)
+
+        # Advanced statistics only make sense with timestamps (Feature 003 - User Story 5)
+        route_statistics = None
+        if route["has_timestamps"]:
+            try:
+                distance_km = np.round(cumulative_distance_km(track, segment_km), 3)
+                route_statistics = track_statistics(track, distance_km)
+            except Exception as e:
+                # Statistics are optional: never fail the whole analysis because of them
+                logger.error(f"Error calculating route statistics: {e}", exc_info=True)
+
+        return {
+            "telemetry": telemetry,
+            "route": route,
+            "route_statistics": route_statistics,
+        }
+
+    def _telemetry_sync(self, file_content: GPXSource, include_trackpoints: bool) -> dict[str, Any]:
+        """CPU-bound part of extract_telemetry_quick (runs in a worker process)."""
+        track = self._read_track(file_content)
+        return self._build_telemetry(track, segment_distances_km(track), include_trackpoints)
+
+    def _read_track(self, file_content: GPXSource) -> TrackArrays:
+        """
+        Stream a GPX document into columnar arrays for the wizard endpoints.
+
+        Raises:
+            ValueError: Generic "could not process" message for malformed XML or trackpoints
+        """
+        try:
+            return read_gpx_track(file_content)
+        except ValueError as e:
+            # Malformed XML or trackpoints: report as an unprocessable file
+            logger.error(f"Error al procesar archivo GPX: {e}")
+            raise ValueError(
+                "No se pudo procesar el archivo GPX. "
+                "Verifica que sea un archivo válido con datos de ruta."
+            )
+
+    def _build_telemetry(
+        self, track: TrackArrays, segment_km: np.ndarray, include_trackpoints: bool
+    ) -> dict[str, Any]:
+        """
+        Compute wizard telemetry for a parsed track.
+
+        Args:
+            track: Original track as columnar arrays
+            segment_km: segment_distances_km(track)
+            include_trackpoints: If True, include simplified trackpoints
+
+        Returns:
+            Same dict as extract_telemetry_quick()
+        """
+        if not len(track):
+            raise ValueError("El archivo GPX no contiene puntos de track")
+
+        # Calculate total distance using Haversine formula (vectorized)
+        total_distance_km = float(segment_km.sum())
+
+        # Check for elevation data
+        has_elevation = track.has_elevation
+
+        # Check for timestamps and extract dates if available
+        has_timestamps = track.has_timestamps
+        start_date = None
+        end_date = None
+        total_time_minutes = None
+        moving_time_minutes = None
+
+        bounds = time_bounds(track) if has_timestamps else None
+        if bounds:
+            # Get earliest and latest timestamps
+            min_time, max_time = bounds
+            # Convert to date-only format (YYYY-MM-DD)
+            start_date = min_time.date().isoformat()
+            end_date = max_time.date().isoformat()
+
+            # Calculate total time in minutes
+            total_time_seconds = (max_time - min_time).total_seconds()
+            total_time_minutes = round(total_time_seconds / 60, 1)
+
+            # Calculate moving time (exclude stops where speed < 1 km/h)
+            moving_seconds = moving_time_seconds(track, segment_km)
+            moving_time_minutes = round(moving_seconds / 60, 1)
+
+        # Calculate elevation statistics if data exists
+        elevation_gain = None
+        elevation_loss = None
+        max_elevation = None
+        min_elevation = None
+
+        if has_elevation:
+            elevations = track.ele[~np.isnan(track.ele)]
+
+            # Detect anomalous elevations (FR-034)
+            anomalous = elevations[(elevations < MIN_ELEVATION) | (elevations > MAX_ELEVATION)]
+            if anomalous.shape[0]:
+                raise ValueError(
+                    f"Elevación anómala detectada: {float(anomalous[0])}m. "
+                    f"Los valores deben estar entre {MIN_ELEVATION}m y {MAX_ELEVATION}m"
+                )
+
+            max_elevation = float(elevations.max())
+            min_elevation = float(elevations.min())
+
+            # Calculate cumulative elevation gain/loss
+            gain, loss = elevation_gain_loss(track.ele)
+
+            elevation_gain = round(gain, 1)
+            elevation_loss = round(loss, 1)
+
+        # Calculate difficulty using DifficultyCalculator
+        from src.services.difficulty_calculator import DifficultyCalculator
+
+        difficulty = DifficultyCalculator.calculate(total_distance_km, elevation_gain)
+
+        # Build base result
+        result = {
+            "distance_km": round(total_distance_km, 2),
+            "elevation_gain": elevation_gain,
+            "elevation_loss": elevation_loss,
+            "max_elevation": max_elevation,
+            "min_elevation": min_elevation,
+            "has_elevation": has_elevation,
+            "has_timestamps": has_timestamps,
+            "start_date": start_date,
+            "end_date": end_date,
+            "total_time_minutes": total_time_minutes,
+            "moving_time_minutes": moving_time_minutes,
+            "difficulty": difficulty,
+        }
+
+        # Optionally include simplified trackpoints for wizard map visualization
+        if include_trackpoints:
+            simplified_trackpoints = self._simplify_track_optimized(track, epsilon=SIMPLIFY_EPSILON)
+            result["trackpoints"] = self._preview_trackpoints(simplified_trackpoints)
+        else:
+            result["trackpoints"] = None
+
+        return result
+
+    def _preview_trackpoints(self, simplified_trackpoints: list[dict[str, Any]]) -> list[dict]:
+        """Convert simplified trackpoints to the simple dict format of the wizard map."""
+        return [
+            {
+                "latitude": tp["latitude"],
+                "longitude": tp["longitude"],
+                "elevation": tp.get("elevation"),
+                "distance_km": tp["distance_km"],
+            }
+            for tp in simplified_trackpoints
+        ]
+
+    async def save_track(self, gpx_file: GPXFile, trackpoints: list[dict[str, Any]]) -> None:
+        """
+        Store the simplified track of a GPX file using the configured storage mode.
+
+        - GPX_TRACK_STORAGE=blob: packed into gpx_file.track_blob (one column)
+        - GPX_TRACK_STORAGE=rows: bulk inserted as track_points rows
+
+        Replaces any track stored before (reprocessing): existing track_points
+        rows are deleted in both modes, and reads prefer the blob, so rows mode
+        clears it to never return a stale track. The coarser level-of-detail
+        tiers (TRACK_TIERS) are always stored as blobs in gpx_track_tiers. The
+        caller commits.
+
+        Args:
+            gpx_file: GPX file record (already flushed)
+            trackpoints: Trackpoint dicts as returned by parse_gpx_file()["trackpoints"]
+        """
+        invalidate_on_commit(self.db, f"gpx:{gpx_file.gpx_file_id}")
+        await self.db.execute(
+            delete(TrackPoint).where(TrackPoint.gpx_file_id == gpx_file.gpx_file_id)
+        )
+        if settings.gpx_track_storage == "blob":
+            gpx_file.track_blob = encode_track(trackpoints)
+        else:
+            gpx_file.track_blob = None
+            await self.save_trackpoints(gpx_file.gpx_file_id, trackpoints)
+
+        await self.db.execute(
+            delete(TrackTier).where(TrackTier.gpx_file_id == gpx_file.gpx_file_id)
+        )
+        tiers = [
+            {
+                "gpx_file_id": gpx_file.gpx_file_id,
+                "tier": tier,
+                "epsilon": TRACK_TIERS[tier][0],
+                "point_count": len(points),
+                "track_blob": encode_track(points),
+            }
+            for tier, points in build_track_tiers(trackpoints).items()
+        ]
+        if tiers:
+            await self.db.execute(insert(TrackTier), tiers)
+
+    async def resolve_track_tier(
+        self, gpx_file: GPXFile, zoom: int | None = None, max_points: int | None = None
+    ) -> str:
+        """
+        Pick the stored level-of-detail tier for a zoom level and/or point budget.
+
+        Args:
+            gpx_file: GPX file record
+            zoom: Map zoom level
+            max_points: Point budget
+
+        Returns:
+            Tier name (see select_track_tier())
+        """
+        if zoom is None and max_points is None:
+            return "detail"
+
+        result = await self.db.execute(
+            select(TrackTier.tier, TrackTier.point_count).where(
+                TrackTier.gpx_file_id == gpx_file.gpx_file_id
+            )
+        )
+        tier_points = dict(result.all())
+        tier_points["detail"] = gpx_file.simplified_points
+        return select_track_tier(tier_points, zoom=zoom, max_points=max_points)
+
+    async def _load_track_blob(self, gpx_file_id: str, tier: str) -> bytes | None:
+        """Fetch the packed track of a tier (None: detail track stored as rows)."""
+        if tier == "detail":
+            return await self.db.scalar(
+                select(GPXFile.track_blob).where(GPXFile.gpx_file_id == gpx_file_id)
+            )
+
+        track_blob = await self.db.scalar(
+            select(TrackTier.track_blob).where(
+                TrackTier.gpx_file_id == gpx_file_id, TrackTier.tier == tier
+            )
+        )
+        if track_blob is None:
+            raise ValueError(f"Nivel de detalle no disponible: {tier}")
+        return track_blob
+
+    async def load_trackpoints(
+        self, gpx_file_id: str, tier: str = "detail"
+    ) -> list[dict[str, Any]]:
+        """
+        Load the simplified track of a GPX file ordered by sequence.
+
+        Reads track_blob when present (single-row fetch), otherwise track_points
+        rows. Coarser tiers are read from gpx_track_tiers.
+
+        Args:
+            gpx_file_id: GPX file identifier
+            tier: Level-of-detail tier (TRACK_TIERS key)
+
+        Returns:
+            Trackpoint dicts (point_id, latitude, longitude, elevation,
+            distance_km, sequence, gradient)
+
+        Raises:
+            ValueError: If a coarser tier is requested but not stored
+        """
+        track_blob = await self._load_track_blob(gpx_file_id, tier)
+        if track_blob is not None:
+            trackpoints = decode_track(track_blob)
+            # Deterministic UUID-shaped ids: file id prefix + tier index + sequence
+            prefix = f"{gpx_file_id[:24]}{list(TRACK_TIERS).index(tier):x}"
+            for point in trackpoints:
+                point["point_id"] = f"{prefix}{point['sequence']:011x}"
+            return trackpoints
+
+        result = await self.db.execute(
+            select(
+                *(
+                    TrackPoint.__table__.c[column]
+                    for column in TRACKPOINT_COLUMNS
+                    if column != "gpx_file_id"
+                )
+            )
+            .where(TrackPoint.gpx_file_id == gpx_file_id)
+            .order_by(TrackPoint.sequence)
+        )
+        return [dict(row) for row in result.mappings()]
+
+    async def load_track_columns(
+        self, gpx_file_id: str, tier: str = "detail"
+    ) -> dict[str, np.ndarray]:
+        """
+        Load the simplified track of a GPX file as columnar arrays.
+
+        Used by the compact track formats (columnar, polyline, binary), which
+        need no per-point dicts or point ids.
+
+        Args:
+            gpx_file_id: GPX file identifier
+            tier: Level-of-detail tier (TRACK_TIERS key)
+
+        Returns:
+            Dict of float64 arrays latitude, longitude, elevation, distance_km and
+            gradient (NaN where missing) plus int64 sequence, ordered by sequence
+
+        Raises:
+            ValueError: If a coarser tier is requested but not stored
+        """
+        track_blob = await self._load_track_blob(gpx_file_id, tier)
+        if track_blob is not None:
+            return decode_track_columns(track_blob)
+
+        columns = ("latitude", "longitude", "elevation", "distance_km", "sequence", "gradient")
+        result = await self.db.execute(
+            select(*(TrackPoint.__table__.c[column] for column in columns))
+            .where(TrackPoint.gpx_file_id == gpx_file_id)
+            .order_by(TrackPoint.sequence)
+        )
+        rows = result.all()
+
+        track = {
+            column: np.array(
+                [np.nan if row[index] is None else row[index] for row in rows], dtype=np.float64
+            )
+            for index, column in enumerate(columns)
+        }
+        track["sequence"] = track["sequence"].astype(np.int64)
+        return track
+
+    async def save_trackpoints(self, gpx_file_id: str, trackpoints: list[dict[str, Any]]) -> int:
+        """
+        Bulk insert simplified trackpoints of a GPX file.
+
+        Bypasses the ORM unit of work (one TrackPoint object per point), which
+        dominated ingestion time for large routes:
+        - PostgreSQL (asyncpg): binary COPY
+        - SQLite: a single executemany of one prepared INSERT
+
+        Rows are written in the session's current transaction; the caller commits.
+
+        Args:
+            gpx_file_id: GPX file the points belong to
+            trackpoints: Trackpoint dicts as returned by parse_gpx_file()["trackpoints"]
+
+        Returns:
+            Number of rows inserted
+        """
+        rows = [
+            (
+                str(uuid4()),
+                gpx_file_id,
+                point["latitude"],
+                point["longitude"],
+                point["elevation"],
+                point["distance_km"],
+                point["sequence"],
+                point["gradient"],
+            )
+            for point in trackpoints
+        ]
+        if not rows:
+            return 0
+
+        conn = await self.db.connection()
+        dialect = conn.dialect
+
+        if dialect.name == "postgresql" and dialect.driver == "asyncpg":
+            raw_connection = await conn.get_raw_connection()
+            pg_connection = cast("asyncpg.Connection", raw_connection.driver_connection)
+            if pg_connection.is_in_transaction():
+                await pg_connection.copy_records_to_table(
+                    TrackPoint.__tablename__, records=rows, columns=TRACKPOINT_COLUMNS
+                )
+            else:
+                # Session has not issued a statement yet: COPY in its own transaction
+                async with pg_connection.transaction():
+                    await pg_connection.copy_records_to_table(
+                        TrackPoint.__tablename__, records=rows, columns=TRACKPOINT_COLUMNS
+                    )
+        elif dialect.name == "sqlite":
+            placeholders = ", ".join("?" for _ in TRACKPOINT_COLUMNS)
+            await conn.exec_driver_sql(
+                f"INSERT INTO {TrackPoint.__tablename__} ({', '.join(TRACKPOINT_COLUMNS)}) "
+                f"VALUES ({placeholders})",
+                rows,
+            )
+        else:
+            await conn.execute(
+                insert(TrackPoint.__table__),
+                [dict(zip(TRACKPOINT_COLUMNS, row, strict=True)) for row in rows],
+            )
+
+        logger.debug(f"Inserted {len(rows)} trackpoints for GPX file {gpx_file_id}")
+        return len(rows)
+
     async def save_gpx_to_storage(self, trip_id: str, file_content: bytes, filename: str) -> str:
         """
         Save original GPX file to filesystem storage.
@@ -739,3 +1129,13 @@ class GPXService:
 
         # Return absolute path for database storage
         return str(file_path)
+
+
+def _run_gpx_task(method: str, *args: Any) -> Any:
+    """
+    Process pool entry point: run a synchronous GPXService pipeline.
+
+    Module-level so it can be pickled by the process pool. The pipelines
+    never touch the database, so no session is needed in the worker.
+    """
+    return getattr(GPXService(db=None), method)(*args)
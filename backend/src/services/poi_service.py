@@ -25,6 +25,8 @@ from src.models.poi import PointOfInterest
 from src.models.trip import Trip
 from src.schemas.poi import POICreateInput, POITypeEnum, POIUpdateInput
 from src.utils.file_storage import validate_photo
+from src.utils.image_executor import get_image_executor
+from src.utils.trip_photo_service import trip_photo_service
 
 logger = logging.getLogger(__name__)
 
@@ -344,9 +346,11 @@ class POIService:
         # Verify user is trip owner
         await self._get_trip_with_ownership_check(poi.trip_id, user_id)
 
-        # Validate photo (max 5MB for POIs)
+        # Validate photo (max 5MB for POIs), then resize and re-encode as an optimized JPEG
+        # (decoding off the event loop)
         photo_bytes = BytesIO(photo_file.read())
-        validate_photo(photo_bytes, content_type, max_size_mb=5)
+        await get_image_executor().run(validate_photo, photo_bytes, content_type, 5)
+        processed = await trip_photo_service.process_photo_async(photo_bytes.getvalue(), filename)
 
         # Generate storage path
         storage_path = self._get_poi_photo_storage_path(poi_id, filename)
@@ -356,9 +360,8 @@ class POIService:
         full_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Save photo to disk
-        photo_bytes.seek(0)
         async with aiofiles.open(full_path, "wb") as f:
-            await f.write(photo_bytes.read())
+            await f.write(processed.optimized_bytes)
 
         # Update POI with photo URL (include /storage prefix for static file serving)
         poi.photo_url = f"/storage/{storage_path}"
@@ -377,11 +380,11 @@ class POIService:
         """
         Generate storage path for a POI's photo.
 
-        Path structure: poi_photos/{year}/{month}/{poi_id}_{uuid}.{ext}
+        Path structure: poi_photos/{year}/{month}/{poi_id}_{uuid}.jpg
 
         Args:
             poi_id: POI identifier
-            filename: Original filename (extension will be extracted)
+            filename: Original filename (photos are always saved as JPEG)
 
         Returns:
             Relative path for storing the file
@@ -395,9 +398,8 @@ class POIService:
         month = now.strftime("%m")
 
         # Generate unique filename
-        file_ext = Path(filename).suffix or ".jpg"
         unique_id = uuid.uuid4().hex[:8]
-        new_filename = f"{poi_id}_{unique_id}{file_ext}"
+        new_filename = f"{poi_id}_{unique_id}.jpg"
 
         # Create path: poi_photos/YYYY/MM/poi_id_uuid.ext
         relative_path = f"poi_photos/{year}/{month}/{new_filename}"
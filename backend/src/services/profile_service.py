@@ -8,7 +8,6 @@ Business logic for profile management including:
 - Public profile views
 """
 
-import asyncio
 import logging
 from datetime import UTC, datetime
 from pathlib import Path
@@ -27,8 +26,10 @@ from src.schemas.profile import (
     ProfileStatsPreview,
     ProfileUpdateRequest,
 )
-from src.utils.file_storage import generate_photo_filename, resize_photo, validate_photo
-from src.utils.security import hash_password, verify_password
+from src.utils.file_storage import generate_photo_filename, validate_photo
+from src.utils.image_executor import get_image_executor
+from src.utils.security import hash_password_async, verify_password_async
+from src.utils.trip_photo_service import trip_photo_service
 
 logger = logging.getLogger(__name__)
 
@@ -232,7 +233,8 @@ class ProfileService:
         """
         T120: Upload and process profile photo.
 
-        Validates, resizes to 400x400, and stores photo.
+        Validates, crops and resizes to a square of settings.profile_photo_size
+        (400x400 by default), and stores photo as JPEG.
 
         Args:
             username: Username of profile
@@ -263,45 +265,26 @@ class ProfileService:
         photo_bytes = BytesIO(content)
 
         try:
-            validate_photo(photo_bytes, photo_file.content_type, max_size_mb=5)
+            await get_image_executor().run(validate_photo, photo_bytes, photo_file.content_type, 5)
         except ValueError as e:
             raise ValueError(str(e))
 
-        # Generate filename
-        if photo_file.filename and "." in photo_file.filename:
-            file_ext = photo_file.filename.split(".")[-1].lower()
-        else:
-            file_ext = "jpg"
-
-        if file_ext not in ["jpg", "jpeg", "png", "webp"]:
-            file_ext = "jpg"
-
-        filename = generate_photo_filename(user.id, file_ext)
+        # T227: Crop, resize and encode in the shared image pool (off the event loop)
+        try:
+            processed = await trip_photo_service.process_photo_async(
+                content, photo_file.filename or "", thumb_size=settings.profile_photo_size
+            )
+        except ValueError as e:
+            raise ValueError(f"Error al procesar la imagen: {str(e)}")
 
-        # Create storage directory
+        # Save the square version (always JPEG)
+        filename = generate_photo_filename(user.id, "jpg")
         storage_dir = (
             Path(settings.storage_path) / "profile_photos" / datetime.now(UTC).strftime("%Y/%m")
         )
         storage_dir.mkdir(parents=True, exist_ok=True)
-
-        # T227: Async photo processing to avoid blocking event loop
-        # Save file in thread pool and resize
-        file_path = storage_dir / filename
-
-        def write_and_resize():
-            """Write file and resize - runs in thread pool."""
-            with open(file_path, "wb") as f:
-                f.write(content)
-            return resize_photo(file_path, target_size=400)
-
-        try:
-            # Run I/O-bound operation in thread pool
-            final_path = await asyncio.to_thread(write_and_resize)
-        except Exception as e:
-            # Clean up file on error
-            if file_path.exists():
-                file_path.unlink()
-            raise ValueError(f"Error al procesar la imagen: {str(e)}")
+        final_path = storage_dir / filename
+        final_path.write_bytes(processed.thumbnail_bytes)
 
         # Delete old photo if exists
         if profile.profile_photo_url:
@@ -320,8 +303,8 @@ class ProfileService:
 
         return {
             "photo_url": photo_url,
-            "photo_width": 400,
-            "photo_height": 400,
+            "photo_width": settings.profile_photo_size,
+            "photo_height": settings.profile_photo_size,
         }
 
     async def delete_photo(self, username: str) -> bool:
@@ -437,11 +420,11 @@ class ProfileService:
             raise ValueError(f"El usuario '{username}' no existe")
 
         # Verify current password
-        if not verify_password(current_password, user.hashed_password):
+        if not await verify_password_async(current_password, user.hashed_password):
             raise ValueError("La contraseña actual es incorrecta")
 
         # Update password
-        user.hashed_password = hash_password(new_password)
+        user.hashed_password = await hash_password_async(new_password)
         user.updated_at = datetime.now(UTC)
 
         await self.db.commit()
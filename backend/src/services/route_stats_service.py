@@ -7,21 +7,51 @@ Provides algorithms for calculating advanced route analytics including:
 - Climb detection (identify top 3 hardest climbs)
 - Gradient classification (distribute route into gradient categories)
 
+All three analyses run on columnar arrays (cumulative distance, elevation,
+timestamps), so a parsed track can be analyzed in one call without first
+converting every point to a dict.
+
 Functional Requirements: FR-030 to FR-034
 Success Criteria: SC-021 to SC-024
 """
 
-from datetime import datetime
 from typing import Any
 
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.utils.track_engine import (
+    MISSING_TIME,
+    TrackArrays,
+    cumulative_distance_km,
+    datetime_to_micros,
+)
+
+# Speed metrics (FR-030)
+STOP_SPEED_THRESHOLD_KMH = 1.0  # Speed below this is considered stopped (matches gpxpy default)
+MAX_REALISTIC_SPEED_KMH = 100.0  # Steep descents can reach 80-90 km/h (filters GPS errors)
+MIN_SEGMENT_TIME_SECONDS = 2.0  # Ignore very short segments (GPS noise)
+
+# Climb detection (FR-031)
+DESCENT_THRESHOLD_M = 10.0  # If elevation drops >10m from max, climb ends
+FLAT_SECTION_COUNT = 3  # If 3+ flat points in a row, climb ends
+MIN_CLIMB_GAIN_M = 50.0  # Minimum gain to qualify as a climb
+
+# Gradient categories (FR-032): upper bound (%) of each category
+GRADIENT_CATEGORIES = (
+    ("llano", 3.0),
+    ("moderado", 6.0),
+    ("empinado", 10.0),
+    ("muy_empinado", np.inf),
+)
+
 
 class RouteStatsService:
     """
     Service for calculating advanced route statistics.
 
     Methods:
+    - calculate_track_statistics: All metrics below for a parsed track in one call
     - calculate_speed_metrics: Calculate speed and time metrics from timestamps
     - detect_climbs: Identify top 3 hardest climbs
     - classify_gradients: Classify route segments by gradient category
@@ -31,6 +61,29 @@ class RouteStatsService:
         """Initialize service with database session."""
         self.db = db
 
+    async def calculate_track_statistics(
+        self, track: TrackArrays, distance_km: np.ndarray | None = None
+    ) -> dict[str, Any]:
+        """
+        Calculate speed metrics, top climbs and gradient distribution for a track.
+
+        Equivalent to calling calculate_speed_metrics, detect_climbs and
+        classify_gradients on GPXService.convert_points_for_stats(track), but
+        shares one set of arrays between the three analyses.
+
+        Args:
+            track: Original (non-simplified) track as columnar arrays
+            distance_km: Cumulative distance per point, rounded to meters.
+                Computed from the track if not provided.
+
+        Returns:
+            Dict with keys:
+            - speed_metrics: Same as calculate_speed_metrics
+            - top_climbs: Same as detect_climbs
+            - gradient_distribution: Same as classify_gradients
+        """
+        return track_statistics(track, distance_km)
+
     async def calculate_speed_metrics(
         self, trackpoints: list[dict[str, Any]]
     ) -> dict[str, float | None]:
@@ -65,74 +118,10 @@ class RouteStatsService:
         """
         # Check if timestamps are available
         if not trackpoints or "timestamp" not in trackpoints[0]:
-            return {
-                "avg_speed_kmh": None,
-                "max_speed_kmh": None,
-                "total_time_minutes": None,
-                "moving_time_minutes": None,
-            }
-
-        # Calculate total time
-        start_time: datetime = trackpoints[0]["timestamp"]
-        end_time: datetime = trackpoints[-1]["timestamp"]
-        total_time_delta = end_time - start_time
-        total_time_minutes = total_time_delta.total_seconds() / 60.0
-
-        # Calculate moving time (exclude stops using gpxpy-compatible algorithm)
-        # Uses a lower speed threshold and groups consecutive slow segments
-        STOP_SPEED_THRESHOLD_KMH = (
-            1.0  # Speed below this is considered stopped (matches gpxpy default)
-        )
-        MAX_REALISTIC_SPEED_KMH = 100.0  # Steep descents can reach 80-90 km/h (filters GPS errors)
-        MIN_SEGMENT_TIME_SECONDS = 2.0  # Ignore very short segments (GPS noise)
-
-        moving_time_minutes = 0.0
-        stopped_time_minutes = 0.0
-        max_speed_kmh = 0.0
-        total_distance_km = trackpoints[-1]["distance_km"]
-
-        for i in range(len(trackpoints) - 1):
-            p1 = trackpoints[i]
-            p2 = trackpoints[i + 1]
-
-            time_delta = p2["timestamp"] - p1["timestamp"]
-            segment_time_seconds = time_delta.total_seconds()
-            segment_time_minutes = segment_time_seconds / 60.0
-            segment_distance_km = p2["distance_km"] - p1["distance_km"]
-
-            # Calculate instantaneous speed for this segment
-            segment_speed_kmh = 0.0
-            if segment_time_minutes > 0:
-                segment_speed_kmh = (segment_distance_km / segment_time_minutes) * 60.0
-
-                # Filter outliers: ignore unrealistic speeds and very short segments
-                # (likely caused by GPS errors or signal jumps)
-                is_valid_speed = (
-                    segment_speed_kmh <= MAX_REALISTIC_SPEED_KMH
-                    and segment_time_seconds >= MIN_SEGMENT_TIME_SECONDS
-                )
-
-                if is_valid_speed:
-                    max_speed_kmh = max(max_speed_kmh, segment_speed_kmh)
-
-            # Classify segment as stopped or moving
-            # (matches gpxpy behavior: any segment < 1 km/h is stopped, regardless of duration)
-            if segment_speed_kmh < STOP_SPEED_THRESHOLD_KMH:
-                stopped_time_minutes += segment_time_minutes
-            else:
-                moving_time_minutes += segment_time_minutes
-
-        # Calculate average speed (based on total distance and moving time)
-        avg_speed_kmh = None
-        if moving_time_minutes > 0:
-            avg_speed_kmh = (total_distance_km / moving_time_minutes) * 60.0
+            return _speed_metrics(np.zeros(0), np.zeros(0, dtype=np.int64))
 
-        return {
-            "avg_speed_kmh": avg_speed_kmh,
-            "max_speed_kmh": max_speed_kmh if max_speed_kmh > 0 else None,
-            "total_time_minutes": total_time_minutes,
-            "moving_time_minutes": moving_time_minutes,
-        }
+        distance_km, _, time = _columns(trackpoints)
+        return _speed_metrics(distance_km, time)
 
     async def detect_climbs(self, trackpoints: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """
@@ -167,138 +156,11 @@ class RouteStatsService:
             return []
 
         # Check if elevation data is available
-        if "elevation" not in trackpoints[0] or trackpoints[0]["elevation"] is None:
+        if "elevation" not in trackpoints[0]:
             return []
 
-        # Segment route into continuous climbs
-        climbs: list[dict[str, Any]] = []
-        DESCENT_THRESHOLD_M = 10.0  # If elevation drops >10m from max, climb ends
-        _FLAT_THRESHOLD_M = 2.0  # Elevation change <2m is considered flat (reserved for future use)
-        FLAT_SECTION_COUNT = 3  # If 3+ flat points in a row, climb ends
-        MIN_CLIMB_GAIN_M = 50.0  # Minimum gain to qualify as a climb
-
-        climb_start_idx = None
-        climb_start_elevation = None
-        climb_max_elevation = None  # Track maximum elevation reached during climb
-        climb_max_idx = None  # Track index where maximum was reached
-        flat_count = 0  # Count consecutive flat/descending points
-
-        for i in range(len(trackpoints)):
-            current_elevation = trackpoints[i]["elevation"]
-
-            if current_elevation is None:
-                continue
-
-            # Start a new climb if not already climbing
-            if climb_start_idx is None:
-                climb_start_idx = i
-                climb_start_elevation = current_elevation
-                climb_max_elevation = current_elevation
-                climb_max_idx = i
-                flat_count = 0
-                continue
-
-            # Check elevation change from previous maximum
-            if current_elevation > climb_max_elevation:
-                # Still climbing - update maximum and reset flat counter
-                climb_max_elevation = current_elevation
-                climb_max_idx = i
-                flat_count = 0
-            else:
-                # Not climbing (flat or descending)
-                flat_count += 1
-
-            # Check if climb ends
-            descent_from_max = climb_max_elevation - current_elevation
-            should_end_climb = False
-
-            # Condition 1: Significant descent from maximum elevation
-            if descent_from_max > DESCENT_THRESHOLD_M:
-                should_end_climb = True
-
-            # Condition 2: Prolonged flat/descending section (indicates climb has ended)
-            if flat_count >= FLAT_SECTION_COUNT:
-                should_end_climb = True
-
-            if should_end_climb:
-                # Save climb (from start to max elevation point)
-                if (
-                    climb_max_idx is not None
-                    and climb_start_idx is not None
-                    and climb_max_elevation is not None
-                    and climb_start_elevation is not None
-                    and climb_max_idx > climb_start_idx
-                ):
-                    climb_gain = climb_max_elevation - climb_start_elevation
-
-                    if climb_gain >= MIN_CLIMB_GAIN_M:
-                        start_km = trackpoints[climb_start_idx]["distance_km"]
-                        end_km = trackpoints[climb_max_idx]["distance_km"]
-                        distance_km = end_km - start_km
-
-                        if distance_km > 0:
-                            avg_gradient = (climb_gain / (distance_km * 1000)) * 100
-
-                            climbs.append(
-                                {
-                                    "start_km": start_km,
-                                    "end_km": end_km,
-                                    "elevation_gain_m": climb_gain,
-                                    "avg_gradient": avg_gradient,
-                                }
-                            )
-
-                # Start new climb at current point
-                climb_start_idx = i
-                climb_start_elevation = current_elevation
-                climb_max_elevation = current_elevation
-                climb_max_idx = i
-                flat_count = 0  # Reset flat counter for new climb
-
-        # Save final climb if exists (from start to max elevation point)
-        if (
-            climb_start_idx is not None
-            and climb_max_idx is not None
-            and climb_max_elevation is not None
-            and climb_start_elevation is not None
-            and climb_max_idx > climb_start_idx
-        ):
-            climb_gain = climb_max_elevation - climb_start_elevation
-
-            if climb_gain >= MIN_CLIMB_GAIN_M:
-                start_km = trackpoints[climb_start_idx]["distance_km"]
-                end_km = trackpoints[climb_max_idx]["distance_km"]
-                distance_km = end_km - start_km
-
-                if distance_km > 0:
-                    avg_gradient = (climb_gain / (distance_km * 1000)) * 100
-
-                    climbs.append(
-                        {
-                            "start_km": start_km,
-                            "end_km": end_km,
-                            "elevation_gain_m": climb_gain,
-                            "avg_gradient": avg_gradient,
-                        }
-                    )
-
-        # Score and rank climbs by difficulty
-        # Score = elevation_gain * (1 + avg_gradient/10)
-        # This balances long climbs (high gain) with steep climbs (high gradient)
-        for climb in climbs:
-            climb["difficulty_score"] = climb["elevation_gain_m"] * (
-                1 + climb["avg_gradient"] / 10.0
-            )
-
-        # Sort by difficulty score (descending)
-        climbs.sort(key=lambda c: c["difficulty_score"], reverse=True)
-
-        # Return top 3 climbs (remove difficulty_score from output)
-        top_climbs = climbs[:3]
-        for climb in top_climbs:
-            climb.pop("difficulty_score", None)
-
-        return top_climbs
+        distance_km, ele, _ = _columns(trackpoints)
+        return _top_climbs(distance_km, ele)
 
     async def classify_gradients(
         self, trackpoints: list[dict[str, Any]]
@@ -333,64 +195,227 @@ class RouteStatsService:
             return self._empty_gradient_distribution()
 
         # Check if elevation data is available
-        if "elevation" not in trackpoints[0] or trackpoints[0]["elevation"] is None:
+        if "elevation" not in trackpoints[0]:
             return self._empty_gradient_distribution()
 
-        # Initialize category distances
-        category_distances = {
-            "llano": 0.0,  # 0-3%
-            "moderado": 0.0,  # 3-6%
-            "empinado": 0.0,  # 6-10%
-            "muy_empinado": 0.0,  # >10%
-        }
+        distance_km, ele, _ = _columns(trackpoints)
+        return _gradient_distribution(distance_km, ele)
 
-        total_distance_km = trackpoints[-1]["distance_km"]
+    def _empty_gradient_distribution(self) -> dict[str, dict[str, float]]:
+        """Return empty gradient distribution (all zeros)."""
+        return _empty_gradient_distribution()
 
-        # Classify each segment
-        for i in range(len(trackpoints) - 1):
-            p1 = trackpoints[i]
-            p2 = trackpoints[i + 1]
 
-            # Skip if elevation missing
-            if p1["elevation"] is None or p2["elevation"] is None:
-                continue
+def track_statistics(track: TrackArrays, distance_km: np.ndarray | None = None) -> dict[str, Any]:
+    """
+    Synchronous core of RouteStatsService.calculate_track_statistics.
 
-            # Calculate segment gradient
-            elevation_change = p2["elevation"] - p1["elevation"]
-            distance_km = p2["distance_km"] - p1["distance_km"]
+    Needs no database session, so it can run in a worker process.
+    """
+    if distance_km is None:
+        distance_km = np.round(cumulative_distance_km(track), 3)
 
-            if distance_km <= 0:
-                continue
+    return {
+        "speed_metrics": _speed_metrics(distance_km, track.time),
+        "top_climbs": _top_climbs(distance_km, track.ele),
+        "gradient_distribution": _gradient_distribution(distance_km, track.ele),
+    }
 
-            # Calculate gradient as percentage
-            gradient = abs((elevation_change / (distance_km * 1000)) * 100)
 
-            # Classify segment
-            if gradient <= 3.0:
-                category_distances["llano"] += distance_km
-            elif gradient <= 6.0:
-                category_distances["moderado"] += distance_km
-            elif gradient <= 10.0:
-                category_distances["empinado"] += distance_km
-            else:
-                category_distances["muy_empinado"] += distance_km
+def gradient_distribution_from_columns(
+    distance_km: np.ndarray, ele: np.ndarray
+) -> dict[str, dict[str, float]]:
+    """
+    Synchronous core of RouteStatsService.classify_gradients on columnar data.
 
-        # Calculate percentages
-        result = {}
-        for category, distance_km in category_distances.items():
-            percentage = (distance_km / total_distance_km) * 100 if total_distance_km > 0 else 0.0
-            result[category] = {
-                "distance_km": distance_km,
-                "percentage": percentage,
-            }
+    Args:
+        distance_km: Cumulative distance per point
+        ele: Elevation per point (NaN where missing)
+    """
+    return _gradient_distribution(distance_km, ele)
 
-        return result
 
-    def _empty_gradient_distribution(self) -> dict[str, dict[str, float]]:
-        """Return empty gradient distribution (all zeros)."""
+def _columns(trackpoints: list[dict[str, Any]]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert trackpoint dicts to (distance_km, elevation, time) arrays."""
+    distance_km = np.array([p["distance_km"] for p in trackpoints], dtype=np.float64)
+    ele = np.array(
+        [np.nan if p.get("elevation") is None else p["elevation"] for p in trackpoints],
+        dtype=np.float64,
+    )
+    time = np.array([datetime_to_micros(p.get("timestamp")) for p in trackpoints], dtype=np.int64)
+    return distance_km, ele, time
+
+
+def _speed_metrics(distance_km: np.ndarray, time: np.ndarray) -> dict[str, float | None]:
+    """
+    Speed and time metrics from cumulative distance and epoch-microsecond timestamps.
+
+    Uses a gpxpy-compatible stop detection: every segment slower than
+    STOP_SPEED_THRESHOLD_KMH is stopped time, regardless of its duration.
+    Segments with a missing timestamp at either end are ignored.
+    """
+    timed = np.flatnonzero(time != MISSING_TIME)
+    if not timed.shape[0]:
         return {
-            "llano": {"distance_km": 0.0, "percentage": 0.0},
-            "moderado": {"distance_km": 0.0, "percentage": 0.0},
-            "empinado": {"distance_km": 0.0, "percentage": 0.0},
-            "muy_empinado": {"distance_km": 0.0, "percentage": 0.0},
+            "avg_speed_kmh": None,
+            "max_speed_kmh": None,
+            "total_time_minutes": None,
+            "moving_time_minutes": None,
         }
+
+    # Calculate total time
+    total_time_minutes = (int(time[timed[-1]]) - int(time[timed[0]])) / 1_000_000 / 60.0
+
+    # Per-segment time, distance and instantaneous speed
+    valid = (time[:-1] != MISSING_TIME) & (time[1:] != MISSING_TIME)
+    segment_time_seconds = (time[1:] - time[:-1])[valid] / 1_000_000
+    segment_time_minutes = segment_time_seconds / 60.0
+    segment_distance_km = np.diff(distance_km)[valid]
+
+    segment_speed_kmh = np.zeros_like(segment_time_minutes)
+    positive = segment_time_minutes > 0
+    segment_speed_kmh[positive] = (
+        segment_distance_km[positive] / segment_time_minutes[positive]
+    ) * 60.0
+
+    # Filter outliers: ignore unrealistic speeds and very short segments
+    # (likely caused by GPS errors or signal jumps)
+    valid_speeds = segment_speed_kmh[
+        positive
+        & (segment_speed_kmh <= MAX_REALISTIC_SPEED_KMH)
+        & (segment_time_seconds >= MIN_SEGMENT_TIME_SECONDS)
+    ]
+    max_speed_kmh = max(0.0, float(valid_speeds.max())) if valid_speeds.shape[0] else 0.0
+
+    # Moving time; summed left to right to match a running total exactly
+    moving = segment_speed_kmh >= STOP_SPEED_THRESHOLD_KMH
+    moving_time_minutes = sum(segment_time_minutes[moving].tolist(), 0.0)
+
+    # Calculate average speed (based on total distance and moving time)
+    avg_speed_kmh = None
+    if moving_time_minutes > 0:
+        avg_speed_kmh = (float(distance_km[-1]) / moving_time_minutes) * 60.0
+
+    return {
+        "avg_speed_kmh": avg_speed_kmh,
+        "max_speed_kmh": max_speed_kmh if max_speed_kmh > 0 else None,
+        "total_time_minutes": total_time_minutes,
+        "moving_time_minutes": moving_time_minutes,
+    }
+
+
+def _top_climbs(distance_km: np.ndarray, ele: np.ndarray) -> list[dict[str, Any]]:
+    """
+    Top 3 climbs by difficulty (see RouteStatsService.detect_climbs).
+
+    Points without elevation (NaN) are skipped. Climb segmentation is
+    inherently sequential, so it runs over plain Python floats.
+    """
+    if distance_km.shape[0] < 2 or np.isnan(ele[0]):
+        return []
+
+    distances = distance_km.tolist()
+    elevations = ele.tolist()
+    climbs: list[dict[str, Any]] = []
+
+    def save_climb(start_idx: int, max_idx: int) -> None:
+        """Record the climb from start to max elevation point if it qualifies."""
+        if max_idx <= start_idx:
+            return
+        climb_gain = elevations[max_idx] - elevations[start_idx]
+        if climb_gain < MIN_CLIMB_GAIN_M:
+            return
+        start_km = distances[start_idx]
+        end_km = distances[max_idx]
+        climb_distance_km = end_km - start_km
+        if climb_distance_km > 0:
+            climbs.append(
+                {
+                    "start_km": start_km,
+                    "end_km": end_km,
+                    "elevation_gain_m": climb_gain,
+                    "avg_gradient": (climb_gain / (climb_distance_km * 1000)) * 100,
+                }
+            )
+
+    climb_start_idx = None
+    climb_max_idx = 0  # Index where maximum elevation was reached
+    flat_count = 0  # Count consecutive flat/descending points
+
+    for i, current_elevation in enumerate(elevations):
+        if current_elevation != current_elevation:  # Missing elevation (NaN)
+            continue
+
+        # Start a new climb if not already climbing
+        if climb_start_idx is None:
+            climb_start_idx = climb_max_idx = i
+            flat_count = 0
+            continue
+
+        # Check elevation change from previous maximum
+        if current_elevation > elevations[climb_max_idx]:
+            # Still climbing - update maximum and reset flat counter
+            climb_max_idx = i
+            flat_count = 0
+        else:
+            # Not climbing (flat or descending)
+            flat_count += 1
+
+        # Climb ends on a significant descent from the maximum elevation
+        # or a prolonged flat/descending section
+        descent_from_max = elevations[climb_max_idx] - current_elevation
+        if descent_from_max > DESCENT_THRESHOLD_M or flat_count >= FLAT_SECTION_COUNT:
+            save_climb(climb_start_idx, climb_max_idx)
+
+            # Start new climb at current point
+            climb_start_idx = climb_max_idx = i
+            flat_count = 0
+
+    # Save final climb if exists
+    if climb_start_idx is not None:
+        save_climb(climb_start_idx, climb_max_idx)
+
+    # Score and rank climbs by difficulty
+    # Score = elevation_gain * (1 + avg_gradient/10)
+    # This balances long climbs (high gain) with steep climbs (high gradient)
+    climbs.sort(key=lambda c: c["elevation_gain_m"] * (1 + c["avg_gradient"] / 10.0), reverse=True)
+
+    # Return top 3 climbs
+    return climbs[:3]
+
+
+def _gradient_distribution(distance_km: np.ndarray, ele: np.ndarray) -> dict[str, dict[str, float]]:
+    """Distance per gradient category (see RouteStatsService.classify_gradients)."""
+    if distance_km.shape[0] < 2 or np.isnan(ele[0]):
+        return _empty_gradient_distribution()
+
+    total_distance_km = float(distance_km[-1])
+
+    # Segment gradients, skipping missing elevations and non-advancing segments
+    segment_km = np.diff(distance_km)
+    elevation_change = np.diff(ele)
+    valid = ~np.isnan(elevation_change) & (segment_km > 0)
+    segment_km = segment_km[valid]
+    gradient = np.abs((elevation_change[valid] / (segment_km * 1000)) * 100)
+
+    result = {}
+    lower = -np.inf
+    for category, upper in GRADIENT_CATEGORIES:
+        in_category = (gradient > lower) & (gradient <= upper)
+        # Summed left to right to match a running total exactly
+        category_km = sum(segment_km[in_category].tolist(), 0.0)
+        percentage = (category_km / total_distance_km) * 100 if total_distance_km > 0 else 0.0
+        result[category] = {
+            "distance_km": category_km,
+            "percentage": percentage,
+        }
+        lower = upper
+
+    return result
+
+
+def _empty_gradient_distribution() -> dict[str, dict[str, float]]:
+    """Return empty gradient distribution (all zeros)."""
+    return {
+        category: {"distance_km": 0.0, "percentage": 0.0} for category, _ in GRADIENT_CATEGORIES
+    }
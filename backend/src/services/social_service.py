@@ -6,6 +6,7 @@ Business logic for social features including:
 - Followers and following lists
 - Follow status checking
 - Counter management
+- Home timeline upkeep on follow/unfollow
 """
 
 import logging
@@ -24,6 +25,7 @@ from src.schemas.social import (
     FollowStatusResponse,
     UserSummary,
 )
+from src.services.timeline_service import TimelineService
 
 logger = logging.getLogger(__name__)
 
@@ -102,6 +104,9 @@ class SocialService:
         follower_profile.following_count += 1
         following_profile.followers_count += 1
 
+        # Deliver the followed user's trips to the follower's home timeline
+        await TimelineService.add_follow(self.db, follower_user.id, following_user.id)
+
         await self.db.commit()
 
         logger.info(f"User {follower_username} followed {following_username}")
@@ -165,8 +170,14 @@ class SocialService:
         follower_profile.following_count = max(0, follower_profile.following_count - 1)
         following_profile.followers_count = max(0, following_profile.followers_count - 1)
 
+        await TimelineService.remove_follow(self.db, follower_user.id, following_user.id)
+
         await self.db.commit()
 
+        await TimelineService.restore_author_fan_out(
+            self.db, following_user.id, following_profile.followers_count
+        )
+
         logger.info(f"User {follower_username} unfollowed {following_username}")
 
         return FollowResponse(
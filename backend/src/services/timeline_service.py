@@ -0,0 +1,265 @@
+"""
+Timeline Service - Home timeline fan-out on write (Feature 004).
+
+Delivers published trips to the home timelines (home_timelines table) of the
+author's followers, so FeedService reads followed users' trips as one indexed
+range query per page instead of querying trips IN (every followed user).
+
+Authors with more than settings.home_timeline_fanout_max_followers followers
+are not fanned out: FeedService pulls their trips at read time and ignores
+their timeline entries, so an author crossing the threshold is never shown
+twice. When an author drops back to the threshold their trips are delivered
+to every follower (SocialService.unfollow_user).
+
+Only active with settings.home_timeline_enabled. Timelines are not written
+while disabled, so run scripts/dev-tools/rebuild_home_timelines.py before
+enabling it.
+"""
+
+import logging
+from typing import cast
+
+from sqlalchemy import CursorResult, delete, exists, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.models.social import Follow
+from src.models.timeline import TimelineEntry
+from src.models.trip import Trip, TripStatus
+from src.models.user import UserProfile
+
+logger = logging.getLogger(__name__)
+
+
+class TimelineService:
+    """Service for home timeline fan-out operations."""
+
+    @staticmethod
+    async def is_fanned_out(db: AsyncSession, author_id: str) -> bool:
+        """
+        Check whether an author's trips are delivered to timelines (push) or read on demand (pull).
+
+        Args:
+            db: Database session
+            author_id: Trip author user ID
+
+        Returns:
+            True if the author has at most home_timeline_fanout_max_followers followers
+        """
+        followers_count = (
+            await db.execute(
+                select(UserProfile.followers_count).where(UserProfile.user_id == author_id)
+            )
+        ).scalar() or 0
+        return followers_count <= settings.home_timeline_fanout_max_followers
+
+    @staticmethod
+    async def fan_out_trip(db: AsyncSession, trip: Trip) -> int:
+        """
+        Deliver a newly published trip to the timelines of its author's followers.
+
+        Commits once per batch of home_timeline_fanout_batch_size followers.
+        No-op when the timeline is disabled or the author is above the fan-out
+        threshold.
+
+        Args:
+            db: Database session
+            trip: Published trip
+
+        Returns:
+            Number of timeline entries written
+        """
+        if not settings.home_timeline_enabled:
+            return 0
+        if not await TimelineService.is_fanned_out(db, trip.user_id):
+            logger.info(f"Trip {trip.trip_id} not fanned out (author above threshold, pulled)")
+            return 0
+
+        delivered = await TimelineService._fan_out(db, trip.user_id, Trip.trip_id == trip.trip_id)
+        logger.info(f"Fanned out trip {trip.trip_id} to {delivered} timelines")
+        return delivered
+
+    @staticmethod
+    async def add_follow(db: AsyncSession, follower_id: str, author_id: str) -> int:
+        """
+        Deliver an author's published trips to a new follower's timeline.
+
+        Does not commit (runs in the follow transaction).
+
+        Args:
+            db: Database session
+            follower_id: User who started following
+            author_id: Followed user
+
+        Returns:
+            Number of timeline entries written
+        """
+        if not settings.home_timeline_enabled:
+            return 0
+        if not await TimelineService.is_fanned_out(db, author_id):
+            return 0
+
+        return await TimelineService._deliver(
+            db, Follow.follower_id == follower_id, Follow.following_id == author_id
+        )
+
+    @staticmethod
+    async def remove_follow(db: AsyncSession, follower_id: str, author_id: str) -> None:
+        """
+        Remove an author's trips from a former follower's timeline.
+
+        Runs even while the timeline is disabled so no stale entries survive
+        until it is enabled again. Does not commit (runs in the unfollow
+        transaction).
+
+        Args:
+            db: Database session
+            follower_id: User who stopped following
+            author_id: Unfollowed user
+        """
+        await db.execute(
+            delete(TimelineEntry).where(
+                TimelineEntry.user_id == follower_id, TimelineEntry.author_id == author_id
+            )
+        )
+
+    @staticmethod
+    async def restore_author_fan_out(db: AsyncSession, author_id: str, followers_count: int) -> int:
+        """
+        Deliver all trips of an author that just dropped back to the fan-out threshold.
+
+        Their trips were pulled at read time until now, so those published
+        meanwhile are missing from their followers' timelines.
+
+        Args:
+            db: Database session
+            author_id: Author who lost a follower
+            followers_count: Author's followers count after the unfollow
+
+        Returns:
+            Number of timeline entries written
+        """
+        if not settings.home_timeline_enabled:
+            return 0
+        if followers_count != settings.home_timeline_fanout_max_followers:
+            return 0
+
+        delivered = await TimelineService._fan_out(db, author_id)
+        logger.info(f"Author {author_id} back under fan-out threshold: {delivered} entries")
+        return delivered
+
+    @staticmethod
+    async def rebuild_timelines(db: AsyncSession) -> int:
+        """
+        Rebuild every home timeline from follows and published trips.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of timeline entries written
+        """
+        await db.execute(delete(TimelineEntry))
+        await db.commit()
+
+        authors = (
+            await db.execute(
+                select(Trip.user_id)
+                .outerjoin(UserProfile, UserProfile.user_id == Trip.user_id)
+                .where(
+                    Trip.status == TripStatus.PUBLISHED,
+                    func.coalesce(UserProfile.followers_count, 0)
+                    <= settings.home_timeline_fanout_max_followers,
+                )
+                .distinct()
+            )
+        ).scalars()
+
+        delivered = 0
+        for author_id in authors.all():
+            delivered += await TimelineService._fan_out(db, author_id)
+
+        logger.info(f"Rebuilt home timelines: {delivered} entries")
+        return delivered
+
+    @staticmethod
+    async def _fan_out(db: AsyncSession, author_id: str, *trip_conditions) -> int:
+        """
+        Deliver an author's trips to all of their followers, one batch of followers at a time.
+
+        Args:
+            db: Database session
+            author_id: Trip author user ID
+            trip_conditions: Extra filters on the author's trips (default: all published)
+
+        Returns:
+            Number of timeline entries written
+        """
+        delivered = 0
+        last_follower_id = ""
+        while True:
+            # Keyset over the author's followers (ix_follows_following_id)
+            follower_ids = (
+                (
+                    await db.execute(
+                        select(Follow.follower_id)
+                        .where(
+                            Follow.following_id == author_id,
+                            Follow.follower_id > last_follower_id,
+                        )
+                        .order_by(Follow.follower_id)
+                        .limit(settings.home_timeline_fanout_batch_size)
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            if not follower_ids:
+                return delivered
+
+            delivered += await TimelineService._deliver(
+                db,
+                Follow.following_id == author_id,
+                Follow.follower_id.in_(follower_ids),
+                *trip_conditions,
+            )
+            await db.commit()
+            last_follower_id = follower_ids[-1]
+
+    @staticmethod
+    async def _deliver(db: AsyncSession, *conditions) -> int:
+        """
+        Insert timeline entries for the (follower, published trip) pairs matching conditions.
+
+        One INSERT ... SELECT over follows joined to the followed users' trips;
+        pairs already in a timeline are skipped.
+
+        Args:
+            db: Database session
+            conditions: Filters on Follow and Trip
+
+        Returns:
+            Number of timeline entries written
+        """
+        pairs = (
+            select(
+                Follow.follower_id,
+                Trip.trip_id,
+                Trip.user_id,
+                func.coalesce(Trip.published_at, Trip.created_at),
+            )
+            .join(Trip, Trip.user_id == Follow.following_id)
+            .where(
+                Trip.status == TripStatus.PUBLISHED,
+                *conditions,
+                ~exists().where(
+                    TimelineEntry.user_id == Follow.follower_id,
+                    TimelineEntry.trip_id == Trip.trip_id,
+                ),
+            )
+        )
+        backfill = insert(TimelineEntry).from_select(
+            ["user_id", "trip_id", "author_id", "published_at"], pairs
+        )
+        result = cast(CursorResult, await db.execute(backfill))
+        return result.rowcount
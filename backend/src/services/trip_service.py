@@ -5,22 +5,28 @@ Business logic for trip creation, publication, and management.
 Functional Requirements: FR-001, FR-002, FR-003, FR-007, FR-008, FR-009, FR-010, FR-011, FR-012, FR-013
 """
 
+import asyncio
 import logging
 import uuid
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import BinaryIO
+from typing import BinaryIO, cast
 
-from PIL import Image
-from sqlalchemy import case, delete, func, select
+from sqlalchemy import CursorResult, case, delete, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from src.config import settings
+from src.models.cache_invalidation import invalidate_on_commit
 from src.models.trip import Tag, Trip, TripDifficulty, TripLocation, TripPhoto, TripStatus, TripTag
+from src.models.trip_ranking import refresh_trip_rankings
 from src.models.user import User
 from src.schemas.trip import LocationInput, TripCreateRequest
 from src.services.stats_service import StatsService
+from src.services.timeline_service import TimelineService
 from src.utils.html_sanitizer import sanitize_html
+from src.utils.photo_variant_cache import get_photo_variant_cache
+from src.utils.trip_photo_service import trip_photo_service
 
 logger = logging.getLogger(__name__)
 
@@ -187,11 +193,8 @@ class TripService:
         # Calculate like_count and is_liked (Feature 004 - US2)
         from src.models.like import Like
 
-        # Count likes for this trip
-        like_count_result = await self.db.execute(
-            select(func.count(Like.id)).where(Like.trip_id == trip_id)
-        )
-        like_count = like_count_result.scalar() or 0
+        # Like count from the denormalized counter
+        like_count = trip.likes_count
 
         # Check if current user has liked this trip
         is_liked = None
@@ -232,7 +235,8 @@ class TripService:
         - Description >= 50 characters
         - Start date present
 
-        Updates user statistics on first publication.
+        Updates user statistics and fans the trip out to followers' home
+        timelines on first publication.
 
         Args:
             trip_id: Trip identifier
@@ -304,6 +308,9 @@ class TripService:
                 trip_date=trip_date,
             )
 
+            # Deliver to followers' home timelines (no-op unless enabled)
+            await TimelineService.fan_out_trip(self.db, trip)
+
             logger.info(f"Published trip {trip_id} and updated user stats")
         else:
             logger.info(f"Trip {trip_id} already published (idempotent)")
@@ -466,50 +473,27 @@ class TripService:
         if content_type not in allowed_types:
             raise ValueError("Formato de archivo no soportado. Usa JPG, PNG o WebP")
 
-        # Read image and validate
-        try:
-            img = Image.open(photo_file)
-            img.verify()  # Verify it's actually an image
-            photo_file.seek(0)  # Reset file pointer after verify
-            img = Image.open(photo_file)  # Re-open after verify
-        except Exception:
-            raise ValueError("El archivo no es una imagen válida")
-
-        # Convert RGBA to RGB if needed (for JPEG)
-        if img.mode == "RGBA":
-            rgb_img = Image.new("RGB", img.size, (255, 255, 255))
-            rgb_img.paste(img, mask=img.split()[3])  # Use alpha channel as mask
-            img = rgb_img
-
         # Generate unique filename
         file_uuid = str(uuid.uuid4())
         ext = "jpg"  # Always save as JPEG for consistency
 
-        # Create storage directory: storage/trip_photos/{year}/{month}/{trip_id}/
+        # Storage directory: storage/trip_photos/{year}/{month}/{trip_id}/
         now = datetime.now(UTC)
         year = now.strftime("%Y")
         month = now.strftime("%m")
         storage_dir = Path("storage/trip_photos") / year / month / trip_id
-        storage_dir.mkdir(parents=True, exist_ok=True)
-
-        # Resize and save optimized version (max 1200px width)
-        optimized_img = img.copy()
-        if optimized_img.width > 1200:
-            ratio = 1200 / optimized_img.width
-            new_height = int(optimized_img.height * ratio)
-            optimized_img = optimized_img.resize((1200, new_height), Image.Resampling.LANCZOS)
-
-        optimized_path = storage_dir / f"{file_uuid}_optimized.{ext}"
-        optimized_img.save(optimized_path, format="JPEG", quality=85, optimize=True)
-
-        # Create thumbnail (400x400px)
-        thumb_img = img.copy()
-        thumb_img.thumbnail((400, 400), Image.Resampling.LANCZOS)
-        thumb_path = storage_dir / f"{file_uuid}_thumb.{ext}"
-        thumb_img.save(thumb_path, format="JPEG", quality=80, optimize=True)
-
-        # Get file size from optimized version
-        file_size = optimized_path.stat().st_size
+        url_prefix = f"/storage/trip_photos/{year}/{month}/{trip_id}"
+
+        # Decode, resize and encode in the shared image pool, then write off the event loop.
+        # Otherwise variants are rendered on first request (get_photo_variant).
+        processed = await trip_photo_service.process_photo_async(
+            await asyncio.to_thread(photo_file.read),
+            filename,
+            with_variants=settings.photo_variants_on_upload,
+        )
+        variants = await asyncio.to_thread(
+            trip_photo_service.write_photo, processed, storage_dir, file_uuid, url_prefix
+        )
 
         # Calculate next order value (last photo's order + 1)
         # Use a query to get the current max order (avoid cached relationship issues)
@@ -522,12 +506,13 @@ class TripService:
         # Create database record
         photo = TripPhoto(
             trip_id=trip_id,
-            photo_url=f"/storage/trip_photos/{year}/{month}/{trip_id}/{file_uuid}_optimized.{ext}",
-            thumb_url=f"/storage/trip_photos/{year}/{month}/{trip_id}/{file_uuid}_thumb.{ext}",
+            photo_url=f"{url_prefix}/{file_uuid}_optimized.{ext}",
+            thumb_url=f"{url_prefix}/{file_uuid}_thumb.{ext}",
             order=next_order,
-            file_size=file_size,
-            width=optimized_img.width,
-            height=optimized_img.height,
+            file_size=len(processed.optimized_bytes),
+            width=processed.optimized_width,
+            height=processed.optimized_height,
+            variants=variants,
         )
 
         self.db.add(photo)
@@ -583,16 +568,14 @@ class TripService:
         if photo.trip_id != trip_id:
             raise ValueError("La foto no pertenece a este viaje")
 
-        # Delete physical files
+        # Delete physical files (optimized, thumbnail and variants)
         try:
-            # Convert URL to filesystem path
-            photo_path = Path(photo.photo_url.lstrip("/"))
-            thumb_path = Path(photo.thumb_url.lstrip("/"))
-
-            if photo_path.exists():
-                photo_path.unlink()
-            if thumb_path.exists():
-                thumb_path.unlink()
+            for url in photo.file_urls:
+                # Convert URL to filesystem path
+                file_path = Path(url.lstrip("/"))
+                if file_path.exists():
+                    file_path.unlink()
+            get_photo_variant_cache().discard(photo_id)
 
             logger.info(f"Deleted photo files for {photo_id}")
         except Exception as e:
@@ -629,6 +612,44 @@ class TripService:
         )
         return {"message": "Foto eliminada correctamente"}
 
+    async def get_photo_variant(self, trip_id: str, photo_id: str, width: int, fmt: str) -> Path:
+        """
+        Get a resized variant of a trip photo, rendering it on first request.
+
+        Variants are rendered from the stored optimized photo (the largest
+        version kept) and cached on disk (see src/utils/photo_variant_cache.py).
+
+        Args:
+            trip_id: Trip identifier
+            photo_id: Photo identifier
+            width: Width from settings.photo_variant_widths
+            fmt: Format from settings.photo_variant_formats
+
+        Returns:
+            Path of the variant file
+
+        Raises:
+            ValueError: If photo not found
+            ImageExecutorBusyError: If the image pool is saturated
+        """
+        result = await self.db.execute(
+            select(TripPhoto.photo_url).where(
+                TripPhoto.photo_id == photo_id, TripPhoto.trip_id == trip_id
+            )
+        )
+        photo_url = result.scalar_one_or_none()
+
+        if photo_url is None:
+            raise ValueError("Foto no encontrada")
+
+        try:
+            return await get_photo_variant_cache().get(
+                photo_id, Path(photo_url.lstrip("/")), width, fmt
+            )
+        except FileNotFoundError:
+            logger.warning(f"Stored file missing for photo {photo_id}: {photo_url}")
+            raise ValueError("Foto no encontrada")
+
     async def reorder_photos(self, trip_id: str, user_id: str, photo_order: list[str]) -> dict:
         """
         Reorder photos in trip gallery.
@@ -755,6 +776,7 @@ class TripService:
         if "tags" in update_data:
             # Remove old tag associations
             await self.db.execute(delete(TripTag).where(TripTag.trip_id == trip_id))
+            invalidate_on_commit(self.db, "tags")
             # Process new tags
             await self._process_tags(trip, update_data["tags"])
 
@@ -839,13 +861,11 @@ class TripService:
         # Delete physical photo files
         for photo in trip.photos:
             try:
-                photo_path = Path(photo.photo_url.lstrip("/"))
-                thumb_path = Path(photo.thumb_url.lstrip("/"))
-
-                if photo_path.exists():
-                    photo_path.unlink()
-                if thumb_path.exists():
-                    thumb_path.unlink()
+                for url in photo.file_urls:
+                    file_path = Path(url.lstrip("/"))
+                    if file_path.exists():
+                        file_path.unlink()
+                get_photo_variant_cache().discard(photo.photo_id)
 
                 logger.debug(f"Deleted photo files for {photo.photo_id}")
             except Exception as e:
@@ -1135,6 +1155,121 @@ class TripService:
 
         return list(trips), total
 
+    async def get_trip_interactions(
+        self, trips: list[Trip], viewer_id: str | None = None
+    ) -> dict[str, dict]:
+        """
+        Resolve like counts and viewer flags for a page of trips (Feature 004).
+
+        Like counts come from the denormalized Trip.likes_count; viewer flags take
+        one IN (...) query each instead of one liked check and one follow check
+        per trip.
+
+        Args:
+            trips: Trips on the page (authors must be loaded or user_id set)
+            viewer_id: Current user ID (None if not authenticated)
+
+        Returns:
+            Dict keyed by trip_id with:
+            - like_count: Number of likes (Trip.likes_count)
+            - is_liked: Whether the viewer liked the trip (None if not authenticated)
+            - is_following: Whether the viewer follows the author (None if not authenticated)
+
+        Examples:
+            interactions = await service.get_trip_interactions(trips, current_user.id)
+            # Returns: {"550e8400-...": {"like_count": 12, "is_liked": True, "is_following": False}}
+        """
+        from src.models.like import Like
+        from src.models.social import Follow
+
+        if not trips:
+            return {}
+
+        trip_ids = [trip.trip_id for trip in trips]
+
+        liked_trip_ids: set[str] = set()
+        followed_user_ids: set[str] = set()
+        if viewer_id:
+            result = await self.db.execute(
+                select(Like.trip_id).where(Like.user_id == viewer_id, Like.trip_id.in_(trip_ids))
+            )
+            liked_trip_ids = set(result.scalars().all())
+
+            author_ids = {trip.user_id for trip in trips}
+            result = await self.db.execute(
+                select(Follow.following_id).where(
+                    Follow.follower_id == viewer_id, Follow.following_id.in_(author_ids)
+                )
+            )
+            followed_user_ids = set(result.scalars().all())
+
+        return {
+            trip.trip_id: {
+                "like_count": trip.likes_count,
+                "is_liked": trip.trip_id in liked_trip_ids if viewer_id else None,
+                "is_following": trip.user_id in followed_user_ids if viewer_id else None,
+            }
+            for trip in trips
+        }
+
+    async def reconcile_interaction_counters(self, trip_ids: list[str] | None = None) -> int:
+        """
+        Recompute Trip interaction counters from the likes, comments and shares tables.
+
+        Counters are maintained on write (src/models/interaction_counters.py);
+        this repairs drift from writes that bypass the ORM (bulk deletes,
+        database cascades, manual SQL). Runs as one UPDATE with correlated
+        counts and only touches trips whose counters are wrong, then refreshes
+        the community ranking (src/models/trip_ranking.py) of the same trips.
+
+        Args:
+            trip_ids: Trips to reconcile (None = all trips)
+
+        Returns:
+            Number of trips whose counters were corrected
+
+        Examples:
+            fixed = await service.reconcile_interaction_counters()
+            # Returns: 3
+        """
+        from src.models.comment import Comment
+        from src.models.like import Like
+        from src.models.share import Share
+
+        counts = {
+            "likes_count": select(func.count(Like.id))
+            .where(Like.trip_id == Trip.trip_id)
+            .scalar_subquery(),
+            "comments_count": select(func.count(Comment.id))
+            .where(Comment.trip_id == Trip.trip_id)
+            .scalar_subquery(),
+            "shares_count": select(func.count(Share.id))
+            .where(Share.trip_id == Trip.trip_id)
+            .scalar_subquery(),
+        }
+
+        stmt = (
+            update(Trip)
+            .where(or_(*(getattr(Trip, counter) != count for counter, count in counts.items())))
+            # Keep updated_at: reconciling counters is not an edit of the trip
+            .values({**counts, "updated_at": Trip.updated_at})
+            .execution_options(synchronize_session=False)
+        )
+        if trip_ids is not None:
+            stmt = stmt.where(Trip.trip_id.in_(trip_ids))
+
+        result = cast(CursorResult, await self.db.execute(stmt))
+        # Rankings are derived from the counters; also rebuilds any missing row
+        await self.db.run_sync(
+            lambda session: refresh_trip_rankings(session.connection(), trip_ids)
+        )
+        invalidate_on_commit(self.db, "trips")
+        await self.db.commit()
+
+        logger.info(f"Reconciled interaction counters of {result.rowcount} trips")
+
+        return result.rowcount
+
     async def count_public_trips(self) -> int:
         """
         T020: Count published trips with public visibility (Feature 013).
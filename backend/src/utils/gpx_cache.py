@@ -0,0 +1,244 @@
+"""
+Content-addressed cache for GPX analysis results.
+
+Results are keyed by the SHA-256 of the GPX bytes plus the analysis kind,
+parameters (e.g. RDP epsilon) and a hash of the analysis code, so the same
+file uploaded twice (wizard preview then publish) or by different users is
+only parsed once, and results of older code are never served.
+
+Two tiers:
+- Memory: LRU with TTL, bounded by entry count and by total pickled size
+  (route results carry the full track, so a count alone does not bound
+  memory). Entries are stored pickled, so every hit returns a fresh copy
+  that callers may mutate freely.
+- Disk (optional): one pickle per key under storage/, shared between workers
+  and surviving restarts. Expired files are dropped when read.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from src.config import settings
+from src.utils.gpx_reader import CHUNK_SIZE, GPXSource
+
+logger = logging.getLogger(__name__)
+
+# Modules producing the cached results (relative to src/). CACHE_VERSION is a
+# hash of their code, so any change to the analysis output gets new keys and
+# stale disk entries are never read. Add a module here when analyze_gpx starts
+# depending on it.
+ANALYSIS_SOURCES = (
+    "services/gpx_service.py",
+    "services/route_stats_service.py",
+    "utils/gpx_reader.py",
+    "utils/track_engine.py",
+)
+
+
+def _analysis_code_version() -> str:
+    """Short SHA-256 of the ANALYSIS_SOURCES files."""
+    src_dir = Path(__file__).resolve().parent.parent
+    digest = hashlib.sha256()
+    for relative_path in ANALYSIS_SOURCES:
+        digest.update((src_dir / relative_path).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+CACHE_VERSION = _analysis_code_version()
+
+
+def gpx_digest(source: GPXSource) -> str:
+    """SHA-256 hex digest of GPX bytes, or of a GPX file streamed from disk."""
+    if isinstance(source, bytes | bytearray | memoryview):
+        return hashlib.sha256(source).hexdigest()
+
+    digest = hashlib.sha256()
+    with open(source, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class GPXAnalysisCache:
+    """
+    Two-tier (memory LRU + optional disk) cache of GPX analysis results.
+
+    Usage:
+        key = cache.make_key(gpx_digest(gpx_bytes), "analysis", epsilon=0.0001)
+        result = cache.get(key)
+        if result is None:
+            result = analyze(gpx_bytes)
+            cache.set(key, result)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl_seconds: int = 3600,
+        disk_path: str | Path | None = None,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum entries kept in memory (least recently used evicted)
+            max_bytes: Maximum total pickled size kept in memory; larger results
+                are only stored on disk
+            ttl_seconds: Lifetime of an entry in both tiers
+            disk_path: Directory for the on-disk tier (None disables it)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.disk_path = Path(disk_path) if disk_path else None
+
+        # key -> (expires_at monotonic, pickled result)
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(digest: str, kind: str, **params: Any) -> str:
+        """
+        Build a cache key from the GPX content digest and analysis parameters.
+
+        Args:
+            digest: gpx_digest() of the GPX file
+            kind: Analysis name (e.g. "analysis", "route")
+            **params: Parameters affecting the result (e.g. epsilon=0.0001)
+
+        Returns:
+            Hex key safe to use as a filename
+        """
+        param_str = ",".join(f"{name}={params[name]!r}" for name in sorted(params))
+        raw_key = f"v{CACHE_VERSION}:{kind}:{param_str}:{digest}"
+        return hashlib.sha256(raw_key.encode()).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        """Return a fresh copy of the cached result, or None on miss."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, payload = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return pickle.loads(payload)
+            self._drop_memory(key)
+
+        payload = self._read_disk(key)
+        if payload is not None:
+            self._store_memory(key, payload)
+            self.hits += 1
+            return pickle.loads(payload)
+
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a result in memory and, if enabled, on disk."""
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self._store_memory(key, payload)
+        self._write_disk(key, payload)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries and reset counters (disk files are kept)."""
+        self._entries.clear()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters and current memory size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "bytes": self._total_bytes,
+        }
+
+    def _store_memory(self, key: str, payload: bytes) -> None:
+        self._drop_memory(key)
+        if len(payload) > self.max_bytes:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, payload)
+        self._total_bytes += len(payload)
+        while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._total_bytes -= len(evicted)
+
+    def _drop_memory(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= len(entry[1])
+
+    def _disk_file(self, key: str) -> Path | None:
+        if self.disk_path is None:
+            return None
+        # Two-level fan-out keeps directories small
+        return self.disk_path / key[:2] / f"{key}.pkl"
+
+    def _read_disk(self, key: str) -> bytes | None:
+        path = self._disk_file(key)
+        if path is None:
+            return None
+
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Error reading GPX cache entry {key}: {e}")
+            return None
+
+    def _write_disk(self, key: str, payload: bytes) -> None:
+        path = self._disk_file(key)
+        if path is None:
+            return
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename so readers never see partial files
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_name, path)
+        except OSError as e:
+            logger.warning(f"Error writing GPX cache entry {key}: {e}")
+
+
+_cache: GPXAnalysisCache | None = None
+
+
+def get_gpx_analysis_cache() -> GPXAnalysisCache | None:
+    """
+    Return the process-wide GPX analysis cache configured from settings.
+
+    Returns:
+        Shared cache instance, or None if caching is disabled
+    """
+    global _cache
+
+    if not settings.gpx_cache_enabled:
+        return None
+
+    if _cache is None:
+        _cache = GPXAnalysisCache(
+            max_entries=settings.gpx_cache_max_entries,
+            max_bytes=settings.gpx_cache_max_mb * 1024 * 1024,
+            ttl_seconds=settings.gpx_cache_ttl_seconds,
+            disk_path=settings.gpx_cache_full_path if settings.gpx_cache_disk_enabled else None,
+        )
+    return _cache
@@ -0,0 +1,142 @@
+"""
+Process pool for CPU-bound GPX analysis.
+
+Parsing and analyzing a large GPX file takes hundreds of milliseconds of pure
+CPU time. Running it inside an async handler blocks the uvicorn event loop, so
+every other request on the worker (health checks, feeds) waits behind it.
+This module runs those functions in a separate process pool instead.
+
+The pool accepts a bounded number of tasks (running + queued). When it is
+full, request handlers get GPXExecutorBusyError, which the API maps to
+503 Service Unavailable, instead of piling up work. Background tasks can wait
+for a free slot instead.
+
+Functions submitted to the pool must be module-level (picklable) and receive
+only picklable arguments (GPX bytes or a file path).
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, TypeVar
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Poll interval for tasks waiting for a free slot (wait=True)
+WAIT_POLL_SECONDS = 0.1
+
+
+class GPXExecutorBusyError(Exception):
+    """Raised when the GPX process pool has no free slots."""
+
+
+class GPXProcessExecutor:
+    """
+    Bounded process pool for GPX analysis.
+
+    With max_workers=0 tasks run inline in the calling thread (useful for
+    tests and single-process debugging); the pending bound still applies.
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 8):
+        """
+        Initialize executor (worker processes are started on first use).
+
+        Args:
+            max_workers: Worker processes (0 runs tasks inline)
+            max_pending: Maximum tasks running or queued at once
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._pool: ProcessPoolExecutor | None = None
+        self._pending = 0
+        self.rejected = 0
+
+    @property
+    def pending(self) -> int:
+        """Tasks currently running or queued."""
+        return self._pending
+
+    async def run(self, fn: Callable[..., T], *args: Any, wait: bool = False) -> T:
+        """
+        Run fn(*args) in the process pool.
+
+        Args:
+            fn: Module-level function to execute
+            *args: Picklable arguments
+            wait: If True, wait for a free slot instead of failing when saturated
+
+        Returns:
+            Return value of fn
+
+        Raises:
+            GPXExecutorBusyError: If saturated and wait is False
+            Exception: Any exception raised by fn is re-raised
+        """
+        while self._pending >= self.max_pending:
+            if not wait:
+                self.rejected += 1
+                logger.warning(
+                    f"GPX executor saturated ({self._pending}/{self.max_pending} tasks), "
+                    f"rejecting {fn.__name__}"
+                )
+                raise GPXExecutorBusyError(
+                    "El servidor está procesando demasiados archivos GPX. "
+                    "Inténtalo de nuevo en unos segundos."
+                )
+            await asyncio.sleep(WAIT_POLL_SECONDS)
+
+        self._pending += 1
+        try:
+            if self.max_workers == 0:
+                return fn(*args)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_pool(), fn, *args)
+        finally:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        """Stop worker processes (pending tasks are cancelled)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn: forking a process that runs an event loop and DB threads is unsafe
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(f"GPX process pool started with {self.max_workers} workers")
+        return self._pool
+
+
+_executor: GPXProcessExecutor | None = None
+
+
+def get_gpx_executor() -> GPXProcessExecutor:
+    """Return the process-wide GPX executor configured from settings."""
+    global _executor
+
+    if _executor is None:
+        _executor = GPXProcessExecutor(
+            max_workers=settings.gpx_process_workers,
+            max_pending=settings.gpx_process_max_pending,
+        )
+    return _executor
+
+
+def shutdown_gpx_executor() -> None:
+    """Stop the shared executor's worker processes (application shutdown)."""
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
@@ -0,0 +1,184 @@
+"""
+Streaming GPX reader.
+
+Parses GPX documents incrementally (XMLPullParser fed in fixed-size chunks)
+and appends <trkpt> values straight into compact typed buffers, discarding
+each XML element as soon as it has been read. Unlike gpxpy.parse(), it never
+materializes a DOM or one Python object per trackpoint, so peak memory is
+roughly 32 bytes per point plus one chunk of input.
+
+Only track data is read (trk/trkseg/trkpt with ele and time); waypoints,
+routes and extensions are skipped.
+"""
+
+import xml.etree.ElementTree as ET
+from array import array
+from collections.abc import Iterator
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+
+import gpxpy.gpx
+import gpxpy.gpxfield
+import numpy as np
+
+from src.utils.track_engine import MISSING_TIME, TrackArrays, datetime_to_micros
+
+# Input accepted by read_gpx_track: raw bytes or a path to a file on disk
+GPXSource = bytes | str | Path
+
+# Bytes fed to the XML parser per iteration
+CHUNK_SIZE = 64 * 1024
+
+
+def read_gpx_track(source: GPXSource) -> TrackArrays:
+    """
+    Read every trackpoint of a GPX document into a columnar track.
+
+    Args:
+        source: Raw GPX bytes, or path to a GPX file (streamed from disk)
+
+    Returns:
+        TrackArrays with one entry per <trkpt>, segments preserved
+
+    Raises:
+        ValueError: If the document is not well-formed XML, is not a GPX
+            document, or contains invalid coordinates, elevations or times
+    """
+    builder = _TrackBuilder()
+    parser = ET.XMLPullParser(events=("start", "end"))
+
+    try:
+        for chunk in _iter_chunks(source):
+            parser.feed(chunk)
+            builder.consume(parser.read_events())
+        parser.close()
+        builder.consume(parser.read_events())
+    except ET.ParseError as e:
+        raise ValueError(f"XML mal formado: {e}")
+
+    return builder.build()
+
+
+def _iter_chunks(source: GPXSource) -> Iterator[bytes]:
+    """Yield the document in CHUNK_SIZE pieces without copying the whole input."""
+    if isinstance(source, bytes | bytearray | memoryview):
+        view = memoryview(source)
+        for offset in range(0, len(view), CHUNK_SIZE):
+            yield bytes(view[offset : offset + CHUNK_SIZE])
+        return
+
+    with open(source, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            yield chunk
+
+
+@lru_cache(maxsize=256)
+def _local_name(tag: str) -> str:
+    """Strip the XML namespace from a tag ('{ns}trkpt' -> 'trkpt')."""
+    return tag.rpartition("}")[2]
+
+
+def _parse_time(text: str | None) -> int:
+    """Parse a GPX <time> value into UTC epoch microseconds."""
+    if text is None or not text.strip():
+        return int(MISSING_TIME)
+    text = text.strip()
+    try:
+        value = datetime.fromisoformat(text)
+    except ValueError:
+        try:
+            value = gpxpy.gpxfield.parse_time(text)
+        except gpxpy.gpx.GPXException:
+            raise ValueError(f"Fecha inválida en el archivo GPX: {text}")
+    return datetime_to_micros(value)
+
+
+class _TrackBuilder:
+    """Accumulates parser events into typed buffers."""
+
+    def __init__(self) -> None:
+        self.lat = array("d")
+        self.lon = array("d")
+        self.ele = array("d")
+        self.time = array("q")
+        self.segment_starts = array("q")
+
+        self._root: ET.Element | None = None
+        self._depth = 0
+        self._segment: ET.Element | None = None
+        self._segment_pending = False
+
+    def consume(self, events) -> None:
+        """Process a batch of (event, element) pairs from XMLPullParser."""
+        for event, elem in events:
+            if event == "start":
+                self._start(elem)
+            else:
+                self._end(elem)
+
+    def _start(self, elem: ET.Element) -> None:
+        self._depth += 1
+        if self._root is None:
+            if _local_name(elem.tag) != "gpx":
+                raise ValueError("El archivo no es un documento GPX válido")
+            self._root = elem
+        elif _local_name(elem.tag) == "trkseg":
+            self._segment = elem
+            self._segment_pending = True
+
+    def _end(self, elem: ET.Element) -> None:
+        self._depth -= 1
+        name = _local_name(elem.tag)
+
+        if name == "trkpt":
+            if self._segment is not None:
+                self._append_point(elem)
+                self._segment.remove(elem)
+            elem.clear()
+        elif name == "trkseg":
+            self._segment = None
+            self._segment_pending = False
+
+        # Drop finished top-level children (metadata, wpt, rte, trk) from the root
+        if self._depth == 1 and self._root is not None:
+            self._root.remove(elem)
+            elem.clear()
+
+    def _append_point(self, elem: ET.Element) -> None:
+        try:
+            lat = float(elem.attrib["lat"])
+            lon = float(elem.attrib["lon"])
+        except (KeyError, ValueError):
+            raise ValueError("Punto de track con coordenadas inválidas en el archivo GPX")
+
+        ele = np.nan
+        timestamp = int(MISSING_TIME)
+        for child in elem:
+            child_name = _local_name(child.tag)
+            if child_name == "ele" and child.text and child.text.strip():
+                try:
+                    ele = float(child.text)
+                except ValueError:
+                    raise ValueError(f"Elevación inválida en el archivo GPX: {child.text}")
+            elif child_name == "time":
+                timestamp = _parse_time(child.text)
+
+        if self._segment_pending:
+            self.segment_starts.append(len(self.lat))
+            self._segment_pending = False
+
+        self.lat.append(lat)
+        self.lon.append(lon)
+        self.ele.append(ele)
+        self.time.append(timestamp)
+
+    def build(self) -> TrackArrays:
+        """Wrap the buffers as NumPy arrays (no copy)."""
+        return TrackArrays(
+            lat=np.frombuffer(self.lat, dtype=np.float64),
+            lon=np.frombuffer(self.lon, dtype=np.float64),
+            ele=np.frombuffer(self.ele, dtype=np.float64),
+            time=np.frombuffer(self.time, dtype=np.int64),
+            segment_starts=np.frombuffer(self.segment_starts, dtype=np.int64),
+        )
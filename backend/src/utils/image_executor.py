@@ -0,0 +1,198 @@
+"""
+Thread pool for photo decoding, resizing and encoding.
+
+Decoding a 10MB camera JPEG, resampling it with LANCZOS and re-encoding the
+optimized and thumbnail versions takes several hundred milliseconds of CPU.
+Done inside an async handler it blocks the uvicorn event loop for every other
+request on the worker. Trip, POI and profile photo uploads run that work in
+this shared pool instead (Pillow releases the GIL while decoding, resampling
+and encoding, so threads scale across cores).
+
+The pool accepts a bounded number of jobs (running + queued). When it is
+full, uploads get ImageExecutorBusyError (503 Service Unavailable) instead of
+piling up decoded images in memory. Each job also has a deadline: a job still
+queued after settings.image_process_timeout_seconds is cancelled and fails with
+ImageProcessingTimeoutError. A job that has already started cannot be
+interrupted, so the caller waits for it to finish and gets its result (nothing
+it produces is left behind by an abandoned request).
+
+Queue depth, throughput and rejections are exposed through stats().
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ImageExecutorBusyError(Exception):
+    """Raised when the image processing pool has no free slots."""
+
+
+class ImageProcessingTimeoutError(ImageExecutorBusyError):
+    """Raised when an image job does not finish before its deadline."""
+
+
+class ImageProcessingExecutor:
+    """
+    Bounded thread pool for photo processing.
+
+    With max_workers=0 jobs run inline in the calling thread (tests and
+    debugging); the pending bound still applies but the deadline does not.
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 16, timeout_seconds: float = 30):
+        """
+        Initialize executor (threads are started on first use).
+
+        Args:
+            max_workers: Concurrent jobs (0 runs jobs inline)
+            max_pending: Maximum jobs running or queued at once
+            timeout_seconds: Deadline for a job to start (queue wait)
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.timeout_seconds = timeout_seconds
+        self._pool: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._pending = 0  # Running + queued
+        self._running = 0
+        self.peak_queued = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    @property
+    def queued(self) -> int:
+        """Jobs waiting for a free thread."""
+        return self._pending - self._running
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Run fn(*args) in the image pool.
+
+        Args:
+            fn: Function to execute
+            *args: Arguments
+
+        Returns:
+            Return value of fn
+
+        Raises:
+            ImageExecutorBusyError: If the pool is saturated
+            ImageProcessingTimeoutError: If the job is still queued at its deadline
+            Exception: Any exception raised by fn is re-raised
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                saturated = True
+            else:
+                self._pending += 1
+                self.peak_queued = max(self.peak_queued, self.queued)
+                saturated = False
+
+        if saturated:
+            logger.warning(
+                f"Image executor saturated ({self.max_pending} jobs), rejecting {fn.__name__}"
+            )
+            raise ImageExecutorBusyError(
+                "El servidor está procesando demasiadas fotos. "
+                "Inténtalo de nuevo en unos segundos."
+            )
+
+        if self.max_workers == 0:
+            try:
+                return self._track(fn, *args)
+            finally:
+                self._release()
+
+        future = self._get_pool().submit(self._track, fn, *args)
+        future.add_done_callback(self._release)
+        result = asyncio.wrap_future(future)
+        try:
+            return await asyncio.wait_for(asyncio.shield(result), self.timeout_seconds)
+        except TimeoutError:
+            if not future.cancel():
+                # Already running (or done): it cannot be interrupted, so let it finish
+                return await result
+            with self._lock:
+                self.timed_out += 1
+            logger.warning(f"Image job {fn.__name__} queued for over {self.timeout_seconds}s")
+            raise ImageProcessingTimeoutError(
+                "La foto está tardando demasiado en procesarse. Inténtalo de nuevo más tarde."
+            )
+
+    def stats(self) -> dict[str, int]:
+        """Queue depth and throughput counters."""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "running": self._running,
+                "queued": self.queued,
+                "peak_queued": self.peak_queued,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the threads (queued jobs are cancelled)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _track(self, fn: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            self._running += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def _release(self, future: Future | None = None) -> None:
+        with self._lock:
+            self._pending -= 1
+            self.completed += 1
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="image-process"
+            )
+            logger.info(f"Image processing pool started with {self.max_workers} threads")
+        return self._pool
+
+
+_executor: ImageProcessingExecutor | None = None
+
+
+def get_image_executor() -> ImageProcessingExecutor:
+    """Return the process-wide image executor configured from settings."""
+    global _executor
+
+    if _executor is None:
+        _executor = ImageProcessingExecutor(
+            max_workers=settings.image_process_workers,
+            max_pending=settings.image_process_max_pending,
+            timeout_seconds=settings.image_process_timeout_seconds,
+        )
+    return _executor
+
+
+def shutdown_image_executor() -> None:
+    """Stop the shared executor's threads (application shutdown)."""
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
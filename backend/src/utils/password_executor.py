@@ -0,0 +1,137 @@
+"""
+Thread pool for bcrypt password hashing and verification.
+
+A bcrypt round at BCRYPT_ROUNDS=12 takes ~250ms of CPU. Called directly from
+an async handler it blocks the uvicorn event loop, so during a login burst
+every other request on the worker waits behind the hashes. This module runs
+them in a dedicated thread pool instead (bcrypt releases the GIL while
+hashing), capped at a fixed number of concurrent hashes so a burst queues up
+instead of starving the rest of the process.
+
+Queue depth and throughput are exposed through stats() for monitoring.
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PasswordHashExecutor:
+    """
+    Bounded thread pool for password hashing.
+
+    With max_workers=0 tasks run inline in the calling thread (tests and
+    debugging).
+    """
+
+    def __init__(self, max_workers: int = 4):
+        """
+        Initialize executor (threads are started on first use).
+
+        Args:
+            max_workers: Concurrent hashes (0 runs tasks inline)
+        """
+        self.max_workers = max_workers
+        self._pool: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._pending = 0  # Running + queued
+        self._running = 0
+        self.peak_queued = 0
+        self.completed = 0
+
+    @property
+    def queued(self) -> int:
+        """Tasks waiting for a free thread."""
+        return self._pending - self._running
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Run fn(*args) in the thread pool.
+
+        Args:
+            fn: Function to execute
+            *args: Arguments
+
+        Returns:
+            Return value of fn
+
+        Raises:
+            Exception: Any exception raised by fn is re-raised
+        """
+        if self.max_workers == 0:
+            return fn(*args)
+
+        with self._lock:
+            self._pending += 1
+            self.peak_queued = max(self.peak_queued, self.queued)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_pool(), self._track, fn, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self.completed += 1
+
+    def stats(self) -> dict[str, int]:
+        """Queue depth and throughput counters."""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "running": self._running,
+                "queued": self.queued,
+                "peak_queued": self.peak_queued,
+                "completed": self.completed,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the threads (queued tasks are cancelled)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _track(self, fn: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            self._running += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="password-hash"
+            )
+            logger.info(f"Password hashing pool started with {self.max_workers} threads")
+        return self._pool
+
+
+_executor: PasswordHashExecutor | None = None
+
+
+def get_password_executor() -> PasswordHashExecutor:
+    """Return the process-wide password hashing executor configured from settings."""
+    global _executor
+
+    if _executor is None:
+        _executor = PasswordHashExecutor(max_workers=settings.password_hash_workers)
+    return _executor
+
+
+def shutdown_password_executor() -> None:
+    """Stop the shared executor's threads (application shutdown)."""
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
@@ -0,0 +1,191 @@
+"""
+On-disk cache of photo variants generated on demand.
+
+GET /trips/{trip_id}/photos/{photo_id}/variant renders a requested width and
+format from the stored photo on first request and keeps the file under
+{storage_path}/photo_variants/, so later requests are served straight from
+disk. Adding a width to settings.photo_variant_widths therefore never
+requires reprocessing existing photos.
+
+The cache is bounded by total size (settings.photo_variant_cache_max_mb):
+when a new file pushes it over the limit, the least recently served files are
+deleted. Recency is tracked in memory per worker; on startup existing files
+are ranked by modification time. Concurrent requests for the same missing
+variant render it once.
+"""
+
+import asyncio
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+from src.config import settings
+from src.utils.image_executor import get_image_executor
+from src.utils.trip_photo_service import VARIANT_ENCODINGS, trip_photo_service
+
+logger = logging.getLogger(__name__)
+
+
+def _render_variant(source: Path, path: Path, width: int, fmt: str) -> None:
+    """Render a variant into path atomically (runs in the image pool)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temp file and rename so readers never see partial files
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        trip_photo_service.render_variant(source, Path(tmp_name), width, fmt)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+class PhotoVariantCache:
+    """Size-bounded LRU of rendered photo variants on local disk."""
+
+    def __init__(self, path: str | Path, max_bytes: int):
+        """
+        Initialize cache (existing files are indexed on first use).
+
+        Args:
+            path: Cache directory
+            max_bytes: Total size above which least recently served files are deleted
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        # file path -> size in bytes, least recently served first
+        self._entries: OrderedDict[Path, int] = OrderedDict()
+        # Files already on disk are indexed on first use
+        self._indexed = False
+        self._total_bytes = 0
+        self._inflight: dict[Path, asyncio.Future[Path]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def file_for(self, photo_id: str, width: int, fmt: str) -> Path:
+        """Cache file of one variant."""
+        ext = VARIANT_ENCODINGS[fmt][0]
+        # Two-level fan-out keeps directories small
+        return self.path / photo_id[:2] / f"{photo_id}_{width}w.{ext}"
+
+    async def get(self, photo_id: str, source: Path, width: int, fmt: str) -> Path:
+        """
+        Return the cached variant file, rendering it from source on a miss.
+
+        Args:
+            photo_id: Photo identifier
+            source: Stored photo to render from
+            width: Requested width (narrower sources are not upscaled)
+            fmt: Variant format (jpeg or webp)
+
+        Returns:
+            Path of the variant file
+
+        Raises:
+            FileNotFoundError: If the source photo is missing
+            ImageExecutorBusyError: If the image pool is saturated or times out
+        """
+        if not self._indexed:
+            await asyncio.to_thread(self._load_index)
+
+        path = self.file_for(photo_id, width, fmt)
+        try:
+            # Also picks up files rendered by other workers
+            self._touch(path, path.stat().st_size)
+            self.hits += 1
+            return path
+        except FileNotFoundError:
+            self._forget(path)
+
+        inflight = self._inflight.get(path)
+        if inflight is None:
+            self.misses += 1
+            inflight = asyncio.ensure_future(self._create(path, source, width, fmt))
+            self._inflight[path] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(path, None))
+        # Shielded: a client disconnecting must not cancel the render for the others
+        return await asyncio.shield(inflight)
+
+    def discard(self, photo_id: str) -> None:
+        """Delete every cached variant of a photo (photo deleted)."""
+        for path in (self.path / photo_id[:2]).glob(f"{photo_id}_*"):
+            path.unlink(missing_ok=True)
+            self._forget(path)
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss/eviction counters and current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._total_bytes,
+        }
+
+    async def _create(self, path: Path, source: Path, width: int, fmt: str) -> Path:
+        if not source.is_file():
+            raise FileNotFoundError(source)
+        await get_image_executor().run(_render_variant, source, path, width, fmt)
+        self._touch(path, path.stat().st_size)
+        self._evict()
+        return path
+
+    def _touch(self, path: Path, size: int) -> None:
+        entries = self._entries
+        if path in entries:
+            entries.move_to_end(path)
+            return
+        entries[path] = size
+        self._total_bytes += size
+
+    def _forget(self, path: Path) -> None:
+        size = self._entries.pop(path, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def _evict(self) -> None:
+        entries = self._entries
+        # The most recent file is always kept, even if larger than the budget
+        while self._total_bytes > self.max_bytes and len(entries) > 1:
+            path, size = entries.popitem(last=False)
+            self._total_bytes -= size
+            path.unlink(missing_ok=True)
+            self.evictions += 1
+
+    def _load_index(self) -> None:
+        files = []
+        for path in self.path.glob("*/*"):
+            if path.suffix == ".tmp":
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, path, stat.st_size))
+
+        files.sort()
+        self._entries = OrderedDict((path, size) for _, path, size in files)
+        self._total_bytes = sum(size for _, _, size in files)
+        self._indexed = True
+        logger.info(
+            f"Photo variant cache: {len(files)} files, {self._total_bytes / 1024 / 1024:.1f}MB"
+        )
+        self._evict()
+
+
+_cache: PhotoVariantCache | None = None
+
+
+def get_photo_variant_cache() -> PhotoVariantCache:
+    """Return the process-wide photo variant cache configured from settings."""
+    global _cache
+
+    if _cache is None:
+        _cache = PhotoVariantCache(
+            path=settings.photo_variant_cache_full_path,
+            max_bytes=settings.photo_variant_cache_max_mb * 1024 * 1024,
+        )
+    return _cache
@@ -0,0 +1,322 @@
+"""
+Response cache for public read endpoints.
+
+Caches the rendered body of public GETs (public trips, cycling types, tags,
+achievements, user stats, GPX tracks) so repeated anonymous requests are
+served without touching the database, and answers If-None-Match with 304.
+
+Invalidation is tag based. Every cached response carries tags naming the data
+it was built from ("trips", "cycling_types", "gpx:<id>", ...). Each tag has a
+version token stored in the backend and mixed into the cache key, so
+invalidate("trips") only replaces one token: every response built from trips
+misses from then on and the stale entries age out. Tags are invalidated when a
+transaction that wrote the underlying rows commits
+(src/models/cache_invalidation.py).
+
+Backends implement CacheBackend (get/set of bytes with a TTL):
+- MemoryCacheBackend: LRU with TTL, per process
+- FileCacheBackend: one file per key under storage/, shared by the workers of
+  one host; the local stand-in for a networked store
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached entry format changes so stale file entries are ignored
+CACHE_VERSION = 1
+
+# Tag version tokens outlive any response built with them
+TAG_TTL_SECONDS = 30 * 24 * 3600
+
+
+class CacheBackend(ABC):
+    """Key-value store of bytes with per-entry TTL."""
+
+    @abstractmethod
+    def get(self, key: str) -> bytes | None:
+        """Return the stored value, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        """Store a value for ttl_seconds."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop all entries."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU with TTL, bounded by entry count."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        # key -> (expires_at monotonic, value)
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class FileCacheBackend(CacheBackend):
+    """One file per key on local disk, shared by every worker of the host."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+
+    def _file(self, key: str) -> Path:
+        # Two-level fan-out keeps directories small
+        return self.path / key[:2] / f"{key}.cache"
+
+    def get(self, key: str) -> bytes | None:
+        path = self._file(key)
+        try:
+            expires_at, value = pickle.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, ValueError, EOFError) as e:
+            logger.warning(f"Error reading response cache entry {key}: {e}")
+            return None
+        if expires_at <= time.time():
+            path.unlink(missing_ok=True)
+            return None
+        return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        path = self._file(key)
+        payload = pickle.dumps((time.time() + ttl_seconds, value), protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename so readers never see partial files
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_name, path)
+        except OSError as e:
+            logger.warning(f"Error writing response cache entry {key}: {e}")
+
+    def clear(self) -> None:
+        for path in self.path.glob("*/*.cache"):
+            path.unlink(missing_ok=True)
+
+
+@dataclass
+class CachedResponse:
+    """Rendered response as stored in the cache."""
+
+    body: bytes
+    media_type: str
+    etag: str
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+class ResponseCache:
+    """Tag-invalidated cache of rendered responses on top of a CacheBackend."""
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: int = 300):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    def _tag_version(self, tag: str) -> str:
+        key = f"tag:{tag}"
+        version = self.backend.get(key)
+        if version is None:
+            version = uuid.uuid4().hex.encode()
+            self.backend.set(key, version, TAG_TTL_SECONDS)
+        return version.decode()
+
+    def make_key(self, key: str, tags: tuple[str, ...]) -> str:
+        """Cache key for a request key under the current versions of its tags."""
+        versions = ",".join(f"{tag}={self._tag_version(tag)}" for tag in sorted(tags))
+        return hashlib.sha256(f"v{CACHE_VERSION}:{key}:{versions}".encode()).hexdigest()
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the cached response for a make_key() key, or None on miss."""
+        payload = self.backend.get(key)
+        if payload is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return pickle.loads(payload)
+
+    def set(self, key: str, cached: CachedResponse) -> None:
+        """Store a response under a make_key() key."""
+        payload = pickle.dumps(cached, protocol=pickle.HIGHEST_PROTOCOL)
+        self.backend.set(key, payload, self.ttl_seconds)
+
+    def invalidate(self, *tags: str) -> None:
+        """Make every response built from these tags miss from now on."""
+        for tag in tags:
+            self.backend.set(f"tag:{tag}", uuid.uuid4().hex.encode(), TAG_TTL_SECONDS)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        self.backend.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters."""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache | None:
+    """
+    Return the process-wide response cache configured from settings.
+
+    Returns:
+        Shared cache instance, or None if caching is disabled
+    """
+    global _cache
+
+    if not settings.response_cache_enabled:
+        return None
+
+    if _cache is None:
+        if settings.response_cache_backend == "file":
+            backend: CacheBackend = FileCacheBackend(settings.response_cache_full_path)
+        else:
+            backend = MemoryCacheBackend(max_entries=settings.response_cache_max_entries)
+        _cache = ResponseCache(backend, ttl_seconds=settings.response_cache_ttl_seconds)
+    return _cache
+
+
+def invalidate(*tags: str) -> None:
+    """Invalidate tags in the process-wide cache (no-op if disabled)."""
+    cache = get_response_cache()
+    if cache is not None and tags:
+        cache.invalidate(*tags)
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match accepts the current ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _to_response(request: Request, cached: CachedResponse) -> Response:
+    """Full response, or 304 Not Modified if the client already has this version."""
+    headers = {**cached.headers, "ETag": cached.etag}
+    if _etag_matches(request, cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type=cached.media_type, headers=headers)
+
+
+class CachedEndpoint:
+    """
+    Response cache lookup for one request.
+
+    Usage in an endpoint:
+        cached = cache_lookup(request, "cycling_types")
+        if cached.response is not None:
+            return cached.response
+        ...
+        return cached.store(result)
+
+    store() renders the result, caches it and answers with an ETag (304 if
+    If-None-Match matches), also when the cache is disabled or skipped.
+    """
+
+    def __init__(self, request: Request, cache: ResponseCache | None, key: str | None):
+        self.request = request
+        self.cache = cache
+        self.key = key
+        self.response: Response | None = None
+
+        if cache is not None and key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                self.response = _to_response(request, cached)
+
+    def store(self, content: Any) -> Response:
+        """
+        Render, cache and return an endpoint result.
+
+        Args:
+            content: Pydantic model / JSON-compatible data, or a rendered Response
+
+        Returns:
+            Response with ETag (304 if the client already has it)
+        """
+        if not isinstance(content, Response):
+            content = JSONResponse(content=jsonable_encoder(content))
+
+        body = bytes(content.body)
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        headers = {name: content.headers[name] for name in ("vary",) if name in content.headers}
+        cached = CachedResponse(
+            body=body, media_type=content.media_type, etag=etag, headers=headers
+        )
+        if self.cache is not None and self.key is not None and content.status_code == 200:
+            self.cache.set(self.key, cached)
+        return _to_response(self.request, cached)
+
+
+def cache_lookup(
+    request: Request, *tags: str, enabled: bool = True, vary: str = ""
+) -> CachedEndpoint:
+    """
+    Look up the cached response of a public GET request.
+
+    The key is the path and sorted query string, plus vary (request headers
+    that change the response, e.g. the resolved Accept format).
+
+    Args:
+        request: Current request
+        *tags: Data the response is built from (see src/models/cache_invalidation.py)
+        enabled: False to skip the cache for this request (e.g. authenticated
+            users, whose responses are personalized)
+        vary: Extra key component
+
+    Returns:
+        CachedEndpoint (response set on a hit)
+    """
+    cache = get_response_cache() if enabled else None
+    key = None
+    if cache is not None:
+        params = request.query_params.multi_items()
+        query = "&".join(sorted(f"{name}={value}" for name, value in params))
+        key = cache.make_key(f"{request.url.path}?{query}#{vary}", tags)
+    return CachedEndpoint(request, cache, key)
@@ -5,6 +5,8 @@ Implements bcrypt password hashing with configurable rounds and JWT encode/decod
 for access and refresh tokens.
 """
 
+import hashlib
+import hmac
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -12,6 +14,7 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from src.config import settings
+from src.utils.password_executor import get_password_executor
 
 # Password hashing context with bcrypt
 pwd_context = CryptContext(
@@ -60,6 +63,74 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password with bcrypt without blocking the event loop.
+
+    Runs hash_password() in the password hashing thread pool. Use from
+    async code.
+
+    Args:
+        password: Plain text password to hash
+
+    Returns:
+        Hashed password string (60 characters)
+    """
+    return await get_password_executor().run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password against its hash without blocking the event loop.
+
+    Runs verify_password() in the password hashing thread pool. Use from
+    async code.
+
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password to check against
+
+    Returns:
+        True if password matches, False otherwise
+    """
+    return await get_password_executor().run(verify_password, plain_password, hashed_password)
+
+
+def hash_token(token: str) -> str:
+    """
+    Digest a high-entropy token (e.g. a refresh token) for storage.
+
+    HMAC-SHA256 keyed with the secret key: deterministic, so stored tokens
+    are found by equality, and microseconds instead of a bcrypt round. Only
+    for random/signed tokens, never for user passwords.
+
+    Args:
+        token: Token string to digest
+
+    Returns:
+        Hex digest (64 characters)
+
+    Example:
+        >>> hash_token("abc") == hash_token("abc")
+        True
+    """
+    return hmac.new(settings.secret_key.encode(), token.encode(), hashlib.sha256).hexdigest()
+
+
+def verify_token_hash(token: str, token_hash: str) -> bool:
+    """
+    Check a token against its hash_token() digest in constant time.
+
+    Args:
+        token: Token string to verify
+        token_hash: Stored digest
+
+    Returns:
+        True if the token matches
+    """
+    return hmac.compare_digest(hash_token(token), token_hash)
+
+
 def create_access_token(data: dict[str, Any], expires_delta: timedelta | None = None) -> str:
     """
     Create a JWT access token.
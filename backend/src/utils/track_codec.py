@@ -0,0 +1,208 @@
+"""
+Compact binary encoding of simplified GPX tracks.
+
+Stores a whole simplified track in a single GPXFile.track_blob column instead
+of one track_points row per point (36-char UUID, FK and six floats each).
+
+Layout (little-endian):
+
+    header   b"CVT" + version (1 byte), point count (uint32), flags (uint8)
+    body     zlib-compressed int32 arrays, each `count` long:
+             - latitude   1e-7 degrees, delta-encoded
+             - longitude  1e-7 degrees, delta-encoded
+             - distance   meters, delta-encoded
+             - elevation  millimeters, delta-encoded (only if FLAG_ELEVATION)
+             - gradient   hundredths of %, MISSING for None (only if FLAG_GRADIENT)
+
+Delta encoding turns neighbouring coordinates into small integers that zlib
+compresses well (typically ~11 bytes per point). Precision is ~1 cm for
+coordinates and 1 mm for elevation; distance (3 decimals) and gradient (2 decimals)
+round-trip exactly as stored by GPXService.
+"""
+
+import struct
+import zlib
+from typing import Any
+
+import numpy as np
+
+MAGIC = b"CVT"
+VERSION = 1
+
+_HEADER = struct.Struct("<3sBIB")
+
+FLAG_ELEVATION = 0x01  # Elevation array present (some point has elevation)
+FLAG_GRADIENT = 0x02  # Gradient array present (some point has a gradient)
+
+# Fixed-point scales
+COORD_SCALE = 10_000_000  # 1e-7 degrees (~1 cm), max 1.8e9 fits int32
+DISTANCE_SCALE = 1000  # meters
+ELEVATION_SCALE = 1000  # millimeters
+GRADIENT_SCALE = 100  # hundredths of percent
+
+# Sentinel for missing elevation/gradient values
+MISSING = np.iinfo(np.int32).min
+
+
+def encode_track(trackpoints: list[dict[str, Any]]) -> bytes:
+    """
+    Encode simplified trackpoints into a compact blob.
+
+    Args:
+        trackpoints: Trackpoint dicts as returned by GPXService.parse_gpx_file()
+            (latitude, longitude, elevation, distance_km, sequence, gradient),
+            ordered by sequence
+
+    Returns:
+        Encoded track (see module docstring for the layout)
+    """
+    count = len(trackpoints)
+    lat = np.fromiter((p["latitude"] for p in trackpoints), dtype=np.float64, count=count)
+    lon = np.fromiter((p["longitude"] for p in trackpoints), dtype=np.float64, count=count)
+    distance = np.fromiter((p["distance_km"] for p in trackpoints), dtype=np.float64, count=count)
+    ele = np.fromiter(
+        (np.nan if p["elevation"] is None else p["elevation"] for p in trackpoints),
+        dtype=np.float64,
+        count=count,
+    )
+    gradient = np.fromiter(
+        (np.nan if p["gradient"] is None else p["gradient"] for p in trackpoints),
+        dtype=np.float64,
+        count=count,
+    )
+
+    flags = 0
+    arrays = [
+        _delta(_fixed(lat, COORD_SCALE)),
+        _delta(_fixed(lon, COORD_SCALE)),
+        _delta(_fixed(distance, DISTANCE_SCALE)),
+    ]
+    if not np.isnan(ele).all():
+        flags |= FLAG_ELEVATION
+        arrays.append(_delta(_fixed(ele, ELEVATION_SCALE), nullable=True))
+    if not np.isnan(gradient).all():
+        flags |= FLAG_GRADIENT
+        arrays.append(_fixed(gradient, GRADIENT_SCALE).astype(np.int32))
+
+    body = b"".join(array.astype("<i4", copy=False).tobytes() for array in arrays)
+    return _HEADER.pack(MAGIC, VERSION, count, flags) + zlib.compress(body)
+
+
+def decode_track_columns(blob: bytes) -> dict[str, np.ndarray]:
+    """
+    Decode a track blob into columnar arrays.
+
+    Args:
+        blob: Value produced by encode_track()
+
+    Returns:
+        Dict of float64 arrays latitude, longitude, distance_km, elevation and
+        gradient (NaN where missing) plus int64 sequence
+
+    Raises:
+        ValueError: If the blob is not a track blob or is corrupt
+    """
+    try:
+        magic, version, count, flags = _HEADER.unpack_from(blob)
+        body = zlib.decompress(blob[_HEADER.size :])
+    except (struct.error, zlib.error) as e:
+        raise ValueError(f"Track blob corrupto: {e}")
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Formato de track blob no soportado: {magic!r} v{version}")
+
+    n_arrays = 3 + bool(flags & FLAG_ELEVATION) + bool(flags & FLAG_GRADIENT)
+    if len(body) != n_arrays * count * 4:
+        raise ValueError("Track blob corrupto: tamaño inesperado")
+    arrays = iter(np.frombuffer(body, dtype="<i4").reshape(n_arrays, count))
+
+    lat = _undelta(next(arrays)) / COORD_SCALE
+    lon = _undelta(next(arrays)) / COORD_SCALE
+    distance = _undelta(next(arrays)) / DISTANCE_SCALE
+    if flags & FLAG_ELEVATION:
+        ele = _from_fixed(_undelta(next(arrays), nullable=True), ELEVATION_SCALE)
+    else:
+        ele = np.full(count, np.nan)
+    if flags & FLAG_GRADIENT:
+        gradient = _from_fixed(next(arrays).astype(np.int64), GRADIENT_SCALE)
+    else:
+        gradient = np.full(count, np.nan)
+
+    return {
+        "latitude": lat,
+        "longitude": lon,
+        "elevation": ele,
+        "distance_km": distance,
+        "sequence": np.arange(count, dtype=np.int64),
+        "gradient": gradient,
+    }
+
+
+def decode_track(blob: bytes) -> list[dict[str, Any]]:
+    """
+    Decode a track blob into trackpoint dicts (inverse of encode_track()).
+
+    Returns:
+        Trackpoint dicts with the same keys as GPXService.parse_gpx_file()
+        trackpoints; missing elevation/gradient are None
+    """
+    columns = decode_track_columns(blob)
+    ele = columns["elevation"]
+    gradient = columns["gradient"]
+
+    return [
+        {
+            "latitude": lat,
+            "longitude": lon,
+            "elevation": None if e != e else e,
+            "distance_km": distance,
+            "sequence": sequence,
+            "gradient": None if g != g else g,
+        }
+        for lat, lon, e, distance, sequence, g in zip(
+            columns["latitude"].tolist(),
+            columns["longitude"].tolist(),
+            ele.tolist(),
+            columns["distance_km"].tolist(),
+            columns["sequence"].tolist(),
+            gradient.tolist(),
+            strict=True,
+        )
+    ]
+
+
+def _fixed(values: np.ndarray, scale: int) -> np.ndarray:
+    """Round to fixed point int64, NaN -> MISSING."""
+    fixed = np.full(values.shape, MISSING, dtype=np.int64)
+    present = ~np.isnan(values)
+    fixed[present] = np.rint(values[present] * scale).astype(np.int64)
+    return fixed
+
+
+def _from_fixed(fixed: np.ndarray, scale: int) -> np.ndarray:
+    """Inverse of _fixed(): MISSING -> NaN."""
+    values = fixed / scale
+    values[fixed == MISSING] = np.nan
+    return values
+
+
+def _delta(fixed: np.ndarray, nullable: bool = False) -> np.ndarray:
+    """
+    Delta-encode a fixed-point column as int32.
+
+    Deltas wrap around modulo 2^32 (e.g. longitude jumps across the
+    antimeridian) and _undelta() unwraps them the same way. For nullable
+    columns, missing values stay MISSING in the stream and the next present
+    value is encoded relative to the last present one.
+    """
+    present = fixed != MISSING if nullable else np.ones(fixed.shape, dtype=bool)
+    encoded = np.full(fixed.shape, MISSING, dtype=np.int32)
+    encoded[present] = np.diff(fixed[present], prepend=0).astype(np.int32)
+    return encoded
+
+
+def _undelta(encoded: np.ndarray, nullable: bool = False) -> np.ndarray:
+    """Inverse of _delta() (returns int64 fixed point, MISSING kept)."""
+    present = encoded != MISSING if nullable else np.ones(encoded.shape, dtype=bool)
+    fixed = np.full(encoded.shape, MISSING, dtype=np.int64)
+    fixed[present] = np.cumsum(encoded[present], dtype=np.int32)
+    return fixed
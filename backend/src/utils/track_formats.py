@@ -0,0 +1,191 @@
+"""
+Compact response encodings for simplified tracks (GET /gpx/{id}/track).
+
+The default JSON response has one object per trackpoint, which dominates the
+payload of map pages. These encodings carry the same track as parallel arrays:
+
+- columnar: JSON arrays latitude, longitude, elevation, distance_km, gradient
+- polyline: Google encoded polyline for the coordinates (precision 5, ~1 m)
+  plus the columnar profile arrays (elevation, distance_km, gradient)
+- binary:   little-endian float32 arrays behind a small JSON metadata header
+
+Binary layout:
+
+    magic b"CVTB" | version u8 | flags u8 (reserved) | u16 (reserved)
+    count u32 | metadata length u32 (padded to 4 bytes)
+    metadata     UTF-8 JSON (route metadata, same fields as the JSON response)
+    float32[count] x 5: latitude, longitude, elevation, distance_km, gradient
+                        (NaN where elevation/gradient are missing)
+"""
+
+import json
+import struct
+from typing import Any
+
+import numpy as np
+
+TRACK_FORMATS = ("json", "columnar", "polyline", "binary")
+BINARY_MEDIA_TYPE = "application/octet-stream"
+
+POLYLINE_PRECISION = 5
+
+BINARY_MAGIC = b"CVTB"
+BINARY_VERSION = 1
+BINARY_COLUMNS = ("latitude", "longitude", "elevation", "distance_km", "gradient")
+
+_BINARY_HEADER = struct.Struct("<4sBBHII")
+
+
+def encode_polyline(
+    latitude: np.ndarray, longitude: np.ndarray, precision: int = POLYLINE_PRECISION
+) -> str:
+    """
+    Encode coordinates with the Google encoded polyline algorithm.
+
+    Vectorized: every value is split into 5-bit chunks with array operations,
+    then the valid chunks are gathered in order.
+
+    Args:
+        latitude: Latitudes in decimal degrees
+        longitude: Longitudes in decimal degrees
+        precision: Decimal places kept (5 = Google Maps default)
+
+    Returns:
+        Encoded polyline string
+    """
+    if not len(latitude):
+        return ""
+
+    scale = 10**precision
+    coords = np.empty(len(latitude) * 2, dtype=np.int64)
+    coords[0::2] = np.rint(np.asarray(latitude) * scale)
+    coords[1::2] = np.rint(np.asarray(longitude) * scale)
+
+    # Deltas per coordinate (lat with previous lat, lon with previous lon)
+    deltas = np.diff(coords.reshape(-1, 2), axis=0, prepend=0).ravel()
+
+    # Zigzag: sign moved to the lowest bit
+    values = (deltas << 1) ^ (deltas >> 63)
+
+    # 5-bit chunks, least significant first; bit 0x20 marks "more chunks follow"
+    n_chunks = np.maximum(1, (np.floor(np.log2(np.maximum(values, 1))).astype(np.int64) + 5) // 5)
+    max_chunks = int(n_chunks.max())
+    shifts = np.arange(max_chunks, dtype=np.int64) * 5
+    chunks = (values[:, None] >> shifts) & 0x1F
+    chunks |= np.where(shifts < (n_chunks[:, None] - 1) * 5, 0x20, 0)
+    chunks += 63
+
+    keep = np.arange(max_chunks) < n_chunks[:, None]
+    return chunks[keep].astype(np.uint8).tobytes().decode("ascii")
+
+
+def decode_polyline(
+    polyline: str, precision: int = POLYLINE_PRECISION
+) -> list[tuple[float, float]]:
+    """
+    Decode a Google encoded polyline.
+
+    Args:
+        polyline: Encoded polyline string
+        precision: Decimal places used when encoding
+
+    Returns:
+        List of (latitude, longitude) tuples
+    """
+    values = []
+    value = shift = 0
+    for char in polyline.encode("ascii"):
+        chunk = char - 63
+        value |= (chunk & 0x1F) << shift
+        shift += 5
+        if not chunk & 0x20:
+            values.append(~(value >> 1) if value & 1 else value >> 1)
+            value = shift = 0
+
+    scale = 10**precision
+    coords = np.cumsum(np.array(values, dtype=np.int64).reshape(-1, 2), axis=0) / scale
+    return list(zip(coords[:, 0].tolist(), coords[:, 1].tolist(), strict=True))
+
+
+def _nullable_list(values: np.ndarray) -> list[float | None]:
+    """Array to list with NaN -> None (JSON null)."""
+    return [None if v != v else v for v in values.tolist()]
+
+
+def columnar_track(columns: dict[str, np.ndarray]) -> dict[str, Any]:
+    """
+    Build the columnar (parallel arrays) representation of a track.
+
+    Args:
+        columns: Track columns as returned by GPXService.load_track_columns()
+
+    Returns:
+        Dict of lists latitude, longitude, elevation, distance_km, gradient
+    """
+    return {
+        "latitude": columns["latitude"].tolist(),
+        "longitude": columns["longitude"].tolist(),
+        "elevation": _nullable_list(columns["elevation"]),
+        "distance_km": columns["distance_km"].tolist(),
+        "gradient": _nullable_list(columns["gradient"]),
+    }
+
+
+def polyline_track(columns: dict[str, np.ndarray]) -> dict[str, Any]:
+    """
+    Build the polyline representation of a track.
+
+    Coordinates are encoded as a polyline; the elevation profile stays columnar.
+    """
+    return {
+        "polyline": encode_polyline(columns["latitude"], columns["longitude"]),
+        "polyline_precision": POLYLINE_PRECISION,
+        "elevation": _nullable_list(columns["elevation"]),
+        "distance_km": columns["distance_km"].tolist(),
+        "gradient": _nullable_list(columns["gradient"]),
+    }
+
+
+def encode_binary_track(columns: dict[str, np.ndarray], metadata: dict[str, Any]) -> bytes:
+    """
+    Encode a track and its route metadata in the binary response format.
+
+    Args:
+        columns: Track columns as returned by GPXService.load_track_columns()
+        metadata: JSON-serializable route metadata
+
+    Returns:
+        Binary payload (see module docstring for the layout)
+    """
+    count = len(columns["latitude"])
+    meta = json.dumps(metadata, separators=(",", ":")).encode()
+    meta += b" " * (-len(meta) % 4)  # Keep float32 arrays 4-byte aligned
+
+    header = _BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, 0, 0, count, len(meta))
+    arrays = np.stack([columns[name] for name in BINARY_COLUMNS]).astype("<f4")
+    return header + meta + arrays.tobytes()
+
+
+def decode_binary_track(payload: bytes) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+    """
+    Decode a binary track payload (inverse of encode_binary_track()).
+
+    Returns:
+        Tuple (metadata, columns as float32 arrays)
+
+    Raises:
+        ValueError: If the payload is not a binary track
+    """
+    try:
+        magic, version, _, _, count, meta_len = _BINARY_HEADER.unpack_from(payload)
+    except struct.error as e:
+        raise ValueError(f"Binary track corrupto: {e}")
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+        raise ValueError(f"Formato de binary track no soportado: {magic!r} v{version}")
+
+    offset = _BINARY_HEADER.size
+    metadata = json.loads(payload[offset : offset + meta_len])
+    arrays = np.frombuffer(payload, dtype="<f4", offset=offset + meta_len).reshape(
+        len(BINARY_COLUMNS), count
+    )
+    return metadata, dict(zip(BINARY_COLUMNS, arrays, strict=True))
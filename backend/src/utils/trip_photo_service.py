@@ -7,18 +7,32 @@ for travel diary photos using Pillow.
 
 import io
 import logging
+import os
 import uuid
-from dataclasses import dataclass
+from collections.abc import Container
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import BinaryIO
 
-from PIL import Image, ImageOps
+from PIL import ExifTags, Image, ImageOps
 
 from src.config import settings
+from src.utils.image_executor import get_image_executor
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class EncodedVariant:
+    """One encoding of the responsive variant ladder."""
+
+    width: int
+    height: int
+    format: str  # jpeg or webp
+    data: bytes | None  # None: identical to the optimized photo (not stored twice)
+
+
 @dataclass
 class PhotoProcessingResult:
     """Result of photo processing operation."""
@@ -28,6 +42,214 @@ class PhotoProcessingResult:
     width: int  # Original width
     height: int  # Original height
     file_size: int  # Original file size in bytes
+    optimized_width: int = 0  # Dimensions of optimized_bytes
+    optimized_height: int = 0
+    variants: list[EncodedVariant] = field(default_factory=list)  # with_variants only
+
+
+@dataclass
+class DecodedPhoto:
+    """Photo decoded at reduced resolution."""
+
+    image: Image.Image  # Decoded pixels (EXIF orientation not applied yet)
+    width: int  # Original width, in display orientation
+    height: int  # Original height, in display orientation
+
+
+# EXIF orientations that rotate the image by 90 degrees (width and height swap)
+ROTATED_ORIENTATIONS = {5, 6, 7, 8}
+
+
+def decode_photo(source: BinaryIO, min_width: int, min_height: int) -> DecodedPhoto:
+    """
+    Decode a photo at the smallest resolution that still covers the target size.
+
+    JPEG decoders can scale by 1/2, 1/4 or 1/8 while decoding (Image.draft), so a
+    4000x3000 phone photo needed at 1200px wide is decoded at 2000x1500: about a
+    quarter of the CPU time and memory of a full decode. All variants are then
+    generated from that one buffer. Other formats are decoded at full size.
+
+    Decoding replaces Image.verify(): corrupt or truncated data raises here, so
+    the file does not need to be opened a second time.
+
+    Args:
+        source: Photo file or BytesIO
+        min_width: Minimum decoded width, in display orientation
+        min_height: Minimum decoded height, in display orientation
+
+    Returns:
+        DecodedPhoto with the decoded image and the original dimensions
+
+    Raises:
+        Exception: Any Pillow error if the content is not a valid image
+    """
+    img = Image.open(source)
+    width, height = img.size
+
+    # Targets are in display orientation; the JPEG is stored before rotation
+    if img.getexif().get(ExifTags.Base.Orientation, 1) in ROTATED_ORIENTATIONS:
+        min_width, min_height = min_height, min_width
+        width, height = height, width
+
+    img.draft(img.mode, (min_width, min_height))
+    img.load()
+
+    return DecodedPhoto(image=img, width=width, height=height)
+
+
+# File extension and Pillow encoder options of each variant format
+VARIANT_ENCODINGS = {
+    "jpeg": ("jpg", "JPEG"),
+    "webp": ("webp", "WEBP"),
+}
+
+
+def encode_photo_variants(
+    img: Image.Image, reuse: Container[tuple[int, str]] = ()
+) -> list[EncodedVariant]:
+    """
+    Encode the responsive variant ladder of a photo in memory.
+
+    One encoding per width in settings.photo_variant_widths and format in
+    settings.photo_variant_formats. Widths larger than the image are capped at
+    its width (never upscaled), so small photos get fewer sizes. Each size is
+    resized from the next larger one.
+
+    Args:
+        img: Decoded RGB image (display orientation)
+        reuse: (width, format) pairs already encoded elsewhere (returned without data)
+
+    Returns:
+        Encoded variants, smallest first
+    """
+    widths = sorted({min(int(width), img.width) for width in settings.photo_variant_widths})
+
+    variants = []
+    source = img
+    for width in reversed(widths):
+        if width < source.width:
+            height = max(1, int(source.height * (width / source.width)))
+            source = source.resize((width, height), Image.Resampling.LANCZOS)
+
+        for fmt in settings.photo_variant_formats:
+            data = None
+            if (width, fmt) not in reuse:
+                buffer = io.BytesIO()
+                source.save(buffer, format=VARIANT_ENCODINGS[fmt][1], **_encoder_options(fmt))
+                data = buffer.getvalue()
+            variants.append(EncodedVariant(source.width, source.height, fmt, data))
+
+    variants.sort(key=lambda variant: (variant.width, variant.format))
+    return variants
+
+
+def write_photo_variants(
+    variants: list[EncodedVariant],
+    output_dir: Path,
+    file_stem: str,
+    url_prefix: str,
+    existing: dict[tuple[int, str], str] | None = None,
+) -> list[dict]:
+    """
+    Save encoded variants as {file_stem}_{width}w.{ext} files.
+
+    Args:
+        variants: encode_photo_variants() output
+        output_dir: Directory for the files (must exist)
+        file_stem: Base name of the files
+        url_prefix: Public URL of output_dir (e.g. /storage/trip_photos/...)
+        existing: URLs of the variants encoded without data, {(width, format): url}
+
+    Returns:
+        Variant metadata [{url, width, height, format, file_size}], smallest first
+    """
+    existing = existing or {}
+    metadata = []
+    for variant in variants:
+        if variant.data is None:
+            url = existing[(variant.width, variant.format)]
+            file_size = (output_dir / Path(url).name).stat().st_size
+        else:
+            filename = f"{file_stem}_{variant.width}w.{VARIANT_ENCODINGS[variant.format][0]}"
+            (output_dir / filename).write_bytes(variant.data)
+            url = f"{url_prefix}/{filename}"
+            file_size = len(variant.data)
+
+        metadata.append(
+            {
+                "url": url,
+                "width": variant.width,
+                "height": variant.height,
+                "format": variant.format,
+                "file_size": file_size,
+            }
+        )
+    return metadata
+
+
+def _encoder_options(fmt: str) -> dict:
+    if fmt == "webp":
+        return {"quality": settings.photo_quality_webp}
+    return {"quality": settings.photo_quality_optimized, "optimize": True, "progressive": True}
+
+
+def reprocess_stored_photo(
+    photo_url: str, old_variants: list[dict], reencode: bool = False
+) -> tuple[int, int, int, list[dict]]:
+    """
+    Regenerate the stored versions of a trip photo with the current settings.
+
+    Originals are not kept, so the optimized file ({stem}_optimized.jpg) goes
+    through TripPhotoService.process_photo like a fresh upload. The optimized
+    file is only replaced when wider than settings.photo_max_width (or with
+    reencode); the thumbnail and the variant ladder are always saved again.
+    Ladder files no longer produced (removed widths or formats) are deleted.
+    Used by scripts/dev-tools/reprocess_trip_photos.py.
+
+    Args:
+        photo_url: TripPhoto.photo_url (relative to the backend directory)
+        old_variants: TripPhoto.variants before reprocessing
+        reencode: Re-encode the optimized file even if it fits the max width
+
+    Returns:
+        Tuple of (optimized file size, optimized width, optimized height, variants)
+
+    Raises:
+        FileNotFoundError: If the optimized file is missing
+        ValueError: If the optimized file cannot be processed
+    """
+    path = Path(photo_url.lstrip("/"))
+    url_prefix = photo_url.rsplit("/", 1)[0]
+    file_stem = path.stem.removesuffix("_optimized")
+
+    result = trip_photo_service.process_photo(
+        path.read_bytes(), path.name, with_variants=settings.photo_variants_on_upload
+    )
+    if reencode or result.width > settings.photo_max_width:
+        _replace_file(path, result.optimized_bytes)
+    _replace_file(path.parent / f"{file_stem}_thumb.jpg", result.thumbnail_bytes)
+
+    variants = write_photo_variants(
+        result.variants,
+        path.parent,
+        file_stem,
+        url_prefix,
+        existing={(result.optimized_width, "jpeg"): photo_url},
+    )
+
+    kept = {variant["url"] for variant in variants} | {photo_url}
+    for variant in old_variants:
+        if variant["url"] not in kept:
+            (path.parent / Path(variant["url"]).name).unlink(missing_ok=True)
+
+    return path.stat().st_size, result.optimized_width, result.optimized_height, variants
+
+
+def _replace_file(path: Path, data: bytes) -> None:
+    """Replace a file atomically so it is never served half-written."""
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
 
 
 @dataclass
@@ -84,10 +306,7 @@ class TripPhotoService:
             img = Image.open(io.BytesIO(photo_bytes))
             img.verify()  # Verify it's actually an image
 
-            # Re-open after verify (verify() closes the file)
-            img = Image.open(io.BytesIO(photo_bytes))
-
-            # Check format is supported
+            # Check format is supported (still known after verify)
             if img.format not in self.SUPPORTED_FORMATS:
                 return (
                     f"Formato de imagen no soportado: {img.format}. "
@@ -103,13 +322,24 @@ class TripPhotoService:
 
         return None
 
-    def process_photo(self, photo_bytes: bytes, filename: str) -> PhotoProcessingResult:
+    def process_photo(
+        self,
+        photo_bytes: bytes,
+        filename: str,
+        thumb_size: int | None = None,
+        with_variants: bool = False,
+    ) -> PhotoProcessingResult:
         """
         Process photo: resize, optimize, create thumbnail.
 
+        Shared by every upload (trip, POI, profile) and by reprocess_stored_photo,
+        so a reprocessed photo matches a fresh upload.
+
         Args:
             photo_bytes: Raw photo file bytes
             filename: Original filename
+            thumb_size: Square thumbnail size (default: settings.photo_thumb_size)
+            with_variants: Also encode the responsive variant ladder of the optimized photo
 
         Returns:
             PhotoProcessingResult with optimized and thumbnail versions
@@ -117,12 +347,18 @@ class TripPhotoService:
         Raises:
             ValueError: If photo cannot be processed
         """
+        thumb_size = thumb_size or settings.photo_thumb_size
         try:
-            # Open image
-            img = Image.open(io.BytesIO(photo_bytes))
+            # Decode once at the smallest JPEG scale covering both versions
+            decoded = decode_photo(
+                io.BytesIO(photo_bytes),
+                min_width=max(settings.photo_max_width, thumb_size),
+                min_height=thumb_size,
+            )
 
             # Handle EXIF orientation (rotate if needed)
-            img = ImageOps.exif_transpose(img)
+            img = decoded.image
+            ImageOps.exif_transpose(img, in_place=True)
 
             # Convert to RGB if needed (handles PNG with transparency, etc.)
             if img.mode in ("RGBA", "LA", "P"):
@@ -135,14 +371,11 @@ class TripPhotoService:
             elif img.mode != "RGB":
                 img = img.convert("RGB")
 
-            # Store original dimensions
-            original_width, original_height = img.size
-
             # Create optimized version (resize if needed)
             optimized_img = self._resize_photo(img, settings.photo_max_width)
 
             # Create thumbnail (square crop)
-            thumbnail_img = self._create_thumbnail(img, settings.photo_thumb_size)
+            thumbnail_img = self._create_thumbnail(img, thumb_size)
 
             # Convert to bytes
             optimized_bytes = self._image_to_bytes(
@@ -152,18 +385,99 @@ class TripPhotoService:
                 thumbnail_img, quality=settings.photo_quality_thumb
             )
 
+            # Responsive variants (optimized_bytes doubles as the JPEG variant of its width)
+            variants = []
+            if with_variants:
+                variants = encode_photo_variants(
+                    optimized_img, reuse={(optimized_img.width, "jpeg")}
+                )
+
             return PhotoProcessingResult(
                 optimized_bytes=optimized_bytes,
                 thumbnail_bytes=thumbnail_bytes,
-                width=original_width,
-                height=original_height,
+                width=decoded.width,
+                height=decoded.height,
                 file_size=len(photo_bytes),
+                optimized_width=optimized_img.width,
+                optimized_height=optimized_img.height,
+                variants=variants,
             )
 
         except Exception as e:
             logger.error(f"Error processing photo {filename}: {e}")
             raise ValueError(f"Error al procesar la foto: {str(e)}")
 
+    async def process_photo_async(
+        self,
+        photo_bytes: bytes,
+        filename: str,
+        thumb_size: int | None = None,
+        with_variants: bool = False,
+    ) -> PhotoProcessingResult:
+        """
+        Process photo in the shared image pool (see process_photo).
+
+        Raises:
+            ValueError: If photo cannot be processed
+            ImageExecutorBusyError: If the pool is saturated or the job times out
+        """
+        return await get_image_executor().run(
+            self.process_photo, photo_bytes, filename, thumb_size, with_variants
+        )
+
+    def write_photo(
+        self, result: PhotoProcessingResult, output_dir: Path, file_stem: str, url_prefix: str
+    ) -> list[dict]:
+        """
+        Write a processed photo as {file_stem}_optimized.jpg, {file_stem}_thumb.jpg
+        and its responsive variants.
+
+        Args:
+            result: process_photo() output
+            output_dir: Directory for the files (created if needed)
+            file_stem: Base name of the files
+            url_prefix: Public URL of output_dir
+
+        Returns:
+            Variant metadata (see write_photo_variants), empty without variants
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        optimized_name = f"{file_stem}_optimized.jpg"
+        (output_dir / optimized_name).write_bytes(result.optimized_bytes)
+        (output_dir / f"{file_stem}_thumb.jpg").write_bytes(result.thumbnail_bytes)
+
+        return write_photo_variants(
+            result.variants,
+            output_dir,
+            file_stem,
+            url_prefix,
+            existing={(result.optimized_width, "jpeg"): f"{url_prefix}/{optimized_name}"},
+        )
+
+    def render_variant(self, source: Path, dest: Path, width: int, fmt: str) -> None:
+        """
+        Encode one responsive variant of a stored photo (on-demand variants).
+
+        Sources narrower than width are re-encoded without upscaling.
+
+        Args:
+            source: Stored photo file
+            dest: Output file
+            width: Target width in pixels
+            fmt: Variant format (jpeg or webp)
+        """
+        with open(source, "rb") as f:
+            img = decode_photo(f, min_width=width, min_height=1).image
+        ImageOps.exif_transpose(img, in_place=True)
+
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        if img.width > width:
+            height = max(1, int(img.height * (width / img.width)))
+            img = img.resize((width, height), Image.Resampling.LANCZOS)
+
+        img.save(dest, format=VARIANT_ENCODINGS[fmt][1], **_encoder_options(fmt))
+
     def _resize_photo(self, img: Image.Image, max_width: int) -> Image.Image:
         """
         Resize photo to max width while maintaining aspect ratio.
@@ -174,7 +488,7 @@ class TripPhotoService:
 
         # Don't upscale small images
         if width <= max_width:
-            return img.copy()
+            return img
 
         # Calculate new dimensions maintaining aspect ratio
         ratio = max_width / width
@@ -0,0 +1,123 @@
+"""
+Authenticated user cache for get_current_user.
+
+Every authenticated request resolves its access token to a User row. Polling
+clients repeat that primary key lookup every few seconds, so the column
+values of recently seen active users are kept in a small per-process LRU with
+a short TTL, and get_current_user attaches them to the request session
+without a query (Session.merge(load=False)).
+
+Entries are evicted when a transaction that updated or deleted the user
+commits (password, role, deactivation, ... see
+src/models/cache_invalidation.py). Changes committed by another process are
+seen after at most settings.user_cache_ttl_seconds.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from src.config import settings
+from src.models.user import User
+
+
+class UserCache:
+    """LRU with TTL of user column values, keyed by user ID."""
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: int = 10):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # user_id -> (expires_at monotonic, column values)
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: str) -> dict[str, Any] | None:
+        """Return the cached column values of a user, or None on miss."""
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[user_id]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, user: User) -> None:
+        """Cache the column values of a loaded user."""
+        values = {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+        self._entries[user.id] = (time.monotonic() + self.ttl_seconds, values)
+        self._entries.move_to_end(user.id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def evict(self, *user_ids: str) -> None:
+        """Drop users from the cache."""
+        for user_id in user_ids:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters and current size."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+async def attach_cached_user(db: AsyncSession, values: dict[str, Any]) -> User:
+    """
+    Attach a cached user to a session without querying the database.
+
+    Args:
+        db: Request database session
+        values: Column values from UserCache.get()
+
+    Returns:
+        Persistent User instance of the session (relationships load lazily)
+    """
+    # Already loaded by this session: keep its (possibly newer) state
+    key = inspect(User).identity_key_from_primary_key((values["id"],))
+    existing = db.identity_map.get(key)
+    if existing is not None:
+        return existing
+
+    user = User(**values)
+    make_transient_to_detached(user)
+    return await db.merge(user, load=False)
+
+
+_cache: UserCache | None = None
+
+
+def get_user_cache() -> UserCache | None:
+    """
+    Return the process-wide user cache configured from settings.
+
+    Returns:
+        Shared cache instance, or None if disabled (TTL 0)
+    """
+    global _cache
+
+    if settings.user_cache_ttl_seconds == 0:
+        return None
+
+    if _cache is None:
+        _cache = UserCache(
+            max_entries=settings.user_cache_max_entries,
+            ttl_seconds=settings.user_cache_ttl_seconds,
+        )
+    return _cache
+
+
+def evict_users(*user_ids: str) -> None:
+    """Evict users from the process-wide cache (no-op if disabled)."""
+    if _cache is not None and user_ids:
+        _cache.evict(*user_ids)
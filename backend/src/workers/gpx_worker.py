@@ -0,0 +1,119 @@
+"""
+GPX processing worker (Feature 003).
+
+Processes large GPX uploads queued by the API in the gpx_jobs table
+(see GPXJobService). Run one or more workers next to the API server:
+
+    python -m src.workers.gpx_worker
+    python -m src.workers.gpx_worker --once          # drain the queue and exit
+    python -m src.workers.gpx_worker --worker-id gpx-1 --poll-interval 5
+
+Workers share nothing but the database and the storage directory, so they
+can run on other hosts and be restarted at any time: a job leased by a
+worker that dies is picked up again once its lease expires.
+
+By default the API also runs a worker loop in-process (GPX_WORKER_EMBEDDED,
+on by default), so no extra service is needed. Deployments that run
+dedicated workers can set GPX_WORKER_EMBEDDED=false.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+
+from src.config import settings
+from src.database import AsyncSessionLocal
+from src.services.gpx_job_service import GPXJobService
+from src.utils.gpx_executor import shutdown_gpx_executor
+
+logger = logging.getLogger(__name__)
+
+
+def default_worker_id() -> str:
+    """Worker identifier stored on leased jobs (hostname:pid)."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+async def run_worker(
+    worker_id: str,
+    poll_interval: float,
+    stop_event: asyncio.Event,
+    once: bool = False,
+) -> int:
+    """
+    Process queued GPX jobs until stopped.
+
+    Args:
+        worker_id: Identifier stored on leased jobs
+        poll_interval: Seconds to wait when the queue is empty
+        stop_event: Set to stop after the current job
+        once: Exit as soon as the queue is empty
+
+    Returns:
+        Number of jobs processed
+    """
+    processed = 0
+    logger.info(f"GPX worker {worker_id} started")
+
+    while not stop_event.is_set():
+        try:
+            async with AsyncSessionLocal() as db:
+                had_job = await GPXJobService(db).run_next(worker_id)
+        except Exception as e:
+            # Database unavailable or similar: keep the worker alive and retry later
+            logger.error(f"GPX worker {worker_id} error: {e}", exc_info=True)
+            had_job = False
+
+        if had_job:
+            processed += 1
+            continue
+        if once:
+            break
+
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=poll_interval)
+        except TimeoutError:
+            pass
+
+    logger.info(f"GPX worker {worker_id} stopped after {processed} jobs")
+    return processed
+
+
+async def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Process queued GPX uploads")
+    parser.add_argument("--worker-id", default=default_worker_id(), help="Worker identifier")
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=settings.gpx_job_poll_seconds,
+        help="Seconds between queue polls when idle",
+    )
+    parser.add_argument("--once", action="store_true", help="Exit when the queue is empty")
+    args = parser.parse_args(argv)
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:
+            # Windows: Ctrl+C raises KeyboardInterrupt instead
+            pass
+
+    try:
+        await run_worker(args.worker_id, args.poll_interval, stop_event, once=args.once)
+    finally:
+        shutdown_gpx_executor()
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=getattr(logging, settings.log_level.upper(), logging.INFO),
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    raise SystemExit(asyncio.run(main()))
@@ -48,6 +48,7 @@ from sqlalchemy.pool import StaticPool
 from src.main import app
 
 if TYPE_CHECKING:
+    from src.models.gpx import GPXFile
     from src.models.user import User
 
 # Configure pytest-asyncio and load Feature 013 fixtures
@@ -91,6 +92,7 @@ async def db_engine():
     """
     # Import Base here (after load_test_env has run)
     from src.database import Base
+    from src.services.cycling_type_registry import cycling_type_registry
 
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
@@ -103,6 +105,9 @@ async def db_engine():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+    # Registry versions restart with every database
+    cycling_type_registry.invalidate()
+
     yield engine
 
     # Drop all tables
@@ -434,6 +439,75 @@ def load_json_fixture(fixtures_dir):
     return _load
 
 
+@pytest.fixture(scope="function")
+async def gpx_file_record(db_session: AsyncSession, tmp_path: Path) -> "GPXFile":
+    """
+    Provide a GPX file record in "processing" state (async upload path).
+
+    The original file (camino_del_cid.gpx) is copied to tmp_path, so tests
+    may overwrite or delete it.
+
+    Args:
+        db_session: Database session
+        tmp_path: Per-test temporary directory
+
+    Returns:
+        GPXFile instance (owned by a draft trip)
+    """
+    import shutil
+    from datetime import date
+
+    from src.models.gpx import GPXFile
+    from src.models.trip import Trip, TripStatus
+    from src.models.user import User
+
+    user = User(
+        username="gpx_worker_user",
+        email="gpx_worker@example.com",
+        hashed_password="hashed",
+        is_verified=True,
+    )
+    db_session.add(user)
+    await db_session.flush()
+
+    trip = Trip(
+        user_id=user.id,
+        title="Ruta en cola",
+        description="Viaje con GPX procesado en segundo plano",
+        start_date=date(2024, 6, 1),
+        status=TripStatus.DRAFT,
+    )
+    db_session.add(trip)
+    await db_session.flush()
+
+    file_path = tmp_path / "original.gpx"
+    shutil.copy(Path(__file__).parent / "fixtures" / "gpx" / "camino_del_cid.gpx", file_path)
+
+    record = GPXFile(
+        trip_id=trip.trip_id,
+        file_url=str(file_path),
+        file_size=file_path.stat().st_size,
+        file_name="camino_del_cid.gpx",
+        distance_km=0.0,
+        elevation_gain=0.0,
+        elevation_loss=0.0,
+        max_elevation=0.0,
+        min_elevation=0.0,
+        start_lat=0.0,
+        start_lon=0.0,
+        end_lat=0.0,
+        end_lon=0.0,
+        total_points=0,
+        simplified_points=0,
+        has_elevation=False,
+        has_timestamps=False,
+        processing_status="processing",
+    )
+    db_session.add(record)
+    await db_session.commit()
+    return record
+
+
 # Pytest configuration
 def pytest_configure(config):
     """Configure pytest with custom markers."""
@@ -69,6 +69,46 @@ class TestPublicCyclingTypesEndpoint:
         # Assert - should not return 401
         assert response.status_code in [200, 404]  # 200 if types exist, 404 if not
 
+    async def test_get_cycling_types_cached_with_etag(
+        self, client: AsyncClient, db_session: AsyncSession, monkeypatch
+    ):
+        """Test that GET /cycling-types answers 304 until a cycling type is written."""
+        # Arrange: enable a fresh response cache
+        from src.config import settings
+        from src.utils import response_cache
+
+        monkeypatch.setattr(settings, "response_cache_enabled", True)
+        monkeypatch.setattr(settings, "response_cache_backend", "memory")
+        monkeypatch.setattr(response_cache, "_cache", None)
+
+        db_session.add(
+            CyclingType(
+                code="road", display_name="Road", description="Road cycling", is_active=True
+            )
+        )
+        await db_session.commit()
+
+        # Act
+        first = await client.get("/cycling-types")
+        etag = first.headers["etag"]
+        revalidated = await client.get("/cycling-types", headers={"If-None-Match": etag})
+
+        # Assert
+        assert first.status_code == 200
+        assert revalidated.status_code == 304
+
+        # Act: a committed write invalidates the cached response
+        db_session.add(
+            CyclingType(code="gravel", display_name="Gravel", description="Gravel", is_active=True)
+        )
+        await db_session.commit()
+        changed = await client.get("/cycling-types", headers={"If-None-Match": etag})
+
+        # Assert
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert {item["code"] for item in changed.json()} == {"road", "gravel"}
+
 
 @pytest.mark.integration
 @pytest.mark.asyncio
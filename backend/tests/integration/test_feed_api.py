@@ -463,3 +463,57 @@ async def test_feed_pagination_no_duplicates(
             f"Sequential algorithm violated: followed trips should appear before community trips. "
             f"Last user1 at index {last_user1_index}, first user2 at index {first_user2_index}"
         )
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_get_feed_cursor_mode(client: AsyncClient, auth_headers: dict):
+    """
+    Test GET /feed?cursor= (keyset pagination).
+
+    - Empty cursor returns the first page with next_cursor
+    - total_count and page are null in cursor mode
+    - Malformed cursor returns 400
+    """
+    response = await client.get("/feed?cursor=&limit=5", headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["limit"] == 5
+    assert data["total_count"] is None
+    assert data["page"] is None
+    assert isinstance(data["has_more"], bool)
+    assert (data["next_cursor"] is not None) == data["has_more"]
+
+    response = await client.get("/feed?cursor=garbage", headers=auth_headers)
+
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "INVALID_CURSOR"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_get_trending_feed(client: AsyncClient, auth_headers: dict):
+    """
+    Test GET /feed/trending (community ranking, keyset pagination).
+
+    - Both rankings return cursor-mode responses
+    - Unknown ranking and malformed cursor return 400
+    """
+    for ranking in ("hot", "popular"):
+        response = await client.get(
+            f"/feed/trending?ranking={ranking}&limit=5", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["limit"] == 5
+        assert data["total_count"] is None
+        assert (data["next_cursor"] is not None) == data["has_more"]
+
+    response = await client.get("/feed/trending?ranking=newest", headers=auth_headers)
+    assert response.status_code == 400
+
+    response = await client.get("/feed/trending?cursor=garbage", headers=auth_headers)
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "INVALID_CURSOR"
@@ -6,6 +6,7 @@ Functional Requirements: FR-001 to FR-008, FR-036, FR-039
 Success Criteria: SC-002, SC-003
 """
 
+import math
 from io import BytesIO
 from pathlib import Path
 
@@ -496,3 +497,192 @@ class TestGPXTrackEndpoint:
         assert -180 <= start_point["longitude"] <= 180
         assert -90 <= end_point["latitude"] <= 90
         assert -180 <= end_point["longitude"] <= 180
+
+    async def test_get_track_points_blob_storage(
+        self, client: AsyncClient, auth_headers: dict, db_session: AsyncSession, monkeypatch
+    ):
+        """
+        Test GET /gpx/{gpx_file_id}/track with GPX_TRACK_STORAGE=blob.
+
+        The track is stored packed in gpx_files.track_blob (no track_points rows)
+        and the endpoint returns the same response shape.
+        """
+        from sqlalchemy import func, select
+
+        from src.config import settings
+        from src.models.gpx import TrackPoint
+
+        monkeypatch.setattr(settings, "gpx_track_storage", "blob")
+
+        # Step 1: Create trip and upload GPX
+        payload = {
+            "title": "Ruta con Track Compacto",
+            "description": "Test de almacenamiento compacto de puntos de track",
+            "start_date": "2024-06-01",
+        }
+
+        create_response = await client.post("/trips", json=payload, headers=auth_headers)
+        trip_id = create_response.json()["data"]["trip_id"]
+
+        fixtures_dir = Path(__file__).parent.parent / "fixtures" / "gpx"
+        gpx_path = fixtures_dir / "short_route.gpx"
+
+        with open(gpx_path, "rb") as f:
+            files = {"file": ("short_route.gpx", f, "application/gpx+xml")}
+            upload_response = await client.post(
+                f"/trips/{trip_id}/gpx", files=files, headers=auth_headers
+            )
+
+        gpx_file_id = upload_response.json()["data"]["gpx_file_id"]
+
+        # Assert no rows were written
+        row_count = await db_session.scalar(
+            select(func.count())
+            .select_from(TrackPoint)
+            .where(TrackPoint.gpx_file_id == gpx_file_id)
+        )
+        assert row_count == 0
+
+        # Step 2: Get track points
+        track_response = await client.get(f"/gpx/{gpx_file_id}/track")
+
+        assert track_response.status_code == 200
+        data = track_response.json()["data"]
+        trackpoints = data["trackpoints"]
+        assert len(trackpoints) == data["simplified_points_count"] > 0
+        assert [point["sequence"] for point in trackpoints] == list(range(len(trackpoints)))
+        assert len({point["point_id"] for point in trackpoints}) == len(trackpoints)
+        assert trackpoints[0]["elevation"] is not None
+
+    @pytest.mark.parametrize("storage", ["rows", "blob"])
+    async def test_get_track_compact_formats(
+        self, client: AsyncClient, auth_headers: dict, monkeypatch, storage: str
+    ):
+        """
+        Test GET /gpx/{gpx_file_id}/track?format=columnar|polyline|binary.
+
+        Compact formats carry the same track and metadata as the default JSON.
+        """
+        import numpy as np
+
+        from src.config import settings
+        from src.utils.track_formats import decode_binary_track, decode_polyline
+
+        monkeypatch.setattr(settings, "gpx_track_storage", storage)
+
+        payload = {
+            "title": "Ruta con Formatos Compactos",
+            "description": "Test de formatos compactos del endpoint de track",
+            "start_date": "2024-06-01",
+        }
+        create_response = await client.post("/trips", json=payload, headers=auth_headers)
+        trip_id = create_response.json()["data"]["trip_id"]
+
+        gpx_path = Path(__file__).parent.parent / "fixtures" / "gpx" / "short_route.gpx"
+        with open(gpx_path, "rb") as f:
+            files = {"file": ("short_route.gpx", f, "application/gpx+xml")}
+            upload_response = await client.post(
+                f"/trips/{trip_id}/gpx", files=files, headers=auth_headers
+            )
+        gpx_file_id = upload_response.json()["data"]["gpx_file_id"]
+
+        reference = (await client.get(f"/gpx/{gpx_file_id}/track")).json()["data"]
+        trackpoints = reference.pop("trackpoints")
+        latitudes = [point["latitude"] for point in trackpoints]
+        longitudes = [point["longitude"] for point in trackpoints]
+        elevations = [point["elevation"] for point in trackpoints]
+
+        # Columnar: parallel arrays, same values
+        columnar_response = await client.get(f"/gpx/{gpx_file_id}/track?format=columnar")
+        assert columnar_response.status_code == 200
+        data = columnar_response.json()["data"]
+        track = data.pop("track")
+        assert data.pop("format") == "columnar"
+        assert data == reference
+        assert track["latitude"] == pytest.approx(latitudes)
+        assert track["longitude"] == pytest.approx(longitudes)
+        assert track["elevation"] == pytest.approx(elevations)
+        assert track["distance_km"] == [point["distance_km"] for point in trackpoints]
+
+        # Polyline: coordinates within the 1e-5 degree precision
+        polyline_response = await client.get(f"/gpx/{gpx_file_id}/track?format=polyline")
+        assert polyline_response.status_code == 200
+        track = polyline_response.json()["data"]["track"]
+        assert track["polyline_precision"] == 5
+        decoded = np.array(decode_polyline(track["polyline"]))
+        np.testing.assert_allclose(decoded[:, 0], latitudes, atol=1e-5)
+        np.testing.assert_allclose(decoded[:, 1], longitudes, atol=1e-5)
+        assert track["elevation"] == pytest.approx(elevations)
+
+        # Binary: selected by format or by Accept header
+        for binary_response in (
+            await client.get(f"/gpx/{gpx_file_id}/track?format=binary"),
+            await client.get(
+                f"/gpx/{gpx_file_id}/track", headers={"Accept": "application/octet-stream"}
+            ),
+        ):
+            assert binary_response.status_code == 200
+            assert binary_response.headers["content-type"] == "application/octet-stream"
+            metadata, columns = decode_binary_track(binary_response.content)
+            assert metadata == reference
+            np.testing.assert_allclose(columns["latitude"], latitudes, atol=1e-5)
+            np.testing.assert_allclose(columns["longitude"], longitudes, atol=1e-5)
+
+        invalid_response = await client.get(f"/gpx/{gpx_file_id}/track?format=xml")
+        assert invalid_response.status_code in (400, 422)
+
+    async def test_get_track_level_of_detail(self, client: AsyncClient, auth_headers: dict):
+        """
+        Test GET /gpx/{gpx_file_id}/track?zoom=N and ?max_points=N.
+
+        Low zoom levels and small point budgets get a coarser tier of the same route.
+        """
+        payload = {
+            "title": "Ruta con Niveles de Detalle",
+            "description": "Test de niveles de detalle del endpoint de track",
+            "start_date": "2024-06-01",
+        }
+        create_response = await client.post("/trips", json=payload, headers=auth_headers)
+        trip_id = create_response.json()["data"]["trip_id"]
+
+        # Winding 600-point route (small enough for synchronous processing)
+        trackpoints = "".join(
+            f'<trkpt lat="{40 + i * 0.0005:.6f}" lon="{-3 + 0.01 * math.sin(i / 15):.6f}">'
+            f"<ele>{700 + 50 * math.sin(i / 40):.1f}</ele></trkpt>"
+            for i in range(600)
+        )
+        gpx_content = (
+            '<?xml version="1.0"?>'
+            '<gpx xmlns="http://www.topografix.com/GPX/1/1" version="1.1">'
+            f"<trk><trkseg>{trackpoints}</trkseg></trk></gpx>"
+        ).encode()
+        files = {"file": ("winding_route.gpx", BytesIO(gpx_content), "application/gpx+xml")}
+        upload_response = await client.post(
+            f"/trips/{trip_id}/gpx", files=files, headers=auth_headers
+        )
+        assert upload_response.status_code == 201
+        gpx_file_id = upload_response.json()["data"]["gpx_file_id"]
+
+        detail = (await client.get(f"/gpx/{gpx_file_id}/track")).json()["data"]
+        assert detail["tier"] == "detail"
+
+        overview_response = await client.get(f"/gpx/{gpx_file_id}/track?zoom=8")
+        assert overview_response.status_code == 200
+        overview = overview_response.json()["data"]
+        assert overview["tier"] == "overview"
+        assert 2 <= len(overview["trackpoints"]) == overview["simplified_points_count"]
+        assert len(overview["trackpoints"]) < len(detail["trackpoints"])
+        assert overview["trackpoints"][0]["latitude"] == detail["trackpoints"][0]["latitude"]
+        assert (
+            overview["trackpoints"][-1]["distance_km"] == detail["trackpoints"][-1]["distance_km"]
+        )
+
+        budget_response = await client.get(f"/gpx/{gpx_file_id}/track?format=columnar&max_points=2")
+        assert budget_response.status_code == 200
+        assert budget_response.json()["data"]["tier"] == "overview"
+
+        full_response = await client.get(f"/gpx/{gpx_file_id}/track?zoom=18&max_points=100000")
+        assert full_response.json()["data"]["tier"] == "detail"
+
+        invalid_response = await client.get(f"/gpx/{gpx_file_id}/track?zoom=40")
+        assert invalid_response.status_code in (400, 422)
@@ -333,3 +333,41 @@ class TestGPXAnalyzeEndpoint:
 
         # Performance assertion: <2 seconds
         assert elapsed_time < 2.0, f"Performance requirement failed: {elapsed_time:.2f}s (max 2s)"
+
+    async def test_analyze_gpx_pool_saturated(
+        self, client: AsyncClient, auth_headers: dict, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Test backpressure when the GPX process pool is saturated.
+
+        Given: GPX executor with no free slots
+        When: POST /gpx/analyze with a file not in the analysis cache
+        Then: Returns 503 GPX_PROCESSING_BUSY with Retry-After header
+        """
+        import uuid
+
+        from src.services import gpx_service as gpx_service_module
+        from src.utils.gpx_executor import GPXProcessExecutor
+
+        busy_executor = GPXProcessExecutor(max_workers=0, max_pending=1)
+        busy_executor._pending = 1
+        monkeypatch.setattr(gpx_service_module, "get_gpx_executor", lambda: busy_executor)
+
+        # Unique content so the analysis cache cannot answer
+        gpx_content = f"""<?xml version="1.0" encoding="UTF-8"?>
+<gpx version="1.1" creator="{uuid.uuid4()}" xmlns="http://www.topografix.com/GPX/1/1">
+  <trk><trkseg>
+    <trkpt lat="40.0" lon="-3.0"><ele>650</ele></trkpt>
+    <trkpt lat="40.01" lon="-3.0"><ele>700</ele></trkpt>
+  </trkseg></trk>
+</gpx>""".encode()
+
+        files = {"file": ("route.gpx", io.BytesIO(gpx_content), "application/gpx+xml")}
+        response = await client.post("/gpx/analyze", headers=auth_headers, files=files)
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "5"
+        data = response.json()
+        assert data["success"] is False
+        assert data["error"]["code"] == "GPX_PROCESSING_BUSY"
+        assert busy_executor.rejected == 1
@@ -145,6 +145,61 @@ class TestPhotoUploadWorkflow:
             assert photo["id"] == photo_ids[i]
             assert photo["order"] == i
 
+    async def test_photo_variant_rendered_on_demand(
+        self, client: AsyncClient, auth_headers: dict, monkeypatch, tmp_path
+    ):
+        """
+        Test on-demand photo variants.
+
+        Steps:
+        1. Upload a photo with eager variants disabled
+        2. Request a 320px WebP variant (rendered and cached)
+        3. Request a width that is not offered (400)
+        """
+        from src.config import settings
+        from src.utils import photo_variant_cache
+
+        monkeypatch.setattr(settings, "photo_variants_on_upload", False)
+        monkeypatch.setattr(
+            photo_variant_cache,
+            "_cache",
+            photo_variant_cache.PhotoVariantCache(tmp_path, max_bytes=10 * 1024 * 1024),
+        )
+
+        # Step 1: Upload photo
+        payload = {
+            "title": "Variant Trip",
+            "description": "Viaje para probar variantes de fotos generadas bajo demanda",
+            "start_date": "2024-05-15",
+        }
+        create_response = await client.post("/trips", json=payload, headers=auth_headers)
+        assert create_response.status_code == 201
+        trip_id = create_response.json()["data"]["trip_id"]
+
+        img_bytes = BytesIO()
+        Image.new("RGB", (800, 600), color="red").save(img_bytes, format="JPEG")
+        img_bytes.seek(0)
+        files = {"photo": ("test.jpg", img_bytes, "image/jpeg")}
+        upload_response = await client.post(
+            f"/trips/{trip_id}/photos", files=files, headers=auth_headers
+        )
+        photo = upload_response.json()["data"]
+        assert photo["variants"] == []
+
+        # Step 2: Request variant
+        url = f"/trips/{trip_id}/photos/{photo['id']}/variant"
+        response = await client.get(url, params={"width": 320, "format": "webp"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/webp"
+        assert "immutable" in response.headers["cache-control"]
+        assert Image.open(BytesIO(response.content)).size == (320, 240)
+        assert list(tmp_path.glob(f"*/{photo['id']}_320w.webp"))
+
+        # Step 3: Width not offered
+        response = await client.get(url, params={"width": 333, "format": "webp"})
+        assert response.status_code == 400
+
     async def test_upload_photo_updates_stats_on_published_trip(
         self, client: AsyncClient, auth_headers: dict, db_session: AsyncSession
     ):
@@ -4,7 +4,7 @@ Unit tests for AuthService business logic.
 Tests the authentication service layer methods.
 """
 
-from datetime import datetime
+from datetime import UTC, datetime
 from unittest.mock import patch
 
 import pytest
@@ -266,6 +266,92 @@ class TestAuthServiceRefreshToken:
         pytest.skip("TODO: Implement after token creation helpers")
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAuthServiceRefreshTokenLookup:
+    """Unit tests for refresh token records (jti lookup, HMAC digest, legacy bcrypt)."""
+
+    @pytest.fixture
+    async def user(self, db_session: AsyncSession):
+        """Active, verified user."""
+        from src.models.user import User
+
+        user = User(
+            username="refresher",
+            email="refresher@example.com",
+            hashed_password="hash",
+            is_verified=True,
+            is_active=True,
+        )
+        db_session.add(user)
+        await db_session.commit()
+        return user
+
+    async def test_each_device_token_refreshes_once(self, db_session: AsyncSession, user):
+        """Verify that tokens of several devices are found by jti and rotated independently."""
+        # Arrange
+        auth_service = AuthService(db_session)
+        phone_token = auth_service._issue_refresh_token(user)
+        laptop_token = auth_service._issue_refresh_token(user)
+        await db_session.commit()
+
+        # Act
+        with patch("src.services.auth_service.verify_password_async") as bcrypt_verify:
+            refreshed = await auth_service.refresh_token(laptop_token)
+            await auth_service.refresh_token(phone_token)
+
+        # Assert: no bcrypt verification, old token rotated out
+        bcrypt_verify.assert_not_called()
+        assert refreshed.refresh_token != laptop_token
+        with pytest.raises(ValueError):
+            await auth_service.refresh_token(laptop_token)
+        await auth_service.refresh_token(refreshed.refresh_token)
+
+    async def test_legacy_bcrypt_token_still_refreshes(self, db_session: AsyncSession, user):
+        """Verify that tokens stored before jti claims (bcrypt records) keep working."""
+        # Arrange
+        from src.models.auth import PasswordReset
+        from src.utils.security import create_refresh_token, hash_password
+
+        legacy_token = create_refresh_token({"sub": user.id})
+        db_session.add(
+            PasswordReset(
+                user_id=user.id,
+                token_hash=hash_password(legacy_token),
+                token_type="refresh_token",
+                expires_at=datetime(2099, 1, 1, tzinfo=UTC),
+            )
+        )
+        await db_session.commit()
+        auth_service = AuthService(db_session)
+
+        # Act
+        refreshed = await auth_service.refresh_token(legacy_token)
+
+        # Assert: the new token is a jti token
+        from src.utils.security import decode_token
+
+        assert decode_token(refreshed.refresh_token)["jti"]
+        with pytest.raises(ValueError):
+            await auth_service.refresh_token(legacy_token)
+
+    async def test_logout_revokes_only_its_token(self, db_session: AsyncSession, user):
+        """Verify that logout on one device leaves the other devices logged in."""
+        # Arrange
+        auth_service = AuthService(db_session)
+        phone_token = auth_service._issue_refresh_token(user)
+        laptop_token = auth_service._issue_refresh_token(user)
+        await db_session.commit()
+
+        # Act
+        await auth_service.logout(phone_token)
+
+        # Assert
+        with pytest.raises(ValueError):
+            await auth_service.refresh_token(phone_token)
+        await auth_service.refresh_token(laptop_token)
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 class TestAuthServiceLogout:
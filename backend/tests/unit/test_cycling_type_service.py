@@ -380,3 +380,63 @@ class TestCyclingTypeServiceGetActiveCodes:
 
         # Assert
         assert result == set()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCyclingTypeRegistry:
+    """Unit tests for the in-memory cycling type registry."""
+
+    async def test_lookups_served_from_memory_until_version_changes(
+        self, db_session: AsyncSession, monkeypatch
+    ):
+        """Verify that the registry reloads only when the shared version changes."""
+        # Arrange
+        from src.config import settings
+        from src.services.cycling_type_registry import cycling_type_registry
+
+        monkeypatch.setattr(settings, "cycling_type_registry_check_seconds", 0)
+        service = CyclingTypeService(db_session)
+        db_session.add(CyclingType(code="mountain", display_name="Mountain", is_active=True))
+        await db_session.commit()
+
+        # Act
+        first = await cycling_type_registry.get(db_session)
+        second = await cycling_type_registry.get(db_session)
+
+        # Assert: same snapshot, no reload
+        assert second is first
+        assert await service.get_active_codes() == {"mountain"}
+
+        # Act: a write outside the service bumps the version
+        db_session.add(CyclingType(code="road", display_name="Road", is_active=True))
+        await db_session.commit()
+        third = await cycling_type_registry.get(db_session)
+
+        # Assert
+        assert third.version == first.version + 1
+        assert await service.get_active_codes() == {"mountain", "road"}
+
+    async def test_admin_changes_refresh_registry(self, db_session: AsyncSession, monkeypatch):
+        """Verify that create/delete refresh the registry without waiting for a version check."""
+        # Arrange
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "cycling_type_registry_check_seconds", 3600)
+        service = CyclingTypeService(db_session)
+        assert await service.get_active_codes() == set()
+
+        # Act
+        await service.create(
+            CyclingTypeCreateRequest(code="gravel", display_name="Gravel", is_active=True)
+        )
+
+        # Assert
+        assert await service.get_active_codes() == {"gravel"}
+        assert [ct.code for ct in await service.get_all_public()] == ["gravel"]
+
+        # Act
+        await service.delete("gravel")
+
+        # Assert
+        assert await service.get_active_codes() == set()
@@ -547,3 +547,218 @@ async def test_feed_includes_is_liked_by_me_flag(db_session: AsyncSession):
         feed_item = result["trips"][0]
         assert "is_liked_by_me" in feed_item
         assert isinstance(feed_item["is_liked_by_me"], bool)
+
+
+@pytest.mark.asyncio
+async def test_feed_cursor_pagination_matches_page_order(db_session: AsyncSession):
+    """
+    Test cursor mode walks own, followed and community trips in page-mode order.
+
+    Cursor pages must not repeat or skip trips across bucket boundaries, and
+    must not run COUNT queries (total_count/page are not returned).
+    """
+    from src.models.like import Like
+
+    user = User(id="user1", username="john", email="john@example.com", hashed_password="hash")
+    followed_user = User(
+        id="user2", username="maria", email="maria@example.com", hashed_password="hash"
+    )
+    community_user = User(
+        id="user3", username="pedro", email="pedro@example.com", hashed_password="hash"
+    )
+    follow = Follow(id=str(uuid.uuid4()), follower_id=user.id, following_id=followed_user.id)
+
+    trips = []
+    base_published_at = datetime(2024, 6, 10, 10, 0, 0, tzinfo=UTC)
+    for index, (owner, count) in enumerate(((user, 2), (followed_user, 4), (community_user, 5))):
+        for i in range(count):
+            trips.append(
+                Trip(
+                    trip_id=f"trip{index}{i}",
+                    user_id=owner.id,
+                    title=f"Trip {index}-{i}",
+                    description="Description",
+                    start_date=datetime(2024, 6, 1).date(),
+                    status=TripStatus.PUBLISHED,
+                    published_at=base_published_at + timedelta(hours=10 * index + i),
+                )
+            )
+
+    # Popular community trips come first in the community bucket
+    likes = [
+        Like(id=str(uuid.uuid4()), user_id=user.id, trip_id="trip20"),
+        Like(id=str(uuid.uuid4()), user_id=followed_user.id, trip_id="trip20"),
+        Like(id=str(uuid.uuid4()), user_id=user.id, trip_id="trip23"),
+    ]
+
+    db_session.add_all([user, followed_user, community_user, follow] + trips)
+    await db_session.flush()
+    db_session.add_all(likes)
+    await db_session.commit()
+
+    expected = await FeedService.get_personalized_feed(
+        db=db_session, user_id=user.id, page=1, limit=50
+    )
+    expected_ids = [trip["trip_id"] for trip in expected["trips"]]
+    assert len(expected_ids) == 11
+
+    # Walk the feed 3 trips at a time
+    seen_ids = []
+    cursor = ""
+    while True:
+        result = await FeedService.get_personalized_feed_cursor(
+            db=db_session, user_id=user.id, cursor=cursor, limit=3
+        )
+        assert "total_count" not in result
+        seen_ids.extend(trip["trip_id"] for trip in result["trips"])
+        if not result["has_more"]:
+            assert result["next_cursor"] is None
+            break
+        assert len(result["trips"]) == 3
+        cursor = result["next_cursor"]
+
+    assert seen_ids == expected_ids
+    assert seen_ids[:2] == ["trip01", "trip00"]  # Own trips first
+    assert seen_ids[6:8] == ["trip20", "trip23"]  # Most liked community trips
+
+
+@pytest.mark.asyncio
+async def test_feed_cursor_rejects_malformed_cursor(db_session: AsyncSession):
+    """Test that a tampered or garbage cursor raises ValueError."""
+    user = User(id="user1", username="john", email="john@example.com", hashed_password="hash")
+    db_session.add(user)
+    await db_session.commit()
+
+    for cursor in ("not-a-cursor", "eyJiIjoib3RoZXIifQ"):
+        with pytest.raises(ValueError, match="Cursor"):
+            await FeedService.get_personalized_feed_cursor(
+                db=db_session, user_id=user.id, cursor=cursor
+            )
+
+
+@pytest.mark.asyncio
+async def test_trip_ranking_follows_trip_and_interactions(db_session: AsyncSession):
+    """
+    Test trip_rankings rows are kept in step with trips and their interactions.
+
+    Published public trips are ranked on insert, re-scored on like/unlike and
+    dropped when made private or deleted.
+    """
+    from src.models.like import Like
+    from src.models.trip_ranking import TripRanking
+
+    author = User(id="user1", username="john", email="john@example.com", hashed_password="hash")
+    fan = User(id="user2", username="maria", email="maria@example.com", hashed_password="hash")
+    trip = Trip(
+        trip_id="trip1",
+        user_id=author.id,
+        title="Ranked Trip",
+        description="Description",
+        start_date=datetime(2024, 6, 1).date(),
+        status=TripStatus.PUBLISHED,
+        published_at=datetime(2024, 6, 10, 10, 0, 0, tzinfo=UTC),
+    )
+    draft = Trip(
+        trip_id="trip2",
+        user_id=author.id,
+        title="Draft Trip",
+        description="Description",
+        start_date=datetime(2024, 6, 1).date(),
+        status=TripStatus.DRAFT,
+    )
+    db_session.add_all([author, fan, trip, draft])
+    await db_session.commit()
+
+    async def ranking(trip_id: str) -> TripRanking | None:
+        db_session.expire_all()
+        return await db_session.get(TripRanking, trip_id)
+
+    assert await ranking("trip2") is None
+    unliked_hot_score = (await ranking("trip1")).hot_score
+
+    like_id = str(uuid.uuid4())
+    db_session.add(Like(id=like_id, user_id="user2", trip_id="trip1"))
+    await db_session.commit()
+    assert (await ranking("trip1")).score == 1
+
+    trip = await db_session.get(Trip, "trip1")
+    trip.is_private = True
+    await db_session.commit()
+    assert await ranking("trip1") is None
+
+    trip.is_private = False
+    await db_session.commit()
+    assert (await ranking("trip1")).score == 1
+
+    await db_session.delete(await db_session.get(Like, like_id))
+    await db_session.commit()
+    rank = await ranking("trip1")
+    assert rank.score == 0
+    assert rank.hot_score == unliked_hot_score
+
+    await db_session.delete(await db_session.get(Trip, "trip1"))
+    await db_session.commit()
+    assert await ranking("trip1") is None
+
+
+@pytest.mark.asyncio
+async def test_get_trending_trips_keyset_pages(db_session: AsyncSession):
+    """
+    Test get_trending_trips pages the hot and popular rankings by cursor.
+
+    Popular orders by interactions; hot lets a newer trip outrank an older,
+    slightly more liked one. Pages never repeat or skip trips.
+    """
+    from src.models.like import Like
+
+    users = [
+        User(id=f"user{i}", username=f"user{i}", email=f"u{i}@example.com", hashed_password="h")
+        for i in range(4)
+    ]
+    base_published_at = datetime(2024, 6, 1, 10, 0, 0, tzinfo=UTC)
+    trips = [
+        Trip(
+            trip_id=f"trip{i}",
+            user_id=users[0].id,
+            title=f"Trip {i}",
+            description="Description",
+            start_date=datetime(2024, 6, 1).date(),
+            status=TripStatus.PUBLISHED,
+            published_at=base_published_at + timedelta(days=i),
+        )
+        for i in range(5)
+    ]
+    # trip0 (oldest): 3 likes, trip4 (newest): 2 likes, the rest: none
+    likes = [
+        Like(id=str(uuid.uuid4()), user_id=user.id, trip_id=trip_id)
+        for trip_id, likers in (("trip0", users[1:]), ("trip4", users[1:3]))
+        for user in likers
+    ]
+    db_session.add_all(users + trips)
+    await db_session.flush()
+    db_session.add_all(likes)
+    await db_session.commit()
+
+    async def walk(ranking: str) -> list[str]:
+        seen_ids, cursor = [], ""
+        while True:
+            result = await FeedService.get_trending_trips(
+                db=db_session, user_id=users[1].id, ranking=ranking, cursor=cursor, limit=2
+            )
+            seen_ids.extend(trip["trip_id"] for trip in result["trips"])
+            if not result["has_more"]:
+                assert result["next_cursor"] is None
+                return seen_ids
+            cursor = result["next_cursor"]
+
+    assert await walk("popular") == ["trip0", "trip4", "trip3", "trip2", "trip1"]
+    assert await walk("hot") == ["trip4", "trip3", "trip2", "trip1", "trip0"]
+
+    # A cursor only continues the ranking it was issued for
+    first_page = await FeedService.get_trending_trips(
+        db=db_session, user_id=users[1].id, ranking="hot", limit=2
+    )
+    with pytest.raises(ValueError, match="Cursor"):
+        await FeedService.get_trending_trips(
+            db=db_session, user_id=users[1].id, ranking="popular", cursor=first_page["next_cursor"]
+        )
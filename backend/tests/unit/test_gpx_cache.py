@@ -0,0 +1,164 @@
+"""
+Unit tests for the content-addressed GPX analysis cache.
+
+Tests LRU/TTL eviction, the on-disk tier, and GPXService cache lookups.
+"""
+
+import pickle
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.services.gpx_service import GPXService
+from src.utils import gpx_cache as gpx_cache_module
+from src.utils.gpx_cache import GPXAnalysisCache, gpx_digest
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "gpx"
+
+
+@pytest.mark.unit
+class TestGPXAnalysisCache:
+    """Tests for GPXAnalysisCache."""
+
+    def test_key_depends_on_content_kind_and_params(self):
+        """Different content, analysis kind or parameters never share a key."""
+        digest = gpx_digest(b"<gpx/>")
+        key = GPXAnalysisCache.make_key(digest, "analysis", epsilon=0.0001)
+
+        assert key == GPXAnalysisCache.make_key(digest, "analysis", epsilon=0.0001)
+        assert key != GPXAnalysisCache.make_key(gpx_digest(b"<gpx />"), "analysis", epsilon=0.0001)
+        assert key != GPXAnalysisCache.make_key(digest, "route", epsilon=0.0001)
+        assert key != GPXAnalysisCache.make_key(digest, "analysis", epsilon=0.001)
+
+    def test_key_depends_on_analysis_code(self, monkeypatch):
+        """Changing the analysis code (CACHE_VERSION) never reuses older results."""
+        digest = gpx_digest(b"<gpx/>")
+        key = GPXAnalysisCache.make_key(digest, "analysis", epsilon=0.0001)
+
+        monkeypatch.setattr(gpx_cache_module, "CACHE_VERSION", "changed")
+
+        assert key != GPXAnalysisCache.make_key(digest, "analysis", epsilon=0.0001)
+        for relative_path in gpx_cache_module.ANALYSIS_SOURCES:
+            assert (Path(gpx_cache_module.__file__).parent.parent / relative_path).exists()
+
+    def test_digest_of_path_matches_bytes(self, tmp_path):
+        """Hashing a file on disk gives the same digest as hashing its bytes."""
+        content = (FIXTURES_DIR / "via-verde.gpx").read_bytes()
+        gpx_path = tmp_path / "route.gpx"
+        gpx_path.write_bytes(content)
+
+        assert gpx_digest(gpx_path) == gpx_digest(content)
+
+    def test_hit_returns_independent_copy(self):
+        """Mutating a returned result does not affect the cached entry."""
+        cache = GPXAnalysisCache()
+        cache.set("key", {"speed_metrics": {"moving_time_minutes": 10.0}})
+
+        first = cache.get("key")
+        first["speed_metrics"]["moving_time_minutes"] = 5.0
+
+        assert cache.get("key") == {"speed_metrics": {"moving_time_minutes": 10.0}}
+        assert cache.stats()["hits"] == 2
+
+    def test_lru_eviction(self):
+        """Least recently used entries are evicted beyond max_entries."""
+        cache = GPXAnalysisCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_byte_size_eviction(self):
+        """Least recently used entries are evicted beyond max_bytes."""
+        payload_size = len(pickle.dumps(b"x" * 1000, protocol=pickle.HIGHEST_PROTOCOL))
+        cache = GPXAnalysisCache(max_bytes=payload_size * 2)
+        cache.set("a", b"x" * 1000)
+        cache.set("b", b"x" * 1000)
+        cache.set("a", b"y" * 1000)  # replacing an entry does not count it twice
+        cache.set("c", b"x" * 1000)
+
+        assert cache.get("b") is None
+        assert cache.stats()["bytes"] == payload_size * 2
+
+    def test_oversized_result_skips_memory(self, tmp_path):
+        """Results larger than max_bytes are only kept on disk."""
+        cache = GPXAnalysisCache(max_bytes=100, disk_path=tmp_path)
+        cache.set("small", 1)
+        cache.set("abcdef", b"x" * 1000)
+
+        assert cache.stats()["entries"] == 1
+        assert cache.get("abcdef") == b"x" * 1000
+        assert cache.get("small") == 1
+
+    def test_ttl_expiry(self, monkeypatch):
+        """Entries older than ttl_seconds are treated as misses."""
+        now = [1000.0]
+        monkeypatch.setattr(gpx_cache_module.time, "monotonic", lambda: now[0])
+        cache = GPXAnalysisCache(ttl_seconds=60)
+        cache.set("key", "value")
+
+        now[0] += 59
+        assert cache.get("key") == "value"
+
+        now[0] += 2
+        assert cache.get("key") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_disk_tier(self, tmp_path):
+        """Results written to disk are found by a fresh cache instance."""
+        GPXAnalysisCache(disk_path=tmp_path).set("abcdef", {"distance_km": 42.5})
+
+        cache = GPXAnalysisCache(disk_path=tmp_path)
+
+        assert cache.get("abcdef") == {"distance_km": 42.5}
+        assert (tmp_path / "ab" / "abcdef.pkl").exists()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGPXServiceCache:
+    """Tests for GPXService cache lookups."""
+
+    async def test_analyze_twice_hits_cache(self, db_session: AsyncSession):
+        """Second analysis of the same bytes is served from the cache."""
+        cache = GPXAnalysisCache()
+        service = GPXService(db_session, cache=cache)
+        gpx_content = (FIXTURES_DIR / "short_route.gpx").read_bytes()
+
+        first = await service.analyze_gpx(gpx_content)
+        second = await service.analyze_gpx(gpx_content)
+
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hits"] == 1
+        assert second["telemetry"] == first["telemetry"]
+        assert second["route"]["trackpoints"] == first["route"]["trackpoints"]
+        assert second["route_statistics"] == first["route_statistics"]
+
+    async def test_preview_warms_publish(self, db_session: AsyncSession):
+        """extract_telemetry_quick caches the analysis reused by parse_gpx_file."""
+        cache = GPXAnalysisCache()
+        service = GPXService(db_session, cache=cache)
+        gpx_content = (FIXTURES_DIR / "camino_del_cid.gpx").read_bytes()
+
+        telemetry = await service.extract_telemetry_quick(gpx_content, include_trackpoints=True)
+        hits_before = cache.stats()["hits"]
+        parsed = await service.parse_gpx_file(gpx_content)
+
+        assert cache.stats()["hits"] == hits_before + 1
+        assert len(telemetry["trackpoints"]) == parsed["simplified_points_count"]
+
+    async def test_errors_are_not_cached(self, db_session: AsyncSession):
+        """Invalid files raise every time and leave the cache empty."""
+        cache = GPXAnalysisCache()
+        service = GPXService(db_session, cache=cache)
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await service.analyze_gpx(b"Not valid XML content")
+
+        assert cache.stats()["entries"] == 0
@@ -0,0 +1,87 @@
+"""
+Unit tests for the GPX process pool executor.
+
+Tests inline and process-pool execution and backpressure when saturated.
+"""
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from src.services.gpx_service import _run_gpx_task
+from src.utils.gpx_executor import GPXExecutorBusyError, GPXProcessExecutor
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "gpx"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGPXProcessExecutor:
+    """Tests for GPXProcessExecutor."""
+
+    async def test_inline_execution(self):
+        """With max_workers=0 the task runs in the calling process."""
+        executor = GPXProcessExecutor(max_workers=0)
+
+        result = await executor.run(sum, [1, 2, 3])
+
+        assert result == 6
+        assert executor.pending == 0
+
+    async def test_process_pool_analysis(self):
+        """GPX analysis in a worker process matches the inline result."""
+        gpx_content = (FIXTURES_DIR / "short_route.gpx").read_bytes()
+        executor = GPXProcessExecutor(max_workers=1)
+
+        try:
+            pooled = await executor.run(_run_gpx_task, "_analyze_sync", gpx_content)
+        finally:
+            executor.shutdown()
+        inline = _run_gpx_task("_analyze_sync", gpx_content)
+
+        assert pooled["telemetry"] == inline["telemetry"]
+        assert pooled["route"]["trackpoints"] == inline["route"]["trackpoints"]
+        assert pooled["route_statistics"] == inline["route_statistics"]
+
+    async def test_worker_errors_are_reraised(self):
+        """Exceptions raised in the worker propagate to the caller."""
+        executor = GPXProcessExecutor(max_workers=0)
+
+        with pytest.raises(ValueError, match="No se pudo procesar"):
+            await executor.run(_run_gpx_task, "_analyze_sync", b"Not valid XML content")
+
+        assert executor.pending == 0
+
+    async def test_saturated_pool_rejects(self):
+        """Tasks beyond max_pending are rejected instead of queued."""
+        executor = GPXProcessExecutor(max_workers=1, max_pending=1)
+
+        try:
+            running = asyncio.create_task(executor.run(time.sleep, 0.5))
+            await asyncio.sleep(0)  # Let the first task take the slot
+
+            with pytest.raises(GPXExecutorBusyError):
+                await executor.run(time.sleep, 0)
+
+            await running
+        finally:
+            executor.shutdown()
+
+        assert executor.rejected == 1
+
+    async def test_wait_for_free_slot(self):
+        """With wait=True tasks wait for a slot instead of failing."""
+        executor = GPXProcessExecutor(max_workers=1, max_pending=1)
+
+        try:
+            first = asyncio.create_task(executor.run(time.sleep, 0.2))
+            await asyncio.sleep(0)
+
+            await executor.run(time.sleep, 0, wait=True)
+            await first
+        finally:
+            executor.shutdown()
+
+        assert executor.rejected == 0
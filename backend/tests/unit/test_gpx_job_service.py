@@ -0,0 +1,273 @@
+"""
+Unit tests for GPXJobService (Feature 003 - background GPX job queue).
+
+Tests enqueueing, leasing (including expired leases), retries with backoff,
+permanent failures and idempotent processing of GPX files from storage.
+"""
+
+import asyncio
+import shutil
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select, update
+
+from src.config import settings
+from src.models.gpx import TrackPoint
+from src.models.gpx_job import GPXJob
+from src.models.route_statistics import RouteStatistics
+from src.services.gpx_job_service import GPXJobService
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "gpx"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGPXJobQueue:
+    """Tests for enqueue/claim/fail state transitions."""
+
+    async def test_enqueue_creates_pending_job(self, db_session, gpx_file_record):
+        """Enqueued jobs start pending with no attempts."""
+        service = GPXJobService(db_session)
+
+        job = await service.enqueue(gpx_file_record.gpx_file_id, gpx_file_record.file_url)
+
+        assert job.status == "pending"
+        assert job.attempts == 0
+        assert job.max_attempts == 3
+
+    async def test_claim_leases_job_once(self, db_session, gpx_file_record):
+        """A claimed job is not handed to a second worker while leased."""
+        service = GPXJobService(db_session)
+        job = await service.enqueue(gpx_file_record.gpx_file_id, gpx_file_record.file_url)
+
+        claimed = await service.claim_next("worker-1")
+        assert claimed.job_id == job.job_id
+        assert claimed.status == "processing"
+        assert claimed.worker_id == "worker-1"
+        assert claimed.attempts == 1
+        assert claimed.leased_until is not None
+
+        assert await service.claim_next("worker-2") is None
+
+    async def test_claim_empty_queue(self, db_session):
+        """No jobs -> None."""
+        assert await GPXJobService(db_session).claim_next("worker-1") is None
+
+    async def test_expired_lease_is_reclaimed(self, db_session, gpx_file_record):
+        """Jobs of crashed workers become available when the lease expires."""
+        service = GPXJobService(db_session)
+        job = await service.enqueue(gpx_file_record.gpx_file_id, gpx_file_record.file_url)
+        await service.claim_next("worker-1")
+
+        await db_session.execute(
+            update(GPXJob)
+            .where(GPXJob.job_id == job.job_id)
+            .values(leased_until=datetime.now(UTC) - timedelta(seconds=1))
+        )
+        await db_session.commit()
+
+        reclaimed = await service.claim_next("worker-2")
+        assert reclaimed.job_id == job.job_id
+        assert reclaimed.worker_id == "worker-2"
+        assert reclaimed.attempts == 2
+
+    async def test_fail_schedules_retry_with_backoff(self, db_session, gpx_file_record):
+        """Failed attempts go back to pending, not available until the backoff passes."""
+        service = GPXJobService(db_session)
+        await service.enqueue(gpx_file_record.gpx_file_id, gpx_file_record.file_url)
+        job = await service.claim_next("worker-1")
+
+        await service.fail(job, "worker-1", "Disco no disponible")
+
+        assert job.status == "pending"
+        assert job.last_error == "Disco no disponible"
+        assert await service.claim_next("worker-1") is None
+
+    async def test_fail_after_max_attempts_marks_gpx_failed(self, db_session, gpx_file_record):
+        """The last failed attempt marks both the job and the GPX file as failed."""
+        service = GPXJobService(db_session)
+        job = await service.enqueue(gpx_file_record.gpx_file_id, gpx_file_record.file_url)
+
+        for _ in range(job.max_attempts):
+            job = await service.claim_next("worker-1")
+            await service.fail(job, "worker-1", "Disco no disponible")
+            await db_session.execute(
+                update(GPXJob).where(GPXJob.job_id == job.job_id).values(available_at=func.now())
+            )
+            await db_session.commit()
+
+        assert job.status == "failed"
+        await db_session.refresh(gpx_file_record)
+        assert gpx_file_record.processing_status == "failed"
+        assert gpx_file_record.error_message == "Disco no disponible"
+
+    async def test_renew_lease_only_by_owner(self, db_session, gpx_file_record):
+        """Only the worker holding the lease can extend it."""
+        service = GPXJobService(db_session)
+        job = await service.enqueue(gpx_file_record.gpx_file_id, gpx_file_record.file_url)
+        await service.claim_next("worker-1")
+        await db_session.execute(
+            update(GPXJob)
+            .where(GPXJob.job_id == job.job_id)
+            .values(leased_until=datetime.now(UTC) + timedelta(seconds=1))
+        )
+        await db_session.commit()
+
+        assert await service.renew_lease(job.job_id, "worker-2") is False
+        assert await service.renew_lease(job.job_id, "worker-1") is True
+
+        await db_session.refresh(job)
+        assert job.leased_until.replace(tzinfo=UTC) > datetime.now(UTC) + timedelta(seconds=60)
+
+    async def test_lease_renewed_while_processing(self, db_session, gpx_file_record, monkeypatch):
+        """The heartbeat keeps extending the lease of a job that is still running."""
+        monkeypatch.setattr(settings, "gpx_job_lease_seconds", 0.3)
+        service = GPXJobService(db_session)
+        job = await service.enqueue(gpx_file_record.gpx_file_id, gpx_file_record.file_url)
+        await service.claim_next("worker-1")
+        claimed_until = job.leased_until
+        await db_session.commit()
+
+        heartbeat = asyncio.create_task(service._keep_leased(job.job_id, "worker-1"))
+        await asyncio.sleep(0.25)
+        heartbeat.cancel()
+        await asyncio.gather(heartbeat, return_exceptions=True)
+
+        await db_session.refresh(job)
+        assert job.leased_until > claimed_until
+
+    async def test_lost_lease_fail_is_dropped(self, db_session, gpx_file_record):
+        """A worker whose job was taken over cannot record a failure for it."""
+        service = GPXJobService(db_session)
+        job = await service.enqueue(gpx_file_record.gpx_file_id, gpx_file_record.file_url)
+        await service.claim_next("worker-1")
+        await self._take_over(db_session, service, job)
+
+        assert await service.fail(job, "worker-1", "Disco no disponible", retry=False) is False
+
+        await db_session.refresh(job)
+        assert job.status == "processing"
+        assert job.last_error is None
+
+    @staticmethod
+    async def _take_over(db_session, service, job):
+        """Expire worker-1's lease and let worker-2 claim the job."""
+        await db_session.execute(
+            update(GPXJob)
+            .where(GPXJob.job_id == job.job_id)
+            .values(leased_until=datetime.now(UTC) - timedelta(seconds=1))
+        )
+        await db_session.commit()
+        assert (await service.claim_next("worker-2")).worker_id == "worker-2"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGPXJobProcessing:
+    """Tests for run_next()/process_job()."""
+
+    async def test_run_next_processes_file_from_disk(self, db_session, gpx_file_record):
+        """The worker fills in the GPX record and stores trackpoints."""
+        service = GPXJobService(db_session)
+        job = await service.enqueue(gpx_file_record.gpx_file_id, gpx_file_record.file_url)
+
+        assert await service.run_next("worker-1") is True
+
+        await db_session.refresh(gpx_file_record)
+        await db_session.refresh(job)
+        assert job.status == "completed"
+        assert gpx_file_record.processing_status == "completed"
+        assert gpx_file_record.distance_km > 0
+        assert gpx_file_record.total_points > 0
+
+        count = await db_session.scalar(
+            select(func.count())
+            .select_from(TrackPoint)
+            .where(TrackPoint.gpx_file_id == gpx_file_record.gpx_file_id)
+        )
+        assert count == gpx_file_record.simplified_points
+        assert await service.run_next("worker-1") is False
+
+    async def test_run_next_saves_route_statistics(self, db_session, gpx_file_record):
+        """Files with timestamps get route statistics, including the max gradient."""
+        service = GPXJobService(db_session)
+        await service.enqueue(gpx_file_record.gpx_file_id, gpx_file_record.file_url)
+
+        assert await service.run_next("worker-1") is True
+
+        stats = await db_session.scalar(
+            select(RouteStatistics).where(
+                RouteStatistics.gpx_file_id == gpx_file_record.gpx_file_id
+            )
+        )
+        assert stats is not None
+        assert stats.avg_speed_kmh is not None
+        assert stats.max_gradient is not None
+
+    async def test_process_job_is_idempotent(self, db_session, gpx_file_record):
+        """Re-running a job replaces the trackpoints of the previous attempt."""
+        service = GPXJobService(db_session)
+        await service.enqueue(gpx_file_record.gpx_file_id, gpx_file_record.file_url)
+        job = await service.claim_next("worker-1")
+
+        await service.process_job(job)
+        await service.process_job(job)
+
+        count = await db_session.scalar(
+            select(func.count())
+            .select_from(TrackPoint)
+            .where(TrackPoint.gpx_file_id == gpx_file_record.gpx_file_id)
+        )
+        await db_session.refresh(gpx_file_record)
+        assert count == gpx_file_record.simplified_points
+
+    async def test_lost_lease_result_is_dropped(self, db_session, gpx_file_record):
+        """Results of a worker whose job was taken over are rolled back, not committed."""
+        service = GPXJobService(db_session)
+        job = await service.enqueue(gpx_file_record.gpx_file_id, gpx_file_record.file_url)
+        await service.claim_next("worker-1")
+        await TestGPXJobQueue._take_over(db_session, service, job)
+
+        await service.process_job(job)
+        assert await service.complete(job, "worker-1") is False
+
+        await db_session.refresh(gpx_file_record)
+        await db_session.refresh(job)
+        assert gpx_file_record.processing_status == "processing"
+        assert job.status == "processing"
+        assert job.worker_id == "worker-2"
+        count = await db_session.scalar(
+            select(func.count())
+            .select_from(TrackPoint)
+            .where(TrackPoint.gpx_file_id == gpx_file_record.gpx_file_id)
+        )
+        assert count == 0
+
+    async def test_invalid_gpx_fails_without_retry(self, db_session, gpx_file_record):
+        """Invalid GPX content is a permanent failure."""
+        shutil.copy(FIXTURES_DIR / "invalid_gpx.xml", gpx_file_record.file_url)
+        service = GPXJobService(db_session)
+        job = await service.enqueue(gpx_file_record.gpx_file_id, gpx_file_record.file_url)
+
+        assert await service.run_next("worker-1") is True
+
+        await db_session.refresh(job)
+        await db_session.refresh(gpx_file_record)
+        assert job.status == "failed"
+        assert job.attempts == 1
+        assert gpx_file_record.processing_status == "failed"
+        assert gpx_file_record.error_message
+
+    async def test_missing_file_is_retried(self, db_session, gpx_file_record):
+        """Unexpected errors (file not readable) are retried."""
+        Path(gpx_file_record.file_url).unlink()
+        service = GPXJobService(db_session)
+        job = await service.enqueue(gpx_file_record.gpx_file_id, gpx_file_record.file_url)
+
+        assert await service.run_next("worker-1") is True
+
+        await db_session.refresh(job)
+        assert job.status == "pending"
+        assert job.last_error == "Error interno al procesar el archivo GPX"
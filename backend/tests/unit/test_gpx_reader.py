@@ -0,0 +1,105 @@
+"""
+Unit tests for the streaming GPX reader.
+
+Verifies that read_gpx_track produces the same trackpoints as gpxpy.parse()
+while streaming from bytes or from a file on disk.
+"""
+
+from pathlib import Path
+
+import gpxpy
+import numpy as np
+import pytest
+
+from src.utils.gpx_reader import CHUNK_SIZE, read_gpx_track
+from src.utils.track_engine import MISSING_TIME, TrackArrays
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "gpx"
+
+
+def _gpxpy_track(content: bytes) -> TrackArrays:
+    """Reference track built from gpxpy's object tree."""
+    gpx = gpxpy.parse(content)
+    points = [p for t in gpx.tracks for s in t.segments for p in s.points]
+    return TrackArrays.from_gpx_points(points)
+
+
+@pytest.mark.unit
+class TestReadGPXTrack:
+    """Tests for read_gpx_track."""
+
+    @pytest.mark.parametrize(
+        "fixture", ["short_route.gpx", "camino_del_cid.gpx", "no_elevation.gpx"]
+    )
+    def test_matches_gpxpy(self, fixture):
+        """Streaming reader yields the same coordinates, elevations and times as gpxpy."""
+        content = (FIXTURES_DIR / fixture).read_bytes()
+
+        track = read_gpx_track(content)
+        expected = _gpxpy_track(content)
+
+        assert len(track) == len(expected)
+        assert np.array_equal(track.lat, expected.lat)
+        assert np.array_equal(track.lon, expected.lon)
+        assert np.array_equal(track.ele, expected.ele, equal_nan=True)
+        assert np.array_equal(track.time, expected.time)
+
+    def test_reads_from_path(self, tmp_path):
+        """A file path is streamed in chunks and gives the same result as bytes."""
+        content = (FIXTURES_DIR / "via-verde.gpx").read_bytes()
+        assert len(content) > CHUNK_SIZE
+        gpx_path = tmp_path / "route.gpx"
+        gpx_path.write_bytes(content)
+
+        from_path = read_gpx_track(gpx_path)
+        from_bytes = read_gpx_track(content)
+
+        assert np.array_equal(from_path.lat, from_bytes.lat)
+        assert np.array_equal(from_path.time, from_bytes.time)
+
+    def test_multiple_segments_and_missing_values(self):
+        """Segment boundaries are recorded; missing ele/time become NaN/MISSING_TIME."""
+        content = b"""<?xml version="1.0" encoding="UTF-8"?>
+<gpx version="1.1" creator="test" xmlns="http://www.topografix.com/GPX/1/1">
+  <metadata><name>Test</name></metadata>
+  <wpt lat="0" lon="0"><name>Ignored</name></wpt>
+  <trk>
+    <trkseg>
+      <trkpt lat="40.0" lon="-3.0"><ele>650</ele><time>2024-06-01T08:00:00Z</time></trkpt>
+      <trkpt lat="40.001" lon="-3.001"></trkpt>
+    </trkseg>
+    <trkseg></trkseg>
+    <trkseg>
+      <trkpt lat="40.002" lon="-3.002"><ele>655.5</ele></trkpt>
+    </trkseg>
+  </trk>
+</gpx>"""
+
+        track = read_gpx_track(content)
+
+        assert track.lat.tolist() == [40.0, 40.001, 40.002]
+        assert track.segment_starts.tolist() == [0, 2]
+        assert track.ele[0] == 650.0
+        assert np.isnan(track.ele[1])
+        assert track.time[0] != MISSING_TIME
+        assert track.time[1] == MISSING_TIME
+        assert track.time[2] == MISSING_TIME
+
+    def test_malformed_xml(self):
+        """Malformed XML raises ValueError."""
+        with pytest.raises(ValueError, match="XML mal formado"):
+            read_gpx_track(b"<gpx><trk><trkseg><trkpt lat='40' lon='-3'></trk>")
+
+    def test_not_a_gpx_document(self):
+        """Well-formed XML that is not GPX raises ValueError."""
+        content = (FIXTURES_DIR / "invalid_gpx.xml").read_bytes()
+
+        with pytest.raises(ValueError):
+            read_gpx_track(content)
+
+    def test_invalid_coordinates(self):
+        """Trackpoints without numeric lat/lon raise ValueError."""
+        content = b'<gpx><trk><trkseg><trkpt lat="abc" lon="-3"/></trkseg></trk></gpx>'
+
+        with pytest.raises(ValueError, match="coordenadas inválidas"):
+            read_gpx_track(content)
@@ -126,15 +126,13 @@ class TestGPXServiceSimplification:
 
         # Get distances
         simplified_distance_km = result["distance_km"]
-        original_points = result["original_points"]
+        track = result["track"]
 
         # Calculate original distance by summing all segments
         original_distance_km = 0.0
-        for i in range(len(original_points) - 1):
-            p1 = original_points[i]
-            p2 = original_points[i + 1]
+        for i in range(len(track) - 1):
             segment_distance = service._calculate_distance(
-                p1.latitude, p1.longitude, p2.latitude, p2.longitude
+                track.lat[i], track.lon[i], track.lat[i + 1], track.lon[i + 1]
             )
             original_distance_km += segment_distance
 
@@ -746,3 +744,291 @@ class TestCleanFilenameForTitle:
             clean_filename_for_title("ruta_montaña_león.gpx") == "Montaña León"
         )  # ruta removed (>2 words)
         assert clean_filename_for_title("vía_plata.gpx") == "Vía Plata"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGPXServiceAnalyze:
+    """
+    Test single-pass GPX analysis for the wizard publish step.
+
+    analyze_gpx() must return the same results as the separate
+    extract_telemetry_quick(), parse_gpx_file() and RouteStatsService calls.
+    """
+
+    async def test_analyze_matches_separate_calls(self, db_session: AsyncSession):
+        """Test that the shared pipeline reproduces each individual analysis."""
+        from src.services.route_stats_service import RouteStatsService
+
+        # Arrange
+        service = GPXService(db_session)
+        fixtures_dir = Path(__file__).parent.parent / "fixtures" / "gpx"
+        gpx_path = fixtures_dir / "short_route.gpx"
+
+        with open(gpx_path, "rb") as f:
+            gpx_content = f.read()
+
+        # Act
+        analysis = await service.analyze_gpx(gpx_content)
+
+        # Assert - Telemetry
+        telemetry = await service.extract_telemetry_quick(gpx_content)
+        assert analysis["telemetry"] == telemetry
+
+        # Assert - Route summary and simplified trackpoints
+        parsed = await service.parse_gpx_file(gpx_content)
+        route = analysis["route"]
+        assert route["trackpoints"] == parsed["trackpoints"]
+        for key in ("distance_km", "elevation_gain", "total_points", "has_timestamps"):
+            assert route[key] == parsed[key]
+
+        # Assert - Route statistics
+        stats_service = RouteStatsService(db_session)
+        trackpoints_for_stats = service.convert_points_for_stats(parsed["track"])
+        route_statistics = analysis["route_statistics"]
+        assert route_statistics is not None
+        assert route_statistics["speed_metrics"] == await stats_service.calculate_speed_metrics(
+            trackpoints_for_stats
+        )
+        assert route_statistics["top_climbs"] == await stats_service.detect_climbs(
+            trackpoints_for_stats
+        )
+        assert route_statistics["gradient_distribution"] == await stats_service.classify_gradients(
+            trackpoints_for_stats
+        )
+
+    async def test_analyze_without_timestamps(self, db_session: AsyncSession):
+        """Test that tracks without timestamps have no route statistics."""
+        # Arrange
+        service = GPXService(db_session)
+        gpx_content = b"""<?xml version="1.0" encoding="UTF-8"?>
+<gpx version="1.1" creator="test" xmlns="http://www.topografix.com/GPX/1/1">
+  <trk><trkseg>
+    <trkpt lat="40.0" lon="-3.0"><ele>650</ele></trkpt>
+    <trkpt lat="40.01" lon="-3.0"><ele>700</ele></trkpt>
+  </trkseg></trk>
+</gpx>"""
+
+        # Act
+        analysis = await service.analyze_gpx(gpx_content)
+
+        # Assert
+        assert analysis["route"]["has_timestamps"] is False
+        assert analysis["route_statistics"] is None
+        assert analysis["telemetry"]["distance_km"] > 0
+
+    async def test_analyze_invalid_gpx(self, db_session: AsyncSession):
+        """Test that invalid GPX is rejected like extract_telemetry_quick()."""
+        # Arrange
+        service = GPXService(db_session)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="No se pudo procesar"):
+            await service.analyze_gpx(b"Not valid XML content")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGPXServiceSaveTrackpoints:
+    """Test bulk insertion of simplified trackpoints."""
+
+    async def test_save_trackpoints_round_trip(self, db_session: AsyncSession, gpx_file_record):
+        """Test that bulk-inserted rows match the parsed trackpoints."""
+        from sqlalchemy import select
+
+        from src.models.gpx import TrackPoint
+
+        # Arrange
+        service = GPXService(db_session)
+        parsed = await service.parse_gpx_file(gpx_file_record.file_url)
+
+        # Act
+        inserted = await service.save_trackpoints(
+            gpx_file_record.gpx_file_id, parsed["trackpoints"]
+        )
+        await db_session.commit()
+
+        # Assert
+        result = await db_session.execute(
+            select(TrackPoint)
+            .where(TrackPoint.gpx_file_id == gpx_file_record.gpx_file_id)
+            .order_by(TrackPoint.sequence)
+        )
+        rows = result.scalars().all()
+        assert inserted == len(rows) == len(parsed["trackpoints"])
+        assert len({row.point_id for row in rows}) == len(rows)
+        for row, point in zip(rows, parsed["trackpoints"], strict=True):
+            assert row.latitude == point["latitude"]
+            assert row.longitude == point["longitude"]
+            assert row.elevation == point["elevation"]
+            assert row.distance_km == point["distance_km"]
+            assert row.sequence == point["sequence"]
+            assert row.gradient == point["gradient"]
+
+    async def test_save_trackpoints_empty(self, db_session: AsyncSession, gpx_file_record):
+        """Test that an empty list inserts nothing."""
+        service = GPXService(db_session)
+
+        assert await service.save_trackpoints(gpx_file_record.gpx_file_id, []) == 0
+
+    @pytest.mark.parametrize("storage", ["rows", "blob"])
+    async def test_save_track_and_load(
+        self, db_session: AsyncSession, gpx_file_record, monkeypatch, storage
+    ):
+        """Test that both storage modes load back the same track."""
+        from sqlalchemy import func, select
+
+        from src.config import settings
+        from src.models.gpx import GPXFile, TrackPoint
+
+        # Arrange
+        monkeypatch.setattr(settings, "gpx_track_storage", storage)
+        service = GPXService(db_session)
+        parsed = await service.parse_gpx_file(gpx_file_record.file_url)
+
+        # Act
+        await service.save_track(gpx_file_record, parsed["trackpoints"])
+        await db_session.commit()
+        loaded = await service.load_trackpoints(gpx_file_record.gpx_file_id)
+
+        # Assert
+        row_count = await db_session.scalar(
+            select(func.count())
+            .select_from(TrackPoint)
+            .where(TrackPoint.gpx_file_id == gpx_file_record.gpx_file_id)
+        )
+        track_blob = await db_session.scalar(
+            select(GPXFile.track_blob).where(GPXFile.gpx_file_id == gpx_file_record.gpx_file_id)
+        )
+        if storage == "blob":
+            assert row_count == 0
+            assert track_blob is not None
+        else:
+            assert row_count == len(parsed["trackpoints"])
+            assert track_blob is None
+
+        assert len({point["point_id"] for point in loaded}) == len(loaded)
+        for point, original in zip(loaded, parsed["trackpoints"], strict=True):
+            assert point["sequence"] == original["sequence"]
+            assert point["latitude"] == pytest.approx(original["latitude"], abs=1e-7)
+            assert point["longitude"] == pytest.approx(original["longitude"], abs=1e-7)
+            assert point["distance_km"] == original["distance_km"]
+            assert point["gradient"] == original["gradient"]
+
+        columns = await service.load_track_columns(gpx_file_record.gpx_file_id)
+        assert columns["sequence"].tolist() == [point["sequence"] for point in loaded]
+        for name in ("latitude", "longitude", "distance_km"):
+            assert columns[name].tolist() == [point[name] for point in loaded]
+        for name in ("elevation", "gradient"):
+            assert [None if v != v else v for v in columns[name].tolist()] == [
+                point[name] for point in loaded
+            ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGPXServiceTrackTiers:
+    """Test level-of-detail track tiers (overview/regional/detail)."""
+
+    @pytest.mark.parametrize(
+        "zoom,max_points,expected_tier",
+        [
+            (None, None, "detail"),
+            (8, None, "overview"),
+            (10, None, "overview"),
+            (12, None, "regional"),
+            (15, None, "detail"),
+            (None, 5000, "detail"),
+            (None, 300, "regional"),
+            (None, 50, "overview"),
+            (None, 10, "overview"),  # Nothing fits: coarsest tier
+            (15, 50, "overview"),  # Point budget caps the zoom tier
+            (8, 5000, "overview"),  # Never finer than the zoom tier
+        ],
+    )
+    def test_select_track_tier(self, zoom, max_points, expected_tier):
+        """Test tier selection by zoom level and point budget."""
+        from src.services.gpx_service import select_track_tier
+
+        tier_points = {"detail": 1200, "regional": 250, "overview": 40}
+
+        assert select_track_tier(tier_points, zoom=zoom, max_points=max_points) == expected_tier
+
+    def test_select_track_tier_detail_only(self):
+        """Test that tracks without stored coarser tiers always get the detail tier."""
+        from src.services.gpx_service import select_track_tier
+
+        assert select_track_tier({"detail": 1200}, zoom=5, max_points=10) == "detail"
+
+    async def test_build_track_tiers(self, db_session: AsyncSession):
+        """Test that coarser tiers shrink the track but keep its ends and distances."""
+        from src.services.gpx_service import build_track_tiers
+
+        # Arrange
+        service = GPXService(db_session)
+        gpx_path = Path(__file__).parent.parent / "fixtures" / "gpx" / "via-verde.gpx"
+        parsed = await service.parse_gpx_file(gpx_path)
+        detail = parsed["trackpoints"]
+
+        # Act
+        tiers = build_track_tiers(detail)
+
+        # Assert
+        assert set(tiers) == {"regional", "overview"}
+        assert len(detail) > len(tiers["regional"]) > len(tiers["overview"]) >= 2
+        detail_distances = {point["distance_km"] for point in detail}
+        for points in tiers.values():
+            assert [point["sequence"] for point in points] == list(range(len(points)))
+            assert points[0]["latitude"] == detail[0]["latitude"]
+            assert points[-1]["longitude"] == detail[-1]["longitude"]
+            assert points[-1]["distance_km"] == detail[-1]["distance_km"]
+            assert {point["distance_km"] for point in points} <= detail_distances
+            assert points[0]["gradient"] is None
+
+    @pytest.mark.parametrize("storage", ["rows", "blob"])
+    async def test_save_track_stores_tiers(
+        self, db_session: AsyncSession, gpx_file_record, monkeypatch, storage
+    ):
+        """Test that save_track stores every tier and they load back by name."""
+        from sqlalchemy import select
+
+        from src.config import settings
+        from src.models.gpx import TrackTier
+
+        # Arrange
+        monkeypatch.setattr(settings, "gpx_track_storage", storage)
+        service = GPXService(db_session)
+        gpx_path = Path(__file__).parent.parent / "fixtures" / "gpx" / "via-verde.gpx"
+        parsed = await service.parse_gpx_file(gpx_path)
+        gpx_file_record.simplified_points = parsed["simplified_points_count"]
+
+        # Act (saved twice: reprocessing replaces the track and its tiers)
+        await service.save_track(gpx_file_record, parsed["trackpoints"])
+        await service.save_track(gpx_file_record, parsed["trackpoints"])
+        await db_session.commit()
+
+        # Assert
+        result = await db_session.execute(
+            select(TrackTier.tier, TrackTier.point_count).where(
+                TrackTier.gpx_file_id == gpx_file_record.gpx_file_id
+            )
+        )
+        tier_points = dict(result.all())
+        assert set(tier_points) == {"regional", "overview"}
+
+        overview = await service.load_trackpoints(gpx_file_record.gpx_file_id, "overview")
+        columns = await service.load_track_columns(gpx_file_record.gpx_file_id, "regional")
+        detail = await service.load_trackpoints(gpx_file_record.gpx_file_id)
+        assert len(overview) == tier_points["overview"]
+        assert len(columns["latitude"]) == tier_points["regional"]
+        assert len(detail) == len(parsed["trackpoints"])
+        assert not {point["point_id"] for point in overview} & {
+            point["point_id"] for point in detail
+        }
+
+        assert await service.resolve_track_tier(gpx_file_record) == "detail"
+        assert await service.resolve_track_tier(gpx_file_record, zoom=8) == "overview"
+        assert (
+            await service.resolve_track_tier(gpx_file_record, max_points=tier_points["regional"])
+            == "regional"
+        )
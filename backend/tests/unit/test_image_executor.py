@@ -0,0 +1,97 @@
+"""
+Unit tests for the photo processing thread pool.
+
+Tests off-loop processing, the pending bound, queue deadlines and counters.
+"""
+
+import asyncio
+import io
+import threading
+
+import pytest
+from PIL import Image
+
+from src.utils.image_executor import (
+    ImageExecutorBusyError,
+    ImageProcessingExecutor,
+    ImageProcessingTimeoutError,
+)
+from src.utils.trip_photo_service import TripPhotoService
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestImageProcessingExecutor:
+    """Tests for ImageProcessingExecutor."""
+
+    async def test_runs_in_pool_thread(self):
+        """Jobs run outside the event loop thread."""
+        executor = ImageProcessingExecutor(max_workers=1)
+
+        try:
+            assert await executor.run(threading.get_ident) != threading.get_ident()
+        finally:
+            executor.shutdown()
+
+        assert executor.stats()["completed"] == 1
+
+    async def test_rejects_when_saturated(self):
+        """Jobs beyond max_pending are rejected instead of queued."""
+        executor = ImageProcessingExecutor(max_workers=1, max_pending=2)
+        release = threading.Event()
+
+        try:
+            tasks = [asyncio.create_task(executor.run(release.wait, 5)) for _ in range(2)]
+            while executor.stats()["running"] < 1:
+                await asyncio.sleep(0.01)
+
+            with pytest.raises(ImageExecutorBusyError):
+                await executor.run(release.wait, 5)
+
+            stats = executor.stats()
+            assert stats["queued"] == 1
+            assert stats["rejected"] == 1
+
+            release.set()
+            await asyncio.gather(*tasks)
+        finally:
+            executor.shutdown()
+
+        assert executor.stats()["completed"] == 2
+
+    async def test_queued_job_times_out_started_job_finishes(self):
+        """A job still queued at its deadline is cancelled; a started one runs to completion."""
+        executor = ImageProcessingExecutor(max_workers=1, max_pending=2, timeout_seconds=0.05)
+        release = threading.Event()
+
+        try:
+            running = asyncio.create_task(executor.run(release.wait, 5))
+            while executor.stats()["running"] < 1:
+                await asyncio.sleep(0.01)
+
+            with pytest.raises(ImageProcessingTimeoutError):
+                await executor.run(threading.get_ident)
+            assert executor.stats()["timed_out"] == 1
+
+            release.set()
+            assert await running is True  # Finished past its deadline
+        finally:
+            executor.shutdown()
+
+        assert executor.stats()["queued"] == 0
+
+    async def test_process_photo_async(self, monkeypatch):
+        """TripPhotoService processing goes through the shared pool."""
+        from src.utils import image_executor
+
+        monkeypatch.setattr(image_executor, "_executor", ImageProcessingExecutor(max_workers=1))
+        buffer = io.BytesIO()
+        Image.new("RGB", (800, 600), color="red").save(buffer, format="JPEG")
+
+        try:
+            result = await TripPhotoService().process_photo_async(buffer.getvalue(), "a.jpg")
+        finally:
+            image_executor.shutdown_image_executor()
+
+        assert (result.width, result.height) == (800, 600)
+        assert result.thumbnail_bytes
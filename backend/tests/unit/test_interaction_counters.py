@@ -0,0 +1,115 @@
+"""
+Unit tests for denormalized trip interaction counters.
+
+Tests cover:
+- likes_count / comments_count / shares_count maintained on insert and delete
+- TripService.reconcile_interaction_counters() repairing drift
+"""
+
+from datetime import UTC, date, datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.comment import Comment
+from src.models.like import Like
+from src.models.share import Share
+from src.models.trip import Trip, TripStatus
+from src.models.user import User
+from src.services.like_service import LikeService
+from src.services.trip_service import TripService
+
+
+@pytest.fixture
+async def users(db_session: AsyncSession) -> list[User]:
+    """Create a trip owner and two other users."""
+    users = [
+        User(
+            id=str(uuid4()),
+            username=f"counter_user_{i}",
+            email=f"counter{i}@example.com",
+            hashed_password="dummy",
+            is_verified=True,
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(users)
+    await db_session.commit()
+    return users
+
+
+@pytest.fixture
+async def trip(db_session: AsyncSession, users: list[User]) -> Trip:
+    """Create a published trip owned by the first user."""
+    trip = Trip(
+        user_id=users[0].id,
+        title="Counter Trip",
+        description="Trip used to test interaction counters",
+        start_date=date(2024, 6, 1),
+        status=TripStatus.PUBLISHED,
+        published_at=datetime.now(UTC),
+    )
+    db_session.add(trip)
+    await db_session.commit()
+    await db_session.refresh(trip)
+    return trip
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_counters_follow_inserts_and_deletes(
+    db_session: AsyncSession, users: list[User], trip: Trip
+):
+    """Counters increase and decrease with interaction rows, without touching updated_at."""
+    # Arrange
+    updated_at = trip.updated_at
+
+    # Act
+    await LikeService.like_trip(db=db_session, user_id=users[1].id, trip_id=trip.trip_id)
+    await LikeService.like_trip(db=db_session, user_id=users[2].id, trip_id=trip.trip_id)
+    comment = Comment(
+        id=str(uuid4()), user_id=users[1].id, trip_id=trip.trip_id, content="¡Qué ruta!"
+    )
+    db_session.add_all([comment, Share(id=str(uuid4()), user_id=users[2].id, trip_id=trip.trip_id)])
+    await db_session.commit()
+
+    # Assert
+    assert (trip.likes_count, trip.comments_count, trip.shares_count) == (2, 1, 1)
+
+    # Act: remove a like and the comment
+    await LikeService.unlike_trip(db=db_session, user_id=users[1].id, trip_id=trip.trip_id)
+    await db_session.delete(comment)
+    await db_session.commit()
+    await db_session.refresh(trip)
+
+    # Assert
+    assert (trip.likes_count, trip.comments_count, trip.shares_count) == (1, 0, 1)
+    assert trip.updated_at == updated_at
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_reconcile_interaction_counters_repairs_drift(
+    db_session: AsyncSession, users: list[User], trip: Trip
+):
+    """Bulk deletes bypass the counters; reconciliation recomputes them."""
+    # Arrange: two likes, then a Core delete the mapper events never see
+    for user in users[1:]:
+        await LikeService.like_trip(db=db_session, user_id=user.id, trip_id=trip.trip_id)
+    await db_session.execute(delete(Like).where(Like.user_id == users[1].id))
+    await db_session.commit()
+    await db_session.refresh(trip)
+    assert trip.likes_count == 2
+
+    # Act
+    fixed = await TripService(db_session).reconcile_interaction_counters([trip.trip_id])
+    await db_session.refresh(trip)
+
+    # Assert
+    assert fixed == 1
+    assert trip.likes_count == 1
+
+    # Act: nothing left to repair
+    assert await TripService(db_session).reconcile_interaction_counters() == 0
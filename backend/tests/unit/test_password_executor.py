@@ -0,0 +1,56 @@
+"""
+Unit tests for the password hashing thread pool.
+
+Tests off-loop bcrypt hashing, the concurrency cap and queue-depth counters.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.utils.password_executor import PasswordHashExecutor
+from src.utils.security import hash_password_async, verify_password_async
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPasswordHashExecutor:
+    """Tests for PasswordHashExecutor."""
+
+    async def test_inline_execution(self):
+        """With max_workers=0 the task runs in the calling thread."""
+        executor = PasswordHashExecutor(max_workers=0)
+
+        assert await executor.run(threading.get_ident) == threading.get_ident()
+
+    async def test_concurrency_cap_and_queue_depth(self):
+        """Tasks beyond max_workers wait in the queue and are counted."""
+        executor = PasswordHashExecutor(max_workers=2)
+        release = threading.Event()
+
+        try:
+            tasks = [asyncio.create_task(executor.run(release.wait, 5)) for _ in range(5)]
+            while executor.stats()["running"] < 2:
+                await asyncio.sleep(0.01)
+
+            stats = executor.stats()
+            assert stats["running"] == 2
+            assert stats["queued"] == 3
+            assert stats["peak_queued"] >= 3
+
+            release.set()
+            await asyncio.gather(*tasks)
+        finally:
+            executor.shutdown()
+
+        assert executor.stats()["completed"] == 5
+        assert executor.stats()["queued"] == 0
+
+    async def test_async_hash_and_verify(self):
+        """Async variants produce and check regular bcrypt hashes."""
+        hashed = await hash_password_async("SecurePass123!")
+
+        assert hashed.startswith("$2")
+        assert await verify_password_async("SecurePass123!", hashed) is True
+        assert await verify_password_async("WrongPass123!", hashed) is False
@@ -0,0 +1,107 @@
+"""
+Unit tests for the on-demand photo variant cache.
+
+Tests rendering on miss, disk hits, single rendering of concurrent requests
+and size-bounded LRU eviction.
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from src.utils import image_executor, photo_variant_cache
+from src.utils.image_executor import ImageProcessingExecutor
+from src.utils.photo_variant_cache import PhotoVariantCache
+
+
+@pytest.fixture(autouse=True)
+def inline_image_executor(monkeypatch):
+    """Render variants in the calling thread."""
+    monkeypatch.setattr(image_executor, "_executor", ImageProcessingExecutor(max_workers=0))
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    """Stored 1200x900 photo."""
+    path = tmp_path / "photo_optimized.jpg"
+    Image.new("RGB", (1200, 900), color="red").save(path, format="JPEG")
+    return path
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPhotoVariantCache:
+    """Tests for PhotoVariantCache."""
+
+    async def test_renders_on_miss_then_serves_from_disk(self, tmp_path: Path, source: Path):
+        """The first request renders the variant, later ones reuse the file."""
+        cache = PhotoVariantCache(tmp_path / "variants", max_bytes=10 * 1024 * 1024)
+
+        path = await cache.get("abc123", source, 320, "webp")
+        again = await cache.get("abc123", source, 320, "webp")
+
+        assert path == again == tmp_path / "variants" / "ab" / "abc123_320w.webp"
+        with Image.open(path) as img:
+            assert img.format == "WEBP"
+            assert img.size == (320, 240)
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    async def test_concurrent_requests_render_once(self, monkeypatch, tmp_path: Path, source: Path):
+        """Requests for a variant being rendered wait for the same render."""
+        renders = []
+        render = photo_variant_cache._render_variant
+
+        def counting_render(*args):
+            renders.append(args)
+            render(*args)
+
+        monkeypatch.setattr(photo_variant_cache, "_render_variant", counting_render)
+        cache = PhotoVariantCache(tmp_path / "variants", max_bytes=10 * 1024 * 1024)
+
+        paths = await asyncio.gather(*(cache.get("abc123", source, 640, "jpeg") for _ in range(3)))
+
+        assert len(set(paths)) == 1
+        assert len(renders) == 1
+
+    async def test_evicts_least_recently_served(self, tmp_path: Path, source: Path):
+        """Beyond the size limit the least recently served files are deleted."""
+        cache = PhotoVariantCache(tmp_path / "variants", max_bytes=10 * 1024 * 1024)
+        first = await cache.get("aaa", source, 320, "jpeg")
+        second = await cache.get("bbb", source, 320, "jpeg")
+        await cache.get("aaa", source, 320, "jpeg")  # aaa is now the most recent
+
+        cache.max_bytes = first.stat().st_size + second.stat().st_size
+        third = await cache.get("ccc", source, 320, "jpeg")
+
+        assert first.exists()
+        assert not second.exists()
+        assert third.exists()
+        assert cache.stats()["evictions"] == 1
+
+    async def test_existing_files_are_indexed(self, tmp_path: Path, source: Path):
+        """Files left by a previous run count towards the limit."""
+        path = await PhotoVariantCache(tmp_path / "variants", 10 * 1024 * 1024).get(
+            "abc123", source, 320, "jpeg"
+        )
+
+        cache = PhotoVariantCache(tmp_path / "variants", max_bytes=10 * 1024 * 1024)
+        await cache.get("abc123", source, 320, "jpeg")
+
+        assert cache.stats()["bytes"] == path.stat().st_size
+        assert cache.stats()["hits"] == 1
+
+    async def test_missing_source_and_discard(self, tmp_path: Path, source: Path):
+        """Missing sources raise FileNotFoundError; discard deletes a photo's files."""
+        cache = PhotoVariantCache(tmp_path / "variants", max_bytes=10 * 1024 * 1024)
+
+        with pytest.raises(FileNotFoundError):
+            await cache.get("abc123", tmp_path / "missing.jpg", 320, "jpeg")
+
+        path = await cache.get("abc123", source, 320, "jpeg")
+        cache.discard("abc123")
+
+        assert not path.exists()
+        assert cache.stats()["bytes"] == 0
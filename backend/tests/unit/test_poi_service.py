@@ -8,12 +8,15 @@ Coverage:
 - T086: PUBLISHED trip requirement
 """
 
+import io
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from PIL import Image
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models.poi import POIType
+from src.config import settings
+from src.models.poi import PointOfInterest, POIType
 from src.models.trip import Trip, TripDifficulty, TripStatus
 from src.schemas.poi import POICreateInput
 from src.services.poi_service import MAX_POIS_PER_TRIP, POIService
@@ -282,3 +285,31 @@ class TestPOIServiceIntegration:
                 assert "6" in error_message
                 assert "Máximo" in error_message
                 assert "POIs permitidos" in error_message
+
+
+class TestPOIPhotoUpload:
+    """Tests for POI photo processing."""
+
+    @pytest.mark.asyncio
+    async def test_upload_photo_saves_optimized_jpeg(
+        self, poi_service, published_trip, monkeypatch, tmp_path
+    ):
+        """Uploads are resized to photo_max_width and saved as JPEG."""
+        monkeypatch.setattr(settings, "storage_path", str(tmp_path))
+        monkeypatch.setattr(settings, "photo_max_width", 800)
+        poi = PointOfInterest(poi_id="poi-1", trip_id=published_trip.trip_id)
+        buffer = io.BytesIO()
+        Image.new("RGB", (1600, 1200), color="green").save(buffer, format="PNG")
+        buffer.seek(0)
+
+        with patch.object(poi_service, "get_poi", return_value=poi), patch.object(
+            poi_service, "_get_trip_with_ownership_check", return_value=published_trip
+        ):
+            result = await poi_service.upload_photo(
+                "poi-1", published_trip.user_id, buffer, "mirador.png", "image/png"
+            )
+
+        assert result.photo_url.endswith(".jpg")
+        saved = Image.open(tmp_path / result.photo_url.removeprefix("/storage/"))
+        assert saved.format == "JPEG"
+        assert saved.size == (800, 600)
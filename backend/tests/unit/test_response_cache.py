@@ -0,0 +1,193 @@
+"""
+Unit tests for the public endpoint response cache.
+
+Tests LRU/TTL eviction, the file backend, tag invalidation (explicit and on
+commit) and ETag / If-None-Match handling.
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import Request
+
+from src.config import settings
+from src.models.cache_invalidation import invalidate_on_commit
+from src.models.cycling_type import CyclingType
+from src.models.user import User
+from src.utils import response_cache as response_cache_module
+from src.utils.response_cache import (
+    FileCacheBackend,
+    MemoryCacheBackend,
+    ResponseCache,
+    cache_lookup,
+    get_response_cache,
+)
+
+
+def make_request(path: str = "/cycling-types", query: str = "", etag: str | None = None) -> Request:
+    """Build a bare GET request."""
+    headers = [(b"if-none-match", etag.encode())] if etag else []
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": query.encode(),
+            "headers": headers,
+        }
+    )
+
+
+@pytest.fixture
+def response_cache(monkeypatch) -> ResponseCache:
+    """Enable a fresh process-wide memory cache."""
+    monkeypatch.setattr(settings, "response_cache_enabled", True)
+    monkeypatch.setattr(settings, "response_cache_backend", "memory")
+    monkeypatch.setattr(response_cache_module, "_cache", None)
+    return get_response_cache()
+
+
+@pytest.mark.unit
+class TestCacheBackends:
+    """Tests for the cache backends."""
+
+    def test_lru_eviction(self):
+        """Least recently used entries are evicted beyond max_entries."""
+        backend = MemoryCacheBackend(max_entries=2)
+        backend.set("a", b"1", 60)
+        backend.set("b", b"2", 60)
+        backend.get("a")  # "b" is now least recently used
+        backend.set("c", b"3", 60)
+
+        assert backend.get("b") is None
+        assert backend.get("a") == b"1"
+        assert backend.get("c") == b"3"
+
+    def test_ttl_expiry(self, monkeypatch):
+        """Entries older than their TTL are treated as misses."""
+        now = [1000.0]
+        monkeypatch.setattr(response_cache_module.time, "monotonic", lambda: now[0])
+        backend = MemoryCacheBackend()
+        backend.set("key", b"value", 60)
+
+        now[0] += 59
+        assert backend.get("key") == b"value"
+
+        now[0] += 2
+        assert backend.get("key") is None
+
+    def test_file_backend_shared_between_instances(self, tmp_path):
+        """Entries written by one worker are read by another."""
+        FileCacheBackend(tmp_path).set("abcdef", b"body", 60)
+
+        assert FileCacheBackend(tmp_path).get("abcdef") == b"body"
+        assert (tmp_path / "ab" / "abcdef.cache").exists()
+
+    def test_file_backend_clear(self, tmp_path):
+        """clear() removes every entry file."""
+        backend = FileCacheBackend(tmp_path)
+        backend.set("abcdef", b"body", 60)
+        backend.clear()
+
+        assert backend.get("abcdef") is None
+        assert not (tmp_path / "ab" / "abcdef.cache").exists()
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    """Tests for tag invalidation and ETag handling."""
+
+    def test_invalidate_changes_keys_of_tag_only(self):
+        """Invalidating a tag misses every response built from it, and only those."""
+        cache = ResponseCache(MemoryCacheBackend())
+        trips_key = cache.make_key("/trips/public?", ("trips",))
+        tags_key = cache.make_key("/trips/tags?", ("tags",))
+
+        cache.invalidate("trips")
+
+        assert cache.make_key("/trips/public?", ("trips",)) != trips_key
+        assert cache.make_key("/trips/tags?", ("tags",)) == tags_key
+
+    def test_store_then_hit_and_304(self, response_cache):
+        """A stored response is served from the cache; a matching ETag gets 304."""
+        first = cache_lookup(make_request(), "cycling_types")
+        assert first.response is None
+        stored = first.store([{"code": "road"}])
+        etag = stored.headers["etag"]
+
+        hit = cache_lookup(make_request(), "cycling_types").response
+        assert hit.status_code == 200
+        assert hit.body == b'[{"code":"road"}]'
+        assert hit.headers["etag"] == etag
+
+        not_modified = cache_lookup(make_request(etag=etag), "cycling_types").response
+        assert not_modified.status_code == 304
+        assert not_modified.body == b""
+
+    def test_query_string_is_part_of_key(self, response_cache):
+        """Different query parameters never share an entry; their order does not matter."""
+        cache_lookup(make_request("/trips/public", "page=1&limit=8"), "trips").store({"page": 1})
+
+        assert cache_lookup(make_request("/trips/public", "limit=8&page=1"), "trips").response
+        other_page = cache_lookup(make_request("/trips/public", "page=2&limit=8"), "trips")
+        assert other_page.response is None
+
+    def test_disabled_lookup_still_sets_etag(self, response_cache):
+        """Skipped lookups (authenticated users) are not cached but answer conditionally."""
+        stored = cache_lookup(make_request(), "trips", enabled=False).store({"trips": []})
+
+        assert stored.headers["etag"]
+        assert cache_lookup(make_request(), "trips").response is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCacheInvalidation:
+    """Tests for invalidation when a transaction commits."""
+
+    async def test_commit_invalidates_written_models(
+        self, db_session: AsyncSession, response_cache
+    ):
+        """Committing a cycling type invalidates the cycling types responses."""
+        cache_lookup(make_request(), "cycling_types").store([])
+
+        db_session.add(
+            CyclingType(
+                code="road", display_name="Road", description="Road cycling", is_active=True
+            )
+        )
+        await db_session.commit()
+
+        assert cache_lookup(make_request(), "cycling_types").response is None
+
+    async def test_rollback_keeps_entries(self, db_session: AsyncSession, response_cache):
+        """Rolled back writes invalidate nothing."""
+        cache_lookup(make_request(), "cycling_types").store([])
+
+        db_session.add(
+            CyclingType(
+                code="road", display_name="Road", description="Road cycling", is_active=True
+            )
+        )
+        await db_session.flush()
+        invalidate_on_commit(db_session, "cycling_types")
+        await db_session.rollback()
+
+        assert cache_lookup(make_request(), "cycling_types").response is not None
+
+    async def test_login_bookkeeping_keeps_entries(self, db_session: AsyncSession, response_cache):
+        """Logins write users but only columns shown in cached responses invalidate them."""
+        user = User(username="ana_bike", email="ana@example.com", hashed_password="x")
+        db_session.add(user)
+        await db_session.commit()
+        cache_lookup(make_request("/trips/public"), "trips").store({"trips": []})
+
+        user.last_login_at = datetime.now(UTC)
+        user.failed_login_attempts = 0
+        await db_session.commit()
+        assert cache_lookup(make_request("/trips/public"), "trips").response is not None
+
+        user.username = "ana_gravel"
+        await db_session.commit()
+        assert cache_lookup(make_request("/trips/public"), "trips").response is None
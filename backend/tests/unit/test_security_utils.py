@@ -15,7 +15,9 @@ from src.utils.security import (
     create_refresh_token,
     decode_token,
     hash_password,
+    hash_token,
     verify_password,
+    verify_token_hash,
 )
 
 
@@ -77,6 +79,29 @@ class TestPasswordHashing:
             assert verify_password(password, password_hash) is True
 
 
+@pytest.mark.unit
+class TestTokenHashing:
+    """Unit tests for keyed token digests (refresh tokens)."""
+
+    def test_hash_token_is_deterministic_and_keyed(self, monkeypatch):
+        """Verify that the digest is stable for a token and depends on the secret key."""
+        digest = hash_token("token")
+
+        assert digest == hash_token("token")
+        assert digest != hash_token("token2")
+        assert len(digest) == 64
+
+        monkeypatch.setattr(settings, "secret_key", "another-secret")
+        assert hash_token("token") != digest
+
+    def test_verify_token_hash(self):
+        """Verify that only the original token matches its digest."""
+        digest = hash_token("token")
+
+        assert verify_token_hash("token", digest) is True
+        assert verify_token_hash("token2", digest) is False
+
+
 @pytest.mark.unit
 class TestJWTTokens:
     """T051: Unit test for JWT token creation and validation."""
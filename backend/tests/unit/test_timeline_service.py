@@ -0,0 +1,132 @@
+"""
+Unit tests for TimelineService (home timeline fan-out on write).
+
+Tests cover:
+- Fan-out to followers on publish, in batches
+- Authors above the fan-out threshold pulled at read time
+- Timeline upkeep on follow/unfollow
+- FeedService reading followed trips from the timeline
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.models.timeline import TimelineEntry
+from src.models.trip import Trip, TripStatus
+from src.models.user import User
+from src.services.feed_service import FeedService
+from src.services.social_service import SocialService
+from src.services.trip_service import TripService
+
+
+@pytest.fixture
+def home_timeline(monkeypatch):
+    """Enable the home timeline with a fan-out threshold of 2 followers."""
+    monkeypatch.setattr(settings, "home_timeline_enabled", True)
+    monkeypatch.setattr(settings, "home_timeline_fanout_max_followers", 2)
+    monkeypatch.setattr(settings, "home_timeline_fanout_batch_size", 1)
+
+
+@pytest.fixture
+async def users(db_session: AsyncSession) -> dict[str, User]:
+    """Create an author, a popular author and three readers."""
+    users = {
+        name: User(username=name, email=f"{name}@example.com", hashed_password="hash")
+        for name in ("author", "popular", "reader1", "reader2", "reader3")
+    }
+    db_session.add_all(users.values())
+    await db_session.commit()
+    return users
+
+
+async def publish(db_session: AsyncSession, user: User, title: str) -> Trip:
+    """Create and publish a trip through TripService (fans it out)."""
+    trip = Trip(
+        user_id=user.id,
+        title=title,
+        description="A" * 60,
+        start_date=date(2024, 5, 15),
+        status=TripStatus.DRAFT,
+    )
+    db_session.add(trip)
+    await db_session.commit()
+    return await TripService(db_session).publish_trip(trip_id=trip.trip_id, user_id=user.id)
+
+
+async def timeline_of(db_session: AsyncSession, user: User) -> set[str]:
+    """Trip IDs in a user's home timeline."""
+    result = await db_session.execute(
+        select(TimelineEntry.trip_id).where(TimelineEntry.user_id == user.id)
+    )
+    return set(result.scalars().all())
+
+
+async def followed_feed(db_session: AsyncSession, user: User) -> list[str]:
+    """Trip IDs of the followed bucket of a user's feed."""
+    trips, _ = await FeedService._get_followed_trips(
+        db=db_session, user_id=user.id, limit=50, offset=0
+    )
+    return [trip["trip_id"] for trip in trips]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_publish_fans_out_to_followers(
+    db_session: AsyncSession, users: dict[str, User], home_timeline
+):
+    """Publishing delivers the trip to every follower's timeline and the feed reads it."""
+    # Arrange
+    social = SocialService(db_session)
+    await social.follow_user("reader1", "author")
+    await social.follow_user("reader2", "author")
+
+    # Act
+    trip = await publish(db_session, users["author"], "Fanned out")
+
+    # Assert
+    assert await timeline_of(db_session, users["reader1"]) == {trip.trip_id}
+    assert await timeline_of(db_session, users["reader2"]) == {trip.trip_id}
+    assert await timeline_of(db_session, users["reader3"]) == set()
+    assert await followed_feed(db_session, users["reader1"]) == [trip.trip_id]
+
+    # Unfollowing removes the author's trips
+    await social.unfollow_user("reader1", "author")
+    assert await timeline_of(db_session, users["reader1"]) == set()
+    assert await followed_feed(db_session, users["reader1"]) == []
+
+    # A new follower gets the author's existing trips
+    await social.follow_user("reader3", "author")
+    assert await timeline_of(db_session, users["reader3"]) == {trip.trip_id}
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_authors_above_threshold_are_pulled(
+    db_session: AsyncSession, users: dict[str, User], home_timeline
+):
+    """Trips of authors above the threshold are read on demand, never twice."""
+    # Arrange: popular has 3 followers (> 2), author has 1
+    social = SocialService(db_session)
+    for reader in ("reader1", "reader2", "reader3"):
+        await social.follow_user(reader, "popular")
+    await social.follow_user("reader1", "author")
+    older = await publish(db_session, users["author"], "Fanned out")
+
+    # Act
+    pulled = await publish(db_session, users["popular"], "Pulled")
+
+    # Assert: not fanned out, still in the feed (newest first)
+    assert await timeline_of(db_session, users["reader1"]) == {older.trip_id}
+    assert await followed_feed(db_session, users["reader1"]) == [pulled.trip_id, older.trip_id]
+
+    # Act: popular drops back to the threshold, its trips are delivered
+    await social.unfollow_user("reader3", "popular")
+
+    # Assert
+    assert await timeline_of(db_session, users["reader1"]) == {older.trip_id, pulled.trip_id}
+    assert await followed_feed(db_session, users["reader1"]) == [pulled.trip_id, older.trip_id]
+    assert await timeline_of(db_session, users["reader3"]) == set()
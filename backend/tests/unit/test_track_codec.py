@@ -0,0 +1,111 @@
+"""
+Unit tests for the compact track blob codec (Feature 003).
+
+Tests round-trip precision, missing elevation/gradient values, the
+antimeridian and corrupt input.
+"""
+
+import pytest
+
+from src.utils.track_codec import decode_track, decode_track_columns, encode_track
+
+
+def _point(sequence: int, lat: float, lon: float, **kwargs) -> dict:
+    return {
+        "latitude": lat,
+        "longitude": lon,
+        "elevation": kwargs.get("elevation"),
+        "distance_km": kwargs.get("distance_km", round(sequence * 0.125, 3)),
+        "sequence": sequence,
+        "gradient": kwargs.get("gradient"),
+    }
+
+
+@pytest.mark.unit
+class TestTrackCodec:
+    """Tests for encode_track()/decode_track()."""
+
+    def test_round_trip(self):
+        """Coordinates keep 7 decimals; elevation, distance and gradient are exact."""
+        trackpoints = [
+            _point(
+                i,
+                40.4165 + i * 0.0001234,
+                -3.7026 - i * 0.0000567,
+                elevation=650.5 + i,
+                gradient=round(i * 0.37, 2),
+            )
+            for i in range(500)
+        ]
+
+        decoded = decode_track(encode_track(trackpoints))
+
+        assert len(decoded) == len(trackpoints)
+        for original, point in zip(trackpoints, decoded, strict=True):
+            assert point["latitude"] == pytest.approx(original["latitude"], abs=1e-7)
+            assert point["longitude"] == pytest.approx(original["longitude"], abs=1e-7)
+            assert point["elevation"] == original["elevation"]
+            assert point["distance_km"] == original["distance_km"]
+            assert point["sequence"] == original["sequence"]
+            assert point["gradient"] == original["gradient"]
+
+    def test_blob_is_compact(self):
+        """Delta encoding + zlib stays far below one table row per point."""
+        trackpoints = [
+            _point(i, 40.0 + i * 0.0001, -3.0 + i * 0.0001, elevation=600.0 + i % 50)
+            for i in range(5000)
+        ]
+
+        assert len(encode_track(trackpoints)) < 5000 * 12
+
+    def test_missing_elevation_and_gradient(self):
+        """None values survive, including gaps in the middle of the track."""
+        trackpoints = [
+            _point(0, 40.0, -3.0, elevation=None, gradient=None),
+            _point(1, 40.001, -3.0, elevation=612.3, gradient=None),
+            _point(2, 40.002, -3.0, elevation=None, gradient=4.25),
+            _point(3, 40.003, -3.0, elevation=618.9, gradient=-2.5),
+        ]
+
+        decoded = decode_track(encode_track(trackpoints))
+
+        assert [p["elevation"] for p in decoded] == [None, 612.3, None, 618.9]
+        assert [p["gradient"] for p in decoded] == [None, None, 4.25, -2.5]
+
+    def test_track_without_elevation(self):
+        """Tracks with no elevation at all omit the elevation array."""
+        trackpoints = [_point(i, 40.0 + i * 0.001, -3.0) for i in range(10)]
+
+        columns = decode_track_columns(encode_track(trackpoints))
+
+        assert len(columns["elevation"]) == 10
+        assert all(p["elevation"] is None for p in decode_track(encode_track(trackpoints)))
+
+    def test_antimeridian_crossing(self):
+        """Longitude jumps of ~360° wrap around correctly."""
+        trackpoints = [
+            _point(0, -16.5, 179.9999999),
+            _point(1, -16.5, -179.9999999),
+            _point(2, -16.5, 179.5),
+        ]
+
+        decoded = decode_track(encode_track(trackpoints))
+
+        assert [p["longitude"] for p in decoded] == pytest.approx(
+            [179.9999999, -179.9999999, 179.5], abs=1e-7
+        )
+
+    def test_empty_track(self):
+        """An empty track encodes to a valid (header-only) blob."""
+        assert decode_track(encode_track([])) == []
+
+    def test_corrupt_blob(self):
+        """Foreign or truncated data is rejected with ValueError."""
+        blob = encode_track([_point(0, 40.0, -3.0)])
+
+        with pytest.raises(ValueError):
+            decode_track(b"not a track")
+        with pytest.raises(ValueError):
+            decode_track(blob[:-4])
+        with pytest.raises(ValueError):
+            decode_track(b"XYZ" + blob[3:])
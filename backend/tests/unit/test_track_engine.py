@@ -0,0 +1,207 @@
+"""
+Unit tests for the columnar track engine.
+
+Verifies that the vectorized kernels reproduce the results of the scalar
+implementations they replace (GPXService._calculate_distance, gpxpy length and
+uphill/downhill, a scalar Ramer-Douglas-Peucker).
+"""
+
+import math
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import gpxpy
+import numpy as np
+import pytest
+
+from src.utils.track_engine import (
+    MISSING_TIME,
+    TrackArrays,
+    cumulative_distance_km,
+    elevation_gain_loss,
+    gradients_percent,
+    haversine_km,
+    length_3d_km,
+    moving_time_seconds,
+    rdp_mask,
+    segment_distances_km,
+    smoothed_elevation_gain_loss,
+)
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "gpx"
+
+
+def _reference_rdp_mask(coords: list[tuple[float, float]], epsilon: float) -> list[bool]:
+    """Scalar Ramer-Douglas-Peucker (one distance call per point, like the rdp library)."""
+
+    def distance(point, start, end):
+        if start == end:
+            return math.dist(point, start)
+        (px, py), (sx, sy), (ex, ey) = point, start, end
+        cross = (ex - sx) * (sy - py) - (ey - sy) * (sx - px)
+        return abs(cross) / math.dist(start, end)
+
+    keep = [True] * len(coords)
+    stack = [(0, len(coords) - 1)]
+    while stack:
+        start, last = stack.pop()
+        dmax, index = 0.0, start
+        for i in range(start + 1, last):
+            d = distance(coords[i], coords[start], coords[last])
+            if d > dmax:
+                dmax, index = d, i
+        if dmax > epsilon:
+            stack.append((start, index))
+            stack.append((index, last))
+        else:
+            for i in range(start + 1, last):
+                keep[i] = False
+    return keep
+
+
+def _load_fixture(name: str):
+    """Parse a GPX fixture with gpxpy and return (gpx, TrackArrays)."""
+    gpx = gpxpy.parse((FIXTURES_DIR / name).read_bytes())
+    points = [p for t in gpx.tracks for s in t.segments for p in s.points]
+    return gpx, TrackArrays.from_gpx_points(points)
+
+
+@pytest.mark.unit
+class TestTrackArrays:
+    """Tests for the TrackArrays container."""
+
+    def test_from_columns_missing_values(self):
+        """Missing elevation/time are stored as NaN/MISSING_TIME."""
+        t0 = datetime(2024, 6, 1, 8, 0, tzinfo=UTC)
+        track = TrackArrays.from_columns(
+            lat=[40.0, 40.001],
+            lon=[-3.0, -3.001],
+            ele=[650.0, None],
+            time=[t0, None],
+        )
+
+        assert len(track) == 2
+        assert track.lat.dtype == np.float64
+        assert track.time.dtype == np.int64
+        assert np.isnan(track.ele[1])
+        assert track.time[1] == MISSING_TIME
+        assert track.has_elevation is True
+        assert track.has_timestamps is True
+        assert track.timestamps() == [t0, None]
+
+    def test_without_elevation_or_time(self):
+        """Tracks without ele/time report has_elevation/has_timestamps False."""
+        track = TrackArrays.from_columns(lat=[40.0, 40.1], lon=[-3.0, -3.1])
+
+        assert track.has_elevation is False
+        assert track.has_timestamps is False
+
+
+@pytest.mark.unit
+class TestDistanceKernels:
+    """Tests for distance kernels."""
+
+    def test_haversine_matches_scalar_formula(self):
+        """Vectorized haversine equals GPXService._calculate_distance."""
+        from src.services.gpx_service import GPXService
+
+        service = GPXService(db=None)
+        expected = service._calculate_distance(40.4168, -3.7038, 41.3874, 2.1686)
+        result = haversine_km(
+            np.array([40.4168]), np.array([-3.7038]), np.array([41.3874]), np.array([2.1686])
+        )
+
+        assert result[0] == pytest.approx(expected, rel=1e-12)
+
+    def test_cumulative_distance(self):
+        """Cumulative distance starts at 0 and sums segment distances."""
+        _, track = _load_fixture("short_route.gpx")
+
+        segments = segment_distances_km(track)
+        cumulative = cumulative_distance_km(track)
+
+        assert cumulative.shape[0] == len(track)
+        assert cumulative[0] == 0.0
+        assert cumulative[-1] == pytest.approx(segments.sum())
+
+    @pytest.mark.parametrize("fixture", ["camino_del_cid.gpx", "no_elevation.gpx"])
+    def test_length_3d_matches_gpxpy(self, fixture):
+        """length_3d_km reproduces gpxpy's GPX.length_3d()."""
+        gpx, track = _load_fixture(fixture)
+
+        assert length_3d_km(track) == pytest.approx(gpx.length_3d() / 1000, rel=1e-9)
+
+
+@pytest.mark.unit
+class TestElevationKernels:
+    """Tests for elevation and gradient kernels."""
+
+    def test_smoothed_gain_loss_matches_gpxpy(self):
+        """smoothed_elevation_gain_loss reproduces gpxpy's get_uphill_downhill()."""
+        gpx, track = _load_fixture("camino_del_cid.gpx")
+        uphill, downhill = gpx.get_uphill_downhill()
+
+        gain, loss = smoothed_elevation_gain_loss(track)
+
+        assert gain == pytest.approx(uphill)
+        assert loss == pytest.approx(downhill)
+
+    def test_raw_gain_loss_skips_missing(self):
+        """Pairs with a missing elevation are ignored."""
+        ele = np.array([100.0, 150.0, np.nan, 120.0, 80.0])
+
+        gain, loss = elevation_gain_loss(ele)
+
+        assert gain == pytest.approx(50.0)
+        assert loss == pytest.approx(40.0)
+
+    def test_gradients(self):
+        """Gradient is elevation change over horizontal distance, NaN for the first point."""
+        distance_km = np.array([0.0, 1.0, 2.0, 2.0])
+        ele = np.array([100.0, 200.0, 100.0, 150.0])
+
+        gradients = gradients_percent(distance_km, ele)
+
+        assert np.isnan(gradients[0])
+        assert gradients[1] == pytest.approx(10.0)
+        assert gradients[2] == pytest.approx(-10.0)
+        assert np.isnan(gradients[3])  # Zero distance
+
+
+@pytest.mark.unit
+class TestMovingTime:
+    """Tests for the moving time kernel."""
+
+    def test_stops_are_excluded(self):
+        """Segments below 1 km/h do not count as moving time."""
+        t0 = datetime(2024, 6, 1, 8, 0, tzinfo=UTC)
+        track = TrackArrays.from_columns(
+            lat=[40.0, 40.009, 40.009, 40.018],
+            lon=[-3.0, -3.0, -3.0, -3.0],
+            time=[t0, t0 + timedelta(minutes=3), t0 + timedelta(minutes=13), None],
+        )
+
+        # First segment: ~1 km in 3 min (moving); second: stopped 10 min; third: no time
+        assert moving_time_seconds(track) == pytest.approx(180.0)
+
+
+@pytest.mark.unit
+class TestRDPMask:
+    """Tests for the vectorized Ramer-Douglas-Peucker kernel."""
+
+    @pytest.mark.parametrize("fixture", ["camino_del_cid.gpx", "via-verde.gpx"])
+    @pytest.mark.parametrize("epsilon", [0.0001, 0.001])
+    def test_matches_scalar_rdp(self, fixture, epsilon):
+        """rdp_mask keeps exactly the same points as a scalar implementation."""
+        _, track = _load_fixture(fixture)
+        coords = list(zip(track.lat.tolist(), track.lon.tolist(), strict=True))
+
+        expected = _reference_rdp_mask(coords, epsilon)
+
+        assert rdp_mask(track.lat, track.lon, epsilon).tolist() == expected
+
+    def test_short_tracks_keep_all_points(self):
+        """Tracks with fewer than 3 points are not simplified."""
+        mask = rdp_mask(np.array([40.0, 40.1]), np.array([-3.0, -3.1]), 0.0001)
+
+        assert mask.tolist() == [True, True]
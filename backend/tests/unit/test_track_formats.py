@@ -0,0 +1,112 @@
+"""
+Unit tests for the compact track response formats (Feature 003).
+
+Tests the encoded polyline against the reference example of the algorithm,
+the columnar arrays with missing values and the binary layout.
+"""
+
+import numpy as np
+import pytest
+
+from src.utils.track_formats import (
+    columnar_track,
+    decode_binary_track,
+    decode_polyline,
+    encode_binary_track,
+    encode_polyline,
+    polyline_track,
+)
+
+
+def _columns(count: int = 200) -> dict[str, np.ndarray]:
+    elevation = 650.0 + np.arange(count, dtype=np.float64)
+    elevation[3] = np.nan
+    gradient = np.round(np.linspace(-5.0, 12.0, count), 2)
+    gradient[0] = np.nan
+    return {
+        "latitude": 40.4165 + np.arange(count) * 0.0001234,
+        "longitude": -3.7026 - np.arange(count) * 0.0000567,
+        "elevation": elevation,
+        "distance_km": np.round(np.arange(count) * 0.012, 3),
+        "sequence": np.arange(count, dtype=np.int64),
+        "gradient": gradient,
+    }
+
+
+@pytest.mark.unit
+class TestPolyline:
+    """Tests for encode_polyline()/decode_polyline()."""
+
+    def test_reference_example(self):
+        """Matches the example of the encoded polyline algorithm documentation."""
+        lat = np.array([38.5, 40.7, 43.252])
+        lon = np.array([-120.2, -120.95, -126.453])
+
+        assert encode_polyline(lat, lon) == "_p~iF~ps|U_ulLnnqC_mqNvxq`@"
+        assert decode_polyline("_p~iF~ps|U_ulLnnqC_mqNvxq`@") == [
+            (38.5, -120.2),
+            (40.7, -120.95),
+            (43.252, -126.453),
+        ]
+
+    def test_round_trip_precision(self):
+        """Coordinates round-trip within the precision (large jumps and zero deltas)."""
+        lat = np.array([0.0, 0.0, 89.99999, -89.99999, 40.41651])
+        lon = np.array([0.0, 0.0, 179.99999, -179.99999, -3.70262])
+
+        decoded = np.array(decode_polyline(encode_polyline(lat, lon)))
+
+        np.testing.assert_allclose(decoded[:, 0], lat, atol=1e-5)
+        np.testing.assert_allclose(decoded[:, 1], lon, atol=1e-5)
+
+    def test_empty(self):
+        """No points -> empty polyline."""
+        assert encode_polyline(np.empty(0), np.empty(0)) == ""
+        assert decode_polyline("") == []
+
+
+@pytest.mark.unit
+class TestTrackFormats:
+    """Tests for columnar, polyline and binary track payloads."""
+
+    def test_columnar_missing_values_are_null(self):
+        """NaN elevation/gradient become None; sequence is implied by position."""
+        columns = _columns()
+
+        track = columnar_track(columns)
+
+        assert set(track) == {"latitude", "longitude", "elevation", "distance_km", "gradient"}
+        assert track["elevation"][3] is None
+        assert track["gradient"][0] is None
+        assert track["elevation"][4] == 654.0
+        assert track["distance_km"] == columns["distance_km"].tolist()
+
+    def test_polyline_track_keeps_profile_arrays(self):
+        """Polyline payload has the encoded coordinates plus the elevation profile."""
+        track = polyline_track(_columns())
+
+        assert len(decode_polyline(track["polyline"])) == 200
+        assert track["polyline_precision"] == 5
+        assert len(track["elevation"]) == len(track["distance_km"]) == 200
+
+    def test_binary_round_trip(self):
+        """Binary payload keeps the metadata and float32 arrays (NaN kept)."""
+        columns = _columns()
+        metadata = {"gpx_file_id": "abc", "distance_km": 2.388, "route_statistics": None}
+
+        payload = encode_binary_track(columns, metadata)
+        decoded_metadata, decoded = decode_binary_track(payload)
+
+        assert decoded_metadata == metadata
+        assert len(payload) % 4 == 0
+        for name in ("latitude", "longitude", "elevation", "distance_km", "gradient"):
+            assert decoded[name].dtype == np.float32
+            np.testing.assert_allclose(decoded[name], columns[name], rtol=1e-6)
+        assert np.isnan(decoded["elevation"][3])
+
+    def test_binary_rejects_other_payloads(self):
+        """Payloads without the binary track header raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_binary_track(b"CVT\x01")
+        with pytest.raises(ValueError):
+            decode_binary_track(b"XXXX" + bytes(12))
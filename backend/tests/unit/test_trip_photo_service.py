@@ -11,7 +11,15 @@ from unittest.mock import patch
 import pytest
 from PIL import Image
 
-from src.utils.trip_photo_service import PhotoProcessingResult, TripPhotoService
+from src.config import settings
+from src.utils.trip_photo_service import (
+    PhotoProcessingResult,
+    TripPhotoService,
+    decode_photo,
+    encode_photo_variants,
+    reprocess_stored_photo,
+    write_photo_variants,
+)
 
 
 class TestTripPhotoService:
@@ -308,3 +316,204 @@ class TestTripPhotoService:
         assert result.file_size > 0
         assert isinstance(result.optimized_bytes, bytes)
         assert isinstance(result.thumbnail_bytes, bytes)
+
+
+class TestDecodePhoto:
+    """Test reduced-resolution decoding."""
+
+    @staticmethod
+    def jpeg(width: int, height: int, orientation: int | None = None) -> io.BytesIO:
+        """Create JPEG image with an optional EXIF orientation."""
+        img = Image.new("RGB", (width, height), color="blue")
+        exif = Image.Exif()
+        if orientation is not None:
+            exif[0x0112] = orientation
+        buffer = io.BytesIO()
+        img.save(buffer, format="JPEG", exif=exif)
+        buffer.seek(0)
+        return buffer
+
+    def test_jpeg_decoded_at_smallest_covering_scale(self) -> None:
+        """A 4000x3000 JPEG needed at 1200px is decoded at 1/2 scale, not 1/4."""
+        decoded = decode_photo(self.jpeg(4000, 3000), min_width=1200, min_height=200)
+
+        assert decoded.image.size == (2000, 1500)
+        assert (decoded.width, decoded.height) == (4000, 3000)
+
+    def test_rotated_jpeg_targets_display_orientation(self) -> None:
+        """With EXIF rotation the targets and original size are swapped."""
+        decoded = decode_photo(self.jpeg(4000, 1000, orientation=6), min_width=400, min_height=1)
+
+        # Displayed width is the stored height: 1000 covers 400 at 1/2 (1/8 if not swapped)
+        assert decoded.image.size == (2000, 500)
+        assert (decoded.width, decoded.height) == (1000, 4000)
+
+    def test_png_decoded_at_full_size(self) -> None:
+        """Formats without scaled decoding are loaded as is."""
+        buffer = io.BytesIO()
+        Image.new("RGB", (1600, 1200), color="green").save(buffer, format="PNG")
+        buffer.seek(0)
+
+        assert decode_photo(buffer, min_width=200, min_height=200).image.size == (1600, 1200)
+
+    def test_truncated_jpeg_raises(self) -> None:
+        """Decoding replaces verify(): truncated data is rejected."""
+        data = self.jpeg(800, 600).getvalue()
+
+        with pytest.raises(OSError):
+            decode_photo(io.BytesIO(data[: len(data) // 2]), min_width=200, min_height=200)
+
+
+class TestPhotoVariants:
+    """Test the responsive variant ladder."""
+
+    @pytest.fixture(autouse=True)
+    def ladder(self, monkeypatch) -> None:
+        """Fixed ladder of three widths in JPEG and WebP."""
+        monkeypatch.setattr(settings, "photo_variant_widths", [320, 640, 1200])
+        monkeypatch.setattr(settings, "photo_variant_formats", ["jpeg", "webp"])
+
+    def test_writes_every_width_and_format(self, tmp_path: Path) -> None:
+        """Each width is saved in each format with its dimensions and size."""
+        img = Image.new("RGB", (2000, 1500), color="blue")
+
+        variants = write_photo_variants(encode_photo_variants(img), tmp_path, "abc", "/storage/x")
+
+        assert [(v["width"], v["format"]) for v in variants] == [
+            (320, "jpeg"),
+            (320, "webp"),
+            (640, "jpeg"),
+            (640, "webp"),
+            (1200, "jpeg"),
+            (1200, "webp"),
+        ]
+        webp = variants[1]
+        assert webp["url"] == "/storage/x/abc_320w.webp"
+        assert webp["height"] == 240
+        assert webp["file_size"] == (tmp_path / "abc_320w.webp").stat().st_size
+        assert Image.open(tmp_path / "abc_320w.webp").format == "WEBP"
+
+    def test_small_photo_is_not_upscaled(self, tmp_path: Path) -> None:
+        """Widths above the photo collapse into its own width."""
+        img = Image.new("RGB", (500, 400), color="green")
+
+        variants = write_photo_variants(encode_photo_variants(img), tmp_path, "abc", "/storage/x")
+
+        assert sorted({v["width"] for v in variants}) == [320, 500]
+
+    def test_reuses_existing_file(self, tmp_path: Path) -> None:
+        """An already saved encoding is referenced instead of written again."""
+        img = Image.new("RGB", (1200, 900), color="red")
+        img.save(tmp_path / "abc_optimized.jpg", format="JPEG")
+
+        variants = write_photo_variants(
+            encode_photo_variants(img, reuse={(1200, "jpeg")}),
+            tmp_path,
+            "abc",
+            "/storage/x",
+            existing={(1200, "jpeg"): "/storage/x/abc_optimized.jpg"},
+        )
+
+        largest_jpeg = [v for v in variants if v["format"] == "jpeg"][-1]
+        assert largest_jpeg["url"] == "/storage/x/abc_optimized.jpg"
+        assert not (tmp_path / "abc_1200w.jpg").exists()
+
+
+class TestProcessPhotoForUpload:
+    """Test the process_photo options used by trip, POI and profile uploads."""
+
+    @pytest.fixture(autouse=True)
+    def ladder(self, monkeypatch) -> None:
+        """Fixed ladder of two widths in JPEG and WebP."""
+        monkeypatch.setattr(settings, "photo_max_width", 1200)
+        monkeypatch.setattr(settings, "photo_variant_widths", [320, 1200])
+        monkeypatch.setattr(settings, "photo_variant_formats", ["jpeg", "webp"])
+
+    @pytest.fixture
+    def photo_bytes(self) -> bytes:
+        """2000x1500 JPEG."""
+        buffer = io.BytesIO()
+        Image.new("RGB", (2000, 1500), color="blue").save(buffer, format="JPEG")
+        return buffer.getvalue()
+
+    def test_thumb_size_override(self, photo_bytes: bytes) -> None:
+        """The square version can be sized per caller (profile photos)."""
+        result = TripPhotoService().process_photo(photo_bytes, "a.jpg", thumb_size=400)
+
+        assert Image.open(io.BytesIO(result.thumbnail_bytes)).size == (400, 400)
+        assert (result.optimized_width, result.optimized_height) == (1200, 900)
+        assert result.variants == []
+
+    def test_write_photo_reuses_optimized_file(self, tmp_path: Path, photo_bytes: bytes) -> None:
+        """The optimized file doubles as the JPEG variant of its width."""
+        service = TripPhotoService()
+        result = service.process_photo(photo_bytes, "a.jpg", with_variants=True)
+
+        variants = service.write_photo(result, tmp_path / "t1", "abc", "/storage/t1")
+
+        assert [v["url"] for v in variants] == [
+            "/storage/t1/abc_320w.jpg",
+            "/storage/t1/abc_320w.webp",
+            "/storage/t1/abc_optimized.jpg",
+            "/storage/t1/abc_1200w.webp",
+        ]
+        assert (tmp_path / "t1" / "abc_optimized.jpg").read_bytes() == result.optimized_bytes
+        assert (tmp_path / "t1" / "abc_thumb.jpg").read_bytes() == result.thumbnail_bytes
+        assert not (tmp_path / "t1" / "abc_1200w.jpg").exists()
+
+
+class TestReprocessStoredPhoto:
+    """Test regenerating stored photo versions with new settings."""
+
+    @pytest.fixture
+    def stored_photo(self, monkeypatch, tmp_path: Path) -> str:
+        """1200x900 optimized photo with an obsolete 800px variant; returns its URL."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(settings, "photo_variants_on_upload", True)
+        photo_dir = tmp_path / "storage" / "trip_photos" / "t1"
+        photo_dir.mkdir(parents=True)
+        Image.new("RGB", (1200, 900), color="red").save(photo_dir / "abc_optimized.jpg")
+        (photo_dir / "abc_800w.jpg").write_bytes(b"old")
+        return "/storage/trip_photos/t1/abc_optimized.jpg"
+
+    def test_downscales_to_max_width_and_rebuilds_ladder(
+        self, monkeypatch, tmp_path: Path, stored_photo: str
+    ) -> None:
+        """A smaller max width rewrites the optimized file; stale variants are removed."""
+        monkeypatch.setattr(settings, "photo_max_width", 800)
+        monkeypatch.setattr(settings, "photo_variant_widths", [320, 800])
+        monkeypatch.setattr(settings, "photo_variant_formats", ["jpeg", "webp"])
+        photo_dir = tmp_path / "storage" / "trip_photos" / "t1"
+
+        file_size, width, height, variants = reprocess_stored_photo(
+            stored_photo, [{"url": "/storage/trip_photos/t1/abc_800w.jpg"}]
+        )
+
+        assert (width, height) == (800, 600)
+        assert file_size == (photo_dir / "abc_optimized.jpg").stat().st_size
+        assert Image.open(photo_dir / "abc_optimized.jpg").size == (800, 600)
+        assert [v["url"] for v in variants] == [
+            "/storage/trip_photos/t1/abc_320w.jpg",
+            "/storage/trip_photos/t1/abc_320w.webp",
+            stored_photo,
+            "/storage/trip_photos/t1/abc_800w.webp",
+        ]
+        assert not (photo_dir / "abc_800w.jpg").exists()
+        assert Image.open(photo_dir / "abc_thumb.jpg").size == (
+            settings.photo_thumb_size,
+            settings.photo_thumb_size,
+        )
+
+    def test_fitting_photo_is_not_reencoded(
+        self, monkeypatch, tmp_path: Path, stored_photo: str
+    ) -> None:
+        """Photos within the max width keep their optimized file unless reencode is set."""
+        monkeypatch.setattr(settings, "photo_max_width", 1200)
+        optimized = tmp_path / "storage" / "trip_photos" / "t1" / "abc_optimized.jpg"
+        before = optimized.read_bytes()
+
+        reprocess_stored_photo(stored_photo, [])
+        assert optimized.read_bytes() == before
+
+        reprocess_stored_photo(stored_photo, [], reencode=True)
+        assert optimized.read_bytes() != before
@@ -91,6 +91,12 @@ class TestTripServiceUploadPhoto:
         assert ".jpg" in photo.photo_url
         assert ".jpg" in photo.thumb_url
 
+        # Assert - Responsive variants stored smallest first, largest JPEG is the optimized file
+        assert [v["width"] for v in photo.variants] == sorted(v["width"] for v in photo.variants)
+        assert {v["format"] for v in photo.variants} == {"jpeg", "webp"}
+        assert [v for v in photo.variants if v["format"] == "jpeg"][-1]["url"] == photo.photo_url
+        assert all(v["file_size"] > 0 for v in photo.variants)
+
     async def test_upload_photo_invalid_format(
         self, db_session: AsyncSession, test_user: User, test_trip: Trip
     ):
@@ -428,3 +428,56 @@ async def test_get_public_trips_loads_all_locations(
     # Locations should be ordered by sequence
     assert trips[0].locations[0].sequence == 0
     assert trips[0].locations[0].name == "Start Point"
+
+
+@pytest.mark.asyncio
+async def test_get_trip_interactions_batches_page(
+    db_session: AsyncSession,
+    public_user: User,
+    private_user: User,
+    published_trip_public_user: Trip,
+    published_trip_private_user: Trip,
+):
+    """Test like counts and viewer flags resolved for a whole page at once."""
+    from uuid import uuid4
+
+    from src.models.like import Like
+    from src.models.social import Follow
+
+    # Arrange: public_user liked and follows private_user's trip/author;
+    # private_user liked public_user's trip
+    likes = [
+        (public_user, published_trip_private_user),
+        (private_user, published_trip_private_user),
+        (private_user, published_trip_public_user),
+    ]
+    db_session.add_all(
+        [Like(id=str(uuid4()), user_id=user.id, trip_id=trip.trip_id) for user, trip in likes]
+    )
+    db_session.add(Follow(follower_id=public_user.id, following_id=private_user.id))
+    await db_session.commit()
+    trips = [published_trip_public_user, published_trip_private_user]
+    service = TripService(db_session)
+
+    # Act
+    anonymous = await service.get_trip_interactions(trips)
+    viewer = await service.get_trip_interactions(trips, viewer_id=public_user.id)
+
+    # Assert
+    assert anonymous[published_trip_public_user.trip_id] == {
+        "like_count": 1,
+        "is_liked": None,
+        "is_following": None,
+    }
+    assert anonymous[published_trip_private_user.trip_id]["like_count"] == 2
+    assert viewer[published_trip_public_user.trip_id] == {
+        "like_count": 1,
+        "is_liked": False,
+        "is_following": False,
+    }
+    assert viewer[published_trip_private_user.trip_id] == {
+        "like_count": 2,
+        "is_liked": True,
+        "is_following": True,
+    }
+    assert await service.get_trip_interactions([], viewer_id=public_user.id) == {}
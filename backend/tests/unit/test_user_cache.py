@@ -0,0 +1,102 @@
+"""
+Unit tests for the authenticated user cache used by get_current_user.
+
+Tests cache hits without a query, eviction on commit, and TTL expiry.
+"""
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.deps import get_current_user
+from src.config import settings
+from src.models.user import User, UserRole
+from src.utils import user_cache as user_cache_module
+from src.utils.security import create_access_token
+from src.utils.user_cache import UserCache, get_user_cache
+
+
+@pytest.fixture
+def user_cache(monkeypatch) -> UserCache:
+    """Enable a fresh process-wide user cache."""
+    monkeypatch.setattr(settings, "user_cache_ttl_seconds", 60)
+    monkeypatch.setattr(user_cache_module, "_cache", None)
+    return get_user_cache()
+
+
+@pytest.fixture
+async def user(db_session: AsyncSession) -> User:
+    """Active user."""
+    user = User(username="poller", email="poller@example.com", hashed_password="hash")
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+def bearer(user_id: str) -> HTTPAuthorizationCredentials:
+    """Access token credentials for a user."""
+    return HTTPAuthorizationCredentials(
+        scheme="Bearer", credentials=create_access_token({"sub": user_id})
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestUserCache:
+    """Tests for get_current_user with the user cache."""
+
+    async def test_second_request_is_served_from_cache(
+        self, db_session: AsyncSession, user: User, user_cache: UserCache
+    ):
+        """The user is loaded once; later requests get a session-attached copy."""
+        user_id = user.id
+        db_session.expunge_all()
+
+        first = await get_current_user(bearer(user_id), db_session)
+        db_session.expunge_all()
+        second = await get_current_user(bearer(user_id), db_session)
+
+        assert user_cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+        assert second.id == user_id
+        assert second.username == first.username
+        assert second in db_session
+
+    async def test_committed_update_evicts_user(
+        self, db_session: AsyncSession, user: User, user_cache: UserCache
+    ):
+        """Role changes and deactivation take effect on the next request."""
+        user_id = user.id
+        await get_current_user(bearer(user_id), db_session)
+
+        # Act: promote
+        user.role = UserRole.ADMIN
+        await db_session.commit()
+
+        # Assert
+        assert user_cache.get(user_id) is None
+        db_session.expunge_all()
+        assert (await get_current_user(bearer(user_id), db_session)).role == UserRole.ADMIN
+
+        # Act: deactivate
+        loaded = (await db_session.execute(select(User).where(User.id == user_id))).scalar_one()
+        loaded.is_active = False
+        await db_session.commit()
+
+        # Assert
+        with pytest.raises(HTTPException):
+            await get_current_user(bearer(user_id), db_session)
+
+    async def test_ttl_expiry(self, monkeypatch, user: User):
+        """Entries older than the TTL are treated as misses."""
+        now = [1000.0]
+        monkeypatch.setattr(user_cache_module.time, "monotonic", lambda: now[0])
+        cache = UserCache(ttl_seconds=10)
+        cache.set(user)
+
+        now[0] += 9
+        assert cache.get(user.id)["username"] == "poller"
+
+        now[0] += 2
+        assert cache.get(user.id) is None